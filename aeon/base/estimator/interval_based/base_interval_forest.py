@@ -21,6 +21,10 @@ from aeon.base._base import _clone_estimator
 from aeon.classification.sklearn import ContinuousIntervalTree
 from aeon.transformations.base import BaseTransformer
 from aeon.transformations.collection import RandomIntervals, SupervisedIntervals
+from aeon.transformations.collection._interval_statistics import (
+    _IntervalStatistics,
+    _is_interval_statistic,
+)
 from aeon.utils.numba.stats import row_mean, row_slope, row_std
 from aeon.utils.validation import check_n_jobs
 from aeon.utils.validation.panel import check_X_y
@@ -142,6 +146,11 @@ class BaseIntervalForest(metaclass=ABCMeta):
         value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
+    predict_batch_size : int or None, default=None
+        The number of cases to predict at a time. Features are extracted for a block
+        of cases and the predictions of all estimators are summed before the next
+        block, so memory used in predict is bounded by the block size rather than
+        the number of cases. If None, all cases are predicted in a single block.
 
     Attributes
     ----------
@@ -192,6 +201,7 @@ class BaseIntervalForest(metaclass=ABCMeta):
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
+        predict_batch_size=None,
     ):
         self.base_estimator = base_estimator
         self.n_estimators = n_estimators
@@ -209,6 +219,7 @@ class BaseIntervalForest(metaclass=ABCMeta):
         self.random_state = random_state
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
+        self.predict_batch_size = predict_batch_size
 
         super(BaseIntervalForest, self).__init__()
 
@@ -741,48 +752,72 @@ class BaseIntervalForest(metaclass=ABCMeta):
 
     def _predict(self, X):
         if is_regressor(self):
-            Xt = self._predict_setup(X)
-
-            y_preds = Parallel(
-                n_jobs=self._n_jobs,
-                backend=self.parallel_backend,
-                prefer="threads",
-            )(
-                delayed(self._predict_for_estimator)(
-                    Xt,
-                    self.estimators_[i],
-                    self.intervals_[i],
-                    predict_proba=False,
-                )
-                for i in range(self._n_estimators)
-            )
-
-            return np.mean(y_preds, axis=0)
+            return self._predict_in_batches(X, False) / self._n_estimators
         else:
             return np.array(
                 [self.classes_[int(np.argmax(prob))] for prob in self._predict_proba(X)]
             )
 
     def _predict_proba(self, X):
-        Xt = self._predict_setup(X)
-
-        y_probas = Parallel(
-            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-        )(
-            delayed(self._predict_for_estimator)(
-                Xt,
-                self.estimators_[i],
-                self.intervals_[i],
-                predict_proba=True,
+        return self._predict_in_batches(X, True) / self._n_estimators
+
+    def _predict_in_batches(self, X, predict_proba):
+        # sum of the predictions of all estimators. Cases are predicted in blocks of
+        # predict_batch_size, and the estimators are split into one group per job
+        # which sums its own predictions, so only the features of a block and one
+        # prediction array per job are held at a time.
+        if self.predict_batch_size is not None and (
+            not isinstance(self.predict_batch_size, (int, np.integer))
+            or self.predict_batch_size < 1
+        ):
+            raise ValueError(
+                "predict_batch_size must be a positive int or None, got "
+                f"{self.predict_batch_size}"
             )
-            for i in range(self._n_estimators)
+
+        n_instances = X.shape[0]
+        batch_size = (
+            n_instances if self.predict_batch_size is None else self.predict_batch_size
+        )
+        groups = np.array_split(
+            np.arange(self._n_estimators), min(self._n_jobs, self._n_estimators)
         )
 
-        output = np.sum(y_probas, axis=0) / (
-            np.ones(self.n_classes_) * self._n_estimators
+        output = np.zeros(
+            (n_instances, self.n_classes_) if predict_proba else n_instances
         )
+        for start in range(0, n_instances, batch_size):
+            Xt = self._predict_setup(X[start : start + batch_size])
+            stats = self._predict_statistics(Xt)
+
+            sums = Parallel(
+                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+            )(
+                delayed(self._predict_for_estimators)(
+                    Xt,
+                    group,
+                    predict_proba,
+                    stats,
+                )
+                for group in groups
+            )
+
+            for p in sums:
+                output[start : start + batch_size] += p
         return output
 
+    def _predict_for_estimators(self, Xt, indices, predict_proba, stats):
+        total = 0
+        for i in indices:
+            total = total + self._predict_for_estimator(
+                Xt,
+                self.estimators_[i],
+                self.intervals_[i],
+                predict_proba=predict_proba,
+                stats=stats,
+            )
+        return total
+
     def _fit_estimator(self, Xt, y, seed):
         # random state for this estimator
         rng = check_random_state(seed)
@@ -1000,12 +1035,32 @@ class BaseIntervalForest(metaclass=ABCMeta):
 
         return Xt
 
-    def _predict_for_estimator(self, Xt, estimator, intervals, predict_proba=False):
-        interval_features = np.empty((Xt[0].shape[0], 0))
+    def _predict_statistics(self, Xt):
+        # cumulative sums of each series representation, shared by all estimators
+        # to find interval summary statistics
+        return [
+            _IntervalStatistics(Xt[r])
+            if any(_is_interval_statistic(f) for f in self._interval_features[r])
+            else None
+            for r in range(len(Xt))
+        ]
 
+    def _predict_for_estimator(
+        self, Xt, estimator, intervals, predict_proba=False, stats=None
+    ):
+        interval_features = []
         for r in range(len(Xt)):
-            f = intervals[r].transform(Xt[r])
-            interval_features = np.hstack((interval_features, f))
+            if stats is not None and stats[r] is not None:
+                # the transformer uses the statistics shared by all estimators
+                # instead of finding them again, see _predict_statistics
+                intervals[r]._shared_statistics = stats[r]
+                try:
+                    interval_features.append(intervals[r].transform(Xt[r]))
+                finally:
+                    del intervals[r]._shared_statistics
+            else:
+                interval_features.append(intervals[r].transform(Xt[r]))
+        interval_features = np.hstack(interval_features)
 
         if isinstance(self.replace_nan, str) and self.replace_nan.lower() == "nan":
             interval_features = np.nan_to_num(
@@ -256,3 +256,38 @@ def test_interval_features():
     est.fit(X, y)
     assert est._interval_function == [True]
     assert est._interval_transformer == [True]
+
+
+@pytest.mark.parametrize(
+    "interval_selection_method",
+    ["random", "supervised"],
+)
+def test_interval_forest_predict_batch_size(interval_selection_method):
+    """Test BaseIntervalForest predictions in blocks of cases."""
+    X, y = make_3d_test_data(n_cases=20, random_state=0)
+
+    est = IntervalForestClassifier(
+        n_estimators=4,
+        n_intervals=2,
+        interval_selection_method=interval_selection_method,
+        random_state=0,
+    )
+    est.fit(X, y)
+
+    est2 = IntervalForestClassifier(
+        n_estimators=4,
+        n_intervals=2,
+        interval_selection_method=interval_selection_method,
+        random_state=0,
+        predict_batch_size=3,
+        n_jobs=2,
+    )
+    est2.fit(X, y)
+
+    np.testing.assert_array_almost_equal(est.predict_proba(X), est2.predict_proba(X))
+    # the statistics shared with the transformers are removed after predicting
+    assert not any(hasattr(t, "_shared_statistics") for i in est2.intervals_ for t in i)
+
+    est2.predict_batch_size = 0
+    with pytest.raises(ValueError, match=r"predict_batch_size must be"):
+        est2.predict(X)
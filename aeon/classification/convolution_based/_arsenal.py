@@ -25,6 +25,9 @@ from aeon.transformations.collection.convolution_based import (
     MultiRocketMultivariate,
     Rocket,
 )
+from aeon.transformations.collection.convolution_based._feature_cache import (
+    _check_feature_cache,
+)
 from aeon.utils.validation.panel import check_X_y
 
 
@@ -62,6 +65,12 @@ class Arsenal(BaseClassifier):
         ``-1`` means using all processors.
     random_state : int or None, default=None
         Seed for random number generation.
+    feature_cache : str, Path, RocketFeatureCache or None, default=None
+        If not None, the fitted transformer and the transformed training data of
+        each ensemble member are stored in and loaded from this cache, see
+        ``RocketFeatureCache``. Fitting again on the same training data with the
+        same ``random_state`` then does not recompute the transforms. Only used if
+        ``random_state`` is an int.
 
     Attributes
     ----------
@@ -132,6 +141,7 @@ class Arsenal(BaseClassifier):
         save_transformed_data=False,
         n_jobs=1,
         random_state=None,
+        feature_cache=None,
     ):
         self.num_kernels = num_kernels
         self.n_estimators = n_estimators
@@ -144,6 +154,7 @@ class Arsenal(BaseClassifier):
 
         self.random_state = random_state
         self.n_jobs = n_jobs
+        self.feature_cache = feature_cache
 
         self.n_instances_ = 0
         self.n_dims_ = 0
@@ -153,6 +164,7 @@ class Arsenal(BaseClassifier):
         self.transformed_data_ = []
 
         self._weight_sum = 0
+        self._feature_cache = None
 
         super(Arsenal, self).__init__()
 
@@ -180,6 +192,7 @@ class Arsenal(BaseClassifier):
         time_limit = self.time_limit_in_minutes * 60
         start_time = time.time()
         train_time = 0
+        self._feature_cache = _check_feature_cache(self.feature_cache)
 
         if self.rocket_transform == "rocket":
             base_rocket = Rocket(num_kernels=self.num_kernels)
@@ -369,7 +382,10 @@ class Arsenal(BaseClassifier):
         return results
 
     def _fit_estimator(self, rocket, X, y):
-        transformed_x = rocket.fit_transform(X)
+        if self._feature_cache is None:
+            transformed_x = rocket.fit_transform(X)
+        else:
+            rocket, transformed_x = self._feature_cache.fit_transform(rocket, X)
         scaler = StandardScaler(with_mean=False)
         scaler.fit(transformed_x, y)
         ridge = RidgeClassifierCV(alphas=np.logspace(-3, 3, 10))
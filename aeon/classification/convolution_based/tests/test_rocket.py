@@ -1,14 +1,18 @@
 # -*- coding: utf-8 -*-
 """Rocket test code."""
+import numpy as np
 import pytest
+from sklearn.linear_model import LogisticRegression
 
 from aeon.classification.convolution_based import RocketClassifier
+from aeon.classification.sklearn import IncrementalRidgeClassifierCV
 from aeon.transformations.collection.convolution_based import (
     MiniRocket,
     MiniRocketMultivariate,
     MultiRocket,
     MultiRocketMultivariate,
     Rocket,
+    RocketFeatureCache,
 )
 from aeon.utils._testing.collection import make_2d_test_data, make_3d_test_data
 
@@ -45,3 +49,39 @@ def test_rocket():
     )
     with pytest.raises(ValueError, match="Invalid Rocket transformer"):
         rocket.fit(X_train, y_train)
+
+
+def test_rocket_feature_cache(tmp_path):
+    """Test the feature cache is reused by classifiers with a different estimator."""
+    X_train, y_train = make_3d_test_data(n_cases=20, n_timepoints=30)
+    rocket = RocketClassifier(num_kernels=20, random_state=0)
+    cached = RocketClassifier(num_kernels=20, random_state=0, feature_cache=tmp_path)
+    rocket.fit(X_train, y_train)
+    cached.fit(X_train, y_train)
+    np.testing.assert_array_equal(rocket.predict(X_train), cached.predict(X_train))
+
+    cached.set_params(estimator=LogisticRegression())
+    cached.fit(X_train, y_train)
+    assert len(RocketFeatureCache(tmp_path)) == 1
+    rocket.set_params(estimator=LogisticRegression())
+    rocket.fit(X_train, y_train)
+    np.testing.assert_array_almost_equal(
+        rocket.predict_proba(X_train), cached.predict_proba(X_train)
+    )
+
+
+def test_rocket_partial_fit():
+    """Test partial_fit trains an incremental ridge classifier on batches."""
+    X_train, y_train = make_3d_test_data(n_cases=40, n_timepoints=30, random_state=0)
+    rocket = RocketClassifier(num_kernels=100, random_state=0)
+    rocket.partial_fit(X_train[:10], y_train[:10], classes=[0, 1])
+    rocket.partial_fit(X_train[10:25], y_train[10:25])
+    rocket.partial_fit(X_train[25:], y_train[25:])
+    assert isinstance(rocket._estimator, IncrementalRidgeClassifierCV)
+    assert rocket._estimator.n_instances_ == 40
+    np.testing.assert_array_equal(rocket.classes_, [0, 1])
+    assert np.mean(rocket.predict(X_train) == y_train) > 0.9
+    assert rocket.predict_proba(X_train).shape == (40, 2)
+
+    with pytest.raises(ValueError, match="default estimator"):
+        RocketClassifier(estimator=LogisticRegression()).partial_fit(X_train, y_train)
@@ -20,6 +20,10 @@ from sklearn.utils.sparsefuncs_fast import csr_row_norms
 from sklearn.utils.validation import _num_samples
 
 from aeon.classification.base import BaseClassifier
+from aeon.classification.dictionary_based._sparse_bags import (
+    _as_csr,
+    _boss_pairwise_distance,
+)
 from aeon.transformations.collection.dictionary_based import SFAFast
 from aeon.utils.validation.panel import check_X_y
 
@@ -75,7 +79,9 @@ class BOSSEnsemble(BaseClassifier):
         accuracy, yet is signifaicantly slower to compute.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
-        ``-1`` means using all processors.
+        ``-1`` means using all processors. In `fit`, the window sizes are searched
+        in parallel threads, or processes inside a
+        ``joblib.parallel_backend("loky")`` context.
     random_state : int or None, default=None
         Seed for random, integer.
 
@@ -205,53 +211,36 @@ class BOSSEnsemble(BaseClassifier):
             )
         max_acc = -1
         min_max_acc = -1
-        for normalise in self._norm_options:
-            for win_size in range(self.min_window, max_window + 1, win_inc):
-                # max_word_len = min(self.min_window - 2, self.word_lengths[0])
-                boss = IndividualBOSS(
-                    win_size,
-                    self._word_lengths[0],
-                    normalise,
-                    self.alphabet_size,
-                    save_words=True,
-                    use_boss_distance=self.use_boss_distance,
-                    feature_selection=self.feature_selection,
-                    n_jobs=self.n_jobs,
-                    random_state=self.random_state,
-                )
-                boss.fit(X, y)
-
-                best_classifier_for_win_size = boss
-                best_acc_for_win_size = -1
-
-                # the used word length may be shorter
-                best_word_len = boss._transformer.word_length
-
-                for n, word_len in enumerate(self._word_lengths):
-                    if n > 0 and word_len < boss._transformer.word_length:
-                        boss = boss._shorten_bags(word_len, y)
-
-                    boss._accuracy = self._individual_train_acc(
-                        boss, y, self.n_instances_, best_acc_for_win_size
-                    )
-
-                    if boss._accuracy >= best_acc_for_win_size:
-                        best_acc_for_win_size = boss._accuracy
-                        best_classifier_for_win_size = boss
-                        best_word_len = word_len
+        parameters = [
+            (win_size, normalise)
+            for normalise in self._norm_options
+            for win_size in range(self.min_window, max_window + 1, win_inc)
+        ]
+        # The word length search of each window size does not depend on the
+        # ensemble, so batches of window sizes are searched in parallel and then
+        # added to the ensemble in the same order as a sequential fit.
+        for i in range(0, len(parameters), self._n_jobs):
+            batch = parameters[i : i + self._n_jobs]
+            n_jobs = self._n_jobs if len(batch) == 1 else 1
+            candidates = Parallel(n_jobs=self._n_jobs, prefer="threads")(
+                delayed(self._fit_window)(X, y, win_size, normalise, n_jobs)
+                for win_size, normalise in batch
+            )
 
+            added = []
+            for boss, best_acc, best_word_len in candidates:
                 if self._include_in_ensemble(
-                    best_acc_for_win_size,
+                    best_acc,
                     max_acc,
                     min_max_acc,
                     len(self.estimators_),
                 ):
-                    best_classifier_for_win_size._clean()
-                    best_classifier_for_win_size._set_word_len(X, y, best_word_len)
-                    self.estimators_.append(best_classifier_for_win_size)
+                    boss._clean()
+                    added.append((boss, best_word_len))
+                    self.estimators_.append(boss)
 
-                    if best_acc_for_win_size > max_acc:
-                        max_acc = best_acc_for_win_size
+                    if best_acc > max_acc:
+                        max_acc = best_acc
                         self.estimators_ = list(
                             compress(
                                 self.estimators_,
@@ -271,6 +260,17 @@ class BOSSEnsemble(BaseClassifier):
                         del self.estimators_[min_acc_ind]
                         min_max_acc, min_acc_ind = self._worst_ensemble_acc()
 
+            # only the members still in the ensemble are refit with their best
+            # word length
+            added = [
+                (boss, word_len)
+                for boss, word_len in added
+                if any(boss is clf for clf in self.estimators_)
+            ]
+            Parallel(n_jobs=self._n_jobs, prefer="threads")(
+                delayed(boss._set_word_len)(X, y, word_len) for boss, word_len in added
+            )
+
         self.n_estimators_ = len(self.estimators_)
 
         return self
@@ -320,6 +320,43 @@ class BOSSEnsemble(BaseClassifier):
                 sums[i, self._class_dictionary[preds[i]]] += 1
         return sums / (np.ones(self.n_classes_) * self.n_estimators_)
 
+    def _fit_window(self, X, y, win_size, normalise, n_jobs):
+        # Fit a BOSS with the longest word length and find the most accurate of the
+        # shortened word lengths.
+        boss = IndividualBOSS(
+            win_size,
+            self._word_lengths[0],
+            normalise,
+            self.alphabet_size,
+            save_words=True,
+            use_boss_distance=self.use_boss_distance,
+            feature_selection=self.feature_selection,
+            n_jobs=n_jobs,
+            random_state=self.random_state,
+        )
+        boss.fit(X, y)
+
+        best_classifier_for_win_size = boss
+        best_acc_for_win_size = -1
+
+        # the used word length may be shorter
+        best_word_len = boss._transformer.word_length
+
+        for n, word_len in enumerate(self._word_lengths):
+            if n > 0 and word_len < boss._transformer.word_length:
+                boss = boss._shorten_bags(word_len, y)
+
+            boss._accuracy = self._individual_train_acc(
+                boss, y, self.n_instances_, best_acc_for_win_size
+            )
+
+            if boss._accuracy >= best_acc_for_win_size:
+                best_acc_for_win_size = boss._accuracy
+                best_classifier_for_win_size = boss
+                best_word_len = word_len
+
+        return best_classifier_for_win_size, best_acc_for_win_size, best_word_len
+
     def _include_in_ensemble(self, acc, max_acc, min_max_acc, size):
         if acc >= max_acc * self.threshold:
             if size >= self.max_ensemble_size:
@@ -364,7 +401,7 @@ class BOSSEnsemble(BaseClassifier):
 
         else:
             for i, clf in enumerate(self.estimators_):
-                if self._transformed_data.shape[1] > 0:
+                if clf._transformed_data.shape[1] > 0:
                     distance_matrix = pairwise_distances(
                         clf._transformed_data,
                         use_boss_distance=self.use_boss_distance,
@@ -397,7 +434,7 @@ class BOSSEnsemble(BaseClassifier):
             distance_matrix = pairwise_distances(
                 boss._transformed_data,
                 use_boss_distance=self.use_boss_distance,
-                n_jobs=self.n_jobs,
+                n_jobs=boss.n_jobs,
             )
 
             for i in range(train_size):
@@ -700,10 +737,9 @@ class IndividualBOSS(BaseClassifier):
         self._transformed_data = self._transformer.fit_transform(X, y)
 
 
-def _dist_wrapper(dist_matrix, X, Y, s, XX_all=None, XY_all=None):
+def _dist_wrapper(dist_matrix, X, Y, s):
     """Write in-place to a slice of a distance matrix."""
-    for i in range(s.start, s.stop):
-        dist_matrix[i] = boss_distance(X, Y, i, XX_all, XY_all)
+    dist_matrix[s] = _boss_pairwise_distance(X[s], Y)
 
 
 def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
@@ -712,19 +748,17 @@ def pairwise_distances(X, Y=None, use_boss_distance=False, n_jobs=1):
         if Y is None:
             Y = X
 
-        XX_row_norms = csr_row_norms(X)
-        XY = safe_sparse_dot(X, Y.T, dense_output=True)
-
-        distance_matrix = np.zeros((X.shape[0], Y.shape[0]))
+        X_csr = _as_csr(X)
+        Y_csr = X_csr if Y is X else _as_csr(Y)
 
         if effective_n_jobs(n_jobs) > 1:
+            distance_matrix = np.zeros((X.shape[0], Y.shape[0]))
             Parallel(n_jobs=n_jobs, prefer="threads")(
-                delayed(_dist_wrapper)(distance_matrix, X, Y, s, XX_row_norms, XY)
+                delayed(_dist_wrapper)(distance_matrix, X_csr, Y_csr, s)
                 for s in gen_even_slices(_num_samples(X), effective_n_jobs(n_jobs))
             )
         else:
-            for i in range(len(distance_matrix)):
-                distance_matrix[i] = boss_distance(X, Y, i, XX_row_norms, XY)
+            distance_matrix = _boss_pairwise_distance(X_csr, Y_csr)
 
     else:
         distance_matrix = pairwise.pairwise_distances(X, Y, n_jobs=n_jobs)
@@ -13,7 +13,9 @@ import math
 import time
 
 import numpy as np
+from joblib import Parallel
 from sklearn.utils import check_random_state
+from sklearn.utils.fixes import delayed
 
 from aeon.classification.base import BaseClassifier
 from aeon.classification.dictionary_based import IndividualBOSS
@@ -68,7 +70,9 @@ class ContractableBOSS(BaseClassifier):
         leave-one-out cross-validation.
     n_jobs : int, default = 1
         The number of jobs to run in parallel for both `fit` and `predict`.
-        ``-1`` means using all processors.
+        ``-1`` means using all processors. In `fit`, ensemble members are built in
+        parallel threads, or processes inside a ``joblib.parallel_backend("loky")``
+        context.
     feature_selection : str, default = "none"
         Sets the feature selections strategy to be used. One of {"chi2", "none",
         "random"}. "chi2" reduces the number of words significantly and is thus much
@@ -236,6 +240,9 @@ class ContractableBOSS(BaseClassifier):
         else:
             n_parameter_samples = self.n_parameter_samples
             contract_max_n_parameter_samples = np.inf
+        max_n_parameter_samples = (
+            contract_max_n_parameter_samples if time_limit > 0 else n_parameter_samples
+        )
 
         while (
             (
@@ -244,53 +251,57 @@ class ContractableBOSS(BaseClassifier):
             )
             or num_classifiers < n_parameter_samples
         ) and len(possible_parameters) > 0:
-            parameters = possible_parameters.pop(
-                rng.randint(0, len(possible_parameters))
+            # Members are drawn in the same order as a sequential fit, and a batch
+            # of them is fit in parallel before they are evaluated in order. A batch
+            # is no larger than the number of members still required, so without a
+            # time limit the same ensemble is built for any n_jobs.
+            n_batch = min(
+                self._n_jobs,
+                len(possible_parameters),
+                max_n_parameter_samples - num_classifiers,
             )
+            batch = []
+            for _ in range(n_batch):
+                parameters = possible_parameters.pop(
+                    rng.randint(0, len(possible_parameters))
+                )
+                subsample = rng.choice(
+                    self.n_instances_, size=subsample_size, replace=False
+                )
+                batch.append((parameters, subsample))
 
-            subsample = rng.choice(
-                self.n_instances_, size=subsample_size, replace=False
-            )
-            X_subsample = X[subsample]
-            y_subsample = y[subsample]
-
-            boss = IndividualBOSS(
-                *parameters,
-                alphabet_size=self._alphabet_size,
-                save_words=False,
-                n_jobs=self.n_jobs,
-                feature_selection=self.feature_selection,
-                random_state=self.random_state,
-            )
-            boss.fit(X_subsample, y_subsample)
-            boss._clean()
-            boss._subsample = subsample
-
-            boss._accuracy = self._individual_train_acc(
-                boss,
-                y_subsample,
-                subsample_size,
-                0 if num_classifiers < self.max_ensemble_size else lowest_acc,
+            n_jobs = self._n_jobs if n_batch == 1 else 1
+            estimators = Parallel(n_jobs=self._n_jobs, prefer="threads")(
+                delayed(self._fit_estimator)(X, y, parameters, subsample, n_jobs)
+                for parameters, subsample in batch
             )
-            if boss._accuracy > 0:
-                weight = math.pow(boss._accuracy, 4)
-            else:
-                weight = 0.000000001
-
-            # Only keep the classifier, if its accuracy is non-zero
-            if boss._accuracy > 0:
-                if num_classifiers < self.max_ensemble_size:
-                    if boss._accuracy < lowest_acc:
-                        lowest_acc = boss._accuracy
-                        lowest_acc_idx = num_classifiers
-                    self.weights_.append(weight)
-                    self.estimators_.append(boss)
-                elif boss._accuracy > lowest_acc:
-                    self.weights_[lowest_acc_idx] = weight
-                    self.estimators_[lowest_acc_idx] = boss
-                    lowest_acc, lowest_acc_idx = self._worst_ensemble_acc()
-
-                num_classifiers += 1
+
+            for boss in estimators:
+                boss._accuracy = self._individual_train_acc(
+                    boss,
+                    y[boss._subsample],
+                    subsample_size,
+                    0 if num_classifiers < self.max_ensemble_size else lowest_acc,
+                )
+                if boss._accuracy > 0:
+                    weight = math.pow(boss._accuracy, 4)
+                else:
+                    weight = 0.000000001
+
+                # Only keep the classifier, if its accuracy is non-zero
+                if boss._accuracy > 0:
+                    if num_classifiers < self.max_ensemble_size:
+                        if boss._accuracy < lowest_acc:
+                            lowest_acc = boss._accuracy
+                            lowest_acc_idx = num_classifiers
+                        self.weights_.append(weight)
+                        self.estimators_.append(boss)
+                    elif boss._accuracy > lowest_acc:
+                        self.weights_[lowest_acc_idx] = weight
+                        self.estimators_[lowest_acc_idx] = boss
+                        lowest_acc, lowest_acc_idx = self._worst_ensemble_acc()
+
+                    num_classifiers += 1
             train_time = time.time() - start_time
 
         self.n_estimators_ = len(self.estimators_)
@@ -344,6 +355,20 @@ class ContractableBOSS(BaseClassifier):
 
         return sums / (np.ones(self.n_classes_) * self._weight_sum)
 
+    def _fit_estimator(self, X, y, parameters, subsample, n_jobs):
+        boss = IndividualBOSS(
+            *parameters,
+            alphabet_size=self._alphabet_size,
+            save_words=False,
+            n_jobs=n_jobs,
+            feature_selection=self.feature_selection,
+            random_state=self.random_state,
+        )
+        boss.fit(X[subsample], y[subsample])
+        boss._clean()
+        boss._subsample = subsample
+        return boss
+
     def _worst_ensemble_acc(self):
         min_acc = 1.0
         min_acc_idx = -1
@@ -413,7 +438,7 @@ class ContractableBOSS(BaseClassifier):
         # there may be no words if feature selection is too aggressive
         if boss._transformed_data.shape[1] > 0:
             distance_matrix = pairwise_distances(
-                boss._transformed_data, n_jobs=self.n_jobs
+                boss._transformed_data, n_jobs=boss.n_jobs
             )
 
             for i in range(train_size):
@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+"""Distances between bag-of-words histograms stored as CSR matrices.
+
+The dictionary classifiers store the histogram of words of each training case as a
+row of a ``scipy.sparse.csr_matrix``. The kernels here take the index pointer,
+column index and data arrays of two such matrices and find the distance or
+similarity between every pair of rows, which is all the 1-nearest neighbour
+classifiers in the BOSS and TDE ensembles need. The kernels release the GIL, so
+blocks of rows can be computed by threads.
+"""
+
+import numpy as np
+from numba import njit, types
+from numba.typed import Dict, List
+from scipy.sparse import csr_matrix, issparse
+
+# key type of the typed dictionary bags of SFA with a spatial pyramid
+_pyramid_key_type = types.UniTuple(types.int64, 2)
+
+
+def _as_csr(X):
+    # CSR matrix of bags, without copying if X is already one.
+    return X.tocsr() if issparse(X) else csr_matrix(X)
+
+
+def _boss_pairwise_distance(X, Y):
+    """Find the BOSS distance between all pairs of rows of two bag matrices.
+
+    The BOSS distance from bag ``x`` to bag ``y`` is the squared Euclidean distance
+    over the words present in ``x``, so it is not symmetric.
+
+    Parameters
+    ----------
+    X : scipy.sparse.csr_matrix or np.ndarray of shape (n_instances, n_words)
+        Bags to measure the distance from.
+    Y : scipy.sparse.csr_matrix or np.ndarray of shape (m_instances, n_words)
+        Bags to measure the distance to.
+
+    Returns
+    -------
+    np.ndarray of shape (n_instances, m_instances)
+        The BOSS distance from each row of X to each row of Y.
+    """
+    X = _as_csr(X)
+    Y = _as_csr(Y)
+    return _boss_distance_csr(
+        X.indptr,
+        X.indices,
+        X.data,
+        Y.indptr,
+        Y.indices,
+        Y.data,
+        max(X.shape[1], Y.shape[1]),
+    )
+
+
+def _histogram_intersection_pairwise(X, Y):
+    """Find the histogram intersection between all pairs of rows of two bag matrices.
+
+    Parameters
+    ----------
+    X : scipy.sparse.csr_matrix or np.ndarray of shape (n_instances, n_words)
+        First set of bags.
+    Y : scipy.sparse.csr_matrix or np.ndarray of shape (m_instances, n_words)
+        Second set of bags.
+
+    Returns
+    -------
+    np.ndarray of shape (n_instances, m_instances)
+        The sum over words of the smaller count of each word, for each row of X and
+        each row of Y.
+    """
+    X = _as_csr(X)
+    Y = _as_csr(Y)
+    return _histogram_intersection_csr(
+        X.indptr,
+        X.indices,
+        X.data,
+        Y.indptr,
+        Y.indices,
+        Y.data,
+        max(X.shape[1], Y.shape[1]),
+    )
+
+
+def _dict_bags_to_csr(bags, vocabulary=None):
+    """Convert a list of dictionary bags to a CSR matrix.
+
+    Parameters
+    ----------
+    bags : list of dict or numba.typed.Dict
+        Word counts of each instance, as returned by ``SFA``.
+    vocabulary : dict, np.ndarray or None, default=None
+        Column of each word, as returned by a previous call. If None, a vocabulary is
+        created from the words in ``bags``, otherwise words not in the vocabulary are
+        dropped.
+
+    Returns
+    -------
+    bags : scipy.sparse.csr_matrix of shape (n_instances, n_words)
+        The bags, with one column per word.
+    vocabulary : dict or np.ndarray
+        Column of each word. For numba typed dictionaries this is an array with the
+        words of each column, as typed dictionaries cannot be pickled.
+    """
+    if len(bags) > 0 and isinstance(bags[0], Dict):
+        return _typed_bags_to_csr(bags, vocabulary)
+
+    if isinstance(vocabulary, np.ndarray):
+        vocabulary = {
+            (word if len(word) > 1 else word[0]): i
+            for i, word in enumerate(map(tuple, vocabulary.tolist()))
+        }
+    grow = vocabulary is None
+    if grow:
+        vocabulary = {}
+    indptr = np.zeros(len(bags) + 1, dtype=np.int64)
+    indices = []
+    data = []
+    for i, bag in enumerate(bags):
+        for word, count in bag.items():
+            column = vocabulary.get(word)
+            if column is None:
+                if not grow:
+                    continue
+                column = len(vocabulary)
+                vocabulary[word] = column
+            indices.append(column)
+            data.append(count)
+        indptr[i + 1] = len(indices)
+    csr = csr_matrix(
+        (
+            np.asarray(data, dtype=np.uint32),
+            np.asarray(indices, dtype=np.int32),
+            indptr,
+        ),
+        shape=(len(bags), len(vocabulary)),
+    )
+    return csr, vocabulary
+
+
+def _typed_bags_to_csr(bags, vocabulary):
+    # Iterating numba dictionaries from Python is slow, so the bags are converted
+    # in compiled code. Words are int64 or (int64, int64) tuples, and the vocabulary
+    # is returned as an array with a row for the word of each column.
+    pyramid = isinstance(bags[0]._dict_type.key_type, types.UniTuple)
+    if vocabulary is None:
+        grow = True
+        vocabulary = np.zeros((0, 2 if pyramid else 1), dtype=np.int64)
+    else:
+        grow = False
+        if isinstance(vocabulary, dict):
+            vocabulary = np.array(
+                [np.atleast_1d(word) for word in vocabulary], dtype=np.int64
+            ).reshape(len(vocabulary), -1)
+    columns = (
+        _pyramid_vocabulary(vocabulary) if pyramid else _word_vocabulary(vocabulary)
+    )
+
+    indptr, indices, data, n_words = _typed_bags_csr_arrays(List(bags), columns, grow)
+    csr = csr_matrix((data, indices, indptr), shape=(len(bags), n_words))
+    if grow:
+        vocabulary = (
+            _pyramid_vocabulary_words(columns)
+            if pyramid
+            else _word_vocabulary_words(columns)
+        )
+    return csr, vocabulary
+
+
+@njit(cache=True)
+def _word_vocabulary(vocabulary):
+    columns = Dict.empty(key_type=types.int64, value_type=types.int64)
+    for i in range(vocabulary.shape[0]):
+        columns[vocabulary[i, 0]] = i
+    return columns
+
+
+@njit(cache=True)
+def _pyramid_vocabulary(vocabulary):
+    columns = Dict.empty(key_type=_pyramid_key_type, value_type=types.int64)
+    for i in range(vocabulary.shape[0]):
+        columns[(vocabulary[i, 0], vocabulary[i, 1])] = i
+    return columns
+
+
+@njit(cache=True)
+def _word_vocabulary_words(columns):
+    words = np.zeros((len(columns), 1), dtype=np.int64)
+    for word, i in columns.items():
+        words[i, 0] = word
+    return words
+
+
+@njit(cache=True)
+def _pyramid_vocabulary_words(columns):
+    words = np.zeros((len(columns), 2), dtype=np.int64)
+    for word, i in columns.items():
+        words[i, 0] = word[0]
+        words[i, 1] = word[1]
+    return words
+
+
+@njit(cache=True)
+def _typed_bags_csr_arrays(bags, columns, grow):
+    n_values = 0
+    for bag in bags:
+        n_values += len(bag)
+    indptr = np.zeros(len(bags) + 1, dtype=np.int64)
+    indices = np.empty(n_values, dtype=np.int32)
+    data = np.empty(n_values, dtype=np.uint32)
+    nnz = 0
+    for i, bag in enumerate(bags):
+        for word, count in bag.items():
+            if word in columns:
+                column = columns[word]
+            elif grow:
+                column = len(columns)
+                columns[word] = column
+            else:
+                continue
+            indices[nnz] = column
+            data[nnz] = count
+            nnz += 1
+        indptr[i + 1] = nnz
+    return indptr, indices[:nnz], data[:nnz], len(columns)
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _boss_distance_csr(
+    x_indptr, x_indices, x_data, y_indptr, y_indices, y_data, n_words
+):
+    # Each bag of X is scattered into a dense histogram, so each word of a bag of Y
+    # is matched in constant time. The distance sums x^2 over the words of x, and
+    # y^2 - 2xy over the words of y which are in x.
+    n_x = x_indptr.shape[0] - 1
+    n_y = y_indptr.shape[0] - 1
+    distances = np.zeros((n_x, n_y))
+    histogram = np.zeros(n_words)
+    for i in range(n_x):
+        xx = 0.0
+        for k in range(x_indptr[i], x_indptr[i + 1]):
+            value = np.float64(x_data[k])
+            histogram[x_indices[k]] = value
+            xx += value * value
+        for j in range(n_y):
+            distance = xx
+            for k in range(y_indptr[j], y_indptr[j + 1]):
+                x_value = histogram[y_indices[k]]
+                if x_value != 0:
+                    y_value = np.float64(y_data[k])
+                    distance += y_value * y_value - 2 * x_value * y_value
+            distances[i, j] = max(distance, 0.0)
+        for k in range(x_indptr[i], x_indptr[i + 1]):
+            histogram[x_indices[k]] = 0
+    return distances
+
+
+@njit(cache=True, fastmath=True, nogil=True)
+def _histogram_intersection_csr(
+    x_indptr, x_indices, x_data, y_indptr, y_indices, y_data, n_words
+):
+    n_x = x_indptr.shape[0] - 1
+    n_y = y_indptr.shape[0] - 1
+    similarities = np.zeros((n_x, n_y), dtype=np.int64)
+    histogram = np.zeros(n_words, dtype=np.int64)
+    for i in range(n_x):
+        for k in range(x_indptr[i], x_indptr[i + 1]):
+            histogram[x_indices[k]] = x_data[k]
+        for j in range(n_y):
+            similarity = 0
+            for k in range(y_indptr[j], y_indptr[j + 1]):
+                similarity += min(histogram[y_indices[k]], np.int64(y_data[k]))
+            similarities[i, j] = similarity
+        for k in range(x_indptr[i], x_indptr[i + 1]):
+            histogram[x_indices[k]] = 0
+    return similarities
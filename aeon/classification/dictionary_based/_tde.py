@@ -19,9 +19,14 @@ from numba import njit, types
 from numba.typed import Dict
 from sklearn import preprocessing
 from sklearn.kernel_ridge import KernelRidge
-from sklearn.utils import check_random_state
+from sklearn.utils import check_random_state, gen_even_slices
 
 from aeon.classification.base import BaseClassifier
+from aeon.classification.dictionary_based._sparse_bags import (
+    _dict_bags_to_csr,
+    _histogram_intersection_csr,
+    _histogram_intersection_pairwise,
+)
 from aeon.transformations.collection.dictionary_based import SFA
 from aeon.utils.validation.panel import check_X_y
 
@@ -93,7 +98,9 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         leave-one-out cross-validation.
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
-        ``-1`` means using all processors.
+        ``-1`` means using all processors. In `fit`, ensemble members with randomly
+        selected parameters are built in parallel threads, or processes inside a
+        ``joblib.parallel_backend("loky")`` context.
     random_state : int or None, default=None
         Seed for random number generation.
 
@@ -283,6 +290,9 @@ class TemporalDictionaryEnsemble(BaseClassifier):
         else:
             n_parameter_samples = self.n_parameter_samples
             contract_max_n_parameter_samples = np.inf
+        max_n_parameter_samples = (
+            contract_max_n_parameter_samples if time_limit > 0 else n_parameter_samples
+        )
 
         rng = check_random_state(self.random_state)
 
@@ -302,67 +312,80 @@ class TemporalDictionaryEnsemble(BaseClassifier):
             )
             or num_classifiers < n_parameter_samples
         ) and len(possible_parameters) > 0:
+            # Members with randomly selected parameters do not depend on each other,
+            # so a batch of them is drawn in the same order as a sequential fit and
+            # fit in parallel. The batch is no larger than the number of members
+            # still required, so without a time limit the same ensemble is built for
+            # any n_jobs. Parameters selected by the GP depend on the accuracy of
+            # all previous members, so those members are built one at a time.
+            n_batch = 1
             if num_classifiers < self.randomly_selected_params:
-                parameters = possible_parameters.pop(
-                    rng.randint(0, len(possible_parameters))
+                n_batch = min(
+                    self._n_jobs,
+                    len(possible_parameters),
+                    self.randomly_selected_params - num_classifiers,
+                    max_n_parameter_samples - num_classifiers,
                 )
-            else:
-                scaler = preprocessing.StandardScaler()
-                scaler.fit(self._prev_parameters_x)
-                gp = KernelRidge(kernel="poly", degree=1)
-                gp.fit(
-                    scaler.transform(self._prev_parameters_x), self._prev_parameters_y
-                )
-                preds = gp.predict(scaler.transform(possible_parameters))
-                parameters = possible_parameters.pop(
-                    rng.choice(np.flatnonzero(preds == preds.max()))
+
+            batch = []
+            for _ in range(n_batch):
+                if num_classifiers < self.randomly_selected_params:
+                    parameters = possible_parameters.pop(
+                        rng.randint(0, len(possible_parameters))
+                    )
+                else:
+                    scaler = preprocessing.StandardScaler()
+                    scaler.fit(self._prev_parameters_x)
+                    gp = KernelRidge(kernel="poly", degree=1)
+                    gp.fit(
+                        scaler.transform(self._prev_parameters_x),
+                        self._prev_parameters_y,
+                    )
+                    preds = gp.predict(scaler.transform(possible_parameters))
+                    parameters = possible_parameters.pop(
+                        rng.choice(np.flatnonzero(preds == preds.max()))
+                    )
+
+                subsample = rng.choice(
+                    self.n_instances_, size=subsample_size, replace=False
                 )
+                batch.append((parameters, subsample))
 
-            subsample = rng.choice(
-                self.n_instances_, size=subsample_size, replace=False
-            )
-            X_subsample = X[subsample]
-            y_subsample = y[subsample]
-
-            tde = IndividualTDE(
-                *parameters,
-                alphabet_size=self._alphabet_size,
-                bigrams=use_bigrams,
-                dim_threshold=self.dim_threshold,
-                max_dims=self.max_dims,
-                typed_dict=self.typed_dict,
-                n_jobs=self._n_jobs,
-                random_state=self.random_state,
-            )
-            tde.fit(X_subsample, y_subsample)
-            tde._subsample = subsample
-
-            tde._accuracy = self._individual_train_acc(
-                tde,
-                y_subsample,
-                subsample_size,
-                0 if num_classifiers < self.max_ensemble_size else lowest_acc,
+            n_jobs = self._n_jobs if n_batch == 1 else 1
+            estimators = Parallel(n_jobs=self._n_jobs, prefer="threads")(
+                delayed(self._fit_estimator)(
+                    X, y, parameters, subsample, use_bigrams, n_jobs
+                )
+                for parameters, subsample in batch
             )
-            if tde._accuracy > 0:
-                weight = math.pow(tde._accuracy, 4)
-            else:
-                weight = 0.000000001
-
-            if num_classifiers < self.max_ensemble_size:
-                if tde._accuracy < lowest_acc:
-                    lowest_acc = tde._accuracy
-                    lowest_acc_idx = num_classifiers
-                self.weights_.append(weight)
-                self.estimators_.append(tde)
-            elif tde._accuracy > lowest_acc:
-                self.weights_[lowest_acc_idx] = weight
-                self.estimators_[lowest_acc_idx] = tde
-                lowest_acc, lowest_acc_idx = self._worst_ensemble_acc()
-
-            self._prev_parameters_x.append(parameters)
-            self._prev_parameters_y.append(tde._accuracy)
-
-            num_classifiers += 1
+
+            for (parameters, subsample), tde in zip(batch, estimators):
+                tde._accuracy = self._individual_train_acc(
+                    tde,
+                    y[subsample],
+                    subsample_size,
+                    0 if num_classifiers < self.max_ensemble_size else lowest_acc,
+                )
+                if tde._accuracy > 0:
+                    weight = math.pow(tde._accuracy, 4)
+                else:
+                    weight = 0.000000001
+
+                if num_classifiers < self.max_ensemble_size:
+                    if tde._accuracy < lowest_acc:
+                        lowest_acc = tde._accuracy
+                        lowest_acc_idx = num_classifiers
+                    self.weights_.append(weight)
+                    self.estimators_.append(tde)
+                elif tde._accuracy > lowest_acc:
+                    self.weights_[lowest_acc_idx] = weight
+                    self.estimators_[lowest_acc_idx] = tde
+                    lowest_acc, lowest_acc_idx = self._worst_ensemble_acc()
+
+                self._prev_parameters_x.append(parameters)
+                self._prev_parameters_y.append(tde._accuracy)
+
+                num_classifiers += 1
             train_time = time.time() - start_time
 
         self.n_estimators_ = len(self.estimators_)
@@ -425,6 +448,21 @@ class TemporalDictionaryEnsemble(BaseClassifier):
 
         return sums / (np.ones(self.n_classes_) * self._weight_sum)
 
+    def _fit_estimator(self, X, y, parameters, subsample, use_bigrams, n_jobs):
+        tde = IndividualTDE(
+            *parameters,
+            alphabet_size=self._alphabet_size,
+            bigrams=use_bigrams,
+            dim_threshold=self.dim_threshold,
+            max_dims=self.max_dims,
+            typed_dict=self.typed_dict,
+            n_jobs=n_jobs,
+            random_state=self.random_state,
+        )
+        tde.fit(X[subsample], y[subsample])
+        tde._subsample = subsample
+        return tde
+
     def _worst_ensemble_acc(self):
         min_acc = 1.0
         min_acc_idx = 0
@@ -739,6 +777,7 @@ class IndividualTDE(BaseClassifier):
 
         self._transformers = []
         self._transformed_data = []
+        self._vocabulary = {}
         self._class_vals = []
         self._dims = []
         self._highest_dim_bit = 0
@@ -748,38 +787,6 @@ class IndividualTDE(BaseClassifier):
 
         super(IndividualTDE, self).__init__()
 
-    # todo remove along with BOSS and SFA workarounds when Dict becomes serialisable.
-    def __getstate__(self):
-        """Return state as dictionary for pickling, required for typed Dict objects."""
-        state = self.__dict__.copy()
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, ndict in enumerate(state["_transformed_data"]):
-                pdict = dict()
-                for key, val in ndict.items():
-                    pdict[key] = val
-                nl[i] = pdict
-            state["_transformed_data"] = nl
-        return state
-
-    def __setstate__(self, state):
-        """Set current state using input pickling, required for typed Dict objects."""
-        self.__dict__.update(state)
-        if self.typed_dict:
-            nl = [None] * len(self._transformed_data)
-            for i, pdict in enumerate(self._transformed_data):
-                ndict = (
-                    Dict.empty(
-                        key_type=types.UniTuple(types.int64, 2), value_type=types.uint32
-                    )
-                    if self.levels > 1 or self.n_dims_ > 1
-                    else Dict.empty(key_type=types.int64, value_type=types.uint32)
-                )
-                for key, val in pdict.items():
-                    ndict[key] = val
-                nl[i] = ndict
-            self._transformed_data = nl
-
     def _fit(self, X, y):
         """Fit a single base TDE classifier on n_instances cases (X,y).
 
@@ -836,7 +843,7 @@ class IndividualTDE(BaseClassifier):
                         for word, count in dim_words[n].items():
                             words[n][word << self._highest_dim_bit | dim] = count
 
-            self._transformed_data = words
+            bags = words
         else:
             self._transformers.append(
                 SFA(
@@ -858,7 +865,11 @@ class IndividualTDE(BaseClassifier):
             # todo use fit_transform when SFA is interface compliant
             self._transformers[0].fit(X, y)
             sfa = self._transformers[0].transform(X, y)
-            self._transformed_data = sfa[0]
+            bags = sfa[0]
+
+        # the bags are stored as a CSR matrix with a column for each word in the
+        # training data, words only found in test cases do not change the similarity
+        self._transformed_data, self._vocabulary = _dict_bags_to_csr(bags)
 
     def _predict(self, X):
         """Predict class values of all instances in X.
@@ -911,23 +922,31 @@ class IndividualTDE(BaseClassifier):
             test_bags = self._transformers[0].transform(X)
             test_bags = test_bags[0]
 
-        classes = Parallel(n_jobs=self._n_jobs, prefer="threads")(
-            delayed(self._test_nn)(
-                test_bag,
+        test_bags, _ = _dict_bags_to_csr(test_bags, self._vocabulary)
+        similarities = np.zeros(
+            (test_bags.shape[0], self._transformed_data.shape[0]), dtype=np.int64
+        )
+        Parallel(n_jobs=self._n_jobs, prefer="threads")(
+            delayed(_similarity_wrapper)(
+                similarities, test_bags, self._transformed_data, s
             )
-            for test_bag in test_bags
+            for s in gen_even_slices(test_bags.shape[0], self._n_jobs)
         )
 
-        return np.array(classes)
+        return np.array([self._test_nn(sim) for sim in similarities])
 
-    def _test_nn(self, test_bag):
+    def _test_nn(self, similarities):
         rng = check_random_state(self.random_state)
 
+        # Bags are compared in order and ties with the most similar bag so far are
+        # broken at random, so only bags at least as similar as all earlier bags
+        # can be the nearest neighbour.
+        best_before = np.maximum.accumulate(np.concatenate(([-1], similarities[:-1])))
         best_sim = -1
         nn = None
 
-        for n, bag in enumerate(self._transformed_data):
-            sim = histogram_intersection(test_bag, bag)
+        for n in np.flatnonzero(similarities >= best_before):
+            sim = similarities[n]
 
             if sim > best_sim or (sim == best_sim and rng.random() < 0.5):
                 best_sim = sim
@@ -971,10 +990,11 @@ class IndividualTDE(BaseClassifier):
             )
             transformers[i].keep_binning_dft = False
             transformers[i].binning_dft = None
+            bags, _ = _dict_bags_to_csr(sfa[0])
 
             correct = 0
             for i in range(self.n_instances_):
-                if self._train_predict(i, sfa[0]) == y[i]:
+                if self._train_predict(i, bags) == y[i]:
                     correct = correct + 1
 
             accs.append(correct)
@@ -1000,21 +1020,26 @@ class IndividualTDE(BaseClassifier):
         if bags is None:
             bags = self._transformed_data
 
-        test_bag = bags[train_num]
-        best_sim = -1
-        nn = None
-
-        for n, bag in enumerate(bags):
-            if n == train_num:
-                continue
-
-            sim = histogram_intersection(test_bag, bag)
-
-            if sim > best_sim:
-                best_sim = sim
-                nn = self._class_vals[n]
-
-        return nn
+        # the index pointer slice selects the row of the training case without
+        # copying the bags
+        similarities = _histogram_intersection_csr(
+            bags.indptr[train_num : train_num + 2],
+            bags.indices,
+            bags.data,
+            bags.indptr,
+            bags.indices,
+            bags.data,
+            bags.shape[1],
+        )[0]
+        similarities[train_num] = -1
+        nn = np.argmax(similarities)
+
+        return None if similarities[nn] < 0 else self._class_vals[nn]
+
+
+def _similarity_wrapper(similarities, X, Y, s):
+    """Write in-place to a slice of a similarity matrix."""
+    similarities[s] = _histogram_intersection_pairwise(X[s], Y)
 
 
 def histogram_intersection(first, second):
@@ -3,7 +3,7 @@
 import numpy as np
 from sklearn.metrics import accuracy_score
 
-from aeon.classification.dictionary_based import BOSSEnsemble
+from aeon.classification.dictionary_based import BOSSEnsemble, ContractableBOSS
 from aeon.datasets import load_unit_test
 
 
@@ -23,3 +23,21 @@ def test_boss_train_estimate():
     assert train_probas.shape == (20, 2)
     train_preds = boss.classes_[np.argmax(train_probas, axis=1)]
     assert accuracy_score(y_train, train_preds) >= 0.6
+
+
+def test_boss_n_jobs():
+    """Test BOSS and cBOSS build the same ensemble when fit in parallel."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+
+    for cls, params in [
+        (BOSSEnsemble, {"max_ensemble_size": 3}),
+        (ContractableBOSS, {"n_parameter_samples": 6, "max_ensemble_size": 3}),
+    ]:
+        probas = [
+            cls(n_jobs=n_jobs, random_state=0, **params)
+            .fit(X_train, y_train)
+            .predict_proba(X_test)
+            for n_jobs in [1, 2]
+        ]
+        np.testing.assert_array_equal(probas[0], probas[1])
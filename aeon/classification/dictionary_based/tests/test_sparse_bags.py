@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Tests for the distances between sparse bags of words."""
+import numpy as np
+from scipy.sparse import csr_matrix
+
+from aeon.classification.dictionary_based._boss import boss_distance
+from aeon.classification.dictionary_based._sparse_bags import (
+    _boss_pairwise_distance,
+    _dict_bags_to_csr,
+    _histogram_intersection_pairwise,
+)
+from aeon.classification.dictionary_based._tde import histogram_intersection
+
+
+def _random_bags(n_instances, n_words, random_state):
+    rng = np.random.RandomState(random_state)
+    bags = rng.randint(0, 4, size=(n_instances, n_words)).astype(np.uint32)
+    bags[rng.rand(n_instances, n_words) < 0.6] = 0
+    return csr_matrix(bags)
+
+
+def test_boss_pairwise_distance():
+    """Test the CSR BOSS distance against the sparse matrix implementation."""
+    X = _random_bags(7, 30, 0)
+    Y = _random_bags(5, 30, 1)
+    distances = _boss_pairwise_distance(X, Y)
+    assert distances.shape == (7, 5)
+    for i in range(X.shape[0]):
+        np.testing.assert_array_equal(distances[i], boss_distance(X, Y, i)[0])
+    # only words in the first bag count, so the distance is not symmetric
+    assert not np.array_equal(distances, _boss_pairwise_distance(Y, X).T)
+
+
+def test_histogram_intersection_pairwise():
+    """Test the CSR histogram intersection against the dictionary implementation."""
+    X = _random_bags(6, 25, 2)
+    Y = _random_bags(4, 25, 3)
+    similarities = _histogram_intersection_pairwise(X, Y)
+    assert similarities.shape == (6, 4)
+    np.testing.assert_array_equal(
+        similarities, _histogram_intersection_pairwise(Y.toarray(), X).T
+    )
+    dicts_x = [dict(zip(row.indices, row.data)) for row in X]
+    dicts_y = [dict(zip(row.indices, row.data)) for row in Y]
+    for i in range(6):
+        for j in range(4):
+            assert similarities[i, j] == histogram_intersection(dicts_x[i], dicts_y[j])
+
+
+def test_dict_bags_to_csr():
+    """Test dictionary bags are converted with a shared vocabulary."""
+    train = [{(1, 0): 2, (5, 1): 1}, {(5, 1): 3}]
+    bags, vocabulary = _dict_bags_to_csr(train)
+    assert vocabulary == {(1, 0): 0, (5, 1): 1}
+    np.testing.assert_array_equal(bags.toarray(), [[2, 1], [0, 3]])
+
+    # words not in the vocabulary do not change the histogram intersection
+    test, _ = _dict_bags_to_csr([{(5, 1): 2, (7, 0): 4}], vocabulary)
+    np.testing.assert_array_equal(test.toarray(), [[0, 2]])
+    np.testing.assert_array_equal(
+        _histogram_intersection_pairwise(test, bags), [[1, 2]]
+    )
@@ -25,3 +25,23 @@ def test_tde_oob_train_estimate():
     assert isinstance(train_proba, np.ndarray)
     assert train_proba.shape == (len(X_train), 2)
     np.testing.assert_almost_equal(train_proba.sum(axis=1), 1, decimal=4)
+
+
+def test_tde_n_jobs():
+    """Test TDE builds the same ensemble when members are fit in parallel."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+
+    probas = []
+    for n_jobs in [1, 2]:
+        tde = TemporalDictionaryEnsemble(
+            n_parameter_samples=6,
+            max_ensemble_size=3,
+            randomly_selected_params=3,
+            n_jobs=n_jobs,
+            random_state=0,
+        )
+        tde.fit(X_train, y_train)
+        probas.append(tde.predict_proba(X_test))
+
+    np.testing.assert_array_equal(probas[0], probas[1])
@@ -12,9 +12,10 @@ __all__ = ["KNeighborsTimeSeriesClassifier"]
 import numpy as np
 
 from aeon.classification.base import BaseClassifier
-from aeon.distances import get_distance_function
+from aeon.distances import DTWSearchIndex, get_distance_function, nearest_neighbors
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
+ALGORITHMS_SUPPORTED = ["brute", "lower_bound"]
 
 
 class KNeighborsTimeSeriesClassifier(BaseClassifier):
@@ -51,7 +52,14 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
         ``-1`` means using all processors. See :term:`Glossary <n_jobs>`
         for more details.
-        Parameter for compatibility purposes, still unimplemented.
+    algorithm : str, default = 'brute'
+        Algorithm used to find the nearest neighbours, one of:
+            'brute' computes the distance to every training case with
+            aeon.distances.nearest_neighbors.
+            'lower_bound' builds an aeon.distances.DTWSearchIndex of the training
+            cases, which prunes candidates with lower bounds. It finds the same
+            neighbours as 'brute', but only supports the 'dtw' and 'ddtw' distances.
+            Unequal length series are searched with 'brute'.
 
     Examples
     --------
@@ -79,6 +87,7 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         n_neighbors=1,
         weights="uniform",
         n_jobs=1,
+        algorithm="brute",
     ):
         self.distance = distance
         self.distance_params = distance_params
@@ -96,6 +105,13 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             )
         self.weights = weights
 
+        if algorithm not in ALGORITHMS_SUPPORTED:
+            raise ValueError(
+                f"Unrecognised kNN algorithm: {algorithm}. "
+                f"Allowed values are: {ALGORITHMS_SUPPORTED}. "
+            )
+        self.algorithm = algorithm
+
         super(KNeighborsTimeSeriesClassifier, self).__init__()
 
     def _fit(self, X, y):
@@ -114,6 +130,13 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
             self.metric_ = get_distance_function(metric=self.distance)
 
         self.X_ = X
+        self._index = None
+        if self.algorithm == "lower_bound" and isinstance(X, np.ndarray):
+            self._index = DTWSearchIndex(
+                distance=self.distance,
+                distance_params=self._distance_params,
+                n_jobs=self.n_jobs,
+            ).fit(X)
         self.classes_, self.y_ = np.unique(y, return_inverse=True)
         return self
 
@@ -137,12 +160,9 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         self.check_is_fitted()
 
         preds = np.zeros((len(X), len(self.classes_)))
+        idx, weights = self._kneighbors(X)
         for i in range(len(X)):
-            idx, weights = self._kneighbors(X[i])
-            for id, w in zip(idx, weights):
-                predicted_class = self.y_[id]
-                preds[i, predicted_class] += w
-
+            np.add.at(preds[i], self.y_[idx[i]], weights[i])
             preds[i] = preds[i] / np.sum(preds[i])
 
         return preds
@@ -166,21 +186,18 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         self.check_is_fitted()
 
         preds = np.empty(len(X), dtype=self.classes_.dtype)
+        idx, weights = self._kneighbors(X)
         for i in range(len(X)):
             scores = np.zeros(len(self.classes_))
-            idx, weights = self._kneighbors(X[i])
-            for id, w in zip(idx, weights):
-                predicted_class = self.y_[id]
-                scores[predicted_class] += w
-
+            np.add.at(scores, self.y_[idx[i]], weights[i])
             preds[i] = self.classes_[np.argmax(scores)]
 
         return preds
 
     def _kneighbors(self, X):
-        """Find the K-neighbors of a point.
+        """Find the K-neighbors of each case in X.
 
-        Returns indices and weights of each point.
+        Returns indices and weights of the neighbours of each case.
 
         Parameters
         ----------
@@ -192,34 +209,31 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
 
         Returns
         -------
-        ind : array
-            Indices of the nearest points in the population matrix.
-        ws : array
+        ind : array of shape (n_cases, n_neighbors)
+            Indices of the nearest points in the population matrix, ordered by
+            distance.
+        ws : array of shape (n_cases, n_neighbors)
             Array representing the weights of each neighbor.
         """
-        distances = np.array(
-            [
-                self.metric_(X, self.X_[j], **self._distance_params)
-                for j in range(len(self.X_))
-            ]
-        )
-
-        # Find indices of k nearest neighbors using partitioning:
-        # [0..k-1], [k], [k+1..n-1]
-        # They might not be ordered within themselves,
-        # but it is not necessary and partitioning is
-        # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
+        if self._index is not None and isinstance(X, np.ndarray):
+            closest_idx, distances = self._index.kneighbors(X, self.n_neighbors)
+        else:
+            closest_idx, distances = nearest_neighbors(
+                X,
+                self.X_,
+                self.distance,
+                n_neighbors=self.n_neighbors,
+                n_jobs=self.n_jobs,
+                **self._distance_params,
+            )
 
         if self.weights == "distance":
-            ws = distances[closest_idx]
-            ws = ws**2
+            ws = distances**2
 
             # Using epsilon ~= 0 to avoid division by zero
             ws = 1 / (ws + np.finfo(float).eps)
         elif self.weights == "uniform":
-            ws = np.repeat(1.0, self.n_neighbors)
+            ws = np.ones(closest_idx.shape)
         else:
             raise Exception(f"Invalid kNN weights: {self.weights}")
 
@@ -245,5 +259,6 @@ class KNeighborsTimeSeriesClassifier(BaseClassifier):
         """
         # non-default distance and algorithm
         params1 = {"distance": "euclidean"}
+        params2 = {"distance": "dtw", "n_neighbors": 3, "algorithm": "lower_bound"}
 
-        return [params1]
+        return [params1, params2]
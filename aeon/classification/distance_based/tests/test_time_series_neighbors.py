@@ -75,3 +75,29 @@ def test_knn_bounding_matrix(distance_key):
         if pred[j] == y_test[j]:
             correct = correct + 1
     assert correct == expected_correct_window[distance_key]
+
+
+@pytest.mark.parametrize("distance_params", [None, {"window": 0.1}])
+def test_knn_lower_bound_algorithm(distance_params):
+    """Test the lower bound search finds the same neighbours as brute force."""
+    X_train, y_train = load_unit_test(split="train")
+    X_test, _ = load_unit_test(split="test")
+    brute = KNeighborsTimeSeriesClassifier(
+        distance_params=distance_params, n_neighbors=3, weights="distance"
+    )
+    lower_bound = KNeighborsTimeSeriesClassifier(
+        distance_params=distance_params,
+        n_neighbors=3,
+        weights="distance",
+        algorithm="lower_bound",
+    )
+    brute.fit(X_train, y_train)
+    lower_bound.fit(X_train, y_train)
+    assert (brute.predict_proba(X_test) == lower_bound.predict_proba(X_test)).all()
+
+    with pytest.raises(ValueError, match="algorithm"):
+        KNeighborsTimeSeriesClassifier(algorithm="kd_tree")
+    with pytest.raises(ValueError, match="distance must be one of"):
+        KNeighborsTimeSeriesClassifier(distance="msm", algorithm="lower_bound").fit(
+            X_train, y_train
+        )
@@ -9,12 +9,18 @@ representations, using the weighted probabilistic CAWPE as an ensemble controlle
 __author__ = ["MatthewMiddlehurst"]
 __all__ = ["HIVECOTEV2"]
 
+import hashlib
+import os
+import uuid
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np
+from joblib import Parallel, delayed
 from sklearn.metrics import accuracy_score
 from sklearn.utils import check_random_state
 
+from aeon.base import load
 from aeon.classification.base import BaseClassifier
 from aeon.classification.convolution_based import Arsenal
 from aeon.classification.dictionary_based import TemporalDictionaryEnsemble
@@ -46,6 +52,11 @@ class HIVECOTEV2(BaseClassifier):
         Time contract to limit build time in minutes, overriding
         n_estimators/n_parameter_samples for each component.
         Default of 0 means n_estimators/n_parameter_samples for each component is used.
+        Two thirds of the contract is split between the components for building
+        and the rest is left for their train estimates. Components fit at the same
+        time with ``parallel_components`` each get the build time of the round
+        they run in, so with ``n_jobs >= 4`` every component gets the full two
+        thirds.
     save_component_probas : bool, default=False
         When predict/predict_proba is called, save each HIVE-COTEV2 component
         probability predictions in component_probas.
@@ -64,6 +75,17 @@ class HIVECOTEV2(BaseClassifier):
         if None a 'prefer' value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
+    parallel_components : bool, default=False
+        If True and ``n_jobs > 1``, fit the four components at the same time in
+        separate processes, each using an equal share of ``n_jobs``. If False, the
+        components are fit one after another, each using all ``n_jobs``.
+    checkpoint_path : str, Path or None, default=None
+        Directory to save each fitted component and its train probability estimates
+        to, created if it does not exist. When fit is called again with the same
+        parameters and data, for example after a stopped job is restarted, saved
+        components are loaded instead of being fit again. Components are only found
+        again if their ``random_state`` has the same representation, so an int
+        ``random_state`` should be used.
 
     Attributes
     ----------
@@ -120,6 +142,8 @@ class HIVECOTEV2(BaseClassifier):
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
+        parallel_components=False,
+        checkpoint_path=None,
     ):
         self.stc_params = stc_params
         self.drcif_params = drcif_params
@@ -131,6 +155,8 @@ class HIVECOTEV2(BaseClassifier):
         self.random_state = random_state
         self.n_jobs = n_jobs
         self.parallel_backend = parallel_backend
+        self.parallel_components = parallel_components
+        self.checkpoint_path = checkpoint_path
 
         self.stc_weight_ = 0
         self.drcif_weight_ = 0
@@ -195,108 +221,109 @@ class HIVECOTEV2(BaseClassifier):
 
         # If we are contracting split the contract time between each algorithm
         if self.time_limit_in_minutes > 0:
-            # Leave 1/3 for train estimates
-            ct = self.time_limit_in_minutes / 6
+            # Leave 1/3 for train estimates, and split the rest between the rounds
+            # of components fit one after another: four rounds when they are fit
+            # one at a time, one when all four are fit at the same time.
+            rounds = 4
+            if self.parallel_components and self._n_jobs > 1:
+                rounds = -(-4 // min(4, self._n_jobs))
+            ct = self.time_limit_in_minutes * 2 / 3 / rounds
             self._stc_params["time_limit_in_minutes"] = ct
             self._drcif_params["time_limit_in_minutes"] = ct
             self._arsenal_params["time_limit_in_minutes"] = ct
             self._tde_params["time_limit_in_minutes"] = ct
 
-        # Build STC
-        self._stc = ShapeletTransformClassifier(
-            **self._stc_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._stc.fit(X, y)
-
-        if self.verbose > 0:
-            print("STC ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find STC weight using train set estimate
-        train_probs = self._stc._get_train_probs(X, y)
-        train_preds = self._stc.classes_[np.argmax(train_probs, axis=1)]
-        self.stc_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "STC train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("STC weight = " + str(self.stc_weight_))  # noqa
-
-        # Build DrCIF
-        self._drcif = DrCIFClassifier(
-            **self._drcif_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._drcif.fit(X, y)
-
-        if self.verbose > 0:
-            print("DrCIF ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find DrCIF weight using train set estimate
-        train_probs = self._drcif._get_train_probs(X, y)
-        train_preds = self._drcif.classes_[np.argmax(train_probs, axis=1)]
-        self.drcif_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "DrCIF train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("DrCIF weight = " + str(self.drcif_weight_))  # noqa
-
-        # Build Arsenal
-        self._arsenal = Arsenal(
-            **self._arsenal_params,
-            save_transformed_data=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._arsenal.fit(X, y)
-
-        if self.verbose > 0:
-            print("Arsenal ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find Arsenal weight using train set estimate
-        train_probs = self._arsenal._get_train_probs(X, y)
-        train_preds = self._arsenal.classes_[np.argmax(train_probs, axis=1)]
-        self.arsenal_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "Arsenal train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
+        components = {
+            "STC": ShapeletTransformClassifier(
+                **self._stc_params,
+                save_transformed_data=True,
+                random_state=self.random_state,
+            ),
+            "DrCIF": DrCIFClassifier(
+                **self._drcif_params,
+                save_transformed_data=True,
+                random_state=self.random_state,
+            ),
+            "Arsenal": Arsenal(
+                **self._arsenal_params,
+                save_transformed_data=True,
+                random_state=self.random_state,
+            ),
+            "TDE": TemporalDictionaryEnsemble(
+                **self._tde_params,
+                save_train_predictions=True,
+                random_state=self.random_state,
+            ),
+        }
+
+        checkpoint = None
+        if self.checkpoint_path is not None:
+            checkpoint = Path(self.checkpoint_path)
+            checkpoint.mkdir(parents=True, exist_ok=True)
+
+        # Load components saved by a previous fit on the same data
+        fitted = {}
+        keys = {}
+        for name, component in components.items():
+            if checkpoint is not None:
+                keys[name] = _checkpoint_key(name, component, X, y)
+                probs_path = checkpoint / f"{name}_{keys[name]}.npy"
+                if probs_path.exists():
+                    fitted[name] = (
+                        load(str(checkpoint / f"{name}_{keys[name]}")),
+                        np.load(probs_path),
+                    )
+                    if self.verbose > 0:
+                        print(f"{name} loaded from checkpoint")  # noqa
+
+        to_fit = [name for name in components if name not in fitted]
+        if self.parallel_components and self._n_jobs > 1 and len(to_fit) > 1:
+            # Each component is fit in its own process with a share of the threads
+            n_jobs = max(1, self._n_jobs // len(to_fit))
+            results = Parallel(
+                n_jobs=min(len(to_fit), self._n_jobs), prefer="processes"
+            )(
+                delayed(_fit_component)(
+                    name,
+                    components[name].set_params(n_jobs=n_jobs),
+                    X,
+                    y,
+                    checkpoint,
+                    keys.get(name),
+                    self.verbose,
+                )
+                for name in to_fit
             )
-            print("Arsenal weight = " + str(self.arsenal_weight_))  # noqa
-
-        # Build TDE
-        self._tde = TemporalDictionaryEnsemble(
-            **self._tde_params,
-            save_train_predictions=True,
-            random_state=self.random_state,
-            n_jobs=self._n_jobs,
-        )
-        self._tde.fit(X, y)
-
-        if self.verbose > 0:
-            print("TDE ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
-
-        # Find TDE weight using train set estimate
-        train_probs = self._tde._get_train_probs(X, y, train_estimate_method="loocv")
-        train_preds = self._tde.classes_[np.argmax(train_probs, axis=1)]
-        self.tde_weight_ = accuracy_score(y, train_preds) ** 4
-
-        if self.verbose > 0:
-            print(  # noqa
-                "TDE train estimate ",
-                datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
-            )
-            print("TDE weight = " + str(self.tde_weight_))  # noqa
+            fitted.update(zip(to_fit, results))
+        else:
+            for name in to_fit:
+                fitted[name] = _fit_component(
+                    name,
+                    components[name].set_params(n_jobs=self._n_jobs),
+                    X,
+                    y,
+                    checkpoint,
+                    keys.get(name),
+                    self.verbose,
+                )
+
+        # Find the weight of each component using its train set estimate
+        weights = {}
+        for name, (component, train_probs) in fitted.items():
+            train_preds = component.classes_[np.argmax(train_probs, axis=1)]
+            weights[name] = accuracy_score(y, train_preds) ** 4
+
+            if self.verbose > 0:
+                print(f"{name} weight = " + str(weights[name]))  # noqa
+
+        self._stc = fitted["STC"][0]
+        self._drcif = fitted["DrCIF"][0]
+        self._arsenal = fitted["Arsenal"][0]
+        self._tde = fitted["TDE"][0]
+        self.stc_weight_ = weights["STC"]
+        self.drcif_weight_ = weights["DrCIF"]
+        self.arsenal_weight_ = weights["Arsenal"]
+        self.tde_weight_ = weights["TDE"]
 
         return self
 
@@ -460,3 +487,50 @@ class HIVECOTEV2(BaseClassifier):
                     "randomly_selected_params": 1,
                 },
             }
+
+
+def _fit_component(name, component, X, y, checkpoint, key, verbose):
+    # Fit a HIVE-COTE component and find its train probability estimates, saving
+    # both to the checkpoint directory if there is one.
+    component.fit(X, y)
+
+    if verbose > 0:
+        print(name + " ", datetime.now().strftime("%H:%M:%S %d/%m/%Y"))  # noqa
+
+    if isinstance(component, TemporalDictionaryEnsemble):
+        train_probs = component._get_train_probs(X, y, train_estimate_method="loocv")
+    else:
+        train_probs = component._get_train_probs(X, y)
+
+    if verbose > 0:
+        print(  # noqa
+            name + " train estimate ",
+            datetime.now().strftime("%H:%M:%S %d/%m/%Y"),
+        )
+
+    if checkpoint is not None:
+        # Written to temporary names and moved, so a stopped fit never leaves a
+        # partly written component. The probabilities are moved last as they mark a
+        # complete checkpoint.
+        tmp = f"{name}_{key}_{uuid.uuid4().hex}"
+        component.save(checkpoint / tmp).close()
+        os.replace(checkpoint / f"{tmp}.zip", checkpoint / f"{name}_{key}.zip")
+        np.save(checkpoint / f"{tmp}.npy", train_probs)
+        os.replace(checkpoint / f"{tmp}.npy", checkpoint / f"{name}_{key}.npy")
+
+    return component, train_probs
+
+
+def _checkpoint_key(name, component, X, y):
+    # Digest of a component, its parameters other than n_jobs and the train data.
+    params = {
+        k: v for k, v in component.get_params(deep=False).items() if k != "n_jobs"
+    }
+    digest = hashlib.sha1()
+    digest.update(name.encode())
+    digest.update(repr(sorted(params.items())).encode())
+    for a in (X, np.asarray(y)):
+        a = np.ascontiguousarray(a)
+        digest.update(repr((a.shape, a.dtype.str)).encode())
+        digest.update(a.tobytes())
+    return digest.hexdigest()
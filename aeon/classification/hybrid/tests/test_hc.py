@@ -1,10 +1,11 @@
 # -*- coding: utf-8 -*-
 """Tests for HC1."""
+import numpy as np
 import pytest
 
 from aeon.classification.hybrid import HIVECOTEV1, HIVECOTEV2
 from aeon.tests._config import PR_TESTING
-from aeon.utils._testing.collection import make_2d_test_data
+from aeon.utils._testing.collection import make_2d_test_data, make_3d_test_data
 
 
 @pytest.mark.skipif(PR_TESTING, reason="slow test, run overnight only")
@@ -55,3 +56,51 @@ def test_hc2():
     HIVECOTEV2._DEFAULT_N_PARA_SAMPLES = 250
     HIVECOTEV2._DEFAULT_MAX_ENSEMBLE_SIZE = 50
     HIVECOTEV2._DEFAULT_RAND_PARAMS = 50
+
+
+def test_hc2_checkpoint(tmp_path):
+    """Test HC2 saving components to a checkpoint and fitting them in parallel."""
+    X, y = make_3d_test_data(n_cases=10, n_timepoints=20, random_state=0)
+    params = HIVECOTEV2.get_test_params()
+
+    hc2 = HIVECOTEV2(random_state=0, checkpoint_path=tmp_path, **params)
+    hc2.fit(X, y)
+    probas = hc2.predict_proba(X)
+    assert len(list(tmp_path.glob("*.zip"))) == 4
+    assert len(list(tmp_path.glob("*.npy"))) == 4
+
+    # a second fit loads every component from the checkpoint
+    for f in tmp_path.glob("*.npy"):
+        np.save(f, np.load(f)[:, ::-1])
+    hc2 = HIVECOTEV2(random_state=0, checkpoint_path=tmp_path, **params)
+    hc2.fit(X, y)
+    assert hc2._stc is not None
+    assert not np.array_equal(hc2.predict_proba(X), probas)
+
+    hc2 = HIVECOTEV2(random_state=0, parallel_components=True, n_jobs=2, **params)
+    hc2.fit(X, y)
+    np.testing.assert_array_almost_equal(hc2.predict_proba(X), probas)
+
+
+@pytest.mark.parametrize(
+    "parallel_components, n_jobs, expected", [(False, 1, 5 / 6), (True, 4, 10 / 3)]
+)
+def test_hc2_contract_split(parallel_components, n_jobs, expected):
+    """Test components fit at the same time each get the full build contract."""
+    X, y = make_3d_test_data(n_cases=10, n_timepoints=20, random_state=0)
+    params = HIVECOTEV2.get_test_params(parameter_set="contracting")
+
+    hc2 = HIVECOTEV2(
+        random_state=0,
+        parallel_components=parallel_components,
+        n_jobs=n_jobs,
+        **params,
+    )
+    hc2.fit(X, y)
+    for component_params in [
+        hc2._stc_params,
+        hc2._drcif_params,
+        hc2._arsenal_params,
+        hc2._tde_params,
+    ]:
+        assert component_params["time_limit_in_minutes"] == pytest.approx(expected)
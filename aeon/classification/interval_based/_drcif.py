@@ -130,6 +130,11 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
         value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
+    predict_batch_size : int or None, default=None
+        The number of cases to predict at a time. Features are extracted for a block
+        of cases and the predictions of all estimators are summed before the next
+        block, so memory used in predict is bounded by the block size rather than
+        the number of cases. If None, all cases are predicted in a single block.
 
     Attributes
     ----------
@@ -208,6 +213,7 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
+        predict_batch_size=None,
     ):
         d = []
         self.use_pycatch22 = use_pycatch22
@@ -259,6 +265,7 @@ class DrCIFClassifier(BaseIntervalForest, BaseClassifier):
             random_state=random_state,
             n_jobs=n_jobs,
             parallel_backend=parallel_backend,
+            predict_batch_size=predict_batch_size,
         )
 
     @classmethod
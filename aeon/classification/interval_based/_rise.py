@@ -80,6 +80,11 @@ class RandomIntervalSpectralEnsembleClassifier(BaseIntervalForest, BaseClassifie
         value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
+    predict_batch_size : int or None, default=None
+        The number of cases to predict at a time. Features are extracted for a block
+        of cases and the predictions of all estimators are summed before the next
+        block, so memory used in predict is bounded by the block size rather than
+        the number of cases. If None, all cases are predicted in a single block.
 
     Attributes
     ----------
@@ -158,6 +163,7 @@ class RandomIntervalSpectralEnsembleClassifier(BaseIntervalForest, BaseClassifie
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
+        predict_batch_size=None,
     ):
         self.acf_lag = acf_lag
         self.acf_min_values = acf_min_values
@@ -195,6 +201,7 @@ class RandomIntervalSpectralEnsembleClassifier(BaseIntervalForest, BaseClassifie
             random_state=random_state,
             n_jobs=n_jobs,
             parallel_backend=parallel_backend,
+            predict_batch_size=predict_batch_size,
         )
 
     @classmethod
@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
 """Vector sklearn classifiers."""
 __all__ = [
+    "IncrementalRidgeClassifierCV",
     "RotationForestClassifier",
     "ContinuousIntervalTree",
 ]
 
 from aeon.classification.sklearn._continuous_interval_tree import ContinuousIntervalTree
+from aeon.classification.sklearn._incremental_ridge import IncrementalRidgeClassifierCV
 from aeon.classification.sklearn._rotation_forest_classifier import (
     RotationForestClassifier,
 )
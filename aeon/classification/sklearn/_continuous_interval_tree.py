@@ -144,9 +144,7 @@ class ContinuousIntervalTree(BaseEstimator):
         le = preprocessing.LabelEncoder()
         y = le.fit_transform(y)
 
-        rng = check_random_state(self.random_state)
-        self._root = _TreeNode(random_state=rng)
-
+        X = X.astype(np.float64, copy=False)
         thresholds = np.linspace(np.min(X, axis=0), np.max(X, axis=0), self.thresholds)
 
         distribution = np.zeros(self.n_classes_)
@@ -155,17 +153,31 @@ class ContinuousIntervalTree(BaseEstimator):
 
         entropy = _entropy(distribution, distribution.sum())
 
-        self._root.build_tree(
-            X,
-            y,
-            thresholds,
-            entropy,
-            distribution,
-            0,
-            self.max_depth,
-            self.n_classes_,
-            False,
-        )
+        # Ties in information gain and margin are broken with random draws. As the
+        # draws cannot be made from a RandomState in compiled code, the tree is built
+        # with a buffer of draws and rebuilt with a larger one if it runs out, and
+        # only the draws used are taken from the random state.
+        rng = check_random_state(self.random_state)
+        n_draws = 64
+        while True:
+            state = rng.get_state()
+            draws = rng.randint(0, 2, size=n_draws) == 0
+            (
+                self._split,
+                self._threshold,
+                self._gain,
+                self._children,
+                self._leaf_distribution,
+                used_draws,
+            ) = _build_tree(
+                X, y, thresholds, entropy, distribution, self.max_depth, draws
+            )
+            if used_draws <= n_draws:
+                break
+            rng.set_state(state)
+            n_draws *= 4
+        rng.set_state(state)
+        rng.randint(0, 2, size=used_draws)
 
         self._is_fitted = True
         return self
@@ -224,281 +236,281 @@ class ContinuousIntervalTree(BaseEstimator):
             )
         X = self._validate_data(X=X, reset=False, force_all_finite="allow-nan")
 
-        dists = np.zeros((X.shape[0], self.n_classes_))
-        for i in range(X.shape[0]):
-            dists[i] = self._root.predict_proba(X[i], self.n_classes_)
-        return dists
+        return _predict_proba(
+            X.astype(np.float64, copy=False),
+            self._split,
+            self._threshold,
+            self._children,
+            self._leaf_distribution,
+        )
 
     def tree_node_splits_and_gain(self):
-        """Recursively find the split and information gain for each tree node."""
-        splits = []
-        gains = []
-
-        if self._root.best_split > -1:
-            self._find_splits_gain(self._root, splits, gains)
-
-        return splits, gains
-
-    def _find_splits_gain(self, node, splits, gains):
-        """Recursively find the split and information gain for each tree node."""
-        splits.append(node.best_split)
-        gains.append(node.best_gain)
-
-        for next_node in node.children:
-            if next_node.best_split > -1:
-                self._find_splits_gain(next_node, splits, gains)
-
-
-class _TreeNode:
-    """ContinuousIntervalTree tree node."""
+        """Find the split attribute and information gain of each tree node.
 
-    def __init__(
-        self,
-        random_state=None,
-    ):
-        self.random_state = random_state
-
-        self.best_split = -1
-        self.best_threshold = 0
-        self.best_gain = 0.000001
-        self.best_margin = -1
-        self.children = []
-        self.leaf_distribution = []
-        self.depth = -1
+        Returns
+        -------
+        splits : list of int
+            The attribute each node splits on, for all nodes which are not leaves in
+            depth first order.
+        gains : list of float
+            The information gain of the split at each node.
+        """
+        nodes = self._split > -1
+        return self._split[nodes].tolist(), self._gain[nodes].tolist()
+
+
+@njit(cache=True)
+def _build_tree(X, y, thresholds, entropy, distribution, max_depth, draws):
+    # Build the tree depth first, storing each node in a row of arrays. Nodes
+    # are numbered in the order they are built, so each split node is numbered
+    # after its parent and before the nodes of its right and missing branches.
+    n_classes = distribution.shape[0]
+    capacity = 64
+    split = np.full(capacity, -1, dtype=np.int64)
+    threshold = np.zeros(capacity)
+    gain = np.zeros(capacity)
+    children = np.full((capacity, 3), -1, dtype=np.int64)
+    leaf_distribution = np.zeros((capacity, n_classes))
+    n_nodes = 0
+    n_draws = 0
+
+    # parent, branch of parent, cases, entropy, distribution, depth, is leaf
+    stack = [(-1, 0, np.arange(X.shape[0]), entropy, distribution, np.int64(0), False)]
+    while len(stack) > 0:
+        parent, branch, cases, entropy, distribution, depth, leaf = stack.pop()
+
+        node = n_nodes
+        n_nodes += 1
+        if node == capacity:
+            capacity *= 2
+            split = _grow(split, capacity, -1)
+            threshold = _grow(threshold, capacity, 0)
+            gain = _grow(gain, capacity, 0)
+            children = _grow(children, capacity, -1)
+            leaf_distribution = _grow(leaf_distribution, capacity, 0)
+        if parent > -1:
+            children[parent, branch] = node
+
+        best_split = -1
+        if not leaf and _remaining_classes(distribution) and depth < max_depth:
+            best_split, best_threshold, best_gain, n_draws = _best_split(
+                X, y, cases, thresholds, entropy, n_classes, draws, n_draws
+            )
+            if n_draws > draws.shape[0]:
+                break
 
-    def build_tree(
-        self,
-        X,
-        y,
-        thresholds,
-        entropy,
-        distribution,
-        depth,
-        max_depth,
-        n_classes,
-        leaf,
-    ):
-        self.depth = depth
-        best_distributions = []
-        best_entropies = []
-
-        if leaf is False and self.remaining_classes(distribution) and depth < max_depth:
-            for (_, att), threshold in np.ndenumerate(thresholds):
-                (
-                    info_gain,
-                    distributions,
-                    entropies,
-                ) = self.information_gain(X, y, att, threshold, entropy, n_classes)
-
-                if info_gain > self.best_gain:
-                    self.best_split = att
-                    self.best_threshold = threshold
-                    self.best_gain = info_gain
-                    self.best_margin = -1
-                    best_distributions = distributions
-                    best_entropies = entropies
-                elif info_gain == self.best_gain and info_gain > 0.000001:
-                    margin = self.margin_gain(X, att, threshold)
-                    if self.best_margin == -1:
-                        self.best_margin = self.margin_gain(
-                            X, self.best_split, self.best_threshold
-                        )
+        if best_split > -1:
+            split[node] = best_split
+            threshold[node] = best_threshold
+            gain[node] = best_gain
 
-                    if margin > self.best_margin or (
-                        margin == self.best_margin
-                        and self.random_state.choice([True, False])
-                    ):
-                        self.best_split = att
-                        self.best_threshold = threshold
-                        self.best_margin = margin
-                        best_distributions = distributions
-                        best_entropies = entropies
-
-        if self.best_split > -1:
-            self.children = [None, None, None]
-
-            left_idx, right_idx, missing_idx = self.split_data(
-                X, self.best_split, self.best_threshold
+            branches, distributions, entropies = _split_cases(
+                X, y, cases, best_split, best_threshold, n_classes
             )
-
-            if len(left_idx) > 0:
-                self.children[0] = _TreeNode(random_state=self.random_state)
-                self.children[0].build_tree(
-                    X[left_idx],
-                    y[left_idx],
-                    thresholds,
-                    best_entropies[0],
-                    best_distributions[0],
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    False,
-                )
+            # pushed in reverse so the left branch is built first
+            for i in range(2, -1, -1):
+                if branches[i].shape[0] > 0:
+                    stack.append(
+                        (
+                            node,
+                            i,
+                            branches[i],
+                            entropies[i],
+                            distributions[i],
+                            depth + 1,
+                            False,
+                        )
+                    )
+                else:
+                    stack.append(
+                        (node, i, cases, entropy, distribution, depth + 1, True)
+                    )
+        else:
+            leaf_distribution[node] = distribution / np.sum(distribution)
+
+    return (
+        split[:n_nodes],
+        threshold[:n_nodes],
+        gain[:n_nodes],
+        children[:n_nodes],
+        leaf_distribution[:n_nodes],
+        n_draws,
+    )
+
+
+@njit(cache=True)
+def _best_split(X, y, cases, thresholds, parent_entropy, n_classes, draws, n_draws):
+    # Find the attribute and threshold with the highest information gain, using
+    # the margin gain and then a random draw to break ties. Returns a number of
+    # draws larger than the buffer if it runs out.
+    n_thresholds, n_atts = thresholds.shape
+    n_cases = cases.shape[0]
+    gains = np.zeros((n_thresholds, n_atts))
+    values = np.zeros(n_cases)
+    counts = np.zeros((n_cases + 1, n_classes))
+    dist_left = np.zeros(n_classes)
+    dist_right = np.zeros(n_classes)
+    dist_missing = np.zeros(n_classes)
+    dist_all_missing = np.zeros(n_classes)
+    for i in range(n_cases):
+        dist_all_missing[y[cases[i]]] += 1
+
+    # The cases are sorted on each attribute, so the class counts either side of
+    # every threshold are found from cumulative counts.
+    for att in range(n_atts):
+        for i in range(n_cases):
+            values[i] = X[cases[i], att]
+        order = np.argsort(values)
+        sorted_values = values[order]
+        n_valid = 0
+        dist_missing[:] = 0
+        for i in range(n_cases):
+            counts[i + 1] = counts[i]
+            if np.isnan(sorted_values[i]):
+                dist_missing[y[cases[order[i]]]] += 1
             else:
-                self.children[0] = _TreeNode(random_state=self.random_state)
-                self.children[0].build_tree(
-                    X,
-                    y,
-                    thresholds,
-                    entropy,
-                    distribution,
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    True,
-                )
-
-            if len(right_idx) > 0:
-                self.children[1] = _TreeNode(random_state=self.random_state)
-                self.children[1].build_tree(
-                    X[right_idx],
-                    y[right_idx],
-                    thresholds,
-                    best_entropies[1],
-                    best_distributions[1],
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    False,
+                counts[i + 1, y[cases[order[i]]]] += 1
+                n_valid += 1
+
+        for t in range(n_thresholds):
+            if np.isnan(thresholds[t, att]):
+                dist_left[:] = 0
+                dist_right[:] = 0
+                gains[t, att] = _information_gain(
+                    dist_left, dist_right, dist_all_missing, parent_entropy, n_cases
                 )
             else:
-                self.children[1] = _TreeNode(random_state=self.random_state)
-                self.children[1].build_tree(
-                    X,
-                    y,
-                    thresholds,
-                    entropy,
-                    distribution,
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    True,
-                )
-
-            if len(missing_idx) > 0:
-                self.children[2] = _TreeNode(random_state=self.random_state)
-                self.children[2].build_tree(
-                    X[missing_idx],
-                    y[missing_idx],
-                    thresholds,
-                    best_entropies[2],
-                    best_distributions[2],
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    False,
+                k = np.searchsorted(
+                    sorted_values[:n_valid], thresholds[t, att], side="right"
                 )
-            else:
-                self.children[2] = _TreeNode(random_state=self.random_state)
-                self.children[2].build_tree(
-                    X,
-                    y,
-                    thresholds,
-                    entropy,
-                    distribution,
-                    depth + 1,
-                    max_depth,
-                    n_classes,
-                    True,
+                dist_left[:] = counts[k]
+                dist_right[:] = counts[n_valid] - counts[k]
+                gains[t, att] = _information_gain(
+                    dist_left, dist_right, dist_missing, parent_entropy, n_cases
                 )
-        else:
-            self.leaf_distribution = distribution / np.sum(distribution)
 
-        return self
-
-    def predict_proba(self, X, n_classes):
-        if self.best_split > -1:
-            if X[self.best_split] <= self.best_threshold:
-                return self.children[0].predict_proba(X, n_classes)
-            elif X[self.best_split] > self.best_threshold:
-                return self.children[1].predict_proba(X, n_classes)
-            else:
-                return self.children[2].predict_proba(X, n_classes)
+    best_split = -1
+    best_threshold = 0.0
+    best_gain = 0.000001
+    best_margin = -1.0
+    for t in range(n_thresholds):
+        for att in range(n_atts):
+            info_gain = gains[t, att]
+            if info_gain > best_gain:
+                best_split = att
+                best_threshold = thresholds[t, att]
+                best_gain = info_gain
+                best_margin = -1.0
+            elif info_gain == best_gain and info_gain > 0.000001:
+                margin = _margin_gain(X, cases, att, thresholds[t, att])
+                if best_margin == -1:
+                    best_margin = _margin_gain(X, cases, best_split, best_threshold)
+
+                if margin > best_margin:
+                    best_split = att
+                    best_threshold = thresholds[t, att]
+                    best_margin = margin
+                elif margin == best_margin:
+                    if n_draws == draws.shape[0]:
+                        return best_split, best_threshold, best_gain, n_draws + 1
+                    n_draws += 1
+                    if draws[n_draws - 1]:
+                        best_split = att
+                        best_threshold = thresholds[t, att]
+                        best_margin = margin
+
+    return best_split, best_threshold, best_gain, n_draws
+
+
+@njit(cache=True)
+def _split_cases(X, y, cases, att, threshold, n_classes):
+    # Split cases into those less than or equal to the threshold, those greater
+    # and those missing, with the class distribution and entropy of each.
+    branch = np.zeros(cases.shape[0], dtype=np.int64)
+    distributions = np.zeros((3, n_classes))
+    for i in range(cases.shape[0]):
+        value = X[cases[i], att]
+        if value <= threshold:
+            branch[i] = 0
+        elif value > threshold:
+            branch[i] = 1
         else:
-            return self.leaf_distribution
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def information_gain(X, y, attribute, threshold, parent_entropy, n_classes):
-        dist_left = np.zeros(n_classes)
-        dist_right = np.zeros(n_classes)
-        dist_missing = np.zeros(n_classes)
-        for i, case in enumerate(X):
-            if case[attribute] <= threshold:
-                dist_left[y[i]] += 1
-            elif case[attribute] > threshold:
-                dist_right[y[i]] += 1
-            else:
-                dist_missing[y[i]] += 1
-
-        sum_missing = 0
-        for v in dist_missing:
-            sum_missing += v
-        sum_left = 0
-        for v in dist_left:
-            sum_left += v
-        sum_right = 0
-        for v in dist_right:
-            sum_right += v
-
-        entropy_left = _entropy(dist_left, sum_left)
-        entropy_right = _entropy(dist_right, sum_right)
-        entropy_missing = _entropy(dist_missing, sum_missing)
-
-        num_cases = X.shape[0]
-        info_gain = (
-            parent_entropy
-            - sum_left / num_cases * entropy_left
-            - sum_right / num_cases * entropy_right
-            - sum_missing / num_cases * entropy_missing
-        )
+            branch[i] = 2
+        distributions[branch[i], y[cases[i]]] += 1
 
-        return (
-            info_gain,
-            [dist_left, dist_right, dist_missing],
-            [entropy_left, entropy_right, entropy_missing],
-        )
+    branches = [cases[branch == i] for i in range(3)]
+    entropies = np.zeros(3)
+    for i in range(3):
+        entropies[i] = _entropy(distributions[i], np.sum(distributions[i]))
+    return branches, distributions, entropies
 
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def margin_gain(X, attribute, threshold):
-        margins = np.abs(X[:, attribute] - threshold)
-        return np.min(margins)
-
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def split_data(X, best_split, best_threshold):
-        left_idx = np.zeros(len(X), dtype=np.int_)
-        left_count = 0
-        right_idx = np.zeros(len(X), dtype=np.int_)
-        right_count = 0
-        missing_idx = np.zeros(len(X), dtype=np.int_)
-        missing_count = 0
-        for i, case in enumerate(X):
-            if case[best_split] <= best_threshold:
-                left_idx[left_count] = i
-                left_count += 1
-            elif case[best_split] > best_threshold:
-                right_idx[right_count] = i
-                right_count += 1
-            else:
-                missing_idx[missing_count] = i
-                missing_count += 1
-
-        return (
-            left_idx[:left_count],
-            right_idx[:right_count],
-            missing_idx[:missing_count],
-        )
 
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def remaining_classes(distribution):
-        remaining_classes = 0
-        for d in distribution:
-            if d > 0:
-                remaining_classes += 1
-        return remaining_classes > 1
+@njit(fastmath=True, cache=True)
+def _information_gain(dist_left, dist_right, dist_missing, parent_entropy, n_cases):
+    sum_missing = 0
+    for v in dist_missing:
+        sum_missing += v
+    sum_left = 0
+    for v in dist_left:
+        sum_left += v
+    sum_right = 0
+    for v in dist_right:
+        sum_right += v
+
+    entropy_left = _entropy(dist_left, sum_left)
+    entropy_right = _entropy(dist_right, sum_right)
+    entropy_missing = _entropy(dist_missing, sum_missing)
+
+    return (
+        parent_entropy
+        - sum_left / n_cases * entropy_left
+        - sum_right / n_cases * entropy_right
+        - sum_missing / n_cases * entropy_missing
+    )
+
+
+@njit(cache=True)
+def _margin_gain(X, cases, att, threshold):
+    margin = np.inf
+    for i in range(cases.shape[0]):
+        diff = abs(X[cases[i], att] - threshold)
+        if np.isnan(diff):
+            return np.nan
+        margin = min(margin, diff)
+    return margin
+
+
+@njit(cache=True)
+def _remaining_classes(distribution):
+    remaining_classes = 0
+    for d in distribution:
+        if d > 0:
+            remaining_classes += 1
+    return remaining_classes > 1
+
+
+@njit(cache=True)
+def _grow(a, capacity, fill):
+    grown = np.full((capacity,) + a.shape[1:], fill, dtype=a.dtype)
+    grown[: a.shape[0]] = a
+    return grown
+
+
+@njit(cache=True)
+def _predict_proba(X, split, threshold, children, leaf_distribution):
+    dists = np.zeros((X.shape[0], leaf_distribution.shape[1]))
+    for i in range(X.shape[0]):
+        node = 0
+        while split[node] > -1:
+            value = X[i, split[node]]
+            if value <= threshold[node]:
+                node = children[node, 0]
+            elif value > threshold[node]:
+                node = children[node, 1]
+            else:
+                node = children[node, 2]
+        dists[i] = leaf_distribution[node]
+    return dists
 
 
 @njit(fastmath=True, cache=True)
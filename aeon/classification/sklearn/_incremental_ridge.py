@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Ridge classifier with built-in alpha selection that can be trained in batches."""
+
+__all__ = ["IncrementalRidgeClassifierCV"]
+
+import numpy as np
+from sklearn.base import BaseEstimator, ClassifierMixin
+from sklearn.utils.multiclass import check_classification_targets
+from sklearn.utils.validation import check_is_fitted
+
+from aeon.utils._ridge import RidgeStatistics
+
+
+class IncrementalRidgeClassifierCV(ClassifierMixin, BaseEstimator):
+    """Ridge classifier with generalised cross-validation trained in batches.
+
+    As ``sklearn.linear_model.RidgeClassifierCV``, the class labels are encoded as
+    targets of -1 and 1, one per class or a single target for two classes, and a
+    ridge regression is fitted to them, see ``IncrementalRidgeCV``. The regression
+    is updated from each batch passed to ``partial_fit``, and the regularisation
+    strength is selected by generalised cross-validation.
+
+    Parameters
+    ----------
+    alphas : array-like of shape (n_alphas,) or None, default=None
+        Regularisation strengths to select from. If None, ``np.logspace(-3, 3, 10)``
+        is used, as in ``RocketClassifier``.
+    fit_intercept : bool, default=True
+        Whether to fit an intercept.
+    scale : bool, default=True
+        Whether to divide each feature by its standard deviation over all data seen
+        before fitting the ridge regression.
+
+    Attributes
+    ----------
+    classes_ : np.ndarray of shape (n_classes,)
+        The class labels.
+    n_features_in_ : int
+        The number of features.
+    n_instances_ : int
+        The number of instances seen.
+    coef_ : np.ndarray of shape (1, n_features) or (n_classes, n_features)
+        Coefficients of the features, for the unscaled features.
+    intercept_ : np.ndarray of shape (1,) or (n_classes,)
+        The intercept.
+    alpha_ : float
+        The selected regularisation strength.
+    best_score_ : float
+        The negative GCV estimate of the mean squared error of the encoded
+        targets with ``alpha_``.
+
+    See Also
+    --------
+    IncrementalRidgeCV, RocketClassifier
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.classification.sklearn import IncrementalRidgeClassifierCV
+    >>> rng = np.random.RandomState(0)
+    >>> X = rng.randn(100, 5)
+    >>> y = (X[:, 0] > 0).astype(int)
+    >>> ridge = IncrementalRidgeClassifierCV()
+    >>> ridge = ridge.partial_fit(X[:50], y[:50], classes=[0, 1])
+    >>> ridge = ridge.partial_fit(X[50:], y[50:])
+    >>> ridge.score(X, y)
+    0.98
+    """
+
+    def __init__(self, alphas=None, fit_intercept=True, scale=True):
+        self.alphas = alphas
+        self.fit_intercept = fit_intercept
+        self.scale = scale
+
+    def fit(self, X, y):
+        """Fit the ridge classifier to X and y, discarding any previous data.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            The training data.
+        y : np.ndarray of shape (n_instances,)
+            The class labels.
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        if hasattr(self, "classes_"):
+            del self.classes_
+        self._partial_fit(X, y, None, True)
+        self._solve()
+        return self
+
+    def partial_fit(self, X, y, classes=None):
+        """Update the ridge classifier with a batch of data.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            A batch of training data.
+        y : np.ndarray of shape (n_instances,)
+            The class labels of the batch.
+        classes : array-like of shape (n_classes,) or None, default=None
+            All class labels. Required on the first call to ``partial_fit`` and
+            ignored on later calls.
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        return self._partial_fit(X, y, classes, False)
+
+    def _partial_fit(self, X, y, classes, all_classes):
+        # If all_classes, the classes are those in y.
+        first = not hasattr(self, "classes_")
+        X, y = self._validate_data(X, y, reset=first)
+        check_classification_targets(y)
+        if first:
+            if all_classes:
+                classes = y
+            elif classes is None:
+                raise ValueError(
+                    "classes must be passed on the first call to partial_fit"
+                )
+            self.classes_ = np.unique(classes)
+            if len(self.classes_) < 2:
+                raise ValueError(
+                    f"IncrementalRidgeClassifierCV needs at least two classes, but "
+                    f"found {len(self.classes_)} class"
+                )
+            self._statistics = RidgeStatistics()
+        unseen = np.setdiff1d(y, self.classes_)
+        if len(unseen) > 0:
+            raise ValueError(f"y contains labels {unseen} not in classes")
+
+        targets = -np.ones((y.shape[0], len(self.classes_)))
+        targets[np.arange(y.shape[0]), np.searchsorted(self.classes_, y)] = 1
+        if len(self.classes_) == 2:
+            targets = targets[:, 1:]
+        self._statistics.update(X, targets)
+        self.n_instances_ = self._statistics.n_instances
+        self._solved = False
+        return self
+
+    def decision_function(self, X):
+        """Return the ridge regression of the encoded targets for X.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            The data to predict.
+
+        Returns
+        -------
+        np.ndarray of shape (n_instances,) or (n_instances, n_classes)
+            The score of each class, or of the second class if there are two.
+        """
+        X = self._validate_data(X, reset=False)
+        coef, intercept, _, _ = self._solution()
+        scores = X @ coef.T + intercept
+        return scores[:, 0] if len(self.classes_) == 2 else scores
+
+    def predict(self, X):
+        """Predict the class labels of X.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            The data to predict.
+
+        Returns
+        -------
+        np.ndarray of shape (n_instances,)
+            The predicted class labels.
+        """
+        scores = self.decision_function(X)
+        if scores.ndim == 1:
+            return self.classes_[(scores > 0).astype(int)]
+        return self.classes_[np.argmax(scores, axis=1)]
+
+    @property
+    def coef_(self):
+        """Coefficients of the features, for the unscaled features."""
+        return self._solution()[0]
+
+    @property
+    def intercept_(self):
+        """The intercept."""
+        return self._solution()[1]
+
+    @property
+    def alpha_(self):
+        """The selected regularisation strength."""
+        return self._solution()[2]
+
+    @property
+    def best_score_(self):
+        """The negative GCV estimate of the mean squared error with ``alpha_``."""
+        return self._solution()[3]
+
+    def _solution(self):
+        check_is_fitted(self, "classes_")
+        if not self._solved:
+            self._solve()
+        return self._coef, self._intercept, self._alpha, self._best_score
+
+    def _solve(self):
+        coef, self._intercept, self._alpha, self._best_score = self._statistics.solve(
+            self.alphas, self.fit_intercept, self.scale
+        )
+        self._coef = coef.T
+        self._solved = True
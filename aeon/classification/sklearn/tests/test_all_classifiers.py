@@ -5,11 +5,19 @@ __author__ = ["MatthewMiddlehurst"]
 
 from sklearn.utils.estimator_checks import parametrize_with_checks
 
-from aeon.classification.sklearn import ContinuousIntervalTree, RotationForestClassifier
+from aeon.classification.sklearn import (
+    ContinuousIntervalTree,
+    IncrementalRidgeClassifierCV,
+    RotationForestClassifier,
+)
 
 
 @parametrize_with_checks(
-    [RotationForestClassifier(n_estimators=3), ContinuousIntervalTree()]
+    [
+        RotationForestClassifier(n_estimators=3),
+        ContinuousIntervalTree(),
+        IncrementalRidgeClassifierCV(),
+    ]
 )
 def test_sklearn_compatible_estimator(estimator, check):
     """Test that sklearn estimators adhere to sklearn conventions."""
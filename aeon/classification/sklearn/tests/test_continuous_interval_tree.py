@@ -4,7 +4,6 @@ import numpy as np
 import pytest
 
 from aeon.classification.sklearn import ContinuousIntervalTree
-from aeon.classification.sklearn._continuous_interval_tree import _TreeNode
 from aeon.exceptions import NotFittedError
 from aeon.utils._testing.collection import make_2d_test_data, make_3d_test_data
 
@@ -22,9 +21,11 @@ def test_predict_proba():
     X, y = make_2d_test_data(n_cases=5)
     cit = ContinuousIntervalTree(max_depth=1)
     cit.fit(X, y)
-    node = cit._root
-    assert isinstance(node, _TreeNode)
-    assert len(node.children[0].children) == 0
+    # root node and its three leaf children
+    assert cit._split.shape == (4,)
+    assert cit._split[0] > -1
+    np.testing.assert_array_equal(cit._children[0], [1, 2, 3])
+    assert np.all(cit._children[1:] == -1)
     X, y = make_3d_test_data(n_channels=3)
     with pytest.raises(
         ValueError, match="ContinuousIntervalTree is not a time series classifier"
@@ -48,3 +49,27 @@ def test_nan_values():
     X[0:3, 0] = np.inf
     with pytest.raises(ValueError):
         clf.fit(X, y)
+
+
+def test_tree_arrays():
+    """Test the flat tree arrays against predictions and splits of the tree."""
+    rng = np.random.RandomState(0)
+    X = rng.uniform(size=(50, 4))
+    X[:5, 1] = np.nan
+    y = (X[:, 0] + X[:, 2] > 1).astype(int)
+
+    cit = ContinuousIntervalTree(random_state=0)
+    cit.fit(X, y)
+    np.testing.assert_array_equal(cit.predict(X), y)
+
+    splits, gains = cit.tree_node_splits_and_gain()
+    nodes = cit._split > -1
+    assert len(splits) == len(gains) == np.sum(nodes)
+    assert np.all(cit._children[nodes] > np.flatnonzero(nodes)[:, None])
+    assert np.all(cit._children[~nodes] == -1)
+    np.testing.assert_almost_equal(cit._leaf_distribution[~nodes].sum(axis=1), 1)
+
+    # ties are broken by the random state, so the same seed builds the same tree
+    cit2 = ContinuousIntervalTree(random_state=0).fit(X, y)
+    np.testing.assert_array_equal(cit._split, cit2._split)
+    np.testing.assert_array_equal(cit._threshold, cit2._threshold)
@@ -0,0 +1,22 @@
+# -*- coding: utf-8 -*-
+"""Incremental ridge classifier test code."""
+import numpy as np
+import pytest
+
+from aeon.classification.sklearn import IncrementalRidgeClassifierCV
+
+
+def test_incremental_ridge_classifier():
+    """Test the classifier encodes labels as RidgeClassifierCV does."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(90, 4)
+    y = np.array(["a", "b", "c"])[np.argmax(X[:, :3], axis=1)]
+    ridge = IncrementalRidgeClassifierCV()
+    with pytest.raises(ValueError, match="classes must be passed"):
+        ridge.partial_fit(X[:30], y[:30])
+    ridge.partial_fit(X[:30], y[:30], classes=["a", "b", "c"])
+    ridge.partial_fit(X[30:], y[30:])
+    assert ridge.coef_.shape == (3, 4)
+    assert ridge.score(X, y) > 0.9
+    with pytest.raises(ValueError, match="not in classes"):
+        ridge.partial_fit(X[:2], ["a", "d"])
@@ -0,0 +1,266 @@
+# -*- coding: utf-8 -*-
+"""Swap search and distance storage for k-medoids on large collections.
+
+The swaps are searched with FasterPAM [1]_. For each candidate series the change
+in total deviation of swapping it with every medoid is found in a single pass over
+the collection, using the distance from each series to its nearest and second
+nearest medoid, and the best of these swaps is made straight away if it reduces the
+deviation. Only the distances from the candidate and from the medoids are needed,
+so distances can be computed a block of rows at a time rather than all at once.
+
+References
+----------
+.. [1] Schubert, Erich & Rousseeuw, Peter. (2021). Fast and eager k-medoids
+clustering: O(k) runtime improvement of the PAM, CLARA, and CLARANS algorithms.
+Information Systems. 101. 101804. 10.1016/j.is.2021.101804.
+"""
+
+from typing import Callable, Tuple, Union
+
+import numpy as np
+from numba import njit
+
+from aeon.distances import pairwise_distance
+
+# Largest number of rows of distances computed in one call.
+_MAX_BLOCK_ROWS = 256
+
+
+class _DistanceRows:
+    """Rows of the distance matrix of a collection, computed when first needed.
+
+    If ``precompute`` is True and ``max_bytes`` is None or the full matrix fits in
+    it, the full matrix is computed on first use. Otherwise rows are computed a
+    block at a time with ``n_jobs`` threads and kept until ``max_bytes`` is used,
+    after which newly computed rows are discarded. Repeated passes over all rows
+    then reuse the same rows each time, where discarding the least recently used
+    rows would reuse none.
+    """
+
+    def __init__(
+        self,
+        X: np.ndarray,
+        distance: Union[str, Callable],
+        distance_params: dict,
+        max_bytes: int = None,
+        n_jobs: int = 1,
+        precompute: bool = True,
+    ):
+        self.X = X
+        self.distance = distance
+        self.distance_params = distance_params
+        self.n_jobs = n_jobs
+        self.n_instances = X.shape[0]
+        row_bytes = 8 * self.n_instances
+        if max_bytes is None or max_bytes >= row_bytes * self.n_instances:
+            self.max_rows = self.n_instances
+        else:
+            self.max_rows = max_bytes // row_bytes
+        self.precompute = precompute and self.max_rows == self.n_instances
+        self.block_size = int(max(1, min(self.max_rows, _MAX_BLOCK_ROWS)))
+        self._full = None
+        self._rows = {}
+
+    def block(self, start: int, stop: int) -> np.ndarray:
+        """Return the rows from start up to stop."""
+        if self.precompute:
+            return self._full_matrix()[start:stop]
+        return self.rows(np.arange(start, stop))
+
+    def rows(self, indexes: np.ndarray) -> np.ndarray:
+        """Return a new array of the rows at indexes."""
+        if self.precompute:
+            return self._full_matrix()[indexes]
+        missing = [i for i in indexes if i not in self._rows]
+        computed = {}
+        if len(missing) > 0:
+            distances = pairwise_distance(
+                self.X[missing],
+                self.X,
+                metric=self.distance,
+                n_jobs=self.n_jobs,
+                **self.distance_params,
+            )
+            for i, row in zip(missing, distances):
+                computed[i] = row
+                if len(self._rows) < self.max_rows:
+                    self._rows[i] = row
+        return np.array([self._rows.get(i, computed.get(i)) for i in indexes])
+
+    def _full_matrix(self) -> np.ndarray:
+        if self._full is None:
+            self._full = pairwise_distance(
+                self.X,
+                metric=self.distance,
+                n_jobs=self.n_jobs,
+                **self.distance_params,
+            )
+        return self._full
+
+
+def _fasterpam(
+    distances: _DistanceRows, medoids: np.ndarray, max_iter: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, int, bool]:
+    """Improve medoids by swapping them with other series until no swap helps.
+
+    Candidates are visited in order of index, cycling back to the start, and the
+    search stops when every series has been visited since the last swap or after
+    max_iter passes over the collection.
+
+    Parameters
+    ----------
+    distances : _DistanceRows
+        Distances between the series of the collection.
+    medoids : np.ndarray of shape (n_clusters,)
+        Indexes of the initial medoids.
+    max_iter : int
+        Maximum number of passes over the collection.
+
+    Returns
+    -------
+    medoids : np.ndarray of shape (n_clusters,)
+        Indexes of the medoids found.
+    labels : np.ndarray of shape (n_instances,)
+        Position in medoids of the nearest medoid of each series.
+    nearest_distances : np.ndarray of shape (n_instances,)
+        Distance from each series to its nearest medoid.
+    n_iter : int
+        Number of passes made over the collection.
+    converged : bool
+        Whether the search stopped before max_iter passes.
+    """
+    n_instances = distances.n_instances
+    medoids = np.array(medoids, dtype=np.int64)
+    is_medoid = np.zeros(n_instances, dtype=np.bool_)
+    is_medoid[medoids] = True
+    medoid_rows = distances.rows(medoids)
+    nearest, nearest_distances, second_distances = _nearest_medoids(medoid_rows)
+
+    last_swap = -1
+    for n_iter in range(1, max_iter + 1):
+        for start in range(0, n_instances, distances.block_size):
+            stop = min(start + distances.block_size, n_instances)
+            last_swap, converged = _fasterpam_swaps(
+                distances.block(start, stop),
+                np.arange(start, stop),
+                medoids,
+                is_medoid,
+                medoid_rows,
+                nearest,
+                nearest_distances,
+                second_distances,
+                last_swap,
+            )
+            if converged:
+                return medoids, nearest, nearest_distances, n_iter, True
+        if last_swap == -1:
+            return medoids, nearest, nearest_distances, n_iter, True
+    return medoids, nearest, nearest_distances, max_iter, False
+
+
+@njit(cache=True, fastmath=True)
+def _nearest_medoids(
+    medoid_rows: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Position of the nearest medoid of each series and the distances to its
+    # nearest and second nearest medoids. Ties go to the earlier medoid.
+    n_clusters, n_instances = medoid_rows.shape
+    nearest = np.zeros(n_instances, dtype=np.int64)
+    nearest_distances = np.full(n_instances, np.inf)
+    second_distances = np.full(n_instances, np.inf)
+    for i in range(n_instances):
+        for m in range(n_clusters):
+            d = medoid_rows[m, i]
+            if d < nearest_distances[i]:
+                second_distances[i] = nearest_distances[i]
+                nearest_distances[i] = d
+                nearest[i] = m
+            elif d < second_distances[i]:
+                second_distances[i] = d
+    return nearest, nearest_distances, second_distances
+
+
+@njit(cache=True, fastmath=True)
+def _swap_losses(
+    row: np.ndarray,
+    nearest: np.ndarray,
+    nearest_distances: np.ndarray,
+    second_distances: np.ndarray,
+    n_clusters: int,
+) -> Tuple[np.ndarray, float]:
+    # Change in total deviation of swapping each medoid with the series whose
+    # distances are row, split into the change for each medoid and the change
+    # shared by all of them.
+    losses = np.zeros(n_clusters)
+    shared = 0.0
+    for i in range(row.shape[0]):
+        d = row[i]
+        if d < nearest_distances[i]:
+            # Moves to the candidate whichever medoid is removed.
+            shared += d - nearest_distances[i]
+        elif d < second_distances[i]:
+            # Only moves if its nearest medoid is removed.
+            losses[nearest[i]] += d - nearest_distances[i]
+        else:
+            losses[nearest[i]] += second_distances[i] - nearest_distances[i]
+    return losses, shared
+
+
+@njit(cache=True, fastmath=True)
+def _swap_cost(
+    row: np.ndarray,
+    medoid: int,
+    nearest: np.ndarray,
+    nearest_distances: np.ndarray,
+    second_distances: np.ndarray,
+) -> float:
+    # Total deviation after swapping the medoid at position medoid with the series
+    # whose distances are row.
+    cost = 0.0
+    for i in range(row.shape[0]):
+        current = nearest_distances[i]
+        if nearest[i] == medoid:
+            current = second_distances[i]
+        cost += min(row[i], current)
+    return cost
+
+
+@njit(cache=True, fastmath=True)
+def _fasterpam_swaps(
+    rows: np.ndarray,
+    candidates: np.ndarray,
+    medoids: np.ndarray,
+    is_medoid: np.ndarray,
+    medoid_rows: np.ndarray,
+    nearest: np.ndarray,
+    nearest_distances: np.ndarray,
+    second_distances: np.ndarray,
+    last_swap: int,
+) -> Tuple[int, bool]:
+    # Make the best swap of each candidate in turn if it reduces the deviation,
+    # updating the medoids and nearest medoid arrays in place. Returns the last
+    # candidate swapped in and whether the search reached it again without a swap.
+    n_clusters = medoids.shape[0]
+    for b in range(candidates.shape[0]):
+        c = candidates[b]
+        if c == last_swap:
+            return last_swap, True
+        if is_medoid[c]:
+            continue
+        losses, shared = _swap_losses(
+            rows[b], nearest, nearest_distances, second_distances, n_clusters
+        )
+        m = np.argmin(losses)
+        if losses[m] + shared < 0:
+            is_medoid[medoids[m]] = False
+            is_medoid[c] = True
+            medoids[m] = c
+            medoid_rows[m] = rows[b]
+            new_nearest, new_nearest_distances, new_second_distances = _nearest_medoids(
+                medoid_rows
+            )
+            nearest[:] = new_nearest
+            nearest_distances[:] = new_nearest_distances
+            second_distances[:] = new_second_distances
+            last_swap = c
+    return last_swap, False
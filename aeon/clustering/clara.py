@@ -66,6 +66,9 @@ class TimeSeriesCLARA(BaseClusterer):
         Determines random number generation for centroid initialization.
     distance_params : dict, default=None
         Dictionary containing kwargs for the distance metric being used.
+    method : str, default='pam'
+        Method used to cluster each sample, either 'pam' or 'fasterpam'. See
+        :class:`aeon.clustering.TimeSeriesKMedoids`.
 
     Attributes
     ----------
@@ -120,6 +123,7 @@ class TimeSeriesCLARA(BaseClusterer):
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
         distance_params: dict = None,
+        method: str = "pam",
     ):
         self.init_algorithm = init_algorithm
         self.distance = distance
@@ -131,6 +135,7 @@ class TimeSeriesCLARA(BaseClusterer):
         self.distance_params = distance_params
         self.n_samples = n_samples
         self.n_sampling_iters = n_sampling_iters
+        self.method = method
 
         self.cluster_centers_ = None
         self.labels_ = None
@@ -175,7 +180,7 @@ class TimeSeriesCLARA(BaseClusterer):
                 verbose=self.verbose,
                 random_state=self._random_state,
                 distance_params=self.distance_params,
-                method="pam",
+                method=self.method,
             )
             pam.fit(X[sample_idxs])
             if pam.inertia_ < best_score:
@@ -8,6 +8,7 @@ from typing import Callable, Union
 import numpy as np
 from numpy.random import RandomState
 
+from aeon.clustering._fasterpam import _DistanceRows, _nearest_medoids, _swap_cost
 from aeon.clustering.k_medoids import TimeSeriesKMedoids
 
 
@@ -61,6 +62,10 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
         Determines random number generation for centroid initialization.
     distance_params : dict, default=None
         Dictionary containing kwargs for the distance metric being used.
+    max_cache_bytes : int, default=None
+        Maximum size in bytes of the distances kept in memory. Distances from a
+        series to all the others are computed when the series is first tried as a
+        medoid and kept until ``max_cache_bytes`` is used. If None, all are kept.
 
     Attributes
     ----------
@@ -109,6 +114,7 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
         distance_params: dict = None,
+        max_cache_bytes: int = None,
     ):
         self.max_neighbours = max_neighbours
 
@@ -120,6 +126,7 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
             verbose=verbose,
             random_state=random_state,
             distance_params=distance_params,
+            max_cache_bytes=max_cache_bytes,
         )
 
     def _fit_one_init(self, X: np.ndarray, max_neighbours: int):
@@ -130,28 +137,34 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
         else:
             best_medoids = self._init_algorithm
         best_non_medoids = np.setdiff1d(X_indexes, best_medoids)
-        best_cost = (
-            self._compute_pairwise(X, best_non_medoids, best_medoids).min(axis=1).sum()
-        )
+        # Only the distances to the medoids and to the series being swapped in are
+        # needed to find the cost of a swap.
+        medoid_rows = self._distances.rows(best_medoids)
+        nearest, nearest_distances, second_distances = _nearest_medoids(medoid_rows)
+        best_cost = nearest_distances.sum()
         num_non_medoids = X.shape[0] - self.n_clusters
         while j < max_neighbours:
-            new_medoids = best_medoids.copy()
-            new_non_medoids = best_non_medoids.copy()
             to_replace_index = self._random_state.randint(self.n_clusters)
             replace_with_index = self._random_state.randint(num_non_medoids)
-            temp = new_medoids[to_replace_index]
-            new_medoids[to_replace_index] = new_non_medoids[replace_with_index]
-            new_non_medoids[replace_with_index] = temp
-
-            new_cost = (
-                self._compute_pairwise(X, new_non_medoids, new_medoids)
-                .min(axis=1)
-                .sum()
+            candidate = best_non_medoids[replace_with_index]
+            candidate_row = self._distances.rows([candidate])[0]
+
+            new_cost = _swap_cost(
+                candidate_row,
+                to_replace_index,
+                nearest,
+                nearest_distances,
+                second_distances,
             )
             if new_cost < best_cost:
                 best_cost = new_cost
-                best_medoids = new_medoids
+                best_medoids = best_medoids.copy()
+                best_medoids[to_replace_index] = candidate
                 best_non_medoids = np.setdiff1d(X_indexes, best_medoids)
+                medoid_rows[to_replace_index] = candidate_row
+                nearest, nearest_distances, second_distances = _nearest_medoids(
+                    medoid_rows
+                )
             else:
                 j += 1
 
@@ -159,6 +172,13 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
 
     def _fit(self, X: np.ndarray, y=None):
         self._check_params(X)
+        self._distances = _DistanceRows(
+            X,
+            self.distance,
+            self._distance_params,
+            self.max_cache_bytes,
+            precompute=False,
+        )
 
         max_neighbours = self.max_neighbours
         if self.max_neighbours is None:
@@ -175,10 +195,10 @@ class TimeSeriesCLARANS(TimeSeriesKMedoids):
                 best_centers = centers
                 best_cost = cost
 
-        labels, inertia = self._assign_clusters(X, best_centers)
+        labels, distances, _ = _nearest_medoids(self._distances.rows(best_centers))
 
         self.labels_ = labels
-        self.inertia_ = inertia
+        self.inertia_ = distances.sum()
         self.cluster_centers_ = X[best_centers]
         self.n_iter_ = 0
 
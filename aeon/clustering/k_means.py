@@ -7,7 +7,10 @@ from typing import Callable, Union
 import numpy as np
 from numpy.random import RandomState
 
-from aeon.clustering.metrics.averaging import _resolve_average_callable
+from aeon.clustering.metrics.averaging import (
+    _resolve_average_callable,
+    elastic_barycenter_average,
+)
 from aeon.clustering.partitioning import TimeSeriesLloyds
 
 
@@ -50,6 +53,19 @@ class TimeSeriesKMeans(TimeSeriesLloyds):
         Dictionary containing kwargs for averaging_method.
     distance_params : dict, default=None
         Dictionary containing kwargs for the distance metric being used.
+    algorithm : str, default='lloyd'
+        Algorithm used to assign each time series to its closest center, one of
+        ['lloyd', 'elkan', 'lower_bound']. 'elkan' skips distances using the
+        triangle inequality and requires one of the metrics ['euclidean', 'erp',
+        'msm', 'twe'] without a window, and msm with independent=True.
+        'lower_bound' skips distances using DTW lower bounds and requires the 'dtw'
+        metric. All three find the same clusters, see
+        :class:`aeon.clustering.partitioning.TimeSeriesLloyds`.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If ``n_init`` is greater than one the
+        runs are done in parallel in separate processes, otherwise the assignment
+        and 'ba' averaging of each iteration use ``n_jobs`` threads. ``-1`` means
+        use all processors. The result is the same for any value of ``n_jobs``.
 
     Attributes
     ----------
@@ -90,6 +106,8 @@ class TimeSeriesKMeans(TimeSeriesLloyds):
         averaging_method: Union[str, Callable[[np.ndarray], np.ndarray]] = "mean",
         distance_params: dict = None,
         average_params: dict = None,
+        algorithm: str = "lloyd",
+        n_jobs: int = 1,
     ):
         self.averaging_method = averaging_method
         self._averaging_method = _resolve_average_callable(averaging_method)
@@ -109,6 +127,8 @@ class TimeSeriesKMeans(TimeSeriesLloyds):
             verbose,
             random_state,
             distance_params,
+            algorithm,
+            n_jobs,
         )
 
     def _compute_new_cluster_centers(
@@ -128,11 +148,14 @@ class TimeSeriesKMeans(TimeSeriesLloyds):
         np.ndarray (3d of shape (n_clusters, n_dimensions, series_length)
             New cluster center values.
         """
+        average_params = self._average_params
+        if self._averaging_method is elastic_barycenter_average:
+            average_params = {"n_jobs": self._n_jobs, **average_params}
         new_centers = np.zeros((self.n_clusters, X.shape[1], X.shape[2]))
         for i in range(self.n_clusters):
             curr_indexes = np.where(assignment_indexes == i)[0]
 
-            result = self._averaging_method(X[curr_indexes], **self._average_params)
+            result = self._averaging_method(X[curr_indexes], **average_params)
             if result.shape[0] > 0:
                 new_centers[i, :] = result
         return new_centers
@@ -6,12 +6,15 @@ import warnings
 from typing import Callable, Tuple, Union
 
 import numpy as np
+from joblib import Parallel, delayed
 from numpy.random import RandomState
 from sklearn.exceptions import ConvergenceWarning
 from sklearn.utils import check_random_state
 
+from aeon.clustering._fasterpam import _DistanceRows, _fasterpam
 from aeon.clustering.base import BaseClusterer
 from aeon.distances import get_distance_function, pairwise_distance
+from aeon.utils.validation import check_n_jobs
 
 
 class TimeSeriesKMedoids(BaseClusterer):
@@ -60,11 +63,17 @@ class TimeSeriesKMedoids(BaseClusterer):
         a function that takes two 2d numpy arrays as input and returns a float.
     method : str, default='pam'
         Method for computing k-medoids. Any of the following are valid:
-        ['alternate', 'pam'].
+        ['alternate', 'pam', 'fasterpam'].
         Alternate applies lloyds method to k-medoids and is faster but less accurate
         than PAM.
         PAM is implemented using the fastpam1 algorithm which gives the same output
         as PAM but is faster.
+        FasterPAM [6]_ finds the change of swapping a series with every medoid in a
+        single pass over the collection and makes the best swap straight away if it
+        improves the clustering, rather than searching all swaps before making one.
+        It usually finds clusters as good as PAM much faster, and only needs the
+        distances of the series to the medoids and to the series being tried, so
+        with ``max_cache_bytes`` it does not need the full distance matrix.
     n_init : int, default=10
         Number of times the k-medoids algorithm will be run with different
         centroid seeds. The final result will be the best output of n_init
@@ -82,6 +91,20 @@ class TimeSeriesKMedoids(BaseClusterer):
         Determines random number generation for centroid initialization.
     distance_params: dict, default=None
         Dictionary containing kwargs for the distance metric being used.
+    n_jobs : int, default=1
+        The number of jobs to run in parallel. If ``n_init`` is greater than one the
+        runs are done in parallel in separate processes. With ``method='pam'`` the
+        distances between all time series are then computed once, with ``n_jobs``
+        threads, and shared by the runs. ``-1`` means use all processors. The result
+        is the same for any value of ``n_jobs``. With ``method='fasterpam'`` the
+        runs are done one after another, sharing the distances they compute, and
+        the distances are computed with ``n_jobs`` threads.
+    max_cache_bytes : int, default=None
+        Maximum size in bytes of the distances kept in memory by
+        ``method='fasterpam'``. If None, or if the full distance matrix is smaller,
+        the full matrix is computed once. Otherwise distances from a block of series
+        at a time are computed when they are needed, and kept until
+        ``max_cache_bytes`` is used.
 
     Attributes
     ----------
@@ -116,6 +139,9 @@ class TimeSeriesKMedoids(BaseClusterer):
     Clustering time series with k-medoids based algorithms.
     In proceedings of the 8th Workshop on Advanced Analytics and Learning on Temporal
     Data (AALTD 2023).
+    .. [6] Schubert, Erich & Rousseeuw, Peter. (2021). Fast and eager k-medoids
+    clustering: O(k) runtime improvement of the PAM, CLARA, and CLARANS algorithms.
+    Information Systems. 101. 101804. 10.1016/j.is.2021.101804.
 
     Examples
     --------
@@ -153,6 +179,8 @@ class TimeSeriesKMedoids(BaseClusterer):
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
         distance_params: dict = None,
+        n_jobs: int = 1,
+        max_cache_bytes: int = None,
     ):
         self.init_algorithm = init_algorithm
         self.distance = distance
@@ -163,6 +191,8 @@ class TimeSeriesKMedoids(BaseClusterer):
         self.random_state = random_state
         self.distance_params = distance_params
         self.method = method
+        self.n_jobs = n_jobs
+        self.max_cache_bytes = max_cache_bytes
 
         self.cluster_centers_ = None
         self.labels_ = None
@@ -172,6 +202,7 @@ class TimeSeriesKMedoids(BaseClusterer):
         self._random_state = None
         self._init_algorithm = None
         self._distance_cache = None
+        self._distances = None
         self._distance_callable = None
         self._fit_method = None
 
@@ -181,13 +212,32 @@ class TimeSeriesKMedoids(BaseClusterer):
     def _fit(self, X: np.ndarray, y=None):
         self._check_params(X)
 
+        # The initial medoids are all chosen here, in the same order as running the
+        # inits one after another, so the result does not depend on n_jobs.
+        initial_medoids = [self._init_medoids(X) for _ in range(self.n_init)]
+        n_jobs = check_n_jobs(self.n_jobs)
+        # Runs from given medoids are all the same, so are not worth parallelising.
+        if not isinstance(self._init_algorithm, Callable):
+            n_jobs = 1
+        # FasterPAM runs share the distances computed by the runs before them.
+        if self.method == "fasterpam":
+            n_jobs = 1
+        if self.n_init > 1 and n_jobs > 1:
+            if self.method == "pam":
+                self._distance_cache = pairwise_distance(
+                    X, metric=self.distance, n_jobs=n_jobs, **self._distance_params
+                )
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(self._fit_method)(X, medoids) for medoids in initial_medoids
+            )
+        else:
+            results = [self._fit_method(X, medoids) for medoids in initial_medoids]
+
         best_centers = None
         best_inertia = np.inf
         best_labels = None
         best_iters = self.max_iter
-
-        for _ in range(self.n_init):
-            labels, centers, inertia, n_iters = self._fit_method(X)
+        for labels, centers, inertia, n_iters in results:
             if inertia < best_inertia:
                 best_centers = centers
                 best_labels = labels
@@ -226,6 +276,8 @@ class TimeSeriesKMedoids(BaseClusterer):
         return np.array(new_center_indexes)
 
     def _compute_distance(self, X: np.ndarray, first_index: int, second_index: int):
+        if self._distance_cache is None:
+            self._distance_cache = np.full((X.shape[0], X.shape[0]), np.inf)
         # Check cache
         if np.isfinite(self._distance_cache[first_index, second_index]):
             return self._distance_cache[first_index, second_index]
@@ -257,14 +309,15 @@ class TimeSeriesKMedoids(BaseClusterer):
         distance_matrix = self._compute_pairwise(X, indexes, indexes)
         return indexes[np.argmin(sum(distance_matrix))]
 
-    def _pam_fit(self, X: np.ndarray):
+    def _init_medoids(self, X: np.ndarray) -> np.ndarray:
+        if isinstance(self._init_algorithm, Callable):
+            return self._init_algorithm(X)
+        return self._init_algorithm
+
+    def _pam_fit(self, X: np.ndarray, medoids_idxs: np.ndarray):
         old_inertia = np.inf
         n_instances = X.shape[0]
 
-        if isinstance(self._init_algorithm, Callable):
-            medoids_idxs = self._init_algorithm(X)
-        else:
-            medoids_idxs = self._init_algorithm
         not_medoid_idxs = np.arange(n_instances, dtype=int)
         distance_matrix = self._compute_pairwise(X, not_medoid_idxs, not_medoid_idxs)
         distance_closest_medoid, distance_second_closest_medoid = np.sort(
@@ -381,10 +434,27 @@ class TimeSeriesKMedoids(BaseClusterer):
         else:
             return None
 
-    def _alternate_fit(self, X) -> Tuple[np.ndarray, np.ndarray, float, int]:
-        cluster_center_indexes = self._init_algorithm
-        if isinstance(self._init_algorithm, Callable):
-            cluster_center_indexes = self._init_algorithm(X)
+    def _fasterpam_fit(
+        self, X: np.ndarray, medoids_idxs: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, float, int]:
+        medoids_idxs, labels, distances, n_iter, converged = _fasterpam(
+            self._distances, medoids_idxs, self.max_iter
+        )
+        if not converged:
+            warnings.warn(
+                "Maximum number of iteration reached before "
+                "convergence. Consider increasing max_iter to "
+                "improve the fit.",
+                ConvergenceWarning,
+                stacklevel=1,
+            )
+        elif self.verbose:
+            print(f"Converged at iteration {n_iter}.")  # noqa: T001, T201
+        return labels, X[medoids_idxs], distances.sum(), n_iter
+
+    def _alternate_fit(
+        self, X: np.ndarray, cluster_center_indexes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, float, int]:
         old_inertia = np.inf
         old_indexes = None
         for i in range(self.max_iter):
@@ -454,12 +524,22 @@ class TimeSeriesKMedoids(BaseClusterer):
                 f"n_instances ({X.shape[0]})"
             )
         self._distance_callable = get_distance_function(metric=self.distance)
-        self._distance_cache = np.full((X.shape[0], X.shape[0]), np.inf)
+        # The distance matrices are only allocated when they are first used.
+        self._distance_cache = None
+        self._distances = _DistanceRows(
+            X,
+            self.distance,
+            self._distance_params,
+            self.max_cache_bytes,
+            check_n_jobs(self.n_jobs),
+        )
 
         if self.method == "alternate":
             self._fit_method = self._alternate_fit
         elif self.method == "pam":
             self._fit_method = self._pam_fit
+        elif self.method == "fasterpam":
+            self._fit_method = self._fasterpam_fit
         else:
             raise ValueError(f"method {self.method} is not supported")
 
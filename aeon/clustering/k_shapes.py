@@ -1,16 +1,28 @@
 # -*- coding: utf-8 -*-
 """Time series kshapes."""
-from typing import Union
+
+from typing import Tuple, Union
 
 import numpy as np
 from numpy.random import RandomState
+from sklearn.utils import check_random_state
 
 from aeon.clustering.base import BaseClusterer
-from aeon.utils.validation._dependencies import _check_soft_dependencies
+from aeon.distances import sbd_pairwise_distance
+from aeon.distances._sbd import _best_shifts, _z_normalise_collection
+from aeon.utils.validation import check_n_jobs
 
 
 class TimeSeriesKShapes(BaseClusterer):
-    """Kshape algorithm: wrapper of the ``tslearn`` implementation.
+    """Kshape clustering algorithm.
+
+    k-Shape [1]_ assigns each series to the closest centroid under the shape-based
+    distance (SBD), see :func:`aeon.distances.sbd_distance`, and updates each
+    centroid to the series that maximises its squared normalised cross-correlation
+    with the members of the cluster once they are aligned to the old centroid. This
+    is the eigenvector of the largest eigenvalue of the mean centred scatter matrix
+    of the aligned members, found separately for each channel. The series and the
+    centroids are z-normalised.
 
     Parameters
     ----------
@@ -22,35 +34,53 @@ class TimeSeriesKShapes(BaseClusterer):
         ['random']. Or a np.ndarray of shape (n_clusters, n_channels, n_timepoints)
         and gives the initial cluster centres.
     n_init: int, default=10
-        Number of times the k-means algorithm will be run with different
+        Number of times the k-shapes algorithm will be run with different
         centroid seeds. The final result will be the best output of n_init
         consecutive runs in terms of inertia.
-    max_iter: int, default=30
-        Maximum number of iterations of the k-means algorithm for a single
+    max_iter: int, default=300
+        Maximum number of iterations of the k-shapes algorithm for a single
         run.
     tol: float, default=1e-4
-        Relative tolerance with regards to Frobenius norm of the difference
-        in the cluster centres of two consecutive iterations to declare
-        convergence.
+        Decrease in inertia between two consecutive iterations below which the
+        algorithm is considered to have converged.
     verbose: bool, default=False
         Verbosity mode.
     random_state: int or np.random.RandomState instance or None, default=None
         Determines random number generation for centroid initialization.
+    n_jobs : int, default=1
+        The number of threads to use for the distance computations and the
+        alignment of series to centroids. ``-1`` means use all processors.
 
     Attributes
     ----------
+    cluster_centers_ : np.ndarray of shape (n_clusters, n_channels, n_timepoints)
+        z-normalised time series that represent each of the cluster centres.
     labels_: np.ndarray (1d array of shape (n_instances,))
         Labels that is the index each time series belongs to.
     inertia_: float
-        Sum of squared distances of samples to their closest cluster centre, weighted by
-        the sample weights if provided.
+        Sum of the shape-based distances of samples to their closest cluster centre.
     n_iter_: int
         Number of iterations run.
+
+    References
+    ----------
+    .. [1] Paparrizos J. and Gravano L.: k-Shape: Efficient and Accurate Clustering
+    of Time Series. Proceedings of the 2015 ACM SIGMOD International Conference on
+    Management of Data, 2015.
+
+    Examples
+    --------
+    >>> from aeon.clustering.k_shapes import TimeSeriesKShapes
+    >>> from aeon.datasets import load_basic_motions
+    >>> X, _ = load_basic_motions(split="train")
+    >>> clst = TimeSeriesKShapes(n_clusters=3, n_init=2, random_state=1)
+    >>> clst.fit(X)
+    TimeSeriesKShapes(n_clusters=3, n_init=2, random_state=1)
+    >>> preds = clst.predict(X)
     """
 
     _tags = {
         "capability:multivariate": True,
-        "python_dependencies": "tslearn",
     }
 
     def __init__(
@@ -62,6 +92,7 @@ class TimeSeriesKShapes(BaseClusterer):
         tol: float = 1e-4,
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
+        n_jobs: int = 1,
     ):
         self.init_algorithm = init_algorithm
         self.n_init = n_init
@@ -69,13 +100,14 @@ class TimeSeriesKShapes(BaseClusterer):
         self.tol = tol
         self.verbose = verbose
         self.random_state = random_state
+        self.n_jobs = n_jobs
 
         self.cluster_centers_ = None
         self.labels_ = None
         self.inertia_ = None
         self.n_iter_ = 0
 
-        self._tslearn_k_shapes = None
+        self._n_jobs = None
 
         super(TimeSeriesKShapes, self).__init__(n_clusters=n_clusters)
 
@@ -94,26 +126,41 @@ class TimeSeriesKShapes(BaseClusterer):
         self:
             Fitted estimator.
         """
-        _check_soft_dependencies("tslearn", severity="error")
-        from tslearn.clustering import KShape
-
-        self._tslearn_k_shapes = KShape(
-            n_clusters=self.n_clusters,
-            max_iter=self.max_iter,
-            tol=self.tol,
-            random_state=self.random_state,
-            n_init=self.n_init,
-            verbose=self.verbose,
-            init=self.init_algorithm,
-        )
+        self._n_jobs = check_n_jobs(self.n_jobs)
+        _X = _z_normalise_collection(X)
+        initial_centres = self._initial_centres(_X)
 
-        _X = X.swapaxes(1, 2)
+        best_inertia = np.inf
+        for centres in initial_centres:
+            labels, centres, inertia, n_iter = self._fit_one_init(_X, centres)
+            if inertia < best_inertia:
+                best_inertia = inertia
+                self.labels_ = labels
+                self.cluster_centers_ = centres
+                self.inertia_ = inertia
+                self.n_iter_ = n_iter
+        return self
 
-        self._tslearn_k_shapes.fit(_X)
-        self._cluster_centers = self._tslearn_k_shapes.cluster_centers_
-        self.labels_ = self._tslearn_k_shapes.labels_
-        self.inertia_ = self._tslearn_k_shapes.inertia_
-        self.n_iter_ = self._tslearn_k_shapes.n_iter_
+    def _initial_centres(self, X: np.ndarray) -> list:
+        if isinstance(self.init_algorithm, np.ndarray):
+            expected = (self.n_clusters,) + X.shape[1:]
+            if self.init_algorithm.shape != expected:
+                raise ValueError(
+                    f"The init_algorithm array must have shape {expected}, but found "
+                    f"{self.init_algorithm.shape}"
+                )
+            return [_z_normalise_collection(self.init_algorithm)] * self.n_init
+        if self.init_algorithm != "random":
+            raise ValueError(
+                f"The value provided for init_algorithm: {self.init_algorithm} is "
+                f"invalid. The following are a list of valid init algorithms strings: "
+                f"['random']"
+            )
+        random_state = check_random_state(self.random_state)
+        return [
+            X[random_state.choice(X.shape[0], self.n_clusters, replace=False)]
+            for _ in range(self.n_init)
+        ]
 
     def _predict(self, X, y=None) -> np.ndarray:
         """Predict the closest cluster each sample in X belongs to.
@@ -130,8 +177,71 @@ class TimeSeriesKShapes(BaseClusterer):
         np.ndarray (1d array of shape (n_instances,))
             Index of the cluster each time series in X belongs to.
         """
-        _X = X.swapaxes(1, 2)
-        return self._tslearn_k_shapes.predict(_X)
+        return self._assign_clusters(_z_normalise_collection(X), self.cluster_centers_)[
+            0
+        ]
+
+    def _fit_one_init(
+        self, X: np.ndarray, cluster_centres: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, float, int]:
+        # One run of k-shapes from the initial centres. Stops when the inertia
+        # decreases by less than tol or the labels do not change, and keeps the
+        # previous centres if an update increases the inertia.
+        labels, inertia = self._assign_clusters(X, cluster_centres)
+        for i in range(self.max_iter):
+            new_centres = self._compute_new_cluster_centers(X, labels, cluster_centres)
+            new_labels, new_inertia = self._assign_clusters(X, new_centres)
+            if self.verbose is True:
+                print(f"Iteration {i}, inertia {new_inertia}.")  # noqa: T001, T201
+            if new_inertia > inertia:
+                break
+            converged = inertia - new_inertia < self.tol or np.array_equal(
+                labels, new_labels
+            )
+            labels, cluster_centres, inertia = new_labels, new_centres, new_inertia
+            if converged:
+                break
+        return labels, cluster_centres, inertia, i + 1
+
+    def _assign_clusters(
+        self, X: np.ndarray, cluster_centres: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        pairwise = sbd_pairwise_distance(
+            X, cluster_centres, standardize=False, n_jobs=self._n_jobs
+        )
+        return pairwise.argmin(axis=1), pairwise.min(axis=1).sum()
+
+    def _compute_new_cluster_centers(
+        self, X: np.ndarray, labels: np.ndarray, cluster_centres: np.ndarray
+    ) -> np.ndarray:
+        # Clusters with no members keep their old centre.
+        new_centres = np.array(cluster_centres)
+        for k in range(self.n_clusters):
+            members = X[labels == k]
+            if members.shape[0] > 0:
+                new_centres[k] = self._shape_extraction(members, cluster_centres[k])
+        return new_centres
+
+    def _shape_extraction(self, X: np.ndarray, centre: np.ndarray) -> np.ndarray:
+        # The members are aligned to the old centre, unless it is zero everywhere,
+        # then the centre of each channel is the leading eigenvector of Q^T S Q,
+        # where S is the scatter matrix of the aligned members and Q centres them.
+        if np.any(centre):
+            X = _shift(X, _best_shifts(centre, X, self._n_jobs))
+        scatter = np.matmul(X.transpose((1, 2, 0)), X.transpose((1, 0, 2)))
+        scatter = (
+            scatter
+            - scatter.mean(axis=1, keepdims=True)
+            - scatter.mean(axis=2, keepdims=True)
+            + scatter.mean(axis=(1, 2), keepdims=True)
+        )
+        _, vectors = np.linalg.eigh(scatter)
+        new_centre = vectors[:, :, -1]
+        # Eigenvectors have an arbitrary sign, take the one closer to the members.
+        plus = np.linalg.norm(X - new_centre, axis=2).sum(axis=0)
+        minus = np.linalg.norm(X + new_centre, axis=2).sum(axis=0)
+        new_centre[minus < plus] *= -1
+        return _z_normalise_collection(new_centre[np.newaxis])[0]
 
     @classmethod
     def get_test_params(cls, parameter_set="default"):
@@ -164,3 +274,15 @@ class TimeSeriesKShapes(BaseClusterer):
 
     def _score(self, X, y=None):
         return np.abs(self.inertia_)
+
+
+def _shift(X: np.ndarray, shifts: np.ndarray) -> np.ndarray:
+    # Move each series of X forward by its shift, or back if negative, filling with
+    # zeros.
+    n_timepoints = X.shape[2]
+    indexes = np.arange(n_timepoints) - shifts[:, np.newaxis]
+    valid = (indexes >= 0) & (indexes < n_timepoints)
+    shifted = np.take_along_axis(
+        X, np.clip(indexes, 0, n_timepoints - 1)[:, np.newaxis, :], axis=2
+    )
+    return shifted * valid[:, np.newaxis, :]
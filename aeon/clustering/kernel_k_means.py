@@ -1,16 +1,30 @@
 # -*- coding: utf-8 -*-
 """Time series kernel kmeans."""
-from typing import Dict, Union
+
+from typing import Dict, Tuple, Union
 
 import numpy as np
 from numpy.random import RandomState
+from sklearn.metrics.pairwise import pairwise_kernels
+from sklearn.utils import check_random_state
 
 from aeon.clustering.base import BaseClusterer
-from aeon.utils.validation._dependencies import _check_soft_dependencies
+from aeon.distances import gak_pairwise_kernel
+from aeon.distances._gak import _sigma_gak
+from aeon.utils.validation import check_n_jobs
 
 
 class TimeSeriesKernelKMeans(BaseClusterer):
-    """Kernel K Means [1]_: wrapper of the ``tslearn`` implementation.
+    """Kernel K Means [1]_.
+
+    Kernel k-means clusters the series in the feature space of a kernel, where the
+    squared distance from a series to the mean of a cluster is found from the kernel
+    matrix alone. By default the full kernel matrix of the training series is
+    computed, which takes memory and time quadratic in the number of series. If
+    ``n_landmarks`` is set the kernel is approximated with the Nystroem method [3]_
+    from the kernel between every series and that many randomly chosen landmark
+    series, so memory and time are linear in the number of series, and the series
+    are clustered with k-means on the approximate feature vectors.
 
     Parameters
     ----------
@@ -19,10 +33,11 @@ class TimeSeriesKernelKMeans(BaseClusterer):
         centroids to generate.
     kernel : string, or callable (default: "gak")
         The kernel should either be "gak", in which case the Global Alignment
-        Kernel from [1]_ is used, or a value that is accepted as a metric
-        by `scikit-learn's pairwise_kernels
+        Kernel from [2]_ is used, see :func:`aeon.distances.gak_pairwise_kernel`, or
+        a value that is accepted as a metric by `scikit-learn's pairwise_kernels
         <https://scikit-learn.org/stable/modules/generated/\
-        sklearn.metrics.pairwise.pairwise_kernels.html>`_
+        sklearn.metrics.pairwise.pairwise_kernels.html>`_, which is applied to the
+        flattened series.
     n_init: int, default=10
         Number of times the k-means algorithm will be run with different
         centroid seeds. The final result will be the best output of ``n_init``
@@ -30,50 +45,60 @@ class TimeSeriesKernelKMeans(BaseClusterer):
     kernel_params : dict or None (default: None)
         Kernel parameters to be passed to the kernel function.
         None means no kernel parameter is set.
-        For Global Alignment Kernel, the only parameter of interest is ``sigma``.
-        If set to 'auto', it is computed based on a sampling of the training
-        set
-        (cf :ref:`tslearn.metrics.sigma_gak <fun-tslearn.metrics.sigma_gak>`).
-        If no specific value is set for ``sigma``, its default to 1.
+        For Global Alignment Kernel, the parameters are ``sigma``, ``window`` and
+        ``itakura_max_slope``. If ``sigma`` is 'auto', it is the median distance
+        between a sample of time points of the training set multiplied by the square
+        root of the series length. If no specific value is set for ``sigma``, its
+        default to 1.
     max_iter: int, default=300
         Maximum number of iterations of the k-means algorithm for a single
         run.
     tol: float, default=1e-4
-        Relative tolerance with regards to Frobenius norm of the difference
-        in the cluster centers of two consecutive iterations to declare
-        convergence.
+        Decrease in inertia between two consecutive iterations below which the
+        algorithm is considered to have converged.
     verbose: bool, default=False
         Verbosity mode.
     n_jobs : int or None, optional (default=None)
-        The number of jobs to run in parallel for GAK cross-similarity matrix
-        computations.
-        ``None`` means 1 unless in a :obj:`joblib.parallel_backend` context.
-        ``-1`` means using all processors. See scikit-learns'
-        `Glossary <https://scikit-learn.org/stable/glossary.html#term-n-jobs>`_
-        for more details.
+        The number of threads to use to compute the kernel matrix. ``None`` means 1,
+        ``-1`` means using all processors.
     random_state: int or np.random.RandomState instance or None, default=None
-        Determines random number generation for centroid initialization.
+        Determines random number generation for centroid initialization and the
+        choice of landmarks.
+    n_landmarks : int or None, default=None
+        Number of landmark series for the Nystroem approximation of the kernel. If
+        None the full kernel matrix is used.
 
     Attributes
     ----------
     labels_: np.ndarray (1d array of shape (n_instance,))
         Labels that is the index each time series belongs to.
     inertia_: float
-        Sum of squared distances of samples to their closest cluster center, weighted by
-        the sample weights if provided.
+        Sum of squared distances in the kernel feature space of samples to their
+        closest cluster center.
     n_iter_: int
         Number of iterations run.
 
-    Reference
-    ---------
-        .. [1] Kernel k-means, Spectral Clustering and Normalized Cuts. Inderjit S.
-        Dhillon, Yuqiang Guan, Brian Kulis. KDD 2004.
-        .. [2] Fast Global Alignment Kernels. Marco Cuturi. ICML 2011.
+    References
+    ----------
+    .. [1] Kernel k-means, Spectral Clustering and Normalized Cuts. Inderjit S.
+    Dhillon, Yuqiang Guan, Brian Kulis. KDD 2004.
+    .. [2] Fast Global Alignment Kernels. Marco Cuturi. ICML 2011.
+    .. [3] Using the Nystroem Method to Speed Up Kernel Machines. Christopher K. I.
+    Williams, Matthias Seeger. NIPS 2000.
+
+    Examples
+    --------
+    >>> from aeon.clustering.kernel_k_means import TimeSeriesKernelKMeans
+    >>> from aeon.datasets import load_basic_motions
+    >>> X, _ = load_basic_motions(split="train")
+    >>> clst = TimeSeriesKernelKMeans(n_clusters=3, n_landmarks=10, random_state=1)
+    >>> clst.fit(X)
+    TimeSeriesKernelKMeans(n_clusters=3, n_landmarks=10, random_state=1)
+    >>> preds = clst.predict(X)
     """
 
     _tags = {
         "capability:multivariate": True,
-        "python_dependencies": "tslearn",
     }
 
     def __init__(
@@ -87,6 +112,7 @@ class TimeSeriesKernelKMeans(BaseClusterer):
         verbose: bool = False,
         n_jobs: Union[int, None] = None,
         random_state: Union[int, RandomState] = None,
+        n_landmarks: Union[int, None] = None,
     ):
         self.kernel = kernel
         self.n_init = n_init
@@ -96,16 +122,43 @@ class TimeSeriesKernelKMeans(BaseClusterer):
         self.verbose = verbose
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.n_landmarks = n_landmarks
 
         self.cluster_centers_ = None
         self.labels_ = None
         self.inertia_ = None
         self.n_iter_ = 0
 
-        self._tslearn_kernel_k_means = None
+        self._random_state = None
+        self._kernel_params = None
+        self._n_jobs = None
+        self._X = None
+        self._weights = None
+        self._within = None
+        self._landmarks = None
+        self._normalization = None
+        self._centres = None
+        self._empty = None
 
         super(TimeSeriesKernelKMeans, self).__init__(n_clusters=n_clusters)
 
+    def _check_params(self, X: np.ndarray) -> None:
+        self._random_state = check_random_state(self.random_state)
+        self._n_jobs = check_n_jobs(self.n_jobs)
+        self._kernel_params = (
+            {} if self.kernel_params is None else dict(self.kernel_params)
+        )
+        if self.kernel == "gak" and self._kernel_params.get("sigma") == "auto":
+            self._kernel_params["sigma"] = _sigma_gak(
+                X, random_state=self._random_state
+            )
+        if self.n_landmarks is not None and self.n_landmarks < 1:
+            raise ValueError(
+                f"n_landmarks must be None or at least 1, but found {self.n_landmarks}"
+            )
+        if self.max_iter < 1:
+            raise ValueError(f"max_iter must be at least 1, but found {self.max_iter}")
+
     def _fit(self, X, y=None):
         """Fit time series clusterer to training data.
 
@@ -121,30 +174,80 @@ class TimeSeriesKernelKMeans(BaseClusterer):
         self:
             Fitted estimator.
         """
-        _check_soft_dependencies("tslearn", severity="error")
-        from tslearn.clustering import KernelKMeans as TsLearnKernelKMeans
-
-        verbose = 0
-        if self.verbose is True:
-            verbose = 1
-
-        self._tslearn_kernel_k_means = TsLearnKernelKMeans(
-            n_clusters=self.n_clusters,
-            kernel=self.kernel,
-            max_iter=self.max_iter,
-            tol=self.tol,
-            n_init=self.n_init,
-            kernel_params=self.kernel_params,
-            n_jobs=self.n_jobs,
-            verbose=verbose,
-            random_state=self.random_state,
-        )
+        self._check_params(X)
+        n_instances = X.shape[0]
+        if self.n_landmarks is None:
+            self._X = X
+            kernel = self._kernel(X)
+            diagonal = np.diag(kernel)
+        else:
+            landmarks = self._random_state.choice(
+                n_instances, min(self.n_landmarks, n_instances), replace=False
+            )
+            self._landmarks = X[landmarks]
+            self._normalization = _nystroem_normalization(self._kernel(self._landmarks))
+            features = self._features(X)
+
+        initial_centres = [
+            self._random_state.choice(n_instances, self.n_clusters, replace=False)
+            for _ in range(self.n_init)
+        ]
+        best_inertia = np.inf
+        for centres in initial_centres:
+            if self.n_landmarks is None:
+                labels, inertia, n_iter = self._fit_one_init(
+                    lambda labels: _kernel_distances(
+                        kernel, diagonal, labels, self.n_clusters
+                    ),
+                    diagonal[:, np.newaxis]
+                    - 2 * kernel[:, centres]
+                    + diagonal[centres][np.newaxis],
+                )
+            else:
+                labels, inertia, n_iter = self._fit_one_init(
+                    lambda labels: _feature_distances(
+                        features, labels, self.n_clusters
+                    )[0],
+                    _squared_distances(features, features[centres]),
+                )
+            if inertia < best_inertia:
+                best_inertia = inertia
+                self.labels_ = labels
+                self.inertia_ = inertia
+                self.n_iter_ = n_iter
+
+        self._empty = np.bincount(self.labels_, minlength=self.n_clusters) == 0
+        if self.n_landmarks is None:
+            self._weights = _cluster_weights(self.labels_, self.n_clusters)
+            self._within = np.sum(self._weights * (kernel @ self._weights), axis=0)
+        else:
+            self._centres = _feature_distances(features, self.labels_, self.n_clusters)[
+                1
+            ]
+        return self
 
-        _X = X.swapaxes(1, 2)
-        self._tslearn_kernel_k_means.fit(_X)
-        self.labels_ = self._tslearn_kernel_k_means.labels_
-        self.inertia_ = self._tslearn_kernel_k_means.inertia_
-        self.n_iter_ = self._tslearn_kernel_k_means.n_iter_
+    def _fit_one_init(
+        self, centre_distances, initial_distances: np.ndarray
+    ) -> Tuple[np.ndarray, float, int]:
+        # One run of kernel k-means. centre_distances returns the squared distances
+        # from each series to the mean of each cluster given the labels, with an
+        # infinite distance to empty clusters.
+        labels = initial_distances.argmin(axis=1)
+        old_inertia = np.inf
+        for i in range(self.max_iter):
+            distances = centre_distances(labels)
+            new_labels = distances.argmin(axis=1)
+            inertia = distances[np.arange(len(labels)), new_labels].sum()
+            if self.verbose is True:
+                print(f"Iteration {i}, inertia {inertia}.")  # noqa: T001, T201
+            converged = np.abs(old_inertia - inertia) < self.tol or np.array_equal(
+                labels, new_labels
+            )
+            labels = new_labels
+            old_inertia = inertia
+            if converged:
+                break
+        return labels, inertia, i + 1
 
     def _predict(self, X, y=None) -> np.ndarray:
         """Predict the closest cluster each sample in X belongs to.
@@ -161,8 +264,29 @@ class TimeSeriesKernelKMeans(BaseClusterer):
         np.ndarray (1d array of shape (n_instances,))
             Index of the cluster each time series in X belongs to.
         """
-        _X = X.swapaxes(1, 2)
-        return self._tslearn_kernel_k_means.predict(_X)
+        if self.n_landmarks is None:
+            # k(x, x) is the same for every cluster so does not change the closest.
+            distances = -2 * self._kernel(X, self._X) @ self._weights + self._within
+        else:
+            distances = _squared_distances(self._features(X), self._centres)
+        distances[:, self._empty] = np.inf
+        return distances.argmin(axis=1)
+
+    def _kernel(self, X: np.ndarray, Y: np.ndarray = None) -> np.ndarray:
+        if self.kernel == "gak":
+            return gak_pairwise_kernel(
+                X, Y, n_jobs=self._n_jobs, **{"sigma": 1.0, **self._kernel_params}
+            )
+        return pairwise_kernels(
+            X.reshape((X.shape[0], -1)),
+            None if Y is None else Y.reshape((Y.shape[0], -1)),
+            metric=self.kernel,
+            n_jobs=self._n_jobs,
+            **self._kernel_params,
+        )
+
+    def _features(self, X: np.ndarray) -> np.ndarray:
+        return self._kernel(X, self._landmarks) @ self._normalization
 
     @classmethod
     def get_test_params(cls, parameter_set="default") -> Dict:
@@ -197,3 +321,54 @@ class TimeSeriesKernelKMeans(BaseClusterer):
 
     def _score(self, X, y=None) -> float:
         return np.abs(self.inertia_)
+
+
+def _cluster_weights(labels: np.ndarray, n_clusters: int) -> np.ndarray:
+    # Matrix of shape (n_instances, n_clusters) where column k averages the series
+    # in cluster k.
+    weights = np.zeros((labels.shape[0], n_clusters))
+    weights[np.arange(labels.shape[0]), labels] = 1.0
+    sizes = weights.sum(axis=0)
+    return weights / np.where(sizes == 0, 1.0, sizes)
+
+
+def _kernel_distances(
+    kernel: np.ndarray, diagonal: np.ndarray, labels: np.ndarray, n_clusters: int
+) -> np.ndarray:
+    # Squared distances in feature space from each series to the mean of each
+    # cluster, k(x, x) - 2 mean_j k(x, x_j) + mean_jl k(x_j, x_l).
+    weights = _cluster_weights(labels, n_clusters)
+    weighted = kernel @ weights
+    within = np.sum(weights * weighted, axis=0)
+    distances = diagonal[:, np.newaxis] - 2 * weighted + within[np.newaxis]
+    distances[:, np.bincount(labels, minlength=n_clusters) == 0] = np.inf
+    return distances
+
+
+def _feature_distances(
+    features: np.ndarray, labels: np.ndarray, n_clusters: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    # Squared distances from each feature vector to the mean of each cluster, and
+    # the means.
+    centres = _cluster_weights(labels, n_clusters).T @ features
+    distances = _squared_distances(features, centres)
+    distances[:, np.bincount(labels, minlength=n_clusters) == 0] = np.inf
+    return distances, centres
+
+
+def _squared_distances(features: np.ndarray, centres: np.ndarray) -> np.ndarray:
+    distances = (
+        np.sum(features * features, axis=1)[:, np.newaxis]
+        - 2 * features @ centres.T
+        + np.sum(centres * centres, axis=1)[np.newaxis]
+    )
+    return np.maximum(distances, 0.0)
+
+
+def _nystroem_normalization(landmark_kernel: np.ndarray) -> np.ndarray:
+    # Matrix mapping the kernel between a series and the landmarks to its
+    # approximate feature vector, the pseudo inverse square root of the kernel
+    # matrix of the landmarks.
+    eigenvalues, eigenvectors = np.linalg.eigh(landmark_kernel)
+    keep = eigenvalues > 1e-12 * max(eigenvalues[-1], 0.0)
+    return eigenvectors[:, keep] / np.sqrt(eigenvalues[keep])
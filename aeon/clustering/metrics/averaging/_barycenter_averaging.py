@@ -1,10 +1,10 @@
 # -*- coding: utf-8 -*-
 __author__ = ["chrisholder"]
 
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.clustering.metrics.medoids import medoids
 from aeon.distances import (
@@ -20,8 +20,25 @@ from aeon.distances import (
     wddtw_alignment_path,
     wdtw_alignment_path,
 )
+from aeon.utils._threading import threaded
+
+_BA_METRICS = (
+    "dtw",
+    "ddtw",
+    "wdtw",
+    "wddtw",
+    "erp",
+    "edr",
+    "twe",
+    "msm",
+    "shape_dtw",
+    "adtw",
+)
+# number of chunks the members are split into when aligned in parallel
+_MAX_CHUNKS = 64
 
 
+@threaded
 def elastic_barycenter_average(
     X: np.ndarray,
     metric: str = "dtw",
@@ -29,6 +46,7 @@ def elastic_barycenter_average(
     tol=1e-5,
     precomputed_medoids_pairwise_distance: np.ndarray = None,
     verbose: bool = False,
+    n_jobs: int = 1,
     **kwargs,
 ) -> np.ndarray:
     """Compute the barycenter average of time series using a elastic distance.
@@ -57,6 +75,10 @@ def elastic_barycenter_average(
         Precomputed medoids pairwise.
     verbose: bool, default=False
         Boolean that controls the verbosity.
+    n_jobs: int, default=1
+        The number of threads used to compute the alignments of the time series to
+        the average in each iteration. ``-1`` means use all processors. The average
+        is the same for any value of ``n_jobs``.
     **kwargs
         Keyword arguments to pass to the distance metric.
 
@@ -100,7 +122,7 @@ def elastic_barycenter_average(
     return center
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ba_update(
     center: np.ndarray,
     X: np.ndarray,
@@ -116,45 +138,98 @@ def _ba_update(
     reach: int = 30,
     warp_penalty: float = 1.0,
 ) -> Tuple[np.ndarray, float]:
+    if metric not in _BA_METRICS:
+        # When numba version > 0.57 add more informative error with what metric
+        # was passed.
+        raise ValueError("Metric parameter invalid")
     X_size, X_dims, X_timepoints = X.shape
-    sum = np.zeros(X_timepoints)
-    alignment = np.zeros((X_dims, X_timepoints))
-    cost = 0.0
-    for i in range(X_size):
-        curr_ts = X[i]
-        if metric == "dtw":
-            curr_alignment, _ = dtw_alignment_path(curr_ts, center, window)
-        elif metric == "ddtw":
-            curr_alignment, _ = ddtw_alignment_path(curr_ts, center, window)
-        elif metric == "wdtw":
-            curr_alignment, _ = wdtw_alignment_path(curr_ts, center, window, g)
-        elif metric == "wddtw":
-            curr_alignment, _ = wddtw_alignment_path(curr_ts, center, window, g)
-        elif metric == "erp":
-            curr_alignment, _ = erp_alignment_path(curr_ts, center, window, g)
-        elif metric == "edr":
-            curr_alignment, _ = edr_alignment_path(curr_ts, center, window, epsilon)
-        elif metric == "twe":
-            curr_alignment, _ = twe_alignment_path(curr_ts, center, window, nu, lmbda)
-        elif metric == "msm":
-            curr_alignment, _ = msm_alignment_path(
-                curr_ts, center, window, independent, c
-            )
-        elif metric == "shape_dtw":
-            curr_alignment, _ = shape_dtw_alignment_path(
-                curr_ts, center, window=window, descriptor=descriptor, reach=reach
-            )
-        elif metric == "adtw":
-            curr_alignment, _ = adtw_alignment_path(
-                curr_ts, center, window=window, warp_penalty=warp_penalty
+    # The members are split into a fixed number of contiguous chunks, each aligned
+    # in parallel into its own sums. The chunk sums are reduced in order at the end,
+    # so the result is the same for any number of threads and memory does not grow
+    # with the number of members.
+    n_chunks = min(X_size, _MAX_CHUNKS)
+    alignments = np.zeros((n_chunks, X_dims, X_timepoints))
+    sums = np.zeros((n_chunks, X_timepoints))
+    costs = np.zeros(n_chunks)
+    for chunk in prange(n_chunks):
+        for i in range(chunk * X_size // n_chunks, (chunk + 1) * X_size // n_chunks):
+            curr_ts = X[i]
+            curr_alignment = _alignment_path(
+                curr_ts,
+                center,
+                metric,
+                window,
+                g,
+                epsilon,
+                nu,
+                lmbda,
+                independent,
+                c,
+                descriptor,
+                reach,
+                warp_penalty,
             )
-        else:
-            # When numba version > 0.57 add more informative error with what metric
-            # was passed.
-            raise ValueError("Metric parameter invalid")
-        for j, k in curr_alignment:
-            alignment[:, k] += curr_ts[:, j]
-            sum[k] += 1
-            cost += squared_distance(curr_ts[:, j], center[:, k])
+            for j, k in curr_alignment:
+                alignments[chunk, :, k] += curr_ts[:, j]
+                sums[chunk, k] += 1
+                costs[chunk] += squared_distance(curr_ts[:, j], center[:, k])
 
+    alignment = np.zeros((X_dims, X_timepoints))
+    sum = np.zeros(X_timepoints)
+    cost = 0.0
+    for chunk in range(n_chunks):
+        alignment += alignments[chunk]
+        sum += sums[chunk]
+        cost += costs[chunk]
     return alignment / sum, cost / X_timepoints
+
+
+@njit(cache=True, fastmath=True)
+def _alignment_path(
+    x: np.ndarray,
+    center: np.ndarray,
+    metric: str,
+    window: float,
+    g: float,
+    epsilon: float,
+    nu: float,
+    lmbda: float,
+    independent: bool,
+    c: float,
+    descriptor: str,
+    reach: int,
+    warp_penalty: float,
+) -> List[Tuple[int, int]]:
+    if metric == "dtw":
+        alignment, _ = dtw_alignment_path(x, center, window)
+    elif metric == "ddtw":
+        alignment, _ = ddtw_alignment_path(x, center, window)
+    elif metric == "wdtw":
+        alignment, _ = wdtw_alignment_path(x, center, window, g)
+    elif metric == "wddtw":
+        alignment, _ = wddtw_alignment_path(x, center, window, g)
+    elif metric == "erp":
+        alignment, _ = erp_alignment_path(x, center, window, g)
+    elif metric == "edr":
+        alignment, _ = edr_alignment_path(x, center, window, epsilon)
+    elif metric == "twe":
+        alignment, _ = twe_alignment_path(x, center, window, nu, lmbda)
+    elif metric == "msm":
+        alignment, _ = msm_alignment_path(x, center, window, independent, c)
+    elif metric == "shape_dtw":
+        alignment, _ = shape_dtw_alignment_path(
+            x, center, window=window, descriptor=descriptor, reach=reach
+        )
+    else:
+        alignment, _ = adtw_alignment_path(
+            x, center, window=window, warp_penalty=warp_penalty
+        )
+    return alignment
+
+
+@threaded
+def _threaded_ba_update(
+    center: np.ndarray, X: np.ndarray, metric: str = "dtw", n_jobs: int = 1, **kwargs
+) -> Tuple[np.ndarray, float]:
+    # One step of barycenter averaging run with n_jobs numba threads.
+    return _ba_update(center, X, metric, **kwargs)
@@ -3,6 +3,11 @@
 import numpy as np
 
 from aeon.clustering.metrics.averaging import elastic_barycenter_average
+from aeon.clustering.metrics.averaging._barycenter_averaging import (
+    _MAX_CHUNKS,
+    _ba_update,
+)
+from aeon.distances import dtw_alignment_path
 from aeon.distances.tests._utils import create_test_distance_numpy
 
 expected_dba = np.array(
@@ -164,3 +169,33 @@ def test_elastic_dba_variations():
 
         assert isinstance(average_ts, np.ndarray)
         assert average_ts.shape == X_train[0].shape
+
+
+def test_dba_n_jobs():
+    """Test dba with several threads gives the same average as with one."""
+    X_train = create_test_distance_numpy(10, 10, 10)
+
+    serial = elastic_barycenter_average(X_train, metric="msm")
+    parallel = elastic_barycenter_average(X_train, metric="msm", n_jobs=-1)
+
+    assert np.array_equal(serial, parallel)
+
+
+def test_ba_update_chunks():
+    """Test a dba update over more members than chunks matches a direct update."""
+    X_train = create_test_distance_numpy(_MAX_CHUNKS * 2 + 3, 2, 10)
+    center = X_train.mean(axis=0)
+
+    average, cost = _ba_update(center, X_train, "dtw")
+
+    alignment = np.zeros_like(center)
+    counts = np.zeros(center.shape[1])
+    expected_cost = 0.0
+    for x in X_train:
+        path, _ = dtw_alignment_path(x, center)
+        for j, k in path:
+            alignment[:, k] += x[:, j]
+            counts[k] += 1
+            expected_cost += np.sum((x[:, j] - center[:, k]) ** 2)
+    assert np.allclose(average, alignment / counts)
+    assert np.isclose(cost, expected_cost / center.shape[1])
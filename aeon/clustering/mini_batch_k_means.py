@@ -0,0 +1,347 @@
+# -*- coding: utf-8 -*-
+"""Time series mini-batch kmeans."""
+
+import time
+from collections.abc import Iterator
+from typing import Callable, Union
+
+import numpy as np
+from numpy.random import RandomState
+from sklearn.utils import check_random_state
+
+from aeon.clustering.base import BaseClusterer
+from aeon.clustering.metrics.averaging import _resolve_average_callable
+from aeon.clustering.metrics.averaging._barycenter_averaging import _threaded_ba_update
+from aeon.clustering.partitioning._lloyds import (
+    _forgy_center_initializer,
+    _kmeans_plus_plus,
+    _random_center_initializer,
+)
+from aeon.distances import get_distance_function, nearest_neighbors
+
+
+class TimeSeriesMiniBatchKMeans(BaseClusterer):
+    """Time series mini-batch K-means clustering algorithm.
+
+    Each step assigns a batch of time series to their closest centers and moves
+    each center towards the average of the series assigned to it. The step size of
+    a center is the number of series in the batch assigned to it divided by the
+    number of series assigned to it so far, so every center is the running average
+    of the batch averages it has seen [1]_. With 'ba' averaging the batch average
+    is one iteration of DBA started from the current center, so centers are
+    refined incrementally rather than averaged from scratch.
+
+    Only one batch is held in memory at a time. ``fit`` samples batches from an
+    array, which can be a ``np.memmap``, or consumes an iterator of batches, and
+    ``partial_fit`` updates the centers with a single batch.
+
+    Parameters
+    ----------
+    n_clusters : int, default=8
+        The number of clusters to form as well as the number of centroids to generate.
+    init_algorithm : str, default='forgy'
+        Method for initializing cluster centers from the first batch. Any of the
+        following are valid: ['kmeans++', 'random', 'forgy'].
+    metric : str, default='dtw'
+        Distance metric to compute similarity between time series. A list of valid
+        strings for metrics can be found in the documentation for
+        :func:`aeon.distances.get_distance_function`.
+    batch_size : int, default=1024
+        Number of time series in each batch sampled by ``fit``.
+    max_iter : int, default=100
+        Maximum number of passes over the data by ``fit``, where one pass is
+        ``n_instances // batch_size`` batches drawn without replacement from a
+        random permutation of the series. Only used when ``fit`` is passed an
+        array.
+    tol : float, default=1e-6
+        ``fit`` stops when the sum of squared differences between the centers
+        before and after a pass is at most ``tol``.
+    compute_labels : bool, default=True
+        Whether ``fit`` computes ``labels_`` and ``inertia_`` with a final pass over
+        an array, one batch at a time.
+    verbose : bool, default=False
+        Verbosity mode.
+    random_state : int or np.random.RandomState instance or None, default=None
+        Determines random number generation for centroid initialization and batch
+        sampling.
+    averaging_method : str or Callable, default='mean'
+        Averaging method to compute the average of the series of a batch assigned
+        to a center. Any of the following strings are valid: ['mean', 'ba']. 'ba'
+        uses ``metric`` and ``distance_params``. If a Callable is provided must
+        take the form Callable[[np.ndarray], np.ndarray].
+    distance_params : dict, default=None
+        Dictionary containing kwargs for the distance metric being used.
+    average_params : dict, default=None
+        Dictionary containing kwargs for averaging_method when it is a Callable.
+
+    Attributes
+    ----------
+    cluster_centers_ : 3d np.ndarray
+        Array of shape (n_clusters, n_channels, n_timepoints))
+        Time series that represent each of the cluster centers.
+    counts_ : 1d np.ndarray
+        Array of shape (n_clusters,) with the number of series assigned to each
+        center so far.
+    labels_ : 1d np.ndarray or None
+        1d array of shape (n_instance,)
+        Labels that is the index each time series belongs to. None if ``fit`` was
+        passed an iterator or ``compute_labels`` is False.
+    inertia_ : float or None
+        Sum of distances of samples to their closest cluster center. None if
+        ``labels_`` is None.
+    n_iter_ : int
+        Number of passes over the data run by ``fit``.
+    n_steps_ : int
+        Number of batches used to update the centers.
+
+    References
+    ----------
+    .. [1] D. Sculley. Web-scale k-means clustering. Proceedings of the 19th
+    international conference on World Wide Web, 2010, pp. 1177-1178.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.clustering.mini_batch_k_means import TimeSeriesMiniBatchKMeans
+    >>> X = np.random.random(size=(100, 2, 20))
+    >>> clst = TimeSeriesMiniBatchKMeans(
+    ...     metric="euclidean", n_clusters=2, batch_size=20
+    ... )
+    >>> clst.fit(X)
+    TimeSeriesMiniBatchKMeans(batch_size=20, metric='euclidean', n_clusters=2)
+    >>> preds = clst.predict(X)
+    """
+
+    _tags = {
+        "capability:multivariate": True,
+    }
+
+    _init_algorithms = {
+        "forgy": _forgy_center_initializer,
+        "random": _random_center_initializer,
+        "kmeans++": _kmeans_plus_plus,
+    }
+
+    def __init__(
+        self,
+        n_clusters: int = 8,
+        init_algorithm: str = "forgy",
+        metric: str = "dtw",
+        batch_size: int = 1024,
+        max_iter: int = 100,
+        tol: float = 1e-6,
+        compute_labels: bool = True,
+        verbose: bool = False,
+        random_state: Union[int, RandomState] = None,
+        averaging_method: Union[str, Callable[[np.ndarray], np.ndarray]] = "mean",
+        distance_params: dict = None,
+        average_params: dict = None,
+    ):
+        self.init_algorithm = init_algorithm
+        self.metric = metric
+        self.batch_size = batch_size
+        self.max_iter = max_iter
+        self.tol = tol
+        self.compute_labels = compute_labels
+        self.verbose = verbose
+        self.random_state = random_state
+        self.averaging_method = averaging_method
+        self.distance_params = distance_params
+        self.average_params = average_params
+
+        self.cluster_centers_ = None
+        self.counts_ = None
+        self.labels_ = None
+        self.inertia_ = None
+        self.n_iter_ = 0
+        self.n_steps_ = 0
+
+        super(TimeSeriesMiniBatchKMeans, self).__init__(n_clusters=n_clusters)
+
+    def fit(self, X, y=None) -> BaseClusterer:
+        """Fit time series clusterer to training data.
+
+        Parameters
+        ----------
+        X : np.ndarray, iterator of np.ndarray or other collection
+            Either a collection of shape (n_instances, n_channels, n_timepoints)
+            or (n_instances, n_timepoints), which can be a ``np.memmap``, or any
+            other collection type accepted by aeon, from which batches of
+            ``batch_size`` series are sampled. Or an iterator, such as a generator,
+            of batches in one of these formats, which is consumed once.
+        y: ignored, exists for API consistency reasons.
+
+        Returns
+        -------
+        self:
+            Fitted estimator.
+        """
+        self.reset()
+        _start_time = int(round(time.time() * 1000))
+        if isinstance(X, Iterator):
+            for batch in X:
+                self._partial_fit(self._preprocess_collection(batch))
+            self.n_iter_ = 1
+        else:
+            # Arrays are converted a batch at a time, so a memory mapped array is
+            # never loaded in full.
+            if not isinstance(X, np.ndarray):
+                X = self._preprocess_collection(X)
+            self._fit(X)
+        self.fit_time_ = int(round(time.time() * 1000)) - _start_time
+        self._is_fitted = True
+        return self
+
+    def partial_fit(self, X, y=None) -> BaseClusterer:
+        """Update the cluster centers with a single batch of time series.
+
+        The first call initializes the centers from the batch with
+        ``init_algorithm``, so it must contain at least ``n_clusters`` series.
+
+        Parameters
+        ----------
+        X : 3D np.array of shape (n_instances, n_channels, n_timepoints)
+            or 2D np.array of shape (n_instances, n_timepoints)
+            A batch of time series instances.
+        y: ignored, exists for API consistency reasons.
+
+        Returns
+        -------
+        self:
+            Fitted estimator.
+        """
+        self._partial_fit(self._preprocess_collection(X))
+        self._is_fitted = True
+        return self
+
+    def _fit(self, X, y=None):
+        n_instances = X.shape[0]
+        batch_size = min(self.batch_size, n_instances)
+        n_batches = max(n_instances // batch_size, 1)
+        self._random_state = check_random_state(self.random_state)
+        for i in range(self.max_iter):
+            previous = None
+            if self.cluster_centers_ is not None:
+                previous = self.cluster_centers_.copy()
+            # Each pass draws its batches without replacement from one permutation,
+            # rather than permuting all the series again for every batch.
+            order = self._random_state.permutation(n_instances)
+            for b in range(n_batches):
+                # Sorted indices read a memory mapped array sequentially.
+                idx = np.sort(order[b * batch_size : (b + 1) * batch_size])
+                self._partial_fit(self._preprocess_collection(X[idx]))
+            self.n_iter_ = i + 1
+            if previous is not None:
+                shift = np.sum((self.cluster_centers_ - previous) ** 2)
+                if self.verbose:
+                    print(f"Pass {i}, center shift {shift}.")  # noqa: T001, T201
+                if shift <= self.tol:
+                    break
+
+        if self.compute_labels:
+            self.labels_ = np.zeros(n_instances, dtype=np.int64)
+            self.inertia_ = 0.0
+            for start in range(0, n_instances, batch_size):
+                batch = self._preprocess_collection(X[start : start + batch_size])
+                labels, distances = self._assign_clusters(batch)
+                self.labels_[start : start + batch_size] = labels
+                self.inertia_ += distances.sum()
+        return self
+
+    def _partial_fit(self, X: np.ndarray) -> None:
+        if self.cluster_centers_ is None:
+            self._check_params()
+            if X.shape[0] < self.n_clusters:
+                raise ValueError(
+                    f"The first batch must have at least n_clusters={self.n_clusters} "
+                    f"series, but found {X.shape[0]}"
+                )
+            self.cluster_centers_ = self._init_algorithm(
+                X,
+                self.n_clusters,
+                self._random_state,
+                distance_metric=get_distance_function(metric=self.metric),
+            ).astype(np.float64)
+            self.counts_ = np.zeros(self.n_clusters, dtype=np.int64)
+
+        labels, distances = self._assign_clusters(X)
+        for j in range(self.n_clusters):
+            members = X[labels == j]
+            if len(members) == 0:
+                continue
+            self.counts_[j] += len(members)
+            average = self._batch_average(self.cluster_centers_[j], members)
+            self.cluster_centers_[j] += (len(members) / self.counts_[j]) * (
+                average - self.cluster_centers_[j]
+            )
+        self.n_steps_ += 1
+        if self.verbose:
+            print(  # noqa: T001, T201
+                f"Step {self.n_steps_}, batch inertia {distances.sum()}."
+            )
+
+    def _check_params(self) -> None:
+        if not hasattr(self, "_random_state"):
+            self._random_state = check_random_state(self.random_state)
+        self._init_algorithm = self._init_algorithms.get(self.init_algorithm)
+        if self._init_algorithm is None:
+            raise ValueError(
+                f"The value provided for init_algorim: {self.init_algorithm} is "
+                f"invalid. The following are a list of valid init algorithms strings: "
+                f"{list(self._init_algorithms.keys())}"
+            )
+        self._averaging_method = _resolve_average_callable(self.averaging_method)
+        self._distance_params = (
+            {} if self.distance_params is None else self.distance_params
+        )
+        self._average_params = (
+            {} if self.average_params is None else self.average_params
+        )
+
+    def _batch_average(self, center: np.ndarray, members: np.ndarray) -> np.ndarray:
+        if self.averaging_method in ("ba", "dba"):
+            params = dict(self._distance_params)
+            if self.metric in ("wdtw", "wddtw") and "g" not in params:
+                params["g"] = 0.05
+            return _threaded_ba_update(center, members, self.metric, **params)[0]
+        # The averages of a single series are returned as a collection of one.
+        average = self._averaging_method(members, **self._average_params)
+        return average.reshape(center.shape)
+
+    def _assign_clusters(self, X: np.ndarray):
+        indices, distances = nearest_neighbors(
+            X, self.cluster_centers_, self.metric, **self._distance_params
+        )
+        return indices[:, 0], distances[:, 0]
+
+    def _predict(self, X: np.ndarray, y=None) -> np.ndarray:
+        return self._assign_clusters(X)[0]
+
+    def _score(self, X, y=None) -> float:
+        return -self._assign_clusters(X)[1].sum()
+
+    @classmethod
+    def get_test_params(cls, parameter_set="default"):
+        """Return testing parameter settings for the estimator.
+
+        Parameters
+        ----------
+        parameter_set : str, default="default"
+            Name of the set of test parameters to return, for use in tests. If no
+            special parameters are defined for a value, will return `"default"` set.
+
+        Returns
+        -------
+        params : dict or list of dict, default={}
+            Parameters to create testing instances of the class
+            Each dict are parameters to construct an "interesting" test instance, i.e.,
+            `MyClass(**params)` or `MyClass(**params[i])` creates a valid test instance.
+            `create_test_instance` uses the first (or only) dictionary in `params`
+        """
+        return {
+            "n_clusters": 2,
+            "metric": "euclidean",
+            "batch_size": 5,
+            "max_iter": 2,
+            "random_state": 0,
+        }
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from typing import Callable, Tuple, Union
 
 import numpy as np
+from joblib import Parallel, delayed
+from numba import njit, prange
 from numpy.random import RandomState
 from sklearn.utils import check_random_state
 from sklearn.utils.extmath import stable_cumsum
@@ -12,7 +14,20 @@ from sklearn.utils.extmath import stable_cumsum
 from aeon.clustering.base import BaseClusterer
 from aeon.clustering.metrics.averaging import mean_average
 from aeon.distances import get_distance_function, pairwise_distance
+from aeon.distances._bounding_matrix import _create_bounding_band
 from aeon.distances._ddtw import average_of_slope
+from aeon.distances._distance import DISTANCES_DICT
+from aeon.distances._dtw import _dtw_distance
+from aeon.distances._lower_bounds import _envelopes, _lb_keogh, _lb_kim
+from aeon.distances._neighbors import _distance_params
+from aeon.utils._threading import threaded
+from aeon.utils.validation import check_n_jobs
+
+# Distances each assignment algorithm other than lloyd can be used with.
+BOUNDED_ALGORITHMS = {
+    "elkan": ["euclidean", "erp", "msm", "twe"],
+    "lower_bound": ["dtw"],
+}
 
 
 def _forgy_center_initializer(
@@ -187,6 +202,24 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         Determines random number generation for centroid initialization.
     distance_params: dict, default=None
         Dictonary containing kwargs for the distance metric being used.
+    algorithm: str, default='lloyd'
+        Algorithm used to assign each time series to its closest center. All of the
+        following find the same assignments:
+        'lloyd' computes the distance from every series to every center.
+        'elkan' keeps a lower bound of the distance from each series to each center,
+        loosened with the triangle inequality as the centers move, and only
+        computes the distances the bounds cannot rule out. The metric must satisfy
+        the triangle inequality, so must be one of ['euclidean', 'erp', 'msm',
+        'twe'] with no window or itakura_max_slope, and msm must be independent.
+        'lower_bound' skips centers whose LB_Kim or LB_Keogh lower bound is larger
+        than the distance to the closest center found so far, and early abandons the
+        remaining distances. The metric must be 'dtw'.
+    n_jobs: int, default=1
+        The number of jobs to run in parallel. If ``n_init`` is greater than one the
+        runs are done in parallel in separate processes, otherwise the assignment
+        and averaging of each iteration use ``n_jobs`` threads where they can.
+        ``-1`` means use all processors. The result is the same for any value of
+        ``n_jobs``.
 
     Attributes
     ----------
@@ -224,6 +257,8 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         verbose: bool = False,
         random_state: Union[int, RandomState] = None,
         distance_params: dict = None,
+        algorithm: str = "lloyd",
+        n_jobs: int = 1,
     ):
         self.init_algorithm = init_algorithm
         self.metric = metric
@@ -233,6 +268,8 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         self.verbose = verbose
         self.random_state = random_state
         self.distance_params = distance_params
+        self.algorithm = algorithm
+        self.n_jobs = n_jobs
 
         self.cluster_centers_ = None
         self.labels_ = None
@@ -241,6 +278,7 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
 
         self._random_state = None
         self._init_algorithm = None
+        self._n_jobs = 1
 
         self._distance_params = distance_params
         if distance_params is None:
@@ -261,6 +299,7 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         ------
         ValueError
             If the init_algorithm value is invalid.
+            If the algorithm value is invalid or does not support the metric.
         """
         self._random_state = check_random_state(self.random_state)
 
@@ -283,6 +322,38 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
 
         self._distance_metric = get_distance_function(metric=self.metric)
 
+        if self.algorithm != "lloyd":
+            if self.algorithm not in BOUNDED_ALGORITHMS:
+                raise ValueError(
+                    f"The value provided for algorithm: {self.algorithm} is invalid. "
+                    f"The following are a list of valid algorithms: "
+                    f"{['lloyd'] + list(BOUNDED_ALGORITHMS.keys())}"
+                )
+            if self.metric not in BOUNDED_ALGORITHMS[self.algorithm]:
+                raise ValueError(
+                    f"The {self.algorithm} algorithm only supports the metrics "
+                    f"{BOUNDED_ALGORITHMS[self.algorithm]}, but found {self.metric}"
+                )
+            if self.algorithm == "elkan" and (
+                self._distance_params.get("window") is not None
+                or self._distance_params.get("itakura_max_slope") is not None
+            ):
+                raise ValueError(
+                    "The elkan algorithm requires a metric that satisfies the "
+                    "triangle inequality, so cannot be used with a window or "
+                    "itakura_max_slope"
+                )
+            if (
+                self.algorithm == "elkan"
+                and self.metric == "msm"
+                and not self._distance_params.get("independent", True)
+            ):
+                raise ValueError(
+                    "The elkan algorithm requires a metric that satisfies the "
+                    "triangle inequality, so cannot be used with msm with "
+                    "independent=False"
+                )
+
     def _fit(self, X: np.ndarray, y=None):
         """Fit time series clusterer to training data.
 
@@ -300,12 +371,32 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         """
         self._check_params(X)
         self._distance_metric = get_distance_function(metric=self.metric)
+        # The initial centers are all drawn here, in the same order as running the
+        # inits one after another, so the result does not depend on n_jobs.
+        initial_centres = [
+            self._init_algorithm(
+                X,
+                self.n_clusters,
+                self._random_state,
+                distance_metric=self._distance_metric,
+            )
+            for _ in range(self.n_init)
+        ]
+        n_jobs = check_n_jobs(self.n_jobs)
+        if self.n_init > 1 and n_jobs > 1:
+            self._n_jobs = 1
+            results = Parallel(n_jobs=n_jobs)(
+                delayed(self._fit_one_init)(X, centres) for centres in initial_centres
+            )
+        else:
+            self._n_jobs = n_jobs
+            results = [self._fit_one_init(X, centres) for centres in initial_centres]
+
         best_centers = None
         best_inertia = np.inf
         best_labels = None
         best_iters = self.max_iter
-        for _ in range(self.n_init):
-            labels, centers, inertia, n_iters = self._fit_one_init(X)
+        for labels, centers, inertia, n_iters in results:
             if inertia < best_inertia:
                 best_centers = centers
                 best_labels = labels
@@ -340,7 +431,9 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
             X = derivative_X
         return self._assign_clusters(X, self.cluster_centers_)[0]
 
-    def _fit_one_init(self, X) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    def _fit_one_init(
+        self, X: np.ndarray, cluster_centres: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, float, int]:
         """Perform one pass of kmeans.
 
         This is done because the initial center assignment greatly effects the final
@@ -352,7 +445,9 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
         X : np.ndarray (2d or 3d array of shape (n_instances, series_length) or shape
             (n_instances, n_dimensions, series_length))
             Training time series instances to cluster.
-        y: ignored, exists for API consistency reasons.
+        cluster_centres: np.ndarray (3d array of shape (n_clusters, n_dimensions,
+            series_length))
+            Initial cluster centres of the pass.
 
         Returns
         -------
@@ -366,16 +461,20 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
             Sum of squared distances of samples to their closest cluster center,
             weighted by the sample weights if provided.
         """
-        cluster_centres = self._init_algorithm(
-            X,
-            self.n_clusters,
-            self._random_state,
-            distance_metric=self._distance_metric,
-        )
+        assign_clusters = self._assign_clusters
+        if self.algorithm != "lloyd":
+            assign_clusters = _BoundedAssignment(
+                self.algorithm,
+                self.metric,
+                self._distance_params,
+                X.shape[0],
+                self.n_clusters,
+                self._n_jobs,
+            ).assign_clusters
         old_inertia = np.inf
         old_labels = None
         for i in range(self.max_iter):
-            labels, inertia = self._assign_clusters(
+            labels, inertia = assign_clusters(
                 X,
                 cluster_centres,
             )
@@ -397,7 +496,7 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
             if self.verbose is True:
                 print(f"Iteration {i}, inertia {inertia}.")  # noqa: T001, T201
 
-        labels, inertia = self._assign_clusters(X, cluster_centres)
+        labels, inertia = assign_clusters(X, cluster_centres)
         centres = cluster_centres
 
         return labels, centres, inertia, i + 1
@@ -428,7 +527,11 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
             the assigned clusters.
         """
         pairwise = pairwise_distance(
-            X, cluster_centres, metric=self.metric, **self._distance_params
+            X,
+            cluster_centres,
+            metric=self.metric,
+            n_jobs=self._n_jobs,
+            **self._distance_params,
         )
         return pairwise.argmin(axis=1), pairwise.min(axis=1).sum()
 
@@ -454,3 +557,172 @@ class TimeSeriesLloyds(BaseClusterer, ABC):
             New cluster center values.
         """
         ...
+
+
+class _BoundedAssignment:
+    """Assignment of series to centers that skips distances with bounds.
+
+    The state kept between iterations of one run of Lloyds algorithm is the label
+    of each series and, for elkan, the lower bound of the distance from each series
+    to each center. Each call first computes the distance from each series to the
+    center it was assigned to, which is exact and so gives the same inertia as
+    computing all distances.
+    """
+
+    def __init__(
+        self,
+        algorithm: str,
+        metric: str,
+        distance_params: dict,
+        n_instances: int,
+        n_clusters: int,
+        n_jobs: int = 1,
+    ):
+        self.algorithm = algorithm
+        self.metric = metric
+        self.distance_params = distance_params
+        self._distance = DISTANCES_DICT[metric]["distance"]
+        self._params, _ = _distance_params(self._distance, distance_params)
+        self._labels = np.zeros(n_instances, dtype=np.int64)
+        self._lower = np.zeros((n_instances, n_clusters))
+        self._centres = None
+        self.n_jobs = n_jobs
+
+    def assign_clusters(
+        self, X: np.ndarray, cluster_centres: np.ndarray
+    ) -> Tuple[np.ndarray, float]:
+        if self.algorithm == "elkan":
+            if self._centres is not None:
+                # A center that moved by shift is at most shift closer to a series.
+                shift = np.array(
+                    [
+                        self._distance(old, new, *self._params)
+                        for old, new in zip(self._centres, cluster_centres)
+                    ]
+                )
+                self._lower = np.maximum(self._lower - shift, 0.0)
+            centre_distances = pairwise_distance(
+                cluster_centres,
+                metric=self.metric,
+                n_jobs=self.n_jobs,
+                **self.distance_params,
+            )
+            distances = _elkan_assign(
+                X,
+                cluster_centres,
+                self._labels,
+                self._lower,
+                centre_distances,
+                self._distance,
+                self._params,
+                n_jobs=self.n_jobs,
+            )
+        else:
+            band = _create_bounding_band(
+                X.shape[2],
+                cluster_centres.shape[2],
+                self.distance_params.get("window"),
+                self.distance_params.get("itakura_max_slope"),
+            )
+            lower, upper = _envelopes(cluster_centres, band)
+            distances = _lower_bound_assign(
+                X, cluster_centres, self._labels, lower, upper, band, n_jobs=self.n_jobs
+            )
+        self._centres = cluster_centres.copy()
+        return self._labels.copy(), distances.sum()
+
+
+@threaded
+def _elkan_assign(
+    X: np.ndarray,
+    centres: np.ndarray,
+    labels: np.ndarray,
+    lower: np.ndarray,
+    centre_distances: np.ndarray,
+    distance_func,
+    params: tuple,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    return _elkan_assign_kernel(
+        X, centres, labels, lower, centre_distances, distance_func, params
+    )
+
+
+@njit(fastmath=True, parallel=True)
+def _elkan_assign_kernel(
+    X: np.ndarray,
+    centres: np.ndarray,
+    labels: np.ndarray,
+    lower: np.ndarray,
+    centre_distances: np.ndarray,
+    distance_func,
+    params: tuple,
+) -> np.ndarray:
+    # Updates labels and lower in place and returns the distance from each series
+    # to its center. A center c is skipped when it is known to be strictly further
+    # than the current center a, either because of its lower bound or because
+    # d(x, c) >= d(a, c) - d(x, a) > d(x, a). Ties go to the lower index.
+    distances = np.zeros(X.shape[0])
+    for i in prange(X.shape[0]):
+        closest = labels[i]
+        distance = distance_func(X[i], centres[closest], *params)
+        lower[i, closest] = distance
+        for j in range(centres.shape[0]):
+            if (
+                j == closest
+                or distance < lower[i, j]
+                or distance < 0.5 * centre_distances[closest, j]
+            ):
+                continue
+            curr = distance_func(X[i], centres[j], *params)
+            lower[i, j] = curr
+            if curr < distance or (curr == distance and j < closest):
+                closest = j
+                distance = curr
+        labels[i] = closest
+        distances[i] = distance
+    return distances
+
+
+@threaded
+def _lower_bound_assign(
+    X: np.ndarray,
+    centres: np.ndarray,
+    labels: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    return _lower_bound_assign_kernel(X, centres, labels, lower, upper, band)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _lower_bound_assign_kernel(
+    X: np.ndarray,
+    centres: np.ndarray,
+    labels: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+) -> np.ndarray:
+    # Updates labels in place and returns the DTW distance from each series to its
+    # center, visiting the center each series was assigned to first.
+    distances = np.zeros(X.shape[0])
+    for i in prange(X.shape[0]):
+        closest = labels[i]
+        distance = _dtw_distance(X[i], centres[closest], band, np.inf)
+        for j in range(centres.shape[0]):
+            if (
+                j == closest
+                or _lb_kim(X[i], centres[j]) > distance
+                or _lb_keogh(X[i], lower[j], upper[j], 0, X.shape[2]) > distance
+            ):
+                continue
+            curr = _dtw_distance(X[i], centres[j], band, distance)
+            if curr < distance or (curr == distance and j < closest):
+                closest = j
+                distance = curr
+        labels[i] = closest
+        distances[i] = distance
+    return distances
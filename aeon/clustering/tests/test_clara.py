@@ -91,3 +91,21 @@ def test_clara_multi():
     assert isinstance(clara.cluster_centers_, np.ndarray)
     for val in proba:
         assert np.count_nonzero(val == 1.0) == 1
+
+
+def test_clara_fasterpam():
+    """Test CLARA clusters each sample with FasterPAM."""
+    X_train, _ = load_gunpoint(split="train")
+    X_train = X_train[:20]
+    clara = TimeSeriesCLARA(
+        random_state=1,
+        n_samples=10,
+        n_clusters=2,
+        distance="euclidean",
+        method="fasterpam",
+    )
+    clara.fit(X_train)
+    assert clara._kmedoids_instance.method == "fasterpam"
+    for center in clara.cluster_centers_:
+        assert (X_train == center).all(axis=(1, 2)).any()
+    assert set(clara.predict(X_train)) <= {0, 1}
@@ -136,3 +136,23 @@ def test_medoids_init():
     )
     kmedoids.fit(X_train)
     assert np.array_equal(kmedoids.cluster_centers_, X_train[custom_init_centres])
+
+
+def test_clarans_max_cache_bytes():
+    """Test a bounded distance cache finds the same medoids."""
+    X_train, _ = load_gunpoint(split="train")
+    X_train = X_train[:20]
+    results = []
+    for max_cache_bytes in [None, 8 * X_train.shape[0] * 3]:
+        clarans = TimeSeriesCLARANS(
+            random_state=1,
+            n_init=2,
+            n_clusters=2,
+            distance="euclidean",
+            max_cache_bytes=max_cache_bytes,
+        )
+        clarans.fit(X_train)
+        results.append(clarans)
+    assert np.array_equal(results[0].labels_, results[1].labels_)
+    assert np.array_equal(results[0].cluster_centers_, results[1].cluster_centers_)
+    assert results[0].inertia_ == results[1].inertia_
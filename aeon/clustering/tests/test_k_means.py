@@ -179,3 +179,81 @@ def test_kmeans_dba():
 
     for val in proba:
         assert np.count_nonzero(val == 1.0) == 1
+
+
+@pytest.mark.parametrize(
+    "metric, algorithm, distance_params",
+    [
+        ("euclidean", "elkan", None),
+        ("msm", "elkan", {"c": 0.5}),
+        ("erp", "elkan", {"g": 0.5}),
+        ("twe", "elkan", None),
+        ("dtw", "lower_bound", None),
+        ("dtw", "lower_bound", {"window": 0.2}),
+    ],
+)
+def test_kmeans_bounded_assignment(metric, algorithm, distance_params):
+    """Test bounded assignment algorithms find the same clusters as lloyd."""
+    X_train, _ = load_basic_motions(split="train")
+    X_train = X_train[:20, :, :20]
+    results = []
+    for algo in ["lloyd", algorithm]:
+        kmeans = TimeSeriesKMeans(
+            random_state=1,
+            n_init=1,
+            n_clusters=4,
+            init_algorithm="forgy",
+            metric=metric,
+            distance_params=distance_params,
+            algorithm=algo,
+        )
+        kmeans.fit(X_train)
+        results.append(kmeans)
+    lloyd, bounded = results
+    assert np.array_equal(lloyd.labels_, bounded.labels_)
+    assert np.array_equal(lloyd.cluster_centers_, bounded.cluster_centers_)
+    assert lloyd.n_iter_ == bounded.n_iter_
+    assert lloyd.inertia_ == pytest.approx(bounded.inertia_)
+
+
+def test_kmeans_bounded_assignment_errors():
+    """Test bounded assignment algorithms reject unsupported metrics."""
+    X_train, _ = load_basic_motions(split="train")
+    with pytest.raises(ValueError, match="algorithm"):
+        TimeSeriesKMeans(algorithm="hartigan").fit(X_train)
+    with pytest.raises(ValueError, match="only supports the metrics"):
+        TimeSeriesKMeans(metric="dtw", algorithm="elkan").fit(X_train)
+    with pytest.raises(ValueError, match="only supports the metrics"):
+        TimeSeriesKMeans(metric="msm", algorithm="lower_bound").fit(X_train)
+    with pytest.raises(ValueError, match="triangle inequality"):
+        TimeSeriesKMeans(
+            metric="msm", algorithm="elkan", distance_params={"window": 0.2}
+        ).fit(X_train)
+    with pytest.raises(ValueError, match="independent=False"):
+        TimeSeriesKMeans(
+            metric="msm", algorithm="elkan", distance_params={"independent": False}
+        ).fit(X_train)
+
+
+@pytest.mark.parametrize("averaging_method", ["mean", "ba"])
+def test_kmeans_n_jobs(averaging_method):
+    """Test parallel runs and averaging find the same clusters as serial ones."""
+    X_train, _ = load_basic_motions(split="train")
+    X_train = X_train[:10, :, :20]
+    results = []
+    for n_init, n_jobs in [(3, 1), (3, 2), (1, 1), (1, 2)]:
+        kmeans = TimeSeriesKMeans(
+            random_state=1,
+            n_init=n_init,
+            n_clusters=3,
+            metric="dtw",
+            averaging_method=averaging_method,
+            n_jobs=n_jobs,
+        )
+        kmeans.fit(X_train)
+        results.append(kmeans)
+    for serial, parallel in [(results[0], results[1]), (results[2], results[3])]:
+        assert np.array_equal(serial.labels_, parallel.labels_)
+        assert np.allclose(serial.cluster_centers_, parallel.cluster_centers_)
+        assert serial.n_iter_ == parallel.n_iter_
+        assert serial.inertia_ == pytest.approx(parallel.inertia_)
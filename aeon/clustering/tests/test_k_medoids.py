@@ -1,12 +1,13 @@
 # -*- coding: utf-8 -*-
 """Tests for time series k-medoids."""
 import numpy as np
+import pytest
 from sklearn import metrics
 from sklearn.utils import check_random_state
 
 from aeon.clustering.k_medoids import TimeSeriesKMedoids
 from aeon.datasets import load_basic_motions, load_gunpoint
-from aeon.distances import euclidean_distance
+from aeon.distances import euclidean_distance, pairwise_distance
 
 
 def test_kmedoids_uni():
@@ -229,3 +230,68 @@ def test_custom_distance_params():
         data, distance="msm", distance_params={"window": 0.2}
     )
     assert not np.array_equal(default_dist, custom_params_dist)
+
+
+@pytest.mark.parametrize("method", ["pam", "alternate"])
+def test_kmedoids_n_jobs(method):
+    """Test parallel runs find the same medoids as serial ones."""
+    X_train, _ = load_basic_motions(split="train")
+    X_train = X_train[:10, :, :20]
+    results = []
+    for n_jobs in [1, 2]:
+        kmedoids = TimeSeriesKMedoids(
+            random_state=1,
+            n_init=3,
+            n_clusters=3,
+            distance="msm",
+            method=method,
+            n_jobs=n_jobs,
+        )
+        kmedoids.fit(X_train)
+        results.append(kmedoids)
+    serial, parallel = results
+    assert np.array_equal(serial.labels_, parallel.labels_)
+    assert np.array_equal(serial.cluster_centers_, parallel.cluster_centers_)
+    assert serial.n_iter_ == parallel.n_iter_
+    assert serial.inertia_ == pytest.approx(parallel.inertia_)
+
+
+def test_kmedoids_fasterpam():
+    """Test FasterPAM finds medoids that no single swap improves."""
+    X_train, _ = load_gunpoint(split="train")
+    X_train = X_train[:30]
+    kmedoids = TimeSeriesKMedoids(
+        random_state=1,
+        n_init=2,
+        n_clusters=3,
+        distance="euclidean",
+        method="fasterpam",
+    )
+    kmedoids.fit(X_train)
+    distances = pairwise_distance(X_train, metric="euclidean")
+    medoids = [
+        np.where((X_train == center).all(axis=(1, 2)))[0][0]
+        for center in kmedoids.cluster_centers_
+    ]
+    assert np.array_equal(kmedoids.labels_, distances[:, medoids].argmin(axis=1))
+    assert np.isclose(kmedoids.inertia_, distances[:, medoids].min(axis=1).sum())
+    for i in range(len(medoids)):
+        for candidate in range(X_train.shape[0]):
+            swapped = list(medoids)
+            swapped[i] = candidate
+            cost = distances[:, swapped].min(axis=1).sum()
+            assert cost >= kmedoids.inertia_ - 1e-8
+
+    # Computing distances when they are needed finds the same medoids.
+    lazy = TimeSeriesKMedoids(
+        random_state=1,
+        n_init=2,
+        n_clusters=3,
+        distance="euclidean",
+        method="fasterpam",
+        max_cache_bytes=8 * X_train.shape[0] * 4,
+    )
+    lazy.fit(X_train)
+    assert np.array_equal(lazy.labels_, kmedoids.labels_)
+    assert np.array_equal(lazy.cluster_centers_, kmedoids.cluster_centers_)
+    assert np.isclose(lazy.inertia_, kmedoids.inertia_)
@@ -1,26 +1,21 @@
 # -*- coding: utf-8 -*-
 """Tests for time series k-shapes."""
 import numpy as np
-import pytest
 
 from aeon.clustering.k_shapes import TimeSeriesKShapes
 from aeon.datasets import load_basic_motions
-from aeon.utils.validation._dependencies import _check_estimator_deps
+from aeon.distances import sbd_distance
 
-expected_results = [2, 2, 2, 0, 0]
+expected_results = [2, 1, 2, 1, 1]
 
-inertia = 0.5645477840468736
+inertia = 0.9791999158855896
 
-expected_iters = 2
+expected_iters = 1
 
-expected_labels = [0, 2, 1, 1, 1]
-expected_score = 0.5645477840468736
+expected_labels = [1, 2, 0, 0, 1]
+expected_score = 0.9791999158855896
 
 
-@pytest.mark.skipif(
-    not _check_estimator_deps(TimeSeriesKShapes, severity="none"),
-    reason="skip test if required soft dependencies not available",
-)
 def test_kshapes():
     """Test implementation of Kshapes."""
     max_train = 5
@@ -35,9 +30,40 @@ def test_kshapes():
     proba = kshapes.predict_proba(X_test[0:max_train])
     assert np.array_equal(test_shape_result, expected_results)
     np.testing.assert_almost_equal(score, expected_score)
+    np.testing.assert_almost_equal(kshapes.inertia_, inertia)
     assert kshapes.n_iter_ == expected_iters
     assert np.array_equal(kshapes.labels_, expected_labels)
+    assert kshapes.cluster_centers_.shape == (3, 6, 100)
     assert proba.shape == (max_train, 3)
 
     for val in proba:
         assert np.count_nonzero(val == 1.0) == 1
+
+
+def test_kshapes_shifted_shapes():
+    """Test Kshapes separates shapes regardless of their phase and scale."""
+    rng = np.random.RandomState(0)
+    t = np.linspace(0, 4 * np.pi, 128)
+    sines = [rng.rand() * np.sin(t + rng.rand() * np.pi) for _ in range(10)]
+    squares = [rng.rand() * np.sign(np.sin(t + rng.rand() * np.pi)) for _ in range(10)]
+    X = np.array(sines + squares)[:, np.newaxis] + 0.01 * rng.randn(20, 1, 128)
+
+    kshapes = TimeSeriesKShapes(n_clusters=2, n_init=2, random_state=0).fit(X)
+    assert len(set(kshapes.labels_[:10])) == 1
+    assert len(set(kshapes.labels_[10:])) == 1
+    assert kshapes.labels_[0] != kshapes.labels_[10]
+    expected_inertia = sum(
+        sbd_distance(x, kshapes.cluster_centers_[label])
+        for x, label in zip(X, kshapes.labels_)
+    )
+    np.testing.assert_almost_equal(kshapes.inertia_, expected_inertia)
+
+
+def test_kshapes_n_jobs():
+    """Test Kshapes finds the same clusters with any number of jobs."""
+    X, _ = load_basic_motions(split="train")
+    kshapes = TimeSeriesKShapes(n_clusters=3, n_init=2, random_state=1).fit(X)
+    parallel = TimeSeriesKShapes(n_clusters=3, n_init=2, random_state=1, n_jobs=2)
+    parallel.fit(X)
+    assert np.array_equal(kshapes.labels_, parallel.labels_)
+    np.testing.assert_almost_equal(kshapes.inertia_, parallel.inertia_)
@@ -5,21 +5,16 @@ import pytest
 
 from aeon.clustering.kernel_k_means import TimeSeriesKernelKMeans
 from aeon.datasets import load_basic_motions
-from aeon.utils.validation._dependencies import _check_estimator_deps
 
-expected_labels = [0, 2, 1, 2, 0]
+expected_labels = [1, 2, 0, 0, 0]
 
-expected_score = 4.0
+expected_score = 0.8554770621262368
 
-expected_iters = 2
+expected_iters = 1
 
-expected_results = [0, 0, 0, 0, 0]
+expected_results = [0, 0, 2, 0, 0]
 
 
-@pytest.mark.skipif(
-    not _check_estimator_deps(TimeSeriesKernelKMeans, severity="none"),
-    reason="skip test if required soft dependencies not available",
-)
 def test_kernel_k_means():
     """Test implementation of kernel k means."""
     max_train = 5
@@ -27,7 +22,9 @@ def test_kernel_k_means():
     X_train, y_train = load_basic_motions(split="train")
     X_test, y_test = load_basic_motions(split="test")
 
-    kernel_kmeans = TimeSeriesKernelKMeans(random_state=1, n_clusters=3)
+    kernel_kmeans = TimeSeriesKernelKMeans(
+        random_state=1, n_clusters=3, kernel_params={"sigma": "auto"}
+    )
     kernel_kmeans.fit(X_train[0:max_train])
     test_shape_result = kernel_kmeans.predict(X_test[0:max_train])
     score = kernel_kmeans.score(X_test[0:max_train])
@@ -41,3 +38,27 @@ def test_kernel_k_means():
 
     for val in proba:
         assert np.count_nonzero(val == 1.0) == 1
+
+
+def test_kernel_k_means_nystroem():
+    """Test the Nystroem approximation with every series as a landmark is exact."""
+    X, _ = load_basic_motions(split="train")
+    params = {"n_clusters": 4, "random_state": 1, "kernel_params": {"sigma": "auto"}}
+    exact = TimeSeriesKernelKMeans(**params).fit(X)
+    nystroem = TimeSeriesKernelKMeans(n_landmarks=X.shape[0], **params).fit(X)
+    assert np.array_equal(exact.labels_, nystroem.labels_)
+    np.testing.assert_almost_equal(exact.inertia_, nystroem.inertia_)
+    assert np.array_equal(exact.predict(X), nystroem.predict(X))
+
+    approximate = TimeSeriesKernelKMeans(n_landmarks=10, **params).fit(X)
+    assert approximate._features(X).shape[1] <= 10
+    assert approximate.predict(X).shape == (X.shape[0],)
+
+
+def test_kernel_k_means_params():
+    """Test invalid parameters raise an error before fitting."""
+    X, _ = load_basic_motions(split="train")
+    with pytest.raises(ValueError, match="max_iter"):
+        TimeSeriesKernelKMeans(max_iter=0).fit(X)
+    with pytest.raises(ValueError, match="n_landmarks"):
+        TimeSeriesKernelKMeans(n_landmarks=0).fit(X)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""Tests for time series mini-batch k-means."""
+import numpy as np
+import pytest
+from sklearn.metrics import adjusted_rand_score
+
+from aeon.clustering.mini_batch_k_means import TimeSeriesMiniBatchKMeans
+
+
+def _make_clusters(n_instances=400, random_state=0):
+    rng = np.random.default_rng(random_state)
+    centers = np.cumsum(rng.normal(size=(3, 2, 30)), axis=2)
+    centers += 10 * np.arange(3).reshape((3, 1, 1))
+    y = rng.integers(0, 3, n_instances)
+    return centers[y] + rng.normal(scale=0.5, size=(n_instances, 2, 30)), y
+
+
+@pytest.mark.parametrize(
+    "metric, averaging_method", [("euclidean", "mean"), ("dtw", "mean"), ("dtw", "ba")]
+)
+def test_mini_batch_kmeans(metric, averaging_method):
+    """Test mini-batch k-means finds well separated clusters."""
+    X, y = _make_clusters()
+    kmeans = TimeSeriesMiniBatchKMeans(
+        n_clusters=3,
+        metric=metric,
+        averaging_method=averaging_method,
+        distance_params={"window": 0.2} if metric == "dtw" else None,
+        batch_size=50,
+        max_iter=3,
+        init_algorithm="kmeans++",
+        random_state=1,
+    )
+    kmeans.fit(X)
+    assert kmeans.cluster_centers_.shape == (3, 2, 30)
+    assert kmeans.counts_.sum() == kmeans.n_steps_ * 50
+    assert adjusted_rand_score(y, kmeans.labels_) == 1.0
+    assert np.array_equal(kmeans.predict(X), kmeans.labels_)
+    assert kmeans.score(X) == pytest.approx(-kmeans.inertia_)
+
+
+def test_mini_batch_kmeans_streaming(tmp_path):
+    """Test fitting from a memory mapped array, a generator and partial_fit."""
+    X, y = _make_clusters()
+    path = str(tmp_path / "X.dat")
+    memmap = np.memmap(path, dtype=np.float64, mode="w+", shape=X.shape)
+    memmap[:] = X
+    memmap.flush()
+    memmap = np.memmap(path, dtype=np.float64, mode="r", shape=X.shape)
+    params = {
+        "n_clusters": 3,
+        "metric": "euclidean",
+        "init_algorithm": "kmeans++",
+        "random_state": 1,
+    }
+
+    in_memory = TimeSeriesMiniBatchKMeans(batch_size=50, max_iter=2, **params).fit(X)
+    memory_mapped = TimeSeriesMiniBatchKMeans(batch_size=50, max_iter=2, **params).fit(
+        memmap
+    )
+    assert np.array_equal(in_memory.cluster_centers_, memory_mapped.cluster_centers_)
+    assert np.array_equal(in_memory.labels_, memory_mapped.labels_)
+
+    generator = TimeSeriesMiniBatchKMeans(**params).fit(
+        X[i : i + 50] for i in range(0, len(X), 50)
+    )
+    assert generator.n_steps_ == 8
+    assert generator.labels_ is None
+    assert adjusted_rand_score(y, generator.predict(X)) == 1.0
+
+    partial = TimeSeriesMiniBatchKMeans(**params)
+    for i in range(0, len(X), 50):
+        partial.partial_fit(X[i : i + 50])
+    assert np.array_equal(partial.cluster_centers_, generator.cluster_centers_)
+
+    with pytest.raises(ValueError, match="at least n_clusters"):
+        TimeSeriesMiniBatchKMeans(**params).partial_fit(X[:2])
@@ -50,6 +50,10 @@ __all__ = [
     "msm_alignment_path",
     "msm_cost_matrix",
     "msm_pairwise_distance",
+    "sbd_distance",
+    "sbd_pairwise_distance",
+    "gak_kernel",
+    "gak_pairwise_kernel",
     "distance",
     "pairwise_distance",
     "alignment_path",
@@ -62,6 +66,16 @@ __all__ = [
     "shape_dtw_cost_matrix",
     "shape_dtw_alignment_path",
     "shape_dtw_pairwise_distance",
+    "create_envelope",
+    "create_envelopes",
+    "lb_kim",
+    "lb_keogh",
+    "lb_improved",
+    "lb_enhanced",
+    "lower_bound_cascade",
+    "nearest_neighbors",
+    "DTWSearchIndex",
+    "PairwiseDistanceCache",
 ]
 
 
@@ -72,6 +86,7 @@ from aeon.distances._adtw import (
     adtw_pairwise_distance,
 )
 from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._cache import PairwiseDistanceCache
 from aeon.distances._ddtw import (
     ddtw_alignment_path,
     ddtw_cost_matrix,
@@ -107,12 +122,22 @@ from aeon.distances._erp import (
     erp_pairwise_distance,
 )
 from aeon.distances._euclidean import euclidean_distance, euclidean_pairwise_distance
+from aeon.distances._gak import gak_kernel, gak_pairwise_kernel
 from aeon.distances._lcss import (
     lcss_alignment_path,
     lcss_cost_matrix,
     lcss_distance,
     lcss_pairwise_distance,
 )
+from aeon.distances._lower_bounds import (
+    create_envelope,
+    create_envelopes,
+    lb_enhanced,
+    lb_improved,
+    lb_keogh,
+    lb_kim,
+    lower_bound_cascade,
+)
 from aeon.distances._manhattan import manhattan_distance, manhattan_pairwise_distance
 from aeon.distances._msm import (
     msm_alignment_path,
@@ -120,6 +145,9 @@ from aeon.distances._msm import (
     msm_distance,
     msm_pairwise_distance,
 )
+from aeon.distances._neighbors import nearest_neighbors
+from aeon.distances._sbd import sbd_distance, sbd_pairwise_distance
+from aeon.distances._search_index import DTWSearchIndex
 from aeon.distances._shape_dtw import (
     shape_dtw_alignment_path,
     shape_dtw_cost_matrix,
@@ -5,12 +5,17 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_row_span,
+    _create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -20,6 +25,7 @@ def adtw_distance(
     window: float = None,
     itakura_max_slope: float = None,
     warp_penalty: float = 1.0,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the ADTW distance between two time series.
 
@@ -47,6 +53,9 @@ def adtw_distance(
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
     warp_penalty: float, default=1.0
         Penalty for warping. A high value will mean less warping.
+    upper_bound : float, default=np.inf
+        If the ADTW distance is greater than ``upper_bound``, the computation is
+        abandoned early and ``np.inf`` is returned.
 
     Returns
     -------
@@ -80,15 +89,13 @@ def adtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _adtw_distance(_x, _y, bounding_matrix, warp_penalty)
+        return _adtw_distance(_x, _y, band, warp_penalty, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _adtw_distance(x, y, bounding_matrix, warp_penalty)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _adtw_distance(x, y, band, warp_penalty, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -167,11 +174,50 @@ def adtw_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _adtw_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, warp_penalty: float
+    x: np.ndarray,
+    y: np.ndarray,
+    band: np.ndarray,
+    warp_penalty: float,
+    upper_bound: float = np.inf,
 ) -> float:
-    return _adtw_cost_matrix(x, y, bounding_matrix, warp_penalty)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+
+    # Cells above upper_bound are pruned as in _dtw_distance.
+    prev_start = 0
+    prev_end = 0
+    for i in range(x_size):
+        start = -1
+        end = -1
+        reset_start, reset_end = _band_row_span(band, i, y_size)
+        curr_row[reset_start : reset_end + 1] = np.inf
+        for j in range(max(prev_start - 1, band[i, 0]), band[i, 1]):
+            curr_row[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + min(
+                prev_row[j + 1] + warp_penalty,
+                curr_row[j] + warp_penalty,
+                prev_row[j],
+            )
+            if curr_row[j + 1] <= upper_bound:
+                if start == -1:
+                    start = j + 1
+                end = j + 1
+                continue
+            if j + 1 > prev_end:
+                break
+        if start == -1:
+            return np.inf
+        prev_start = start
+        prev_end = end
+        prev_row, curr_row = curr_row, prev_row
+
+    distance = prev_row[y_size]
+    if distance > upper_bound:
+        return np.inf
+    return distance
 
 
 @njit(cache=True, fastmath=True)
@@ -197,13 +243,14 @@ def _adtw_cost_matrix(
     return cost_matrix[1:, 1:]
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def adtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     itakura_max_slope: float = None,
     warp_penalty: float = 1.0,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     r"""Compute the ADTW pairwise distance between a set of time series.
 
@@ -225,6 +272,9 @@ def adtw_pairwise_distance(
         Penalty for warping. A high value will mean less warping.
         warp less and if value is low then will encourage algorithm to warp
         more.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -278,25 +328,24 @@ def adtw_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _adtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float, warp_penalty: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _adtw_distance(X[i], X[j], bounding_matrix, warp_penalty)
+            distances[i, j] = _adtw_distance(X[i], X[j], band, warp_penalty)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _adtw_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -307,13 +356,12 @@ def _adtw_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _adtw_distance(x[i], y[j], bounding_matrix, warp_penalty)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _adtw_distance(x[i], y[j], band, warp_penalty)
     return distances
 
 
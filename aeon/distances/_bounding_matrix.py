@@ -2,6 +2,7 @@
 __author__ = ["chrisholder"]
 
 import math
+from typing import Tuple
 
 import numpy as np
 from numba import njit
@@ -112,3 +113,145 @@ def _sakoe_chiba_bounding(
         bounding_matrix[i, lower:upper] = True
 
     return bounding_matrix
+
+
+@njit(cache=True)
+def _create_bounding_band(
+    x_size: int, y_size: int, window: float = None, itakura_max_slope: float = None
+) -> np.ndarray:
+    """Create the bounding band for an elastic distance.
+
+    The band is a compact form of the bounding matrix returned by
+    create_bounding_matrix with the same arguments. Each row of the bounding matrix
+    is a single run of True values, so row ``i`` is stored as the start and end
+    (exclusive) column of that run. Rows with no cell in bounds are ``(0, 0)``.
+
+    Parameters
+    ----------
+    x_size : int
+        Size of the first time series.
+    y_size : int
+        Size of the second time series.
+    window : float, default=None
+        Window size as a percentage of the smallest time series.
+        If None, the band will be full.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+
+    Returns
+    -------
+    np.ndarray of shape (x_size, 2)
+        Band where columns ``band[i, 0]`` to ``band[i, 1] - 1`` of row ``i`` are in
+        bounds.
+    """
+    if itakura_max_slope is not None:
+        if itakura_max_slope < 0 or itakura_max_slope > 1:
+            raise ValueError("itakura_max_slope must be between 0 and 1")
+        return _itakura_parallelogram_band(x_size, y_size, itakura_max_slope)
+    if window is not None:
+        if window < 0 or window > 1:
+            raise ValueError("window must be between 0 and 1")
+        return _sakoe_chiba_band(x_size, y_size, window)
+    band = np.zeros((x_size, 2), dtype=np.int64)
+    band[:, 1] = y_size
+    return band
+
+
+@njit(cache=True)
+def _itakura_parallelogram_band(
+    x_size: int, y_size: int, max_slope_percent: float
+) -> np.ndarray:
+    one_percent = min(x_size, y_size) / 100
+    max_slope = math.floor(((max_slope_percent * one_percent) * 100))
+    min_slope = 1 / float(max_slope)
+    max_slope *= float(x_size) / float(y_size)
+    min_slope *= float(x_size) / float(y_size)
+
+    band = np.zeros((x_size, 2), dtype=np.int64)
+    band[:, 0] = y_size
+    for i in range(y_size):
+        lower_bound = math.ceil(
+            max(
+                round(min_slope * i, 2),
+                round((x_size - 1) - max_slope * (y_size - 1) + max_slope * i, 2),
+            )
+        )
+        upper_bound = math.floor(
+            min(
+                round(max_slope * i, 2),
+                round((x_size - 1) - min_slope * (y_size - 1) + min_slope * i, 2),
+            )
+            + 1
+        )
+        # Rows lower_bound to upper_bound - 1 of column i are in bounds.
+        for j in range(max(lower_bound, 0), min(upper_bound, x_size)):
+            band[j, 0] = min(band[j, 0], i)
+            band[j, 1] = max(band[j, 1], i + 1)
+    for j in range(x_size):
+        if band[j, 0] >= band[j, 1]:
+            band[j, 0] = 0
+            band[j, 1] = 0
+    return band
+
+
+@njit(cache=True)
+def _sakoe_chiba_band(x_size: int, y_size: int, radius_percent: float) -> np.ndarray:
+    one_percent = min(x_size, y_size) / 100
+    radius = math.floor(((radius_percent * one_percent) * 100))
+    band = np.zeros((x_size, 2), dtype=np.int64)
+
+    smallest_size = min(x_size, y_size)
+    largest_size = max(x_size, y_size)
+
+    width = largest_size - smallest_size + radius
+    for i in range(smallest_size):
+        band[i, 0] = max(0, i - radius)
+        band[i, 1] = min(min(largest_size, i + width) + 1, y_size)
+
+    return band
+
+
+@njit(cache=True)
+def _in_band(band: np.ndarray, i: int, j: int) -> bool:
+    return band[i, 0] <= j < band[i, 1]
+
+
+@njit(cache=True)
+def _band_is_full(band: np.ndarray, y_size: int) -> bool:
+    for i in range(band.shape[0]):
+        if band[i, 0] != 0 or band[i, 1] != y_size:
+            return False
+    return True
+
+
+@njit(cache=True)
+def _transpose_band(band: np.ndarray, y_size: int) -> np.ndarray:
+    # Band of the transposed bounding matrix, i.e. the in bounds rows of each column.
+    transposed = np.zeros((y_size, 2), dtype=np.int64)
+    transposed[:, 0] = band.shape[0]
+    for i in range(band.shape[0]):
+        for j in range(band[i, 0], band[i, 1]):
+            transposed[j, 0] = min(transposed[j, 0], i)
+            transposed[j, 1] = max(transposed[j, 1], i + 1)
+    for j in range(y_size):
+        if transposed[j, 0] >= transposed[j, 1]:
+            transposed[j, 0] = 0
+            transposed[j, 1] = 0
+    return transposed
+
+
+@njit(cache=True)
+def _band_row_span(band: np.ndarray, i: int, y_size: int) -> Tuple[int, int]:
+    # Columns in bounds in row i or row i + 1 of the band. These are the cells of
+    # row i a two row cost matrix kernel writes or reads back on the next row, so
+    # only they need resetting. The last row spans to y_size so the final cell is
+    # always reset.
+    start = band[i, 0]
+    end = band[i, 1]
+    if i + 1 < band.shape[0]:
+        start = min(start, band[i + 1, 0])
+        end = max(end, band[i + 1, 1])
+    else:
+        end = y_size
+    return start, end
@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""Cache of pairwise distance matrices."""
+__all__ = ["PairwiseDistanceCache"]
+
+import hashlib
+import inspect
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+_active_caches = []
+
+
+class PairwiseDistanceCache:
+    """Least recently used cache of pairwise distance matrices.
+
+    While the cache is active, :func:`aeon.distances.pairwise_distance` looks up
+    every call with a string metric in the cache before computing it, so the same
+    matrix is only computed once by estimators and hyperparameter searches. Calls
+    are keyed by a hash of the contents of ``x`` and ``y``, the metric and its
+    parameters, so a cached matrix is returned exactly as it was computed. A ``y``
+    equal to ``x`` is keyed as ``y=None``, and parameters set to the default of the
+    metric are keyed as if they were not passed.
+
+    The cache is activated with a ``with`` statement. Matrices are kept in memory
+    up to ``max_bytes``. When it is full the least recently used matrices are
+    evicted, or written to ``memmap_dir`` and read back as memory mapped arrays if it
+    is set. Spilled matrices are kept up to ``max_disk_bytes``, after which the
+    least recently spilled files are deleted. The cache is only seen by the process
+    that activated it.
+
+    Matrices are returned as read-only arrays that share memory with the cache, so
+    cache hits do not copy the matrix or read a memory mapped matrix into memory.
+    Copy a returned matrix with ``np.array`` to modify it.
+
+    Parameters
+    ----------
+    max_bytes : int, default=2**30
+        Maximum total size in bytes of the matrices kept in memory.
+    memmap_dir : str or None, default=None
+        Directory to spill evicted matrices to. Files are deleted when
+        :meth:`clear` is called or the cache is garbage collected. If None, evicted
+        matrices are discarded.
+    max_disk_bytes : int, default=2**32
+        Maximum total size in bytes of the matrices spilled to ``memmap_dir``.
+
+    Attributes
+    ----------
+    hits : int
+        Number of calls answered from the cache.
+    misses : int
+        Number of calls that were computed and added to the cache.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import PairwiseDistanceCache, pairwise_distance
+    >>> X = np.array([[[1.0, 2.0, 3.0]], [[4.0, 5.0, 6.0]], [[7.0, 8.0, 9.0]]])
+    >>> with PairwiseDistanceCache() as cache:
+    ...     first = pairwise_distance(X, metric="dtw", window=0.5)
+    ...     second = pairwise_distance(X, metric="dtw", window=0.5)
+    >>> cache.hits, cache.misses
+    (1, 1)
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 2**30,
+        memmap_dir: Optional[str] = None,
+        max_disk_bytes: int = 2**32,
+    ):
+        self.max_bytes = max_bytes
+        self.memmap_dir = memmap_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._memory = OrderedDict()
+        self._disk = OrderedDict()
+        self._size = 0
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        # spilled files are deleted even if clear is never called
+        self._finalizer = weakref.finalize(self, _remove_files, self._disk)
+
+    def __enter__(self) -> "PairwiseDistanceCache":
+        """Activate the cache for calls to pairwise_distance."""
+        _active_caches.append(self)
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Deactivate the cache, keeping the matrices it holds."""
+        _active_caches.remove(self)
+
+    def __len__(self) -> int:
+        """Return the number of matrices in memory and on disk."""
+        return len(self._memory) + len(self._disk)
+
+    def get_or_compute(
+        self,
+        compute: Callable[[], np.ndarray],
+        x: np.ndarray,
+        y: Optional[np.ndarray],
+        metric: str,
+        params: dict,
+    ) -> np.ndarray:
+        """Return the cached matrix for a call, computing it if it is not cached.
+
+        Parameters
+        ----------
+        compute : Callable
+            Function with no arguments that computes the matrix.
+        x : np.ndarray
+            First collection passed to ``pairwise_distance``.
+        y : np.ndarray or None
+            Second collection passed to ``pairwise_distance``.
+        metric : str
+            Name of the distance metric.
+        params : dict
+            Parameters of the distance metric.
+
+        Returns
+        -------
+        np.ndarray
+            A read-only view of the pairwise distance matrix.
+        """
+        if y is not None and (y is x or np.array_equal(x, y)):
+            y = None
+        defaults = _default_params(metric)
+        params = {
+            name: value
+            for name, value in params.items()
+            if not _is_default(value, defaults.get(name, inspect.Parameter.empty))
+        }
+        key = _fingerprint((x, y, metric, sorted(params.items())))
+        with self._lock:
+            matrix = self._get(key)
+            if matrix is not None:
+                self.hits += 1
+                return _read_only(matrix)
+        matrix = compute()
+        with self._lock:
+            self.misses += 1
+            matrix = self._put(key, matrix)
+        return _read_only(matrix)
+
+    def clear(self) -> None:
+        """Remove all matrices from the cache and delete any spilled files."""
+        with self._lock:
+            _remove_files(self._disk)
+            self._memory.clear()
+            self._size = 0
+            self._disk_size = 0
+
+    def _get(self, key: str) -> Optional[np.ndarray]:
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            return self._memory[key]
+        if key in self._disk:
+            path, _ = self._disk[key]
+            return np.load(path, mmap_mode="r")
+        return None
+
+    def _put(self, key: str, matrix: np.ndarray) -> np.ndarray:
+        # Returns the matrix held by the cache, or matrix if it was not kept.
+        cached = self._get(key)
+        if cached is not None:
+            return cached
+        if matrix.nbytes > self.max_bytes:
+            self._spill(key, matrix)
+            return matrix
+        matrix = np.array(matrix)
+        self._memory[key] = matrix
+        self._size += matrix.nbytes
+        while self._size > self.max_bytes:
+            old_key, old_matrix = self._memory.popitem(last=False)
+            self._size -= old_matrix.nbytes
+            self._spill(old_key, old_matrix)
+        return matrix
+
+    def _spill(self, key: str, matrix: np.ndarray) -> None:
+        if self.memmap_dir is None or matrix.nbytes > self.max_disk_bytes:
+            return
+        while self._disk_size + matrix.nbytes > self.max_disk_bytes:
+            _, (old_path, old_nbytes) = self._disk.popitem(last=False)
+            _remove_file(old_path)
+            self._disk_size -= old_nbytes
+        os.makedirs(self.memmap_dir, exist_ok=True)
+        fd, path = tempfile.mkstemp(suffix=".npy", dir=self.memmap_dir)
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, matrix)
+        self._disk[key] = (path, matrix.nbytes)
+        self._disk_size += matrix.nbytes
+
+
+def _get_active_cache() -> Optional[PairwiseDistanceCache]:
+    return _active_caches[-1] if len(_active_caches) > 0 else None
+
+
+def _read_only(matrix: np.ndarray) -> np.ndarray:
+    view = matrix.view()
+    view.flags.writeable = False
+    return view
+
+
+def _remove_file(path: str) -> None:
+    # A file still memory mapped by a returned matrix cannot be removed on Windows.
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _remove_files(disk: dict) -> None:
+    for path, _ in disk.values():
+        _remove_file(path)
+    disk.clear()
+
+
+@lru_cache(maxsize=None)
+def _default_params(metric: str) -> dict:
+    # Default parameter values of the pairwise distance function of a metric.
+    from aeon.distances._distance import DISTANCES_DICT
+
+    function = DISTANCES_DICT.get(metric, {}).get("pairwise_distance")
+    if function is None:
+        return {}
+    return {
+        name: parameter.default
+        for name, parameter in inspect.signature(function).parameters.items()
+        if parameter.default is not inspect.Parameter.empty
+    }
+
+
+def _is_default(value: Any, default: Any) -> bool:
+    if value is default:
+        return True
+    if default is inspect.Parameter.empty or default is None or value is None:
+        return False
+    if isinstance(value, np.ndarray) or isinstance(default, np.ndarray):
+        return False
+    return type(value) is type(default) and value == default
+
+
+def _fingerprint(obj: Any) -> str:
+    h = hashlib.blake2b(digest_size=20)
+    _update_hash(h, obj)
+    return h.hexdigest()
+
+
+def _update_hash(h, obj: Any) -> None:
+    if isinstance(obj, np.ndarray):
+        h.update(f"ndarray{obj.dtype.str}{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f"{type(obj).__name__}{len(obj)}".encode())
+        for item in obj:
+            _update_hash(h, item)
+    else:
+        h.update(repr(obj).encode())
@@ -5,16 +5,25 @@ __author__ = ["chrisholder", "tonybagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance, create_bounding_matrix
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._bounding_matrix import (
+    _create_bounding_band,
+    create_bounding_matrix,
+)
+from aeon.distances._dtw import _dtw_cost_matrix, _dtw_distance
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
 def ddtw_distance(
-    x: np.ndarray, y: np.ndarray, window: float = None, itakura_max_slope: float = None
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the DDTW distance between two time series.
 
@@ -43,6 +52,9 @@ def ddtw_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        If the DDTW distance is greater than ``upper_bound``, the computation is
+        abandoned early and ``np.inf`` is returned.
 
     Returns
     -------
@@ -73,17 +85,17 @@ def ddtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = average_of_slope(x.reshape((1, x.shape[0])))
         _y = average_of_slope(y.reshape((1, y.shape[0])))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, band, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
         _x = average_of_slope(x)
         _y = average_of_slope(y)
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, band, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -155,12 +167,13 @@ def ddtw_cost_matrix(
     raise ValueError("x and y must be 1D or 2D")
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def ddtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the DDTW pairwise distance between a set of time series.
 
@@ -178,6 +191,9 @@ def ddtw_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -229,53 +245,53 @@ def ddtw_pairwise_distance(
     return _ddtw_from_multiple_to_multiple_distance(_x, _y, window, itakura_max_slope)
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
+    band = _create_bounding_band(
         X.shape[2] - 2, X.shape[2] - 2, window, itakura_max_slope
     )
 
     X_average_of_slope = np.zeros((n_instances, X.shape[1], X.shape[2] - 2))
-    for i in range(n_instances):
+    for i in prange(n_instances):
         X_average_of_slope[i] = average_of_slope(X[i])
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
             distances[i, j] = _dtw_distance(
-                X_average_of_slope[i], X_average_of_slope[j], bounding_matrix
+                X_average_of_slope[i], X_average_of_slope[j], band
             )
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _ddtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
     # Derive the arrays before so that we dont have to redo every iteration
     derive_x = np.zeros((x.shape[0], x.shape[1], x.shape[2] - 2))
-    for i in range(x.shape[0]):
+    for i in prange(x.shape[0]):
         derive_x[i] = average_of_slope(x[i])
 
     derive_y = np.zeros((y.shape[0], y.shape[1], y.shape[2] - 2))
-    for i in range(y.shape[0]):
+    for i in prange(y.shape[0]):
         derive_y[i] = average_of_slope(y[i])
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], bounding_matrix)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _dtw_distance(derive_x[i], derive_y[j], band)
     return distances
 
 
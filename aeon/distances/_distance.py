@@ -11,6 +11,7 @@ from aeon.distances._adtw import (
     adtw_distance,
     adtw_pairwise_distance,
 )
+from aeon.distances._cache import _get_active_cache
 from aeon.distances._ddtw import (
     ddtw_alignment_path,
     ddtw_cost_matrix,
@@ -49,6 +50,7 @@ from aeon.distances._msm import (
     msm_distance,
     msm_pairwise_distance,
 )
+from aeon.distances._sbd import sbd_distance, sbd_pairwise_distance
 from aeon.distances._shape_dtw import (
     shape_dtw_alignment_path,
     shape_dtw_cost_matrix,
@@ -107,7 +109,9 @@ def distance(
         :func:`aeon.distances.get_distance_function`.
     kwargs : Any
         Arguments for metric. Refer to each metrics documentation for a list of
-        possible arguments.
+        possible arguments. The elastic distances dtw, ddtw, wdtw, wddtw, adtw,
+        erp, msm and twe accept an ``upper_bound`` argument to early abandon the
+        distance computation.
 
     Returns
     -------
@@ -136,10 +140,20 @@ def distance(
     elif metric == "manhattan":
         return manhattan_distance(x, y)
     elif metric == "dtw":
-        return dtw_distance(x, y, kwargs.get("window"), kwargs.get("itakura_max_slope"))
+        return dtw_distance(
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
+        )
     elif metric == "ddtw":
         return ddtw_distance(
-            x, y, kwargs.get("window"), kwargs.get("itakura_max_slope")
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "wdtw":
         return wdtw_distance(
@@ -148,6 +162,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "shape_dtw":
         return shape_dtw_distance(
@@ -165,6 +180,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "lcss":
         return lcss_distance(
@@ -182,6 +198,7 @@ def distance(
             kwargs.get("g", 0.0),
             kwargs.get("g_arr", None),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "edr":
         return edr_distance(
@@ -199,6 +216,7 @@ def distance(
             kwargs.get("nu", 0.001),
             kwargs.get("lmbda", 1.0),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
     elif metric == "msm":
         return msm_distance(
@@ -208,7 +226,10 @@ def distance(
             kwargs.get("independent", True),
             kwargs.get("c", 1.0),
             kwargs.get("itakura_max_slope"),
+            kwargs.get("upper_bound", np.inf),
         )
+    elif metric == "sbd":
+        return sbd_distance(x, y, kwargs.get("standardize", True))
     elif metric == "mpdist":
         return mpdist(x, y, **kwargs)
     elif metric == "adtw":
@@ -218,6 +239,7 @@ def distance(
             kwargs.get("window"),
             kwargs.get("itakura_max_slope"),
             kwargs.get("warp_penalty", 1.0),
+            kwargs.get("upper_bound", np.inf),
         )
     else:
         if isinstance(metric, Callable):
@@ -229,6 +251,7 @@ def pairwise_distance(
     x: np.ndarray,
     y: np.ndarray = None,
     metric: Union[str, DistanceFunction] = None,
+    n_jobs: int = 1,
     **kwargs: Any,
 ) -> np.ndarray:
     """Compute the pairwise distance matrix between two time series.
@@ -245,6 +268,11 @@ def pairwise_distance(
         The distance metric to use.
         A list of valid pairwise distance metrics can be found in the documentation for
         :func:`aeon.distances.get_pairwise_distance_function`.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use all
+        processors. Only used by the built-in distances, a callable ``metric`` or
+        ``"mpdist"`` are always computed in a single thread. The result is the same
+        for any value of ``n_jobs``.
     kwargs : Any
         Extra arguments for metric. Refer to each metric documentation for a list of
         possible arguments.
@@ -287,15 +315,38 @@ def pairwise_distance(
            [147.],
            [ 48.]])
     """
+    cache = _get_active_cache()
+    if cache is not None and isinstance(metric, str):
+        return cache.get_or_compute(
+            lambda: _pairwise_distance(x, y, metric, n_jobs, **kwargs),
+            x,
+            y,
+            metric,
+            kwargs,
+        )
+    return _pairwise_distance(x, y, metric, n_jobs, **kwargs)
+
+
+def _pairwise_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    metric: Union[str, DistanceFunction],
+    n_jobs: int,
+    **kwargs: Any,
+) -> np.ndarray:
     if metric == "squared":
-        return squared_pairwise_distance(x, y)
+        return squared_pairwise_distance(x, y, n_jobs=n_jobs)
     elif metric == "euclidean":
-        return euclidean_pairwise_distance(x, y)
+        return euclidean_pairwise_distance(x, y, n_jobs=n_jobs)
     elif metric == "manhattan":
-        return manhattan_pairwise_distance(x, y)
+        return manhattan_pairwise_distance(x, y, n_jobs=n_jobs)
     elif metric == "dtw":
         return dtw_pairwise_distance(
-            x, y, kwargs.get("window"), kwargs.get("itakura_max_slope")
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "shape_dtw":
         return shape_dtw_pairwise_distance(
@@ -305,10 +356,15 @@ def pairwise_distance(
             itakura_max_slope=kwargs.get("itakura_max_slope"),
             descriptor=kwargs.get("descriptor", "identity"),
             reach=kwargs.get("reach", 30),
+            n_jobs=n_jobs,
         )
     elif metric == "ddtw":
         return ddtw_pairwise_distance(
-            x, y, kwargs.get("window"), kwargs.get("itakura_max_slope")
+            x,
+            y,
+            kwargs.get("window"),
+            kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "wdtw":
         return wdtw_pairwise_distance(
@@ -317,6 +373,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "wddtw":
         return wddtw_pairwise_distance(
@@ -325,6 +382,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("g", 0.05),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "lcss":
         return lcss_pairwise_distance(
@@ -333,6 +391,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("epsilon", 1.0),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "erp":
         return erp_pairwise_distance(
@@ -342,6 +401,7 @@ def pairwise_distance(
             kwargs.get("g", 0.0),
             kwargs.get("g_arr", None),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "edr":
         return edr_pairwise_distance(
@@ -350,6 +410,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("epsilon"),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "twe":
         return twe_pairwise_distance(
@@ -359,6 +420,7 @@ def pairwise_distance(
             kwargs.get("nu", 0.001),
             kwargs.get("lmbda", 1.0),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
         )
     elif metric == "msm":
         return msm_pairwise_distance(
@@ -368,6 +430,11 @@ def pairwise_distance(
             kwargs.get("independent", True),
             kwargs.get("c", 1.0),
             kwargs.get("itakura_max_slope"),
+            n_jobs=n_jobs,
+        )
+    elif metric == "sbd":
+        return sbd_pairwise_distance(
+            x, y, kwargs.get("standardize", True), n_jobs=n_jobs
         )
     elif metric == "mpdist":
         return _custom_func_pairwise(x, y, mpdist, **kwargs)
@@ -378,6 +445,7 @@ def pairwise_distance(
             kwargs.get("window"),
             kwargs.get("itakura_max_slope"),
             kwargs.get("warp_penalty", 1.0),
+            n_jobs=n_jobs,
         )
     else:
         if isinstance(metric, Callable):
@@ -722,6 +790,7 @@ def get_distance_function(metric: Union[str, DistanceFunction]) -> DistanceFunct
     'lcss'          distance.lcss_distance
     'euclidean'     distance.euclidean_distance
     'squared'       distance.squared_distance
+    'sbd'           distance.sbd_distance
     =============== ========================================
 
     Parameters
@@ -776,6 +845,7 @@ def get_pairwise_distance_function(
     'lcss'          distance.lcss_pairwise_distance
     'euclidean'     distance.euclidean_pairwise_distance
     'squared'       distance.squared_pairwise_distance
+    'sbd'           distance.sbd_pairwise_distance
     =============== ========================================
 
     Parameters
@@ -1012,6 +1082,11 @@ DISTANCES = [
         "cost_matrix": shape_dtw_cost_matrix,
         "alignment_path": shape_dtw_alignment_path,
     },
+    {
+        "name": "sbd",
+        "distance": sbd_distance,
+        "pairwise_distance": sbd_pairwise_distance,
+    },
 ]
 
 DISTANCES_DICT = {d["name"]: d for d in DISTANCES}
@@ -5,17 +5,26 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_row_span,
+    _create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
 def dtw_distance(
-    x: np.ndarray, y: np.ndarray, window: float = None, itakura_max_slope: float = None
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the DTW distance between two time series.
 
@@ -54,7 +63,7 @@ def dtw_distance(
     The optimal warping path :math:`P^*` can be found exactly through a dynamic
     programming formulation. This can be a time consuming operation, and it is common to
     put a restriction on the amount of warping allowed. This is implemented through
-    the bounding_matrix structure, that supplies a mask for allowable warpings.
+    the band structure, that supplies a mask for allowable warpings.
     The most common bounding strategies include the Sakoe-Chiba band [2]_. The width
     of the allowed warping is controlled through the ``window`` parameter
     which sets the maximum proportion of warping allowed.
@@ -75,11 +84,18 @@ def dtw_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        If the DTW distance is greater than ``upper_bound``, the computation is
+        abandoned early and ``np.inf`` is returned. Cells of the cost matrix which
+        can only lead to a distance greater than ``upper_bound`` are pruned, which
+        can greatly speed up nearest neighbour search, where the distance to the
+        current nearest neighbour is passed.
 
     Returns
     -------
     float
-        DTW distance between x and y, minimum value 0.
+        DTW distance between x and y, minimum value 0. ``np.inf`` if the distance is
+        greater than ``upper_bound``.
 
     Raises
     ------
@@ -111,15 +127,13 @@ def dtw_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _dtw_distance(_x, _y, bounding_matrix)
+        return _dtw_distance(_x, _y, band, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _dtw_distance(x, y, bounding_matrix)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _dtw_distance(x, y, band, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -193,8 +207,54 @@ def dtw_cost_matrix(
 
 
 @njit(cache=True, fastmath=True)
-def _dtw_distance(x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray) -> float:
-    return _dtw_cost_matrix(x, y, bounding_matrix)[x.shape[1] - 1, y.shape[1] - 1]
+def _dtw_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    band: np.ndarray,
+    upper_bound: float = np.inf,
+) -> float:
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.full(y_size + 1, np.inf)
+    curr_row = np.full(y_size + 1, np.inf)
+    prev_row[0] = 0.0
+
+    # Costs never decrease along a warping path, so cells above upper_bound cannot
+    # be part of a path with a distance below it (PrunedDTW). Columns
+    # before the first cell below upper_bound in the previous row are skipped, and
+    # a row stops once a cell is above upper_bound past the last such cell in the
+    # previous row. If no cell in a row is below upper_bound the DTW is abandoned.
+    prev_start = 0
+    prev_end = 0
+    for i in range(x_size):
+        start = -1
+        end = -1
+        reset_start, reset_end = _band_row_span(band, i, y_size)
+        curr_row[reset_start : reset_end + 1] = np.inf
+        for j in range(max(prev_start - 1, band[i, 0]), band[i, 1]):
+            curr_row[j + 1] = _univariate_squared_distance(x[:, i], y[:, j]) + min(
+                prev_row[j + 1],
+                curr_row[j],
+                prev_row[j],
+            )
+            if curr_row[j + 1] <= upper_bound:
+                if start == -1:
+                    start = j + 1
+                end = j + 1
+                continue
+            if j + 1 > prev_end:
+                break
+        if start == -1:
+            return np.inf
+        prev_start = start
+        prev_end = end
+        prev_row, curr_row = curr_row, prev_row
+
+    distance = prev_row[y_size]
+    if distance > upper_bound:
+        return np.inf
+    return distance
 
 
 @njit(cache=True, fastmath=True)
@@ -220,12 +280,13 @@ def _dtw_cost_matrix(
     return cost_matrix[1:, 1:]
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def dtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     r"""Compute the DTW pairwise distance between a set of time series.
 
@@ -259,6 +320,9 @@ def dtw_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -310,38 +374,36 @@ def dtw_pairwise_distance(
     return _dtw_from_multiple_to_multiple_distance(_x, _y, window, itakura_max_slope)
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_pairwise_distance(
     X: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _dtw_distance(X[i], X[j], bounding_matrix)
+            distances[i, j] = _dtw_distance(X[i], X[j], band)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _dtw_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray, window: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _dtw_distance(x[i], y[j], bounding_matrix)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _dtw_distance(x[i], y[j], band)
     return distances
 
 
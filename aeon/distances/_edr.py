@@ -5,15 +5,20 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_row_span,
+    _create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -99,15 +104,13 @@ def edr_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _edr_distance(_x, _y, bounding_matrix, epsilon)
+        return _edr_distance(_x, _y, band, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _edr_distance(x, y, bounding_matrix, epsilon)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _edr_distance(x, y, band, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -182,12 +185,33 @@ def edr_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _edr_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float = None
+    x: np.ndarray, y: np.ndarray, band: np.ndarray, epsilon: float = None
 ) -> float:
-    distance = _edr_cost_matrix(x, y, bounding_matrix, epsilon)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
-    return float(distance / max(x.shape[1], y.shape[1]))
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    if epsilon is None:
+        epsilon = max(np.std(x), np.std(y)) / 4
+
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.zeros(y_size + 1)
+    curr_row = np.zeros(y_size + 1)
+
+    for i in range(1, x_size + 1):
+        reset_start, reset_end = _band_row_span(band, i - 1, y_size)
+        curr_row[reset_start : reset_end + 1] = 0.0
+        for j in range(band[i - 1, 0] + 1, band[i - 1, 1] + 1):
+            if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) < epsilon:
+                cost = 0
+            else:
+                cost = 1
+            curr_row[j] = min(
+                prev_row[j - 1] + cost,
+                prev_row[j] + 1,
+                curr_row[j - 1] + 1,
+            )
+        prev_row, curr_row = curr_row, prev_row
+
+    return float(prev_row[y_size] / max(x_size, y_size))
 
 
 @njit(cache=True, fastmath=True)
@@ -216,13 +240,14 @@ def _edr_cost_matrix(
     return cost_matrix[1:, 1:]
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def edr_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     epsilon: float = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the pairwise EDR distance between a set of time series.
 
@@ -244,6 +269,9 @@ def edr_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -296,25 +324,24 @@ def edr_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _edr_pairwise_distance(
     X: np.ndarray, window: float, epsilon: float = None, itakura_max_slope: float = None
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _edr_distance(X[i], X[j], bounding_matrix, epsilon)
+            distances[i, j] = _edr_distance(X[i], X[j], band, epsilon)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _edr_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -325,13 +352,12 @@ def _edr_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _edr_distance(x[i], y[j], bounding_matrix, epsilon)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _edr_distance(x[i], y[j], band, epsilon)
     return distances
 
 
@@ -5,15 +5,21 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple, Union
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_is_full,
+    _band_row_span,
+    _create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -24,6 +30,7 @@ def erp_distance(
     g: float = 0.0,
     g_arr: np.ndarray = None,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the ERP distance between two time series.
 
@@ -70,6 +77,9 @@ def erp_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        If the ERP distance is greater than ``upper_bound``, the computation is
+        abandoned early and ``np.inf`` is returned.
 
     Returns
     -------
@@ -99,15 +109,13 @@ def erp_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _erp_distance(_x, _y, bounding_matrix, g, g_arr)
+        return _erp_distance(_x, _y, band, g, g_arr, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _erp_distance(x, y, bounding_matrix, g, g_arr)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _erp_distance(x, y, band, g, g_arr, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -188,13 +196,44 @@ def erp_cost_matrix(
 def _erp_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    band: np.ndarray,
     g: float,
     g_arr: np.ndarray,
+    upper_bound: float = np.inf,
 ) -> float:
-    return _erp_cost_matrix(x, y, bounding_matrix, g, g_arr)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+
+    gx_distance, x_sum = _precompute_g(x, g, g_arr)
+    gy_distance, y_sum = _precompute_g(y, g, g_arr)
+
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.full(y_size + 1, y_sum)
+    prev_row[0] = 0.0
+    curr_row = np.zeros(y_size + 1)
+    # Out of bounds cells are left at zero, so the minimum of a row is only a lower
+    # bound on the distance if every cell is in bounds.
+    early_abandon = upper_bound < np.inf and _band_is_full(band, y_size)
+
+    for i in range(1, x_size + 1):
+        reset_start, reset_end = _band_row_span(band, i - 1, y_size)
+        curr_row[reset_start : reset_end + 1] = 0.0
+        curr_row[0] = x_sum
+        for j in range(band[i - 1, 0] + 1, band[i - 1, 1] + 1):
+            curr_row[j] = min(
+                prev_row[j - 1]
+                + _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]),
+                prev_row[j] + gx_distance[i - 1],
+                curr_row[j - 1] + gy_distance[j - 1],
+            )
+        if early_abandon and np.min(curr_row) > upper_bound:
+            return np.inf
+        prev_row, curr_row = curr_row, prev_row
+
+    distance = prev_row[y_size]
+    if distance > upper_bound:
+        return np.inf
+    return distance
 
 
 @njit(cache=True, fastmath=True)
@@ -249,7 +288,7 @@ def _precompute_g(
     return gx_distance, x_sum
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def erp_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -257,6 +296,7 @@ def erp_pairwise_distance(
     g: float = 0.0,
     g_arr: np.ndarray = None,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the ERP pairwise distance between a set of time series.
 
@@ -283,6 +323,9 @@ def erp_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -336,7 +379,7 @@ def erp_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _erp_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -346,19 +389,18 @@ def _erp_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _erp_distance(X[i], X[j], bounding_matrix, g, g_arr)
+            distances[i, j] = _erp_distance(X[i], X[j], band, g, g_arr)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _erp_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -370,13 +412,12 @@ def _erp_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _erp_distance(x[i], y[j], bounding_matrix, g, g_arr)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _erp_distance(x[i], y[j], band, g, g_arr)
     return distances
 
 
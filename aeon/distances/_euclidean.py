@@ -2,10 +2,11 @@
 __author__ = ["chrisholder", "tonybagnall"]
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._squared import _univariate_squared_distance, squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -62,8 +63,10 @@ def _univariate_euclidean_distance(x: np.ndarray, y: np.ndarray) -> float:
     return np.sqrt(_univariate_squared_distance(x, y))
 
 
-@njit(cache=True, fastmath=True)
-def euclidean_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarray:
+@threaded
+def euclidean_pairwise_distance(
+    X: np.ndarray, y: np.ndarray = None, n_jobs: int = 1
+) -> np.ndarray:
     """Compute the euclidean pairwise distance between a set of time series.
 
     Parameters
@@ -74,7 +77,9 @@ def euclidean_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarr
     y : np.ndarray, of shape (m_instances, m_channels, m_timepoints) or
             (m_instances, m_timepoints) or (m_timepoints,), default=None
         A collection of time series instances.
-
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -123,12 +128,13 @@ def euclidean_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarr
     return _euclidean_from_multiple_to_multiple_distance(_x, _y)
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _euclidean_pairwise_distance(X: np.ndarray) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
             distances[i, j] = euclidean_distance(X[i], X[j])
             distances[j, i] = distances[i, j]
@@ -136,7 +142,7 @@ def _euclidean_pairwise_distance(X: np.ndarray) -> np.ndarray:
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _euclidean_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray
 ) -> np.ndarray:
@@ -144,7 +150,8 @@ def _euclidean_from_multiple_to_multiple_distance(
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = euclidean_distance(x[i], y[j])
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = euclidean_distance(x[i], y[j])
     return distances
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+r"""Global alignment kernel (GAK) between time series.
+
+The global alignment kernel [1]_ sums the products of a local kernel over every
+alignment of two series, which is computed with a dynamic programming recursion
+like DTW. The kernel values grow or shrink exponentially with the length of the
+series, so each row of the recursion is rescaled by its largest value and the
+logarithm of the kernel is accumulated. The normalised kernel divides by the
+kernel of each series with itself, so it is 1 for identical series.
+
+References
+----------
+.. [1] Cuturi M.: Fast Global Alignment Kernels. Proceedings of the 28th
+International Conference on Machine Learning, 2011.
+"""
+
+import numpy as np
+from numba import njit, prange
+from sklearn.utils import check_random_state
+
+from aeon.distances._bounding_matrix import _create_bounding_band
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
+
+
+@njit(cache=True, fastmath=True)
+def gak_kernel(
+    x: np.ndarray,
+    y: np.ndarray,
+    sigma: float = 1.0,
+    window: float = None,
+    itakura_max_slope: float = None,
+) -> float:
+    r"""Compute the normalised global alignment kernel between two time series.
+
+    The global alignment kernel (GAK) [1]_ between series :math:`x` and :math:`y`
+    of lengths :math:`n` and :math:`m` sums over all alignments :math:`\pi` of the
+    series the product of a local kernel :math:`\kappa` along the alignment:
+
+    .. math::
+        k(x, y) = \sum_{\pi} \prod_{(i, j) \in \pi} \kappa(x_i, y_j), \quad
+        \kappa(x_i, y_j) = \frac{e^{-d_{ij}}}{2 - e^{-d_{ij}}}, \quad
+        d_{ij} = \frac{\|x_i - y_j\|^2}{2\sigma^2}
+
+    where the alignments are the warping paths of DTW. The normalised kernel is
+    :math:`k(x, y) / \sqrt{k(x, x) k(y, y)}`, which is between 0 and 1 and is 1 if
+    the series are equal.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    sigma : float, default=1.0
+        Bandwidth of the Gaussian local kernel.
+    window : float, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used. Alignments outside the window are not counted.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+
+    Returns
+    -------
+    float
+        Normalised global alignment kernel between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Cuturi M.: Fast Global Alignment Kernels. Proceedings of the 28th
+    International Conference on Machine Learning, 2011.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import gak_kernel
+    >>> x = np.array([[1, 2, 3, 4, 5, 6, 7, 8, 9, 10]])
+    >>> y = np.array([[2, 3, 4, 5, 6, 7, 8, 9, 10, 11]])
+    >>> round(gak_kernel(x, y, sigma=2.0), 6)
+    0.429592
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        _x = x.reshape((1, x.shape[0]))
+        _y = y.reshape((1, y.shape[0]))
+    elif x.ndim == 2 and y.ndim == 2:
+        _x = x
+        _y = y
+    else:
+        raise ValueError("x and y must be 1D or 2D")
+    x_size = _x.shape[1]
+    y_size = _y.shape[1]
+    band = _create_bounding_band(x_size, y_size, window, itakura_max_slope)
+    x_band = _create_bounding_band(x_size, x_size, window, itakura_max_slope)
+    y_band = _create_bounding_band(y_size, y_size, window, itakura_max_slope)
+    return _normalised_gak(
+        _log_gak(_x, _y, sigma, band),
+        _log_gak(_x, _x, sigma, x_band),
+        _log_gak(_y, _y, sigma, y_band),
+    )
+
+
+@njit(cache=True, fastmath=True)
+def _log_gak(x: np.ndarray, y: np.ndarray, sigma: float, band: np.ndarray) -> float:
+    # Logarithm of the unnormalised kernel. Only the previous and current rows of
+    # the recursion are kept, and each row is divided by its largest value.
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    n_channels = min(x.shape[0], y.shape[0])
+    scale = 2.0 * sigma * sigma
+    prev_row = np.zeros(y_size + 1)
+    curr_row = np.zeros(y_size + 1)
+    prev_row[0] = 1.0
+    log_kernel = 0.0
+    for i in range(x_size):
+        curr_row[:] = 0.0
+        row_max = 0.0
+        for j in range(band[i, 0], band[i, 1]):
+            d = 0.0
+            for c in range(n_channels):
+                diff = x[c, i] - y[c, j]
+                d += diff * diff
+            local = np.exp(-d / scale)
+            curr_row[j + 1] = (
+                local / (2.0 - local) * (prev_row[j] + prev_row[j + 1] + curr_row[j])
+            )
+            row_max = max(row_max, curr_row[j + 1])
+        if row_max == 0.0:
+            return -np.inf
+        curr_row /= row_max
+        log_kernel += np.log(row_max)
+        prev_row, curr_row = curr_row, prev_row
+    if prev_row[y_size] == 0.0:
+        return -np.inf
+    return log_kernel + np.log(prev_row[y_size])
+
+
+@njit(cache=True, fastmath=True)
+def _normalised_gak(log_xy: float, log_xx: float, log_yy: float) -> float:
+    if log_xy == -np.inf:
+        return 0.0
+    return np.exp(log_xy - 0.5 * (log_xx + log_yy))
+
+
+@threaded
+def gak_pairwise_kernel(
+    X: np.ndarray,
+    y: np.ndarray = None,
+    sigma: float = 1.0,
+    window: float = None,
+    itakura_max_slope: float = None,
+    n_jobs: int = 1,
+) -> np.ndarray:
+    """Compute the normalised global alignment kernel between a set of time series.
+
+    Parameters
+    ----------
+    X : np.ndarray, of shape (n_instances, n_channels, n_timepoints) or
+            (n_instances, n_timepoints) or (n_timepoints,)
+        A collection of time series instances.
+    y : np.ndarray, of shape (m_instances, m_channels, m_timepoints) or
+            (m_instances, m_timepoints) or (m_timepoints,), default=None
+        A collection of time series instances.
+    sigma : float, default=1.0
+        Bandwidth of the Gaussian local kernel.
+    window : float, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
+
+    Returns
+    -------
+    np.ndarray (n_instances, n_instances) or (n_instances, m_instances)
+        Kernel matrix between the instances of X, or of X and y.
+
+    Raises
+    ------
+    ValueError
+        If X is not 2D or 3D array when only passing X.
+        If X and y are not 1D, 2D or 3D arrays when passing both X and y.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import gak_pairwise_kernel
+    >>> X = np.array([[[1, 2, 3]],[[4, 5, 6]], [[7, 8, 9]]])
+    >>> gak_pairwise_kernel(X, sigma=2.0).round(6)
+    array([[1.      , 0.003491, 0.      ],
+           [0.003491, 1.      , 0.003491],
+           [0.      , 0.003491, 1.      ]])
+    """
+    if y is None:
+        # To self
+        if X.ndim == 3:
+            return _gak_pairwise_kernel(X, sigma, window, itakura_max_slope)
+        if X.ndim == 2:
+            _X = X.reshape((X.shape[0], 1, X.shape[1]))
+            return _gak_pairwise_kernel(_X, sigma, window, itakura_max_slope)
+        raise ValueError("X must be 2D or 3D array")
+    _x, _y = reshape_pairwise_to_multiple(X, y)
+    return _gak_from_multiple_to_multiple_kernel(
+        _x, _y, sigma, window, itakura_max_slope
+    )
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _self_log_gak(
+    X: np.ndarray, sigma: float, window: float, itakura_max_slope: float
+) -> np.ndarray:
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
+    log_kernels = np.zeros(X.shape[0])
+    for i in prange(X.shape[0]):
+        log_kernels[i] = _log_gak(X[i], X[i], sigma, band)
+    return log_kernels
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _gak_pairwise_kernel(
+    X: np.ndarray, sigma: float, window: float, itakura_max_slope: float
+) -> np.ndarray:
+    n_instances = X.shape[0]
+    kernels = np.eye(n_instances)
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
+    log_kernels = _self_log_gak(X, sigma, window, itakura_max_slope)
+
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
+        for j in range(i + 1, n_instances):
+            kernels[i, j] = _normalised_gak(
+                _log_gak(X[i], X[j], sigma, band), log_kernels[i], log_kernels[j]
+            )
+            kernels[j, i] = kernels[i, j]
+
+    return kernels
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _gak_from_multiple_to_multiple_kernel(
+    x: np.ndarray,
+    y: np.ndarray,
+    sigma: float,
+    window: float,
+    itakura_max_slope: float,
+) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    kernels = np.zeros((n_instances, m_instances))
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
+    x_log_kernels = _self_log_gak(x, sigma, window, itakura_max_slope)
+    y_log_kernels = _self_log_gak(y, sigma, window, itakura_max_slope)
+
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        kernels[i, j] = _normalised_gak(
+            _log_gak(x[i], y[j], sigma, band), x_log_kernels[i], y_log_kernels[j]
+        )
+    return kernels
+
+
+def _sigma_gak(X: np.ndarray, n_samples: int = 100, random_state=None) -> float:
+    """Estimate a bandwidth for the global alignment kernel of a collection.
+
+    The bandwidth is the median Euclidean distance between randomly sampled time
+    points of the collection, multiplied by the square root of the series length,
+    as suggested in [1]_.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        A collection of time series.
+    n_samples : int, default=100
+        Number of time points to sample.
+    random_state : int, np.random.RandomState instance or None, default=None
+        Determines the time points sampled.
+
+    Returns
+    -------
+    float
+        Bandwidth of the local kernel.
+    """
+    random_state = check_random_state(random_state)
+    points = X.transpose((0, 2, 1)).reshape((-1, X.shape[1]))
+    sample = points[
+        random_state.choice(
+            points.shape[0], n_samples, replace=points.shape[0] < n_samples
+        )
+    ]
+    diffs = sample[:, np.newaxis] - sample[np.newaxis]
+    distances = np.sqrt(np.sum(diffs * diffs, axis=2))
+    return float(
+        np.median(distances[np.triu_indices(n_samples, 1)]) * np.sqrt(X.shape[2])
+    )
@@ -5,12 +5,17 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_lcss_return_path
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_row_span,
+    _create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -33,7 +38,7 @@ def lcss_distance(
     of matching pairs. The LCSS distance uses a matrix :math:`L` that records the
     sequence of matches over valid warpings. For two series :math:`a = a_1,... a_n`
     and :math:`b = b_1,... b_m, L'` is found by iterating over all valid windows (i.e.
-    where bounding_matrix is not infinity, which by default is the constant band
+    where band is not infinity, which by default is the constant band
     :math:`|i-j|<w*m`, where :math:`w` is the window parameter value and :math:`m` is
     series length), then calculating
 
@@ -104,15 +109,13 @@ def lcss_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _lcss_distance(_x, _y, bounding_matrix, epsilon)
+        return _lcss_distance(_x, _y, band, epsilon)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _lcss_distance(x, y, bounding_matrix, epsilon)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _lcss_distance(x, y, band, epsilon)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -190,10 +193,26 @@ def lcss_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _lcss_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, epsilon: float
+    x: np.ndarray, y: np.ndarray, band: np.ndarray, epsilon: float
 ) -> float:
-    distance = _lcss_cost_matrix(x, y, bounding_matrix, epsilon)[x.shape[1], y.shape[1]]
-    return 1 - (float(distance / min(x.shape[1], y.shape[1])))
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.zeros(y_size + 1)
+    curr_row = np.zeros(y_size + 1)
+
+    for i in range(1, x_size + 1):
+        reset_start, reset_end = _band_row_span(band, i - 1, y_size)
+        curr_row[reset_start : reset_end + 1] = 0.0
+        for j in range(band[i - 1, 0] + 1, band[i - 1, 1] + 1):
+            if _univariate_euclidean_distance(x[:, i - 1], y[:, j - 1]) <= epsilon:
+                curr_row[j] = 1 + prev_row[j - 1]
+            else:
+                curr_row[j] = max(curr_row[j - 1], prev_row[j])
+        prev_row, curr_row = curr_row, prev_row
+
+    return 1 - (float(prev_row[y_size] / min(x_size, y_size)))
 
 
 @njit(cache=True, fastmath=True)
@@ -217,13 +236,14 @@ def _lcss_cost_matrix(
     return cost_matrix
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def lcss_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
     window: float = None,
     epsilon: float = 1.0,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the LCSS pairwise distance between a set of time series.
 
@@ -244,6 +264,9 @@ def lcss_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -296,25 +319,24 @@ def lcss_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _lcss_pairwise_distance(
     X: np.ndarray, window: float, epsilon: float, itakura_max_slope: float
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _lcss_distance(X[i], X[j], bounding_matrix, epsilon)
+            distances[i, j] = _lcss_distance(X[i], X[j], band, epsilon)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _lcss_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -325,13 +347,12 @@ def _lcss_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _lcss_distance(x[i], y[j], bounding_matrix, epsilon)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _lcss_distance(x[i], y[j], band, epsilon)
     return distances
 
 
@@ -0,0 +1,634 @@
+# -*- coding: utf-8 -*-
+r"""Lower bounds for the dynamic time warping (DTW) distance.
+
+A lower bound is a cheap to compute value that is never larger than the DTW
+distance between two series. In nearest neighbour search, a candidate whose lower
+bound is already larger than the distance to the best match found so far cannot be
+the nearest neighbour, so the full DTW computation can be skipped [1]_.
+
+All bounds here are for :func:`aeon.distances.dtw_distance`, i.e. the squared
+pointwise cost summed over channels, and respect the same ``window`` and
+``itakura_max_slope`` constraints.
+
+References
+----------
+.. [1] Rakthanmanon T. et al.: Searching and mining trillions of time series
+subsequences under dynamic time warping, Proceedings of the 18th ACM SIGKDD
+international conference on Knowledge discovery and data mining, 2012.
+"""
+
+from typing import List, Tuple, Union
+
+import numpy as np
+from numba import njit
+
+from aeon.distances._bounding_matrix import (
+    _create_bounding_band,
+    _in_band,
+    _transpose_band,
+)
+from aeon.distances._dtw import _dtw_distance
+
+
+def create_envelope(
+    x: np.ndarray, window: float = None, itakura_max_slope: float = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the lower and upper envelope of a time series.
+
+    The envelope at time point ``i`` is the minimum and maximum of ``x`` over the
+    time points ``i`` can be aligned with under the bounding matrix created by
+    :func:`aeon.distances.create_bounding_matrix` for a series of the same length.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+
+    Returns
+    -------
+    lower : np.ndarray
+        Lower envelope, same shape as ``x``.
+    upper : np.ndarray
+        Upper envelope, same shape as ``x``.
+
+    Raises
+    ------
+    ValueError
+        If x is not a 1D or 2D array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import create_envelope
+    >>> x = np.array([1.0, 3.0, 2.0, 5.0, 4.0])
+    >>> lower, upper = create_envelope(x, window=0.2)
+    >>> lower
+    array([1., 1., 2., 2., 4.])
+    >>> upper
+    array([3., 3., 5., 5., 5.])
+    """
+    if x.ndim == 1:
+        _x = x.reshape((1, x.shape[0]))
+        band = _create_bounding_band(
+            _x.shape[1], _x.shape[1], window, itakura_max_slope
+        )
+        lower, upper = _envelope(_x, band)
+        return lower[0], upper[0]
+    if x.ndim == 2:
+        band = _create_bounding_band(x.shape[1], x.shape[1], window, itakura_max_slope)
+        return _envelope(x, band)
+    raise ValueError("x must be 1D or 2D")
+
+
+def create_envelopes(
+    X: np.ndarray, window: float = None, itakura_max_slope: float = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Compute the lower and upper envelopes of a collection of time series.
+
+    The envelopes of a training set only depend on the series and the bounding
+    constraint, so they can be computed once and passed to
+    :func:`lower_bound_cascade` for every query.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        A collection of time series instances  of shape ``(n_instances,
+        n_timepoints)`` or ``(n_instances, n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+
+    Returns
+    -------
+    lower : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        Lower envelope of each series.
+    upper : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        Upper envelope of each series.
+
+    Raises
+    ------
+    ValueError
+        If X is not a 2D or 3D array.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import create_envelopes
+    >>> X = np.array([[1.0, 3.0, 2.0, 5.0, 4.0], [0.0, 1.0, 0.0, 1.0, 0.0]])
+    >>> lower, upper = create_envelopes(X, window=0.2)
+    >>> lower.shape
+    (2, 1, 5)
+    """
+    if X.ndim == 2:
+        _X = X.reshape((X.shape[0], 1, X.shape[1]))
+    elif X.ndim == 3:
+        _X = X
+    else:
+        raise ValueError("X must be 2D or 3D")
+    band = _create_bounding_band(_X.shape[2], _X.shape[2], window, itakura_max_slope)
+    return _envelopes(_X, band)
+
+
+def lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    """Compute the LB_Kim lower bound of the DTW distance.
+
+    Every warping path aligns the first and the last time points of both series,
+    so the cost of those two alignments is a lower bound of DTW [1]_. This is the
+    constant time ``LB_KimFL`` variant used in the UCR suite.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+
+    Returns
+    -------
+    float
+        LB_Kim lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Kim S., Park S. and Chu W.: An index-based approach for similarity search
+    supporting time warping in large sequence databases, Proceedings 17th
+    International Conference on Data Engineering, 2001.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_kim
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0])
+    >>> y = np.array([2.0, 2.0, 2.0, 2.0])
+    >>> lb_kim(x, y)
+    5.0
+    """
+    _x, _y = _reshape_pair(x, y)
+    return _lb_kim(_x, _y)
+
+
+def lb_keogh(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    y_envelope: Tuple[np.ndarray, np.ndarray] = None,
+) -> float:
+    """Compute the LB_Keogh lower bound of the DTW distance.
+
+    Each time point of ``x`` is aligned with at least one time point of ``y`` inside
+    its window, so the distance from ``x`` to the envelope of ``y`` is a lower bound
+    of DTW [1]_.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    y_envelope : tuple of two np.ndarray, default=None
+        Envelope of ``y`` returned by :func:`create_envelope` with the same
+        ``window`` and ``itakura_max_slope``. Only valid if x and y have the same
+        length. If None, the envelope is computed.
+
+    Returns
+    -------
+    float
+        LB_Keogh lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Keogh E. and Ratanamahatana C.: Exact indexing of dynamic time warping,
+    Knowledge and Information Systems 7(3):358–386, 2005.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_keogh
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([2.0, 2.0, 2.0, 2.0, 2.0])
+    >>> lb_keogh(x, y, window=0.2)
+    15.0
+    """
+    _x, _y = _reshape_pair(x, y)
+    band = _create_bounding_band(_x.shape[1], _y.shape[1], window, itakura_max_slope)
+    lower, upper = _get_envelope(_y, band, y_envelope)
+    return _lb_keogh(_x, lower, upper, 0, _x.shape[1])
+
+
+def lb_improved(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    itakura_max_slope: float = None,
+    y_envelope: Tuple[np.ndarray, np.ndarray] = None,
+) -> float:
+    """Compute the LB_Improved lower bound of the DTW distance.
+
+    LB_Improved [1]_ adds to LB_Keogh the distance from ``y`` to the envelope of the
+    projection of ``x`` onto the envelope of ``y``. It is always at least as tight
+    as LB_Keogh.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    y_envelope : tuple of two np.ndarray, default=None
+        Envelope of ``y`` returned by :func:`create_envelope` with the same
+        ``window`` and ``itakura_max_slope``. Only valid if x and y have the same
+        length. If None, the envelope is computed.
+
+    Returns
+    -------
+    float
+        LB_Improved lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Lemire D.: Faster retrieval with a two-pass dynamic-time-warping lower
+    bound, Pattern Recognition 42(9):2169–2180, 2009.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_improved
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([2.0, 2.0, 2.0, 2.0, 2.0])
+    >>> lb_improved(x, y, window=0.2)
+    15.0
+    """
+    _x, _y = _reshape_pair(x, y)
+    band = _create_bounding_band(_x.shape[1], _y.shape[1], window, itakura_max_slope)
+    lower, upper = _get_envelope(_y, band, y_envelope)
+    return _lb_improved(_x, _y, lower, upper, band, np.inf)
+
+
+def lb_enhanced(
+    x: np.ndarray,
+    y: np.ndarray,
+    n_bands: int = 5,
+    window: float = None,
+    itakura_max_slope: float = None,
+    y_envelope: Tuple[np.ndarray, np.ndarray] = None,
+) -> float:
+    """Compute the LB_Enhanced lower bound of the DTW distance.
+
+    LB_Enhanced [1]_ uses the fact that every warping path crosses each of the
+    ``n_bands`` L-shaped bands at the start and the end of the cost matrix. The
+    minimum cost in each band is summed with the LB_Keogh bound of the remaining
+    time points. It is tight for small windows, where LB_Keogh is weakest at the
+    ends of the series.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    n_bands : int, default=5
+        Number of bands used at each end of the series. It is capped at half the
+        length of ``x`` and the length of ``y``.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    y_envelope : tuple of two np.ndarray, default=None
+        Envelope of ``y`` returned by :func:`create_envelope` with the same
+        ``window`` and ``itakura_max_slope``. Only valid if x and y have the same
+        length. If None, the envelope is computed.
+
+    Returns
+    -------
+    float
+        LB_Enhanced lower bound of the DTW distance between x and y.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Tan C., Petitjean F. and Webb G.: Elastic bands across the path: A new
+    framework and method to lower bound DTW, Proceedings of the 2019 SIAM
+    International Conference on Data Mining, 2019.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import lb_enhanced
+    >>> x = np.array([1.0, 2.0, 3.0, 4.0, 5.0])
+    >>> y = np.array([2.0, 2.0, 2.0, 2.0, 2.0])
+    >>> lb_enhanced(x, y, n_bands=2, window=0.2)
+    15.0
+    """
+    _x, _y = _reshape_pair(x, y)
+    band = _create_bounding_band(_x.shape[1], _y.shape[1], window, itakura_max_slope)
+    lower, upper = _get_envelope(_y, band, y_envelope)
+    return _lb_enhanced(_x, _y, lower, upper, band, n_bands)
+
+
+def lower_bound_cascade(
+    x: np.ndarray,
+    X: Union[np.ndarray, List[np.ndarray]],
+    window: float = None,
+    itakura_max_slope: float = None,
+    envelopes: Tuple[np.ndarray, np.ndarray] = None,
+    upper_bound: float = np.inf,
+) -> np.ndarray:
+    """Find the DTW nearest neighbour of a series, pruning with lower bounds.
+
+    Candidates are visited in order. Each is tested against the distance to the
+    nearest neighbour found so far with LB_Kim, then LB_Keogh, then LB_Improved,
+    and only candidates that pass all three have their DTW distance computed, with
+    the current nearest neighbour distance as ``upper_bound``.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Query time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    X : np.ndarray or list of np.ndarray
+        Candidate series, of shape ``(n_instances, n_timepoints)`` or
+        ``(n_instances, n_channels, n_timepoints)``, or a list of 1D or 2D arrays
+        if the series are unequal length.
+    window : float or None, default=None
+        The window to use for the bounding matrix. If None, no bounding matrix
+        is used.
+    itakura_max_slope : float, default=None
+        Maximum slope as a proportion of the number of time points used to create
+        Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    envelopes : tuple of two np.ndarray, default=None
+        Envelopes of ``X`` returned by :func:`create_envelopes` with the same
+        ``window`` and ``itakura_max_slope``, cached so they are not recomputed
+        for every query. Requires ``x`` to be the same length as the series in
+        ``X``. If None, envelopes are computed for each candidate.
+    upper_bound : float, default=np.inf
+        Only candidates with a DTW distance of at most ``upper_bound`` are returned.
+
+    Returns
+    -------
+    np.ndarray of shape (n_instances,)
+        DTW distance from ``x`` to each candidate, or ``np.inf`` for candidates that
+        were pruned. ``np.argmin`` of the result is the exact nearest neighbour.
+
+    Raises
+    ------
+    ValueError
+        If ``envelopes`` are passed and ``x`` is a different length to the
+        series in ``X``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import create_envelopes, lower_bound_cascade
+    >>> X = np.array([[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0], [1.0, 2.0, 2.0, 4.0]])
+    >>> envelopes = create_envelopes(X, window=0.25)
+    >>> distances = lower_bound_cascade(
+    ...     np.array([1.0, 2.0, 2.5, 4.0]), X, window=0.25, envelopes=envelopes
+    ... )
+    >>> int(np.argmin(distances))
+    0
+    """
+    _x = x.reshape((1, x.shape[0])) if x.ndim == 1 else x
+    if envelopes is not None:
+        lower, upper = envelopes
+        if lower.ndim == 2:
+            lower = lower.reshape((lower.shape[0], 1, lower.shape[1]))
+            upper = upper.reshape((upper.shape[0], 1, upper.shape[1]))
+        if lower.shape[2] != _x.shape[1]:
+            raise ValueError(
+                "envelopes can only be used with a query the same length as the "
+                "series in X"
+            )
+
+    distances = np.full(len(X), np.inf)
+    best = upper_bound
+    band = None
+    band_size = -1
+    for i in range(len(X)):
+        _y = X[i].reshape((1, X[i].shape[0])) if X[i].ndim == 1 else X[i]
+        if band_size != _y.shape[1]:
+            band_size = _y.shape[1]
+            band = _create_bounding_band(
+                _x.shape[1], _y.shape[1], window, itakura_max_slope
+            )
+        if envelopes is None:
+            y_lower, y_upper = _envelope(_y, band)
+        else:
+            y_lower, y_upper = lower[i], upper[i]
+        distances[i] = _cascade_distance(_x, _y, y_lower, y_upper, band, best)
+        best = min(best, distances[i])
+    return distances
+
+
+def _reshape_pair(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if x.ndim == 1 and y.ndim == 1:
+        return x.reshape((1, x.shape[0])), y.reshape((1, y.shape[0]))
+    if x.ndim == 2 and y.ndim == 2:
+        return x, y
+    raise ValueError("x and y must be 1D or 2D")
+
+
+def _get_envelope(
+    y: np.ndarray,
+    band: np.ndarray,
+    y_envelope: Tuple[np.ndarray, np.ndarray],
+) -> Tuple[np.ndarray, np.ndarray]:
+    if y_envelope is None:
+        return _envelope(y, band)
+    lower, upper = y_envelope
+    return lower.reshape(y.shape), upper.reshape(y.shape)
+
+
+@njit(cache=True, fastmath=True)
+def _envelope(x: np.ndarray, band: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Envelope of x for each row of the band. Rows with no cell in bounds can never
+    # be aligned, so they get an infinite envelope and add nothing to the bounds.
+    n_channels = x.shape[0]
+    n_rows = band.shape[0]
+    lower = np.full((n_channels, n_rows), -np.inf)
+    upper = np.full((n_channels, n_rows), np.inf)
+    for i in range(n_rows):
+        if band[i, 0] < band[i, 1]:
+            for c in range(n_channels):
+                lower[c, i] = np.min(x[c, band[i, 0] : band[i, 1]])
+                upper[c, i] = np.max(x[c, band[i, 0] : band[i, 1]])
+    return lower, upper
+
+
+@njit(cache=True, fastmath=True)
+def _envelopes(X: np.ndarray, band: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    lower = np.zeros((X.shape[0], X.shape[1], band.shape[0]))
+    upper = np.zeros((X.shape[0], X.shape[1], band.shape[0]))
+    for i in range(X.shape[0]):
+        lower[i], upper[i] = _envelope(X[i], band)
+    return lower, upper
+
+
+@njit(cache=True, fastmath=True)
+def _lb_kim(x: np.ndarray, y: np.ndarray) -> float:
+    bound = 0.0
+    for c in range(x.shape[0]):
+        bound += (x[c, 0] - y[c, 0]) ** 2
+    if x.shape[1] > 1 or y.shape[1] > 1:
+        for c in range(x.shape[0]):
+            bound += (x[c, -1] - y[c, -1]) ** 2
+    return bound
+
+
+@njit(cache=True, fastmath=True)
+def _lb_keogh(
+    x: np.ndarray, lower: np.ndarray, upper: np.ndarray, start: int, end: int
+) -> float:
+    bound = 0.0
+    for i in range(start, end):
+        for c in range(x.shape[0]):
+            if x[c, i] > upper[c, i]:
+                bound += (x[c, i] - upper[c, i]) ** 2
+            elif x[c, i] < lower[c, i]:
+                bound += (x[c, i] - lower[c, i]) ** 2
+    return bound
+
+
+@njit(cache=True, fastmath=True)
+def _lb_improved(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+    upper_bound: float,
+) -> float:
+    # Project x onto the envelope of y, then add the distance from y to the
+    # envelope of the projection, taken over the columns of the bounding matrix.
+    bound = 0.0
+    projection = np.empty_like(x)
+    for i in range(x.shape[1]):
+        for c in range(x.shape[0]):
+            if x[c, i] > upper[c, i]:
+                projection[c, i] = upper[c, i]
+                bound += (x[c, i] - upper[c, i]) ** 2
+            elif x[c, i] < lower[c, i]:
+                projection[c, i] = lower[c, i]
+                bound += (x[c, i] - lower[c, i]) ** 2
+            else:
+                projection[c, i] = x[c, i]
+    if bound > upper_bound:
+        return bound
+
+    projection_lower, projection_upper = _envelope(
+        projection, _transpose_band(band, y.shape[1])
+    )
+    return bound + _lb_keogh(y, projection_lower, projection_upper, 0, y.shape[1])
+
+
+@njit(cache=True, fastmath=True)
+def _lb_enhanced(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+    n_bands: int,
+) -> float:
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    n_bands = min(n_bands, x_size // 2, y_size)
+    bound = 0.0
+    for i in range(n_bands):
+        # Left L-shaped band: cells with max(row, column) == i.
+        left = np.inf
+        # Right L-shaped band: cells with max(x_size - 1 - row, y_size - 1 - column)
+        # == i.
+        right = np.inf
+        for j in range(i + 1):
+            if _in_band(band, j, i):
+                left = min(left, _cell_cost(x, y, j, i))
+            if _in_band(band, i, j):
+                left = min(left, _cell_cost(x, y, i, j))
+            row = x_size - 1 - i
+            column = y_size - 1 - j
+            if _in_band(band, row, column):
+                right = min(right, _cell_cost(x, y, row, column))
+            row = x_size - 1 - j
+            column = y_size - 1 - i
+            if _in_band(band, row, column):
+                right = min(right, _cell_cost(x, y, row, column))
+        bound += left + right
+    return bound + _lb_keogh(x, lower, upper, n_bands, x_size - n_bands)
+
+
+@njit(cache=True, fastmath=True)
+def _cell_cost(x: np.ndarray, y: np.ndarray, i: int, j: int) -> float:
+    cost = 0.0
+    for c in range(x.shape[0]):
+        cost += (x[c, i] - y[c, j]) ** 2
+    return cost
+
+
+@njit(cache=True, fastmath=True)
+def _cascade_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+    upper_bound: float,
+) -> float:
+    if _lb_kim(x, y) > upper_bound:
+        return np.inf
+    if _lb_keogh(x, lower, upper, 0, x.shape[1]) > upper_bound:
+        return np.inf
+    if _lb_improved(x, y, lower, upper, band, upper_bound) > upper_bound:
+        return np.inf
+    return _dtw_distance(x, y, band, upper_bound)
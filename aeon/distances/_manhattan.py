@@ -2,9 +2,10 @@
 __author__ = ["chrisholder", "TonyBagnall", "baraline"]
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -69,8 +70,10 @@ def _univariate_manhattan_distance(x: np.ndarray, y: np.ndarray) -> float:
     return distance
 
 
-@njit(cache=True, fastmath=True)
-def manhattan_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarray:
+@threaded
+def manhattan_pairwise_distance(
+    X: np.ndarray, y: np.ndarray = None, n_jobs: int = 1
+) -> np.ndarray:
     """Compute the manhattan pairwise distance between a set of time series.
 
     Parameters
@@ -81,7 +84,9 @@ def manhattan_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarr
     y : np.ndarray, of shape (m_instances, m_channels, m_timepoints) or
             (m_instances, m_timepoints) or (m_timepoints,), default=None
         A collection of time series instances.
-
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -131,12 +136,13 @@ def manhattan_pairwise_distance(X: np.ndarray, y: np.ndarray = None) -> np.ndarr
     return _manhattan_from_multiple_to_multiple_distance(_x, _y)
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _manhattan_pairwise_distance(X: np.ndarray) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
             distances[i, j] = manhattan_distance(X[i], X[j])
             distances[j, i] = distances[i, j]
@@ -144,7 +150,7 @@ def _manhattan_pairwise_distance(X: np.ndarray) -> np.ndarray:
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _manhattan_from_multiple_to_multiple_distance(
     x: np.ndarray, y: np.ndarray
 ) -> np.ndarray:
@@ -152,7 +158,8 @@ def _manhattan_from_multiple_to_multiple_distance(
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = manhattan_distance(x[i], y[j])
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = manhattan_distance(x[i], y[j])
     return distances
@@ -5,15 +5,22 @@ __author__ = ["chrisholder", "jlines", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_is_full,
+    _band_row_span,
+    _create_bounding_band,
+    _in_band,
+    create_bounding_matrix,
+)
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -24,6 +31,7 @@ def msm_distance(
     independent: bool = True,
     c: float = 1.0,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the MSM distance between two time series.
 
@@ -86,6 +94,9 @@ def msm_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        If the MSM distance is greater than ``upper_bound``, the computation is
+        abandoned early and ``np.inf`` is returned.
 
     Returns
     -------
@@ -116,15 +127,13 @@ def msm_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _msm_distance(_x, _y, bounding_matrix, independent, c)
+        return _msm_distance(_x, _y, band, independent, c, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _msm_distance(x, y, bounding_matrix, independent, c)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _msm_distance(x, y, band, independent, c, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -227,17 +236,107 @@ def msm_cost_matrix(
 def _msm_distance(
     x: np.ndarray,
     y: np.ndarray,
-    bounding_matrix: np.ndarray,
+    band: np.ndarray,
     independent: bool,
     c: float,
+    upper_bound: float = np.inf,
 ) -> float:
+    # Out of bounds cells are left at zero, so the minimum of a row is only a lower
+    # bound on the distance if every cell is in bounds.
+    early_abandon = upper_bound < np.inf and _band_is_full(band, y.shape[1])
     if independent:
-        return _msm_independent_cost_matrix(x, y, bounding_matrix, c)[
-            x.shape[1] - 1, y.shape[1] - 1
-        ]
-    return _msm_dependent_cost_matrix(x, y, bounding_matrix, c)[
-        x.shape[1] - 1, y.shape[1] - 1
-    ]
+        distance = 0.0
+        for i in range(x.shape[0]):
+            distance += _independent_distance(
+                x[i], y[i], band, c, distance, upper_bound, early_abandon
+            )
+            if distance > upper_bound:
+                return np.inf
+        return distance
+    return _dependent_distance(x, y, band, c, upper_bound, early_abandon)
+
+
+@njit(cache=True, fastmath=True)
+def _independent_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    band: np.ndarray,
+    c: float,
+    offset: float,
+    upper_bound: float,
+    early_abandon: bool,
+) -> float:
+    # offset is the distance accumulated over the previous channels.
+    x_size = x.shape[0]
+    y_size = y.shape[0]
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.zeros(y_size)
+    curr_row = np.zeros(y_size)
+    prev_row[0] = np.abs(x[0] - y[0])
+
+    for i in range(max(band[0, 0], 1), band[0, 1]):
+        cost = _cost_independent(y[i], y[i - 1], x[0], c)
+        prev_row[i] = prev_row[i - 1] + cost
+
+    for i in range(1, x_size):
+        reset_start, reset_end = _band_row_span(band, i, y_size)
+        curr_row[max(reset_start - 1, 0) : reset_end] = 0.0
+        if _in_band(band, i, 0):
+            cost = _cost_independent(x[i], x[i - 1], y[0], c)
+            curr_row[0] = prev_row[0] + cost
+        for j in range(max(band[i, 0], 1), band[i, 1]):
+            d1 = prev_row[j - 1] + np.abs(x[i] - y[j])
+            d2 = prev_row[j] + _cost_independent(x[i], x[i - 1], y[j], c)
+            d3 = curr_row[j - 1] + _cost_independent(y[j], x[i], y[j - 1], c)
+
+            curr_row[j] = min(d1, d2, d3)
+        if early_abandon and offset + np.min(curr_row) > upper_bound:
+            return np.inf
+        prev_row, curr_row = curr_row, prev_row
+
+    return prev_row[y_size - 1]
+
+
+@njit(cache=True, fastmath=True)
+def _dependent_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    band: np.ndarray,
+    c: float,
+    upper_bound: float,
+    early_abandon: bool,
+) -> float:
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.zeros(y_size)
+    curr_row = np.zeros(y_size)
+    prev_row[0] = np.sum(np.abs(x[:, 0] - y[:, 0]))
+
+    for i in range(max(band[0, 0], 1), band[0, 1]):
+        cost = _cost_dependent(y[:, i], y[:, i - 1], x[:, 0], c)
+        prev_row[i] = prev_row[i - 1] + cost
+
+    for i in range(1, x_size):
+        reset_start, reset_end = _band_row_span(band, i, y_size)
+        curr_row[max(reset_start - 1, 0) : reset_end] = 0.0
+        if _in_band(band, i, 0):
+            cost = _cost_dependent(x[:, i], x[:, i - 1], y[:, 0], c)
+            curr_row[0] = prev_row[0] + cost
+        for j in range(max(band[i, 0], 1), band[i, 1]):
+            d1 = prev_row[j - 1] + np.sum(np.abs(x[:, i] - y[:, j]))
+            d2 = prev_row[j] + _cost_dependent(x[:, i], x[:, i - 1], y[:, j], c)
+            d3 = curr_row[j - 1] + _cost_dependent(y[:, j], x[:, i], y[:, j - 1], c)
+
+            curr_row[j] = min(d1, d2, d3)
+        if early_abandon and np.min(curr_row) > upper_bound:
+            return np.inf
+        prev_row, curr_row = curr_row, prev_row
+
+    distance = prev_row[y_size - 1]
+    if distance > upper_bound:
+        return np.inf
+    return distance
 
 
 @njit(cache=True, fastmath=True)
@@ -343,7 +442,7 @@ def _cost_independent(x: float, y: float, z: float, c: float) -> float:
     return c + min(abs(x - y), abs(x - z))
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def msm_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -351,6 +450,7 @@ def msm_pairwise_distance(
     independent: bool = True,
     c: float = 1.0,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the msm pairwise distance between a set of time series.
 
@@ -373,6 +473,9 @@ def msm_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -445,7 +548,7 @@ def msm_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _msm_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -455,19 +558,18 @@ def _msm_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _msm_distance(X[i], X[j], bounding_matrix, independent, c)
+            distances[i, j] = _msm_distance(X[i], X[j], band, independent, c)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _msm_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -479,13 +581,12 @@ def _msm_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _msm_distance(x[i], y[j], bounding_matrix, independent, c)
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _msm_distance(x[i], y[j], band, independent, c)
     return distances
 
 
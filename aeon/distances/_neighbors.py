@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""Nearest neighbours of time series in a collection."""
+
+import inspect
+from typing import Any, List, Tuple, Union
+
+import numpy as np
+from numba import njit, prange
+from numba.typed import List as NumbaList
+
+from aeon.distances._distance import DISTANCES_DICT, DistanceFunction
+from aeon.utils._threading import threaded
+
+
+@threaded
+def nearest_neighbors(
+    x: Union[np.ndarray, List[np.ndarray]],
+    y: Union[np.ndarray, List[np.ndarray]],
+    metric: Union[str, DistanceFunction],
+    n_neighbors: int = 1,
+    n_jobs: int = 1,
+    **kwargs: Any,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Find the nearest neighbours of one or more series in a collection.
+
+    The distances from every query series in ``x`` to every series in ``y`` are
+    computed in a single compiled call for the distances in
+    :func:`aeon.distances.get_distance_function`, and only the ``n_neighbors``
+    closest are kept. Distances that support an ``upper_bound`` (dtw, ddtw, wdtw,
+    wddtw, adtw, erp, msm and twe) are early abandoned once they exceed the distance
+    to the current ``n_neighbors``-th nearest neighbour.
+
+    Parameters
+    ----------
+    x : np.ndarray or list of np.ndarray
+        A single query series of shape ``(n_timepoints,)`` or ``(n_channels,
+        n_timepoints)``, or a collection of queries of shape ``(n_queries,
+        n_channels, n_timepoints)`` or a list of 2D arrays. If ``x`` and ``y`` are
+        both 2D arrays, ``x`` is a collection of univariate queries of shape
+        ``(n_queries, n_timepoints)``.
+    y : np.ndarray or list of np.ndarray
+        The collection to search, of shape ``(n_instances, n_timepoints)`` or
+        ``(n_instances, n_channels, n_timepoints)``, or a list of 1D or 2D arrays
+        if the series are unequal length.
+    metric : str or Callable
+        The distance metric to use.
+        A list of valid distance metrics can be found in the documentation for
+        :func:`aeon.distances.get_distance_function`.
+    n_neighbors : int or None, default=1
+        Number of neighbours to find for each query. If None, all series in ``y``
+        are returned, sorted by distance, and no distance is early abandoned.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
+        Callable and mpdist metrics are always computed serially.
+    kwargs : Any
+        Arguments for metric. Refer to each metrics documentation for a list of
+        possible arguments.
+
+    Returns
+    -------
+    indices : np.ndarray of shape (n_queries, n_neighbors)
+        Indices in ``y`` of the nearest neighbours of each query, ordered by
+        distance. Ties are broken by the lower index.
+    distances : np.ndarray of shape (n_queries, n_neighbors)
+        Distances to the nearest neighbours of each query.
+
+    Raises
+    ------
+    ValueError
+        If ``n_neighbors`` is not between 1 and the number of series in ``y``.
+        If metric is not a valid string or callable.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import nearest_neighbors
+    >>> y = np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0], [7.0, 8.0, 9.0]])
+    >>> indices, distances = nearest_neighbors(
+    ...     np.array([4.0, 5.0, 7.0]), y, metric="dtw", n_neighbors=2
+    ... )
+    >>> indices
+    array([[1, 2]])
+    >>> distances
+    array([[ 1., 18.]])
+    """
+    _x, _y = _convert_collections(x, y)
+    n_instances = len(_y)
+    if n_neighbors is None:
+        n_neighbors = n_instances
+    if not 1 <= n_neighbors <= n_instances:
+        raise ValueError(
+            f"n_neighbors must be between 1 and the number of series in y, "
+            f"{n_instances}, but found {n_neighbors}"
+        )
+
+    if isinstance(metric, str) and metric in DISTANCES_DICT:
+        distance_func = DISTANCES_DICT[metric]["distance"]
+        params, early_abandon = _distance_params(distance_func, kwargs)
+        if early_abandon and n_neighbors < n_instances:
+            return _early_abandon_nearest_neighbors(
+                _x, _y, n_neighbors, distance_func, params
+            )
+        return _nearest_neighbors(_x, _y, n_neighbors, distance_func, params)
+
+    if metric == "mpdist":
+        from aeon.distances.mpdist import mpdist
+
+        metric = mpdist
+    elif not callable(metric):
+        raise ValueError("Metric must be one of the supported strings or a callable")
+    distances = np.array([[metric(q, s, **kwargs) for s in _y] for q in _x])
+    indices = np.argsort(distances, axis=1, kind="stable")[:, :n_neighbors]
+    return indices, np.take_along_axis(distances, indices, axis=1)
+
+
+def _convert_collections(
+    x: Union[np.ndarray, List[np.ndarray]], y: Union[np.ndarray, List[np.ndarray]]
+) -> Tuple[Union[np.ndarray, NumbaList], Union[np.ndarray, NumbaList]]:
+    # Convert y to a 3D array, or a list of 2D arrays if unequal length, and x to
+    # the same kind of collection.
+    if isinstance(y, np.ndarray):
+        if y.ndim == 2:
+            if isinstance(x, np.ndarray) and x.ndim == 2:
+                x = x.reshape((x.shape[0], 1, x.shape[1]))
+            y = y.reshape((y.shape[0], 1, y.shape[1]))
+        elif y.ndim != 3:
+            raise ValueError("y must be a 2D or 3D array or a list of arrays")
+    if isinstance(x, np.ndarray):
+        if x.ndim == 1:
+            x = x.reshape((1, 1, x.shape[0]))
+        elif x.ndim == 2:
+            x = x.reshape((1, x.shape[0], x.shape[1]))
+        elif x.ndim != 3:
+            raise ValueError("x must be a 1D, 2D or 3D array or a list of arrays")
+
+    if isinstance(x, np.ndarray) and isinstance(y, np.ndarray):
+        return x.astype(np.float64, copy=False), y.astype(np.float64, copy=False)
+    return _to_numba_list(x), _to_numba_list(y)
+
+
+def _to_numba_list(X: Union[np.ndarray, List[np.ndarray]]) -> NumbaList:
+    _X = NumbaList()
+    for series in X:
+        series = np.asarray(series, dtype=np.float64)
+        _X.append(series.reshape((1, -1)) if series.ndim == 1 else series)
+    return _X
+
+
+def _distance_params(
+    distance_func: DistanceFunction, kwargs: dict
+) -> Tuple[tuple, bool]:
+    # Positional arguments of distance_func after x and y, taken from kwargs or the
+    # function defaults, and whether the last argument is upper_bound.
+    parameters = list(inspect.signature(distance_func.py_func).parameters.values())[2:]
+    early_abandon = len(parameters) > 0 and parameters[-1].name == "upper_bound"
+    if early_abandon:
+        parameters = parameters[:-1]
+    names = [p.name for p in parameters]
+    unexpected = set(kwargs) - set(names)
+    if unexpected:
+        raise TypeError(
+            f"{distance_func.__name__} got unexpected arguments {sorted(unexpected)}"
+        )
+    params = tuple(kwargs.get(p.name, p.default) for p in parameters)
+    return params, early_abandon
+
+
+@njit(fastmath=True, parallel=True)
+def _nearest_neighbors(
+    x, y, n_neighbors: int, distance_func, params: tuple
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_queries = len(x)
+    indices = np.full((n_queries, n_neighbors), -1, dtype=np.int64)
+    distances = np.full((n_queries, n_neighbors), np.inf)
+    for k in prange(n_queries):
+        # prange indices are unsigned, but typed lists are indexed by int64.
+        i = np.int64(k)
+        for j in range(len(y)):
+            _insert_neighbor(
+                indices[i], distances[i], j, distance_func(x[i], y[j], *params)
+            )
+    return indices, distances
+
+
+@njit(fastmath=True, parallel=True)
+def _early_abandon_nearest_neighbors(
+    x, y, n_neighbors: int, distance_func, params: tuple
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_queries = len(x)
+    indices = np.full((n_queries, n_neighbors), -1, dtype=np.int64)
+    distances = np.full((n_queries, n_neighbors), np.inf)
+    for k in prange(n_queries):
+        i = np.int64(k)
+        for j in range(len(y)):
+            # The distance to the current n_neighbors-th neighbour is an upper bound
+            # for any series that can still be a neighbour.
+            upper_bound = distances[i, n_neighbors - 1]
+            distance = distance_func(x[i], y[j], *(params + (upper_bound,)))
+            _insert_neighbor(indices[i], distances[i], j, distance)
+    return indices, distances
+
+
+@njit(cache=True, fastmath=True)
+def _insert_neighbor(
+    indices: np.ndarray, distances: np.ndarray, index: int, distance: float
+) -> None:
+    # Insert into the neighbours sorted by distance then index, where empty places
+    # have index -1.
+    pos = indices.shape[0]
+    while pos > 0 and (
+        indices[pos - 1] == -1
+        or distances[pos - 1] > distance
+        or (distances[pos - 1] == distance and indices[pos - 1] > index)
+    ):
+        pos -= 1
+    if pos == indices.shape[0]:
+        return
+    for k in range(indices.shape[0] - 1, pos, -1):
+        distances[k] = distances[k - 1]
+        indices[k] = indices[k - 1]
+    distances[pos] = distance
+    indices[pos] = index
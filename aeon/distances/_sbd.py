@@ -0,0 +1,338 @@
+# -*- coding: utf-8 -*-
+r"""Shape-based distance (SBD) between time series.
+
+The shape-based distance [1]_ is one minus the largest normalised cross-correlation
+of two series over all shifts of one against the other. Cross-correlations summed
+over the channels of multivariate series are normalised by the product of the norms
+of the whole series.
+
+Between two series the cross-correlation is computed directly. For pairwise
+distances between collections of series of at least ``_FFT_MIN_TIMEPOINTS`` time
+points, the cross-correlations of a block of rows with all columns are computed at
+once with the fast Fourier transform, where multiplying the transforms for every
+pair and summing over channels is a single batched matrix product.
+
+References
+----------
+.. [1] Paparrizos J. and Gravano L.: k-Shape: Efficient and Accurate Clustering of
+Time Series. Proceedings of the 2015 ACM SIGMOD International Conference on
+Management of Data, 2015.
+"""
+
+import numpy as np
+from numba import njit, prange
+from scipy.fft import irfft, next_fast_len, rfft
+
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
+from aeon.utils.validation import check_n_jobs
+
+# Shortest series for which pairwise cross-correlations are computed with the FFT.
+_FFT_MIN_TIMEPOINTS = 64
+# Largest number of bytes used by the cross-correlations of one block of rows.
+_MAX_BLOCK_BYTES = 2**26
+
+
+@njit(cache=True, fastmath=True)
+def sbd_distance(x: np.ndarray, y: np.ndarray, standardize: bool = True) -> float:
+    r"""Compute the shape-based distance (SBD) between two time series.
+
+    The shape-based distance [1]_ between series :math:`x` and :math:`y` is defined
+    as:
+
+    .. math::
+        sbd(x, y) = 1 - \max_w \frac{CC_w(x, y)}{\|x\| \|y\|}
+
+    where :math:`CC_w(x, y)` is the cross-correlation of :math:`x` and :math:`y`
+    with :math:`y` shifted by :math:`w` time points, summed over channels for
+    multivariate series. The distance is between 0 and 2, and is 0 if one series is
+    a shifted and scaled copy of the other.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        First time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    y : np.ndarray
+        Second time series, either univariate, shape ``(n_timepoints,)``, or
+        multivariate, shape ``(n_channels, n_timepoints)``.
+    standardize : bool, default=True
+        Whether to z-normalise each channel of the series before computing the
+        distance. Constant channels are only mean centred.
+
+    Returns
+    -------
+    float
+        Shape-based distance between x and y. If either series is zero everywhere
+        the distance is 1, or 0 if both are.
+
+    Raises
+    ------
+    ValueError
+        If x and y are not 1D or 2D arrays.
+
+    References
+    ----------
+    .. [1] Paparrizos J. and Gravano L.: k-Shape: Efficient and Accurate Clustering
+    of Time Series. Proceedings of the 2015 ACM SIGMOD International Conference on
+    Management of Data, 2015.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import sbd_distance
+    >>> x = np.array([[1, 2, 3, 4, 5, 4, 3, 2, 1, 0]])
+    >>> y = np.array([[0, 1, 2, 3, 4, 5, 4, 3, 2, 1]])
+    >>> sbd_distance(x, y)
+    0.2222222222222222
+    """
+    if x.ndim == 1 and y.ndim == 1:
+        return _sbd_distance(
+            x.reshape((1, x.shape[0])), y.reshape((1, y.shape[0])), standardize
+        )
+    if x.ndim == 2 and y.ndim == 2:
+        return _sbd_distance(x, y, standardize)
+    raise ValueError("x and y must be 1D or 2D")
+
+
+@njit(cache=True, fastmath=True)
+def _sbd_distance(x: np.ndarray, y: np.ndarray, standardize: bool) -> float:
+    n_channels = min(x.shape[0], y.shape[0])
+    if standardize:
+        _x = _z_normalise_series(x[:n_channels])
+        _y = _z_normalise_series(y[:n_channels])
+    else:
+        _x = x[:n_channels].astype(np.float64)
+        _y = y[:n_channels].astype(np.float64)
+    return _standardised_sbd_distance(_x, _y)
+
+
+@njit(cache=True, fastmath=True)
+def _standardised_sbd_distance(x: np.ndarray, y: np.ndarray) -> float:
+    # SBD of two series with the same number of channels, without normalising them.
+    x_norm = np.sum(x * x)
+    y_norm = np.sum(y * y)
+    if x_norm == 0.0 or y_norm == 0.0:
+        return 0.0 if x_norm == y_norm else 1.0
+    x_length = x.shape[1]
+    y_length = y.shape[1]
+    best = -np.inf
+    for lag in range(-(y_length - 1), x_length):
+        cc = 0.0
+        for c in range(x.shape[0]):
+            for i in range(max(0, -lag), min(y_length, x_length - lag)):
+                cc += x[c, i + lag] * y[c, i]
+        best = max(best, cc)
+    return max(0.0, 1.0 - best / np.sqrt(x_norm * y_norm))
+
+
+@njit(cache=True, fastmath=True)
+def _z_normalise_series(x: np.ndarray) -> np.ndarray:
+    _x = np.empty(x.shape)
+    for c in range(x.shape[0]):
+        std = np.std(x[c])
+        if std == 0.0:
+            std = 1.0
+        _x[c] = (x[c] - np.mean(x[c])) / std
+    return _x
+
+
+@njit(cache=True, fastmath=True)
+def _z_normalise_collection(X: np.ndarray) -> np.ndarray:
+    _X = np.empty(X.shape)
+    for i in range(X.shape[0]):
+        _X[i] = _z_normalise_series(X[i])
+    return _X
+
+
+@threaded
+def sbd_pairwise_distance(
+    X: np.ndarray, y: np.ndarray = None, standardize: bool = True, n_jobs: int = 1
+) -> np.ndarray:
+    """Compute the shape-based distance (SBD) between a set of time series.
+
+    For series of at least 64 time points of equal length within each collection,
+    the cross-correlations are computed for blocks of series at once with the fast
+    Fourier transform. These distances agree with :func:`sbd_distance` to within
+    floating point error.
+
+    Parameters
+    ----------
+    X : np.ndarray, of shape (n_instances, n_channels, n_timepoints) or
+            (n_instances, n_timepoints) or (n_timepoints,)
+        A collection of time series instances.
+    y : np.ndarray, of shape (m_instances, m_channels, m_timepoints) or
+            (m_instances, m_timepoints) or (m_timepoints,), default=None
+        A collection of time series instances.
+    standardize : bool, default=True
+        Whether to z-normalise each channel of the series before computing the
+        distance.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
+
+    Returns
+    -------
+    np.ndarray (n_instances, n_instances)
+        SBD pairwise matrix between the instances of X.
+
+    Raises
+    ------
+    ValueError
+        If X is not 2D or 3D array when only passing X.
+        If X and y are not 1D, 2D or 3D arrays when passing both X and y.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import sbd_pairwise_distance
+    >>> X = np.array([[[1, 2, 3, 2]],[[2, 3, 2, 1]], [[3, 2, 1, 2]]])
+    >>> sbd_pairwise_distance(X)
+    array([[0. , 0.5, 0.5],
+           [0.5, 0. , 0. ],
+           [0.5, 0. , 0. ]])
+
+    >>> X = np.array([[[1, 2, 3, 2]],[[2, 3, 2, 1]], [[3, 2, 1, 2]]])
+    >>> y = np.array([[[1, 2, 3, 4]],[[4, 3, 2, 1]]])
+    >>> sbd_pairwise_distance(X, y)
+    array([[0.36754447, 0.52565835],
+           [0.52565835, 0.36754447],
+           [0.52565835, 0.36754447]])
+    """
+    if y is None:
+        # To self
+        if X.ndim == 3:
+            _X = X
+        elif X.ndim == 2:
+            _X = X.reshape((X.shape[0], 1, X.shape[1]))
+        else:
+            raise ValueError("X must be 2D or 3D array")
+        _X = _standardise_collection(_X, standardize)
+        if _X.shape[2] >= _FFT_MIN_TIMEPOINTS:
+            distances = _fft_sbd_distances(_X, _X, n_jobs)
+            distances = np.triu(distances, 1)
+            return distances + distances.T
+        return _sbd_pairwise_distance(_X)
+    _x, _y = reshape_pairwise_to_multiple(X, y)
+    n_channels = min(_x.shape[1], _y.shape[1])
+    _x = _standardise_collection(_x[:, :n_channels], standardize)
+    _y = _standardise_collection(_y[:, :n_channels], standardize)
+    if min(_x.shape[2], _y.shape[2]) >= _FFT_MIN_TIMEPOINTS:
+        return _fft_sbd_distances(_x, _y, n_jobs)
+    return _sbd_from_multiple_to_multiple_distance(_x, _y)
+
+
+def _standardise_collection(X: np.ndarray, standardize: bool) -> np.ndarray:
+    if standardize:
+        return _z_normalise_collection(X)
+    return X.astype(np.float64)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _sbd_pairwise_distance(X: np.ndarray) -> np.ndarray:
+    n_instances = X.shape[0]
+    distances = np.zeros((n_instances, n_instances))
+
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
+        for j in range(i + 1, n_instances):
+            distances[i, j] = _standardised_sbd_distance(X[i], X[j])
+            distances[j, i] = distances[i, j]
+
+    return distances
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _sbd_from_multiple_to_multiple_distance(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    distances = np.zeros((n_instances, m_instances))
+
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _standardised_sbd_distance(x[i], y[j])
+    return distances
+
+
+def _fft_sbd_distances(x: np.ndarray, y: np.ndarray, n_jobs: int) -> np.ndarray:
+    # SBD between each series of x and each series of y, both 3D arrays with the
+    # same number of channels, computed a block of rows of x at a time.
+    workers = check_n_jobs(n_jobs)
+    n_fft = next_fast_len(x.shape[2] + y.shape[2] - 1, real=True)
+    fft_y = np.conj(rfft(y, n=n_fft, axis=2, workers=workers))
+    x_norms = np.sum(x * x, axis=(1, 2))
+    y_norms = np.sum(y * y, axis=(1, 2))
+
+    n_rows = max(1, _MAX_BLOCK_BYTES // (32 * n_fft * y.shape[0]))
+    distances = np.empty((x.shape[0], y.shape[0]))
+    for start in range(0, x.shape[0], n_rows):
+        stop = min(start + n_rows, x.shape[0])
+        fft_x = rfft(x[start:stop], n=n_fft, axis=2, workers=workers)
+        cc = _fft_cross_correlation(
+            fft_x, fft_y, n_fft, x.shape[2], y.shape[2], workers
+        )
+        distances[start:stop] = _normalised_distances(
+            cc.max(axis=0), x_norms[start:stop], y_norms
+        )
+    return distances
+
+
+def _fft_cross_correlation(
+    fft_x: np.ndarray,
+    conj_fft_y: np.ndarray,
+    n_fft: int,
+    x_length: int,
+    y_length: int,
+    workers: int = 1,
+) -> np.ndarray:
+    # Cross-correlations summed over channels of every series of x with every
+    # series of y, from the real FFTs of x and the conjugate real FFTs of y of
+    # shapes (n_instances, n_channels, n_freqs) and (m_instances, n_channels,
+    # n_freqs). Returns an array of shape (x_length + y_length - 1, n_instances,
+    # m_instances) ordered by the shift of x against y, from -(y_length - 1) to
+    # x_length - 1.
+    products = np.matmul(fft_x.transpose((2, 0, 1)), conj_fft_y.transpose((2, 1, 0)))
+    cc = irfft(products, n=n_fft, axis=0, workers=workers)
+    return np.concatenate((cc[n_fft - y_length + 1 :], cc[:x_length]), axis=0)
+
+
+def _normalised_distances(
+    cc: np.ndarray, x_norms: np.ndarray, y_norms: np.ndarray
+) -> np.ndarray:
+    # One minus the cross-correlations of shape (n_instances, m_instances) divided
+    # by the products of the norms, with the distance from a zero series being 1, or
+    # 0 to another zero series.
+    norms = np.sqrt(np.outer(x_norms, y_norms))
+    zero = norms == 0.0
+    distances = np.maximum(0.0, 1.0 - cc / np.where(zero, 1.0, norms))
+    distances[zero] = 1.0
+    distances[np.outer(x_norms == 0.0, y_norms == 0.0)] = 0.0
+    return distances
+
+
+def _best_shifts(x: np.ndarray, X: np.ndarray, n_jobs: int = 1) -> np.ndarray:
+    """Find the shift of each series in X that best aligns it with x.
+
+    Parameters
+    ----------
+    x : np.ndarray of shape (n_channels, n_timepoints)
+        Series to align to.
+    X : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        Series to shift.
+    n_jobs : int, default=1
+        The number of threads to use for the FFT.
+
+    Returns
+    -------
+    np.ndarray of shape (n_instances,)
+        Number of time points to move each series of X forward (or back, if
+        negative) to maximise its cross-correlation with x.
+    """
+    workers = check_n_jobs(n_jobs)
+    n_timepoints = X.shape[2]
+    n_fft = next_fast_len(x.shape[1] + n_timepoints - 1, real=True)
+    fft_x = rfft(x[np.newaxis], n=n_fft, axis=2, workers=workers)
+    fft_X = np.conj(rfft(X, n=n_fft, axis=2, workers=workers))
+    cc = _fft_cross_correlation(fft_x, fft_X, n_fft, x.shape[1], n_timepoints, workers)
+    return np.argmax(cc[:, 0], axis=0) - (n_timepoints - 1)
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+r"""Exact nearest neighbour search under dynamic time warping.
+
+The search follows the UCR suite [1]_. The envelopes of the reference collection
+are computed once when the index is fitted. For each query, every candidate is given
+a lower bound (the larger of LB_Kim and LB_Keogh against the candidate envelope),
+and candidates are visited in increasing order of that bound. The search stops as
+soon as the bound of the next candidate is larger than the distance to the current
+``n_neighbors``-th neighbour. Candidates that are visited are first tested with
+LB_Keogh against the query envelope, summed over the query time points in
+decreasing order of their absolute z-normalised value so that the bound is
+abandoned as early as possible, and only then is the DTW distance computed with
+early abandoning.
+
+References
+----------
+.. [1] Rakthanmanon T. et al.: Searching and mining trillions of time series
+subsequences under dynamic time warping, Proceedings of the 18th ACM SIGKDD
+international conference on Knowledge discovery and data mining, 2012.
+"""
+__all__ = ["DTWSearchIndex"]
+
+from typing import List, Tuple, Union
+
+import numpy as np
+from numba import njit, prange
+
+from aeon.distances._bounding_matrix import _create_bounding_band, _transpose_band
+from aeon.distances._ddtw import average_of_slope
+from aeon.distances._dtw import _dtw_distance
+from aeon.distances._lower_bounds import _envelope, _envelopes, _lb_keogh, _lb_kim
+from aeon.distances._neighbors import _insert_neighbor
+from aeon.utils._threading import threaded
+
+SEARCH_DISTANCES = ["dtw", "ddtw"]
+
+
+class DTWSearchIndex:
+    """Index of a collection for exact DTW nearest neighbour search.
+
+    The index precomputes the envelopes of the collection passed to ``fit``, and
+    ``kneighbors`` prunes candidates with lower bounds, visiting them in order of
+    their lower bound and early abandoning the remaining DTW computations [1]_.
+    The neighbours found are exactly those of a brute force search with
+    :func:`aeon.distances.nearest_neighbors`.
+
+    Parameters
+    ----------
+    distance : str, default="dtw"
+        The distance to search with, either "dtw" or "ddtw".
+    distance_params : dict, default=None
+        The ``window`` and ``itakura_max_slope`` parameters of the distance.
+    n_jobs : int, default=1
+        The number of threads to use to search for the neighbours of different
+        queries. ``-1`` means use all processors.
+
+    Attributes
+    ----------
+    X_ : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        The indexed collection. For "ddtw" this is the derivative of the series.
+    lower_ : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        Lower envelope of each series in ``X_``.
+    upper_ : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        Upper envelope of each series in ``X_``.
+
+    References
+    ----------
+    .. [1] Rakthanmanon T. et al.: Searching and mining trillions of time series
+    subsequences under dynamic time warping, Proceedings of the 18th ACM SIGKDD
+    international conference on Knowledge discovery and data mining, 2012.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.distances import DTWSearchIndex
+    >>> X = np.array([[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0], [1.0, 2.0, 2.0, 4.0]])
+    >>> index = DTWSearchIndex(distance_params={"window": 0.25}).fit(X)
+    >>> indices, distances = index.kneighbors(
+    ...     np.array([[1.0, 2.0, 2.5, 4.0]]), n_neighbors=2
+    ... )
+    >>> indices
+    array([[0, 2]])
+    >>> distances
+    array([[0.25, 0.25]])
+    """
+
+    def __init__(self, distance="dtw", distance_params=None, n_jobs=1):
+        self.distance = distance
+        self.distance_params = distance_params
+        self.n_jobs = n_jobs
+
+    def fit(self, X: Union[np.ndarray, List[np.ndarray]]) -> "DTWSearchIndex":
+        """Build the index of a collection of equal length series.
+
+        Parameters
+        ----------
+        X : np.ndarray or list of np.ndarray
+            The collection to search, of shape ``(n_instances, n_timepoints)`` or
+            ``(n_instances, n_channels, n_timepoints)``, or a list of equal length
+            2D arrays.
+
+        Returns
+        -------
+        self
+            Reference to self.
+
+        Raises
+        ------
+        ValueError
+            If the distance or its parameters are not supported, or the series are
+            not all the same length.
+        """
+        if self.distance not in SEARCH_DISTANCES:
+            raise ValueError(
+                f"DTWSearchIndex distance must be one of {SEARCH_DISTANCES}, but "
+                f"found {self.distance}"
+            )
+        params = {} if self.distance_params is None else self.distance_params
+        unexpected = set(params) - {"window", "itakura_max_slope"}
+        if unexpected:
+            raise ValueError(
+                f"DTWSearchIndex got unexpected distance parameters "
+                f"{sorted(unexpected)}"
+            )
+
+        self.X_ = self._transform(self._check_collection(X))
+        n_timepoints = self.X_.shape[2]
+        self._band = _create_bounding_band(
+            n_timepoints,
+            n_timepoints,
+            params.get("window"),
+            params.get("itakura_max_slope"),
+        )
+        self._transposed_band = _transpose_band(self._band, n_timepoints)
+        self.lower_, self.upper_ = _envelopes(self.X_, self._band)
+        return self
+
+    def kneighbors(
+        self, X: Union[np.ndarray, List[np.ndarray]], n_neighbors: int = 1
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Find the nearest neighbours of each query in the indexed collection.
+
+        Parameters
+        ----------
+        X : np.ndarray or list of np.ndarray
+            Query series, of shape ``(n_queries, n_timepoints)`` or ``(n_queries,
+            n_channels, n_timepoints)``, or a list of 2D arrays, the same length and
+            number of channels as the indexed series.
+        n_neighbors : int, default=1
+            Number of neighbours to find for each query.
+
+        Returns
+        -------
+        indices : np.ndarray of shape (n_queries, n_neighbors)
+            Indices of the nearest neighbours of each query, ordered by distance.
+            Ties are broken by the lower index.
+        distances : np.ndarray of shape (n_queries, n_neighbors)
+            Distances to the nearest neighbours of each query.
+
+        Raises
+        ------
+        ValueError
+            If the index is not fitted, ``n_neighbors`` is not between 1 and the
+            number of indexed series, or the queries are a different shape to the
+            indexed series.
+        """
+        if not hasattr(self, "X_"):
+            raise ValueError("DTWSearchIndex must be fitted before kneighbors")
+        n_instances = self.X_.shape[0]
+        if not 1 <= n_neighbors <= n_instances:
+            raise ValueError(
+                f"n_neighbors must be between 1 and the number of indexed series, "
+                f"{n_instances}, but found {n_neighbors}"
+            )
+        _X = self._transform(self._check_collection(X))
+        if _X.shape[1:] != self.X_.shape[1:]:
+            raise ValueError(
+                f"Queries must have the same number of channels and time points as "
+                f"the indexed series, {self.X_.shape[1:]}, but found {_X.shape[1:]}"
+            )
+        return _search(
+            _X,
+            self.X_,
+            self.lower_,
+            self.upper_,
+            self._band,
+            self._transposed_band,
+            n_neighbors,
+            n_jobs=self.n_jobs,
+        )
+
+    def _transform(self, X: np.ndarray) -> np.ndarray:
+        if self.distance == "ddtw":
+            return np.array([average_of_slope(x) for x in X])
+        return X
+
+    @staticmethod
+    def _check_collection(X: Union[np.ndarray, List[np.ndarray]]) -> np.ndarray:
+        if isinstance(X, list):
+            if len({x.shape for x in X}) > 1:
+                raise ValueError("DTWSearchIndex only supports equal length series")
+            X = np.array(X)
+        if X.ndim == 2:
+            X = X.reshape((X.shape[0], 1, X.shape[1]))
+        elif X.ndim != 3:
+            raise ValueError("X must be a 2D or 3D array or a list of 2D arrays")
+        return X.astype(np.float64)
+
+
+@threaded
+def _search(
+    X: np.ndarray,
+    data: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+    transposed_band: np.ndarray,
+    n_neighbors: int,
+    n_jobs: int = 1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    return _kneighbors(X, data, lower, upper, band, transposed_band, n_neighbors)
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _kneighbors(
+    X: np.ndarray,
+    data: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    band: np.ndarray,
+    transposed_band: np.ndarray,
+    n_neighbors: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    n_queries = X.shape[0]
+    n_instances = data.shape[0]
+    n_timepoints = X.shape[2]
+    indices = np.full((n_queries, n_neighbors), -1, dtype=np.int64)
+    distances = np.full((n_queries, n_neighbors), np.inf)
+    for i in prange(n_queries):
+        x = X[i]
+        bounds = np.empty(n_instances)
+        for j in range(n_instances):
+            bounds[j] = max(
+                _lb_kim(x, data[j]), _lb_keogh(x, lower[j], upper[j], 0, n_timepoints)
+            )
+        order = _query_order(x)
+        x_lower, x_upper = _envelope(x, transposed_band)
+        for j in np.argsort(bounds, kind="mergesort"):
+            upper_bound = distances[i, n_neighbors - 1]
+            # Candidates are sorted by their bound, so none of the rest can be a
+            # neighbour either.
+            if bounds[j] > upper_bound:
+                break
+            if (
+                _ordered_lb_keogh(data[j], x_lower, x_upper, order, upper_bound)
+                > upper_bound
+            ):
+                continue
+            _insert_neighbor(
+                indices[i],
+                distances[i],
+                j,
+                _dtw_distance(x, data[j], band, upper_bound),
+            )
+    return indices, distances
+
+
+@njit(cache=True, fastmath=True)
+def _query_order(x: np.ndarray) -> np.ndarray:
+    # Time points in decreasing order of absolute z-normalised value, summed over
+    # channels. Far from the mean the query is more likely to be outside the
+    # envelope of a candidate, so LB_Keogh grows fastest in this order.
+    z = np.zeros(x.shape[1])
+    for c in range(x.shape[0]):
+        std = np.std(x[c])
+        if std == 0:
+            std = 1.0
+        z += np.abs((x[c] - np.mean(x[c])) / std)
+    return np.argsort(-z)
+
+
+@njit(cache=True, fastmath=True)
+def _ordered_lb_keogh(
+    x: np.ndarray,
+    lower: np.ndarray,
+    upper: np.ndarray,
+    order: np.ndarray,
+    upper_bound: float,
+) -> float:
+    bound = 0.0
+    for i in order:
+        for c in range(x.shape[0]):
+            if x[c, i] > upper[c, i]:
+                bound += (x[c, i] - upper[c, i]) ** 2
+            elif x[c, i] < lower[c, i]:
+                bound += (x[c, i] - lower[c, i]) ** 2
+        if bound > upper_bound:
+            return bound
+    return bound
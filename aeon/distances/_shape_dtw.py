@@ -5,13 +5,14 @@ __author__ = ["hadifawaz1999"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import compute_min_return_path
 from aeon.distances._bounding_matrix import create_bounding_matrix
 from aeon.distances._dtw import _dtw_cost_matrix
 from aeon.distances._squared import _univariate_squared_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -440,7 +441,7 @@ def shape_dtw_alignment_path(
     return (compute_min_return_path(cost_matrix), shapedtw_dist)
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def shape_dtw_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -448,6 +449,7 @@ def shape_dtw_pairwise_distance(
     descriptor: str = "identity",
     reach: int = 30,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the ShapeDTW pairwise distance among a set of series.
 
@@ -479,6 +481,10 @@ def shape_dtw_pairwise_distance(
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
 
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
+
     Returns
     -------
     np.ndarray
@@ -517,8 +523,8 @@ def shape_dtw_pairwise_distance(
         X_pad = _pad_ts_edges(x=_X, reach=reach)
         y_pad = _pad_ts_edges(x=_y, reach=reach)
 
-        return _shape_dtw_pairwise_distance(
-            X=X_pad,
+        return _shape_dtw_from_multiple_to_multiple_distance(
+            x=X_pad,
             y=y_pad,
             window=window,
             descriptor=descriptor,
@@ -527,31 +533,60 @@ def shape_dtw_pairwise_distance(
         )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _shape_dtw_pairwise_distance(
     X: np.ndarray,
-    y: np.ndarray = None,
     window: float = None,
     descriptor: str = "identity",
     reach: int = 30,
     itakura_max_slope: float = None,
 ) -> np.ndarray:
-    if y is None:
-        y = np.copy(X)
-
-    distances = np.zeros(shape=(len(X), len(y)))
+    n_instances = X.shape[0]
+    distances = np.zeros((n_instances, n_instances))
     bounding_matrix = create_bounding_matrix(
-        X.shape[2] - 2 * reach, y.shape[2] - 2 * reach, window, itakura_max_slope
+        X.shape[2] - 2 * reach, X.shape[2] - 2 * reach, window, itakura_max_slope
     )
 
-    for i in range(len(X)):
-        for j in range(len(y)):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
+        for j in range(i + 1, n_instances):
             distances[i, j] = _shape_dtw_distance(
                 x=X[i],
-                y=y[j],
+                y=X[j],
                 descriptor=descriptor,
                 reach=reach,
                 bounding_matrix=bounding_matrix,
             )
+            distances[j, i] = distances[i, j]
+
+    return distances
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _shape_dtw_from_multiple_to_multiple_distance(
+    x: np.ndarray,
+    y: np.ndarray,
+    window: float = None,
+    descriptor: str = "identity",
+    reach: int = 30,
+    itakura_max_slope: float = None,
+) -> np.ndarray:
+    n_instances = x.shape[0]
+    m_instances = y.shape[0]
+    distances = np.zeros((n_instances, m_instances))
+    bounding_matrix = create_bounding_matrix(
+        x.shape[2] - 2 * reach, y.shape[2] - 2 * reach, window, itakura_max_slope
+    )
+
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _shape_dtw_distance(
+            x=x[i],
+            y=y[j],
+            descriptor=descriptor,
+            reach=reach,
+            bounding_matrix=bounding_matrix,
+        )
 
     return distances
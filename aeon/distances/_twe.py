@@ -5,15 +5,21 @@ __author__ = ["chrisholder", "TonyBagnall"]
 from typing import List, Tuple
 
 import numpy as np
-from numba import njit
+from numba import njit, prange
 
 from aeon.distances._alignment_paths import (
     _add_inf_to_out_of_bounds_cost_matrix,
     compute_min_return_path,
 )
-from aeon.distances._bounding_matrix import create_bounding_matrix
+from aeon.distances._bounding_matrix import (
+    _band_is_full,
+    _band_row_span,
+    _create_bounding_band,
+    create_bounding_matrix,
+)
 from aeon.distances._euclidean import _univariate_euclidean_distance
-from aeon.distances._utils import reshape_pairwise_to_multiple
+from aeon.distances._utils import _balanced_row_index, reshape_pairwise_to_multiple
+from aeon.utils._threading import threaded
 
 
 @njit(cache=True, fastmath=True)
@@ -24,6 +30,7 @@ def twe_distance(
     nu: float = 0.001,
     lmbda: float = 1.0,
     itakura_max_slope: float = None,
+    upper_bound: float = np.inf,
 ) -> float:
     r"""Compute the TWE distance between two time series.
 
@@ -69,6 +76,9 @@ def twe_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    upper_bound : float, default=np.inf
+        If the TWE distance is greater than ``upper_bound``, the computation is
+        abandoned early and ``np.inf`` is returned.
 
     Returns
     -------
@@ -98,15 +108,13 @@ def twe_distance(
     if x.ndim == 1 and y.ndim == 1:
         _x = x.reshape((1, x.shape[0]))
         _y = y.reshape((1, y.shape[0]))
-        bounding_matrix = create_bounding_matrix(
+        band = _create_bounding_band(
             _x.shape[1], _y.shape[1], window, itakura_max_slope
         )
-        return _twe_distance(_pad_arrs(_x), _pad_arrs(_y), bounding_matrix, nu, lmbda)
+        return _twe_distance(_pad_arrs(_x), _pad_arrs(_y), band, nu, lmbda, upper_bound)
     if x.ndim == 2 and y.ndim == 2:
-        bounding_matrix = create_bounding_matrix(
-            x.shape[1], y.shape[1], window, itakura_max_slope
-        )
-        return _twe_distance(_pad_arrs(x), _pad_arrs(y), bounding_matrix, nu, lmbda)
+        band = _create_bounding_band(x.shape[1], y.shape[1], window, itakura_max_slope)
+        return _twe_distance(_pad_arrs(x), _pad_arrs(y), band, nu, lmbda, upper_bound)
     raise ValueError("x and y must be 1D or 2D")
 
 
@@ -186,11 +194,58 @@ def twe_cost_matrix(
 
 @njit(cache=True, fastmath=True)
 def _twe_distance(
-    x: np.ndarray, y: np.ndarray, bounding_matrix: np.ndarray, nu: float, lmbda: float
+    x: np.ndarray,
+    y: np.ndarray,
+    band: np.ndarray,
+    nu: float,
+    lmbda: float,
+    upper_bound: float = np.inf,
 ) -> float:
-    return _twe_cost_matrix(x, y, bounding_matrix, nu, lmbda)[
-        x.shape[1] - 2, y.shape[1] - 2
-    ]
+    x_size = x.shape[1]
+    y_size = y.shape[1]
+    # Only the previous and current rows of the cost matrix are kept in memory.
+    prev_row = np.full(y_size, np.inf)
+    prev_row[0] = 0.0
+    curr_row = np.zeros(y_size)
+
+    del_add = nu + lmbda
+    # Out of bounds cells are left at zero, so the minimum of a row is only a lower
+    # bound on the distance if every cell is in bounds.
+    early_abandon = upper_bound < np.inf and _band_is_full(band, y_size - 1)
+
+    for i in range(1, x_size):
+        reset_start, reset_end = _band_row_span(band, i - 1, y_size - 1)
+        curr_row[reset_start : reset_end + 1] = 0.0
+        curr_row[0] = np.inf
+        for j in range(band[i - 1, 0] + 1, band[i - 1, 1] + 1):
+            # Deletion in x
+            del_x_squared_dist = _univariate_euclidean_distance(x[:, i - 1], x[:, i])
+            del_x = prev_row[j] + del_x_squared_dist + del_add
+            # Deletion in y
+            del_y_squared_dist = _univariate_euclidean_distance(y[:, j - 1], y[:, j])
+            del_y = curr_row[j - 1] + del_y_squared_dist + del_add
+
+            # Match
+            match_same_squared_d = _univariate_euclidean_distance(x[:, i], y[:, j])
+            match_prev_squared_d = _univariate_euclidean_distance(
+                x[:, i - 1], y[:, j - 1]
+            )
+            match = (
+                prev_row[j - 1]
+                + match_same_squared_d
+                + match_prev_squared_d
+                + nu * (abs(i - j) + abs((i - 1) - (j - 1)))
+            )
+
+            curr_row[j] = min(del_x, del_y, match)
+        if early_abandon and np.min(curr_row[1:]) > upper_bound:
+            return np.inf
+        prev_row, curr_row = curr_row, prev_row
+
+    distance = prev_row[y_size - 1]
+    if distance > upper_bound:
+        return np.inf
+    return distance
 
 
 @njit(cache=True, fastmath=True)
@@ -245,7 +300,7 @@ def _pad_arrs(x: np.ndarray) -> np.ndarray:
     return padded_x
 
 
-@njit(cache=True, fastmath=True)
+@threaded
 def twe_pairwise_distance(
     X: np.ndarray,
     y: np.ndarray = None,
@@ -253,6 +308,7 @@ def twe_pairwise_distance(
     nu: float = 0.001,
     lmbda: float = 1.0,
     itakura_max_slope: float = None,
+    n_jobs: int = 1,
 ) -> np.ndarray:
     """Compute the TWE pairwise distance between a set of time series.
 
@@ -275,6 +331,9 @@ def twe_pairwise_distance(
     itakura_max_slope : float, default=None
         Maximum slope as a proportion of the number of time points used to create
         Itakura parallelogram on the bounding matrix. Must be between 0. and 1.
+    n_jobs : int, default=1
+        The number of threads to use for the computation. ``-1`` means use
+        all processors. The result is the same for any value of ``n_jobs``.
 
     Returns
     -------
@@ -327,7 +386,7 @@ def twe_pairwise_distance(
     )
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _twe_pairwise_distance(
     X: np.ndarray,
     window: float,
@@ -337,26 +396,23 @@ def _twe_pairwise_distance(
 ) -> np.ndarray:
     n_instances = X.shape[0]
     distances = np.zeros((n_instances, n_instances))
-    bounding_matrix = create_bounding_matrix(
-        X.shape[2], X.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(X.shape[2], X.shape[2], window, itakura_max_slope)
 
     # Pad the arrays before so that we don't have to redo every iteration
     padded_X = np.zeros((X.shape[0], X.shape[1], X.shape[2] + 1))
-    for i in range(X.shape[0]):
+    for i in prange(X.shape[0]):
         padded_X[i] = _pad_arrs(X[i])
 
-    for i in range(n_instances):
+    for k in prange(n_instances):
+        i = _balanced_row_index(k, n_instances)
         for j in range(i + 1, n_instances):
-            distances[i, j] = _twe_distance(
-                padded_X[i], padded_X[j], bounding_matrix, nu, lmbda
-            )
+            distances[i, j] = _twe_distance(padded_X[i], padded_X[j], band, nu, lmbda)
             distances[j, i] = distances[i, j]
 
     return distances
 
 
-@njit(cache=True, fastmath=True)
+@njit(cache=True, fastmath=True, parallel=True)
 def _twe_from_multiple_to_multiple_distance(
     x: np.ndarray,
     y: np.ndarray,
@@ -368,24 +424,21 @@ def _twe_from_multiple_to_multiple_distance(
     n_instances = x.shape[0]
     m_instances = y.shape[0]
     distances = np.zeros((n_instances, m_instances))
-    bounding_matrix = create_bounding_matrix(
-        x.shape[2], y.shape[2], window, itakura_max_slope
-    )
+    band = _create_bounding_band(x.shape[2], y.shape[2], window, itakura_max_slope)
 
     # Pad the arrays before so that we dont have to redo every iteration
     padded_x = np.zeros((x.shape[0], x.shape[1], x.shape[2] + 1))
-    for i in range(x.shape[0]):
+    for i in prange(x.shape[0]):
         padded_x[i] = _pad_arrs(x[i])
 
     padded_y = np.zeros((y.shape[0], y.shape[1], y.shape[2] + 1))
-    for i in range(y.shape[0]):
+    for i in prange(y.shape[0]):
         padded_y[i] = _pad_arrs(y[i])
 
-    for i in range(n_instances):
-        for j in range(m_instances):
-            distances[i, j] = _twe_distance(
-                padded_x[i], padded_y[j], bounding_matrix, nu, lmbda
-            )
+    for k in prange(n_instances * m_instances):
+        i = k // m_instances
+        j = k % m_instances
+        distances[i, j] = _twe_distance(padded_x[i], padded_y[j], band, nu, lmbda)
     return distances
 
 
@@ -60,3 +60,14 @@ def reshape_pairwise_to_multiple(
             _y = y.reshape((y.shape[0], 1, y.shape[1]))
             return _x, _y
         raise ValueError("x and y must be 2D or 3D arrays")
+
+
+@njit(cache=True)
+def _balanced_row_index(k: int, n_instances: int) -> int:
+    # Maps 0, 1, 2, 3, ... to rows 0, n-1, 1, n-2, ... of the upper triangle of a
+    # self pairwise matrix. Used as the row order of a prange loop, each contiguous
+    # block of iterations then pairs long rows with short rows so threads given the
+    # same number of rows do a similar number of distance computations.
+    if k % 2 == 0:
+        return k // 2
+    return n_instances - 1 - k // 2
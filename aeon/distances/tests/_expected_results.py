@@ -84,6 +84,13 @@ _expected_distance_results = {
         9.360373075383167,
         49.86527164702194,
     ],
+    "sbd": [
+        0.0,
+        0.3344927567618089,
+        0.8548949456350899,
+        0.5967483689427071,
+        0.9294818105130588,
+    ],
 }
 
 _expected_distance_results_params = {
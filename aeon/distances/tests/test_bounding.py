@@ -2,8 +2,10 @@
 __author__ = ["chrisholder"]
 
 import numpy as np
+import pytest
 
 from aeon.distances import create_bounding_matrix
+from aeon.distances._bounding_matrix import _create_bounding_band
 
 
 def test_full_bounding():
@@ -29,3 +31,21 @@ def test_window_bounding():
 def test_itakura_parallelogram():
     matrix = create_bounding_matrix(10, 10, itakura_max_slope=0.2)
     assert isinstance(matrix, np.ndarray)
+
+
+@pytest.mark.parametrize(
+    "bounding",
+    [{}, {"window": 0.0}, {"window": 0.2}, {"window": 1.0}, {"itakura_max_slope": 0.5}],
+)
+def test_bounding_band(bounding):
+    """Test the band holds the same cells as the bounding matrix."""
+    for x_size, y_size in [(10, 10), (7, 12), (12, 7), (1, 5)]:
+        if "itakura_max_slope" in bounding and min(x_size, y_size) < 2:
+            continue
+        matrix = create_bounding_matrix(x_size, y_size, **bounding)
+        band = _create_bounding_band(x_size, y_size, **bounding)
+        assert band.shape == (x_size, 2)
+        from_band = np.zeros((x_size, y_size), dtype=bool)
+        for i in range(x_size):
+            from_band[i, band[i, 0] : band[i, 1]] = True
+        np.testing.assert_array_equal(from_band, matrix)
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+"""Tests for the pairwise distance cache."""
+import gc
+import os
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_equal
+
+from aeon.distances import PairwiseDistanceCache, pairwise_distance
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+
+def test_pairwise_distance_cache():
+    """Test cached matrices are reused only for identical calls."""
+    X = create_test_distance_numpy(6, 2, 10)
+    y = create_test_distance_numpy(4, 2, 10, random_state=2)
+    expected = pairwise_distance(X, metric="dtw", window=0.2)
+    with PairwiseDistanceCache() as cache:
+        assert_array_equal(pairwise_distance(X, metric="dtw", window=0.2), expected)
+        result = pairwise_distance(X, metric="dtw", window=0.2)
+        assert_array_equal(result, expected)
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        # The returned matrix is a read-only view of the cached one.
+        assert not result.flags.writeable
+        with pytest.raises(ValueError):
+            result[0, 1] = -1.0
+
+        pairwise_distance(X, metric="dtw", window=0.3)
+        pairwise_distance(X, metric="msm", window=0.2)
+        pairwise_distance(X, y, metric="dtw", window=0.2)
+        pairwise_distance(X + 1.0, metric="dtw", window=0.2)
+        assert (cache.hits, cache.misses) == (1, 5)
+
+    # The cache is no longer consulted once it is deactivated.
+    pairwise_distance(X, metric="dtw", window=0.2)
+    assert (cache.hits, cache.misses) == (1, 5)
+    assert len(cache) == 5
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_pairwise_distance_cache_memory_bound(tmp_path):
+    """Test evicted matrices are discarded or spilled to disk."""
+    X = create_test_distance_numpy(5, 1, 10)
+    matrix_bytes = 5 * 5 * 8
+
+    cache = PairwiseDistanceCache(max_bytes=2 * matrix_bytes)
+    with cache:
+        for window in [0.1, 0.2, 0.3]:
+            pairwise_distance(X, metric="dtw", window=window)
+        assert len(cache) == 2
+        pairwise_distance(X, metric="dtw", window=0.1)
+        assert cache.hits == 0
+
+    memmap_dir = str(tmp_path)
+    cache = PairwiseDistanceCache(max_bytes=2 * matrix_bytes, memmap_dir=memmap_dir)
+    with cache:
+        for window in [0.1, 0.2, 0.3]:
+            pairwise_distance(X, metric="dtw", window=window)
+        assert len(cache) == 3
+        assert len(os.listdir(memmap_dir)) == 1
+        assert_array_equal(
+            pairwise_distance(X, metric="dtw", window=0.1),
+            pairwise_distance(X, metric="dtw", window=0.1, n_jobs=1),
+        )
+        assert cache.hits == 2
+    assert_array_equal(
+        pairwise_distance(X, metric="dtw", window=0.1),
+        cache.get_or_compute(None, X, None, "dtw", {"window": 0.1}),
+    )
+    cache.clear()
+    assert len(os.listdir(memmap_dir)) == 0
+
+
+def test_pairwise_distance_cache_key():
+    """Test equivalent calls share a key."""
+    X = create_test_distance_numpy(5, 1, 10)
+    with PairwiseDistanceCache() as cache:
+        expected = pairwise_distance(X, metric="dtw")
+        assert_array_equal(pairwise_distance(X, X, metric="dtw"), expected)
+        assert_array_equal(pairwise_distance(X, metric="dtw", window=None), expected)
+        expected = pairwise_distance(X, X.copy(), metric="msm")
+        assert_array_equal(
+            pairwise_distance(X, metric="msm", independent=True), expected
+        )
+        pairwise_distance(X, metric="msm", independent=False)
+        assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_pairwise_distance_cache_disk_bound(tmp_path):
+    """Test spilled matrices are bounded on disk and deleted with the cache."""
+    X = create_test_distance_numpy(5, 1, 10)
+    matrix_bytes = 5 * 5 * 8
+    memmap_dir = str(tmp_path)
+
+    cache = PairwiseDistanceCache(
+        max_bytes=matrix_bytes, memmap_dir=memmap_dir, max_disk_bytes=2 * matrix_bytes
+    )
+    with cache:
+        for window in [0.1, 0.2, 0.3, 0.4, 0.5]:
+            pairwise_distance(X, metric="dtw", window=window)
+        assert len(cache) == 3
+        assert len(os.listdir(memmap_dir)) == 2
+        result = pairwise_distance(X, metric="dtw", window=0.3)
+        assert isinstance(result, np.memmap)
+        assert not result.flags.writeable
+        assert cache.hits == 1
+
+    del cache, result
+    gc.collect()
+    assert len(os.listdir(memmap_dir)) == 0
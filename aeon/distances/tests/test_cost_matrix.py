@@ -94,3 +94,19 @@ def test_cost_matrix(dist):
         dist["distance"],
         dist["cost_matrix"],
     )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+@pytest.mark.parametrize("bounding", [{"window": 0.2}, {"itakura_max_slope": 0.5}])
+def test_bounded_distance_matches_cost_matrix(dist, bounding):
+    """Test the two row distance kernels match the bounded cost matrix."""
+    if "cost_matrix" not in dist or dist["name"] in ["shape_dtw", "lcss", "edr"]:
+        return
+    x = create_test_distance_numpy(3, 12)
+    y = create_test_distance_numpy(3, 12, random_state=2)
+    if dist["name"] == "msm":
+        bounding = {**bounding, "independent": False}
+    assert_almost_equal(
+        dist["cost_matrix"](x, y, **bounding)[-1, -1],
+        dist["distance"](x, y, **bounding),
+    )
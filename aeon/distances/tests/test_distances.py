@@ -70,3 +70,37 @@ def test_distances(dist):
         dist["distance"],
         _expected_distance_results[dist["name"]][4],
     )
+
+
+UPPER_BOUND_DISTANCES = ["dtw", "ddtw", "wdtw", "wddtw", "adtw", "erp", "msm", "twe"]
+
+
+@pytest.mark.parametrize("dist", UPPER_BOUND_DISTANCES)
+@pytest.mark.parametrize("window", [None, 0.2])
+def test_distance_upper_bound(dist, window):
+    """Test early abandoned distances are exact below the bound and inf above."""
+    for x, y in [
+        (
+            create_test_distance_numpy(10),
+            create_test_distance_numpy(10, random_state=2),
+        ),
+        (
+            create_test_distance_numpy(3, 10),
+            create_test_distance_numpy(3, 10, random_state=2),
+        ),
+    ]:
+        expected = compute_distance(x, y, metric=dist, window=window)
+        for upper_bound in [expected, expected * 1.5]:
+            assert (
+                compute_distance(
+                    x, y, metric=dist, window=window, upper_bound=upper_bound
+                )
+                == expected
+            )
+        for upper_bound in [0.0, expected * 0.5]:
+            assert (
+                compute_distance(
+                    x, y, metric=dist, window=window, upper_bound=upper_bound
+                )
+                == np.inf
+            )
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Tests for the global alignment kernel."""
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal
+
+from aeon.distances import gak_kernel, gak_pairwise_kernel
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+
+def _unnormalised_gak(x, y, sigma):
+    # Reference recursion over the full matrix without rescaling.
+    M = np.zeros((x.shape[1] + 1, y.shape[1] + 1))
+    M[0, 0] = 1.0
+    for i in range(x.shape[1]):
+        for j in range(y.shape[1]):
+            local = np.exp(-np.sum((x[:, i] - y[:, j]) ** 2) / (2 * sigma**2))
+            M[i + 1, j + 1] = (
+                local / (2 - local) * (M[i, j] + M[i, j + 1] + M[i + 1, j])
+            )
+    return M[-1, -1]
+
+
+@pytest.mark.parametrize("shapes", [(1, 10, 10), (3, 10, 10), (1, 8, 12), (2, 12, 8)])
+@pytest.mark.parametrize("sigma", [0.5, 2.0])
+def test_gak_kernel(shapes, sigma):
+    """Test the kernel against the recursion and its normalisation."""
+    n_channels, x_size, y_size = shapes
+    x = create_test_distance_numpy(n_channels, x_size)
+    y = create_test_distance_numpy(n_channels, y_size, random_state=2)
+    expected = _unnormalised_gak(x, y, sigma) / np.sqrt(
+        _unnormalised_gak(x, x, sigma) * _unnormalised_gak(y, y, sigma)
+    )
+    assert_almost_equal(gak_kernel(x, y, sigma), expected)
+    assert_almost_equal(gak_kernel(x, x, sigma), 1.0)
+    assert 0 <= gak_kernel(x, y, sigma, window=0.2) <= 1.0
+
+
+def test_gak_kernel_long_series():
+    """Test the kernel does not overflow or underflow for long series."""
+    x = create_test_distance_numpy(2, 2000)
+    y = x + 0.01 * create_test_distance_numpy(2, 2000, random_state=2)
+    assert 0 < gak_kernel(x, y, sigma=1.0) < 1.0
+
+
+def test_gak_pairwise_kernel():
+    """Test the pairwise kernel matches the kernel between each pair."""
+    X = create_test_distance_numpy(6, 2, 10)
+    y = create_test_distance_numpy(4, 2, 8, random_state=2)
+    params = {"sigma": 2.0, "window": 0.5}
+    expected = np.array([[gak_kernel(a, b, **params) for b in y] for a in X])
+    assert_almost_equal(gak_pairwise_kernel(X, y, **params), expected)
+    expected = np.array([[gak_kernel(a, b, **params) for b in X] for a in X])
+    kernel = gak_pairwise_kernel(X, **params)
+    assert_almost_equal(kernel, expected)
+    assert np.array_equal(kernel, gak_pairwise_kernel(X, n_jobs=-1, **params))
+    assert np.linalg.eigvalsh(kernel).min() > -1e-10
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Tests for the DTW lower bounds."""
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal
+
+from aeon.distances import (
+    create_envelope,
+    create_envelopes,
+    dtw_distance,
+    lb_enhanced,
+    lb_improved,
+    lb_keogh,
+    lb_kim,
+    lower_bound_cascade,
+)
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+BOUNDING = [{}, {"window": 0.1}, {"window": 0.5}, {"itakura_max_slope": 0.5}]
+
+
+@pytest.mark.parametrize("bounding", BOUNDING)
+@pytest.mark.parametrize("shapes", [(1, 10, 10), (3, 10, 10), (1, 8, 12), (2, 12, 8)])
+def test_lower_bounds(bounding, shapes):
+    """Test the lower bounds are never above the DTW distance."""
+    n_channels, x_size, y_size = shapes
+    for random_state in range(5):
+        x = create_test_distance_numpy(n_channels, x_size, random_state=random_state)
+        y = create_test_distance_numpy(
+            n_channels, y_size, random_state=random_state + 10
+        )
+        distance = dtw_distance(x, y, **bounding)
+        keogh = lb_keogh(x, y, **bounding)
+        assert lb_kim(x, y) <= distance
+        assert keogh <= distance
+        assert keogh <= lb_improved(x, y, **bounding) <= distance
+        for n_bands in [1, 3, 20]:
+            assert lb_enhanced(x, y, n_bands=n_bands, **bounding) <= distance
+
+
+@pytest.mark.parametrize("bounding", BOUNDING)
+def test_envelope(bounding):
+    """Test cached envelopes give the same bounds as computing them."""
+    X = create_test_distance_numpy(5, 2, 10)
+    lower, upper = create_envelopes(X, **bounding)
+    for i in range(len(X)):
+        envelope = create_envelope(X[i], **bounding)
+        np.testing.assert_array_equal(envelope[0], lower[i])
+        np.testing.assert_array_equal(envelope[1], upper[i])
+        assert np.all(lower[i] <= X[i]) and np.all(X[i] <= upper[i])
+        assert_almost_equal(
+            lb_improved(X[0], X[i], y_envelope=envelope, **bounding),
+            lb_improved(X[0], X[i], **bounding),
+        )
+
+    univariate = create_envelope(X[0, 0], **bounding)
+    np.testing.assert_array_equal(univariate[0], lower[0, 0])
+
+
+@pytest.mark.parametrize("bounding", BOUNDING)
+def test_lower_bound_cascade(bounding):
+    """Test the cascade finds the exact DTW nearest neighbour."""
+    X = create_test_distance_numpy(20, 2, 15).cumsum(axis=2)
+    envelopes = create_envelopes(X, **bounding)
+    for random_state in range(3):
+        x = create_test_distance_numpy(2, 15, random_state=random_state + 100).cumsum(
+            axis=1
+        )
+        expected = np.array([dtw_distance(x, X[i], **bounding) for i in range(20)])
+        for distances in [
+            lower_bound_cascade(x, X, **bounding),
+            lower_bound_cascade(x, X, envelopes=envelopes, **bounding),
+            lower_bound_cascade(x, list(X), **bounding),
+        ]:
+            assert np.argmin(distances) == np.argmin(expected)
+            assert distances.min() == expected.min()
+            assert np.all((distances == expected) | np.isinf(distances))
+
+    with pytest.raises(ValueError, match="same length"):
+        lower_bound_cascade(X[0, :, :10], X, envelopes=envelopes, **bounding)
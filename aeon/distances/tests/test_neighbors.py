@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+"""Tests for the nearest neighbours search."""
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_equal
+
+from aeon.distances import euclidean_distance, nearest_neighbors, pairwise_distance
+from aeon.distances._distance import DISTANCES
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+
+def _validate_nearest_neighbors(x, y, name, n_neighbors, **kwargs):
+    indices, distances = nearest_neighbors(
+        x, y, name, n_neighbors=n_neighbors, **kwargs
+    )
+    expected = pairwise_distance(x, y, metric=name, **kwargs)
+    expected_indices = np.argsort(expected, axis=1, kind="stable")[:, :n_neighbors]
+    assert indices.shape == (len(expected), n_neighbors)
+    assert_array_equal(indices, expected_indices)
+    assert_almost_equal(
+        distances, np.take_along_axis(expected, expected_indices, axis=1)
+    )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+@pytest.mark.parametrize("n_neighbors", [1, 3, 10])
+def test_nearest_neighbors(dist, n_neighbors):
+    """Test nearest neighbours match a sorted pairwise distance matrix."""
+    y = create_test_distance_numpy(10, 2, 12)
+    x = create_test_distance_numpy(4, 2, 12, random_state=2)
+    _validate_nearest_neighbors(x, y, dist["name"], n_neighbors)
+    _validate_nearest_neighbors(
+        create_test_distance_numpy(4, 12, random_state=2),
+        create_test_distance_numpy(10, 12),
+        dist["name"],
+        n_neighbors,
+    )
+
+    # Unequal length collections given as lists.
+    y_list = [create_test_distance_numpy(2, 8 + i, random_state=i) for i in range(10)]
+    x_list = [create_test_distance_numpy(2, 10, random_state=20), x[0]]
+    indices, distances = nearest_neighbors(
+        x_list, y_list, dist["name"], n_neighbors=n_neighbors
+    )
+    for i, query in enumerate(x_list):
+        expected = np.array([dist["distance"](query, series) for series in y_list])
+        assert_almost_equal(distances[i], np.sort(expected)[:n_neighbors])
+
+
+def test_nearest_neighbors_single_query():
+    """Test a single series is searched as a collection of one query."""
+    y = create_test_distance_numpy(10, 1, 12)
+    indices, distances = nearest_neighbors(y[3, 0], y, "dtw", n_neighbors=2)
+    assert indices.shape == (1, 2)
+    assert indices[0, 0] == 3
+    assert distances[0, 0] == 0.0
+
+
+def test_nearest_neighbors_parameters():
+    """Test distance parameters, callables, n_jobs and invalid arguments."""
+    y = create_test_distance_numpy(10, 2, 12)
+    x = create_test_distance_numpy(3, 2, 12, random_state=2)
+    _validate_nearest_neighbors(x, y, "dtw", 2, window=0.2)
+    _validate_nearest_neighbors(x, y, "msm", 2, c=0.5, independent=False)
+
+    indices, distances = nearest_neighbors(x, y, "euclidean", n_neighbors=None)
+    assert indices.shape == (3, 10)
+    callable_indices, callable_distances = nearest_neighbors(
+        x, y, euclidean_distance, n_neighbors=None
+    )
+    assert_array_equal(indices, callable_indices)
+    assert_almost_equal(distances, callable_distances)
+    parallel_indices, parallel_distances = nearest_neighbors(
+        x, y, "dtw", n_neighbors=3, n_jobs=-1
+    )
+    serial_indices, serial_distances = nearest_neighbors(x, y, "dtw", n_neighbors=3)
+    assert_array_equal(parallel_indices, serial_indices)
+    assert_array_equal(parallel_distances, serial_distances)
+
+    with pytest.raises(ValueError, match="n_neighbors"):
+        nearest_neighbors(x, y, "dtw", n_neighbors=11)
+    with pytest.raises(ValueError, match="n_neighbors"):
+        nearest_neighbors(x, y, "dtw", n_neighbors=0)
+    with pytest.raises(ValueError):
+        nearest_neighbors(x, y, "fake")
+    with pytest.raises(TypeError):
+        nearest_neighbors(x, y, "dtw", fake=1.0)
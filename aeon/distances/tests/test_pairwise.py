@@ -277,3 +277,25 @@ def test_new_single_to_multiple_distances(dist):
         dist["distance"],
         dist["pairwise_distance"],
     )
+
+
+@pytest.mark.parametrize("dist", DISTANCES)
+def test_pairwise_distance_n_jobs(dist):
+    """Test the pairwise distances give the same result for any n_jobs."""
+    X = create_test_distance_numpy(7, 2, 10)
+    y = create_test_distance_numpy(4, 2, 10, random_state=2)
+
+    serial = dist["pairwise_distance"](X)
+    for n_jobs in [2, -1]:
+        assert np.array_equal(serial, dist["pairwise_distance"](X, n_jobs=n_jobs))
+        assert np.array_equal(
+            serial, compute_pairwise_distance(X, metric=dist["name"], n_jobs=n_jobs)
+        )
+
+    serial = dist["pairwise_distance"](X, y)
+    for n_jobs in [2, -1]:
+        assert np.array_equal(serial, dist["pairwise_distance"](X, y, n_jobs=n_jobs))
+        assert np.array_equal(
+            serial,
+            compute_pairwise_distance(X, y, metric=dist["name"], n_jobs=n_jobs),
+        )
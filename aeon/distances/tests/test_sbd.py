@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+"""Tests for the shape-based distance."""
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal
+
+from aeon.distances import sbd_distance, sbd_pairwise_distance
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+
+def _correlate_sbd(x, y):
+    # Reference SBD from numpy's cross-correlation of z-normalised series.
+    x = (x - x.mean(axis=1, keepdims=True)) / x.std(axis=1, keepdims=True)
+    y = (y - y.mean(axis=1, keepdims=True)) / y.std(axis=1, keepdims=True)
+    cc = sum(np.correlate(x[c], y[c], "full") for c in range(len(x)))
+    return 1 - cc.max() / (np.linalg.norm(x) * np.linalg.norm(y))
+
+
+@pytest.mark.parametrize("shapes", [(1, 10, 10), (3, 10, 10), (1, 8, 12), (2, 12, 8)])
+def test_sbd_distance(shapes):
+    """Test SBD against the definition and its invariance to shift and scale."""
+    n_channels, x_size, y_size = shapes
+    x = create_test_distance_numpy(n_channels, x_size)
+    y = create_test_distance_numpy(n_channels, y_size, random_state=2)
+    assert_almost_equal(sbd_distance(x, y), _correlate_sbd(x, y))
+    assert_almost_equal(sbd_distance(x, y), sbd_distance(y, x))
+    assert_almost_equal(sbd_distance(x, 3 * x + 2), 0.0)
+    assert sbd_distance(x[:, :-1], x[:, 1:]) < sbd_distance(x[:, :-1], y[:, 1:])
+    assert sbd_distance(np.zeros(5), np.zeros(5), standardize=False) == 0.0
+    assert sbd_distance(np.zeros(5), np.ones(5), standardize=False) == 1.0
+
+
+@pytest.mark.parametrize("n_timepoints", [60, 100, 128])
+def test_sbd_pairwise_distance_fft(n_timepoints):
+    """Test the FFT pairwise distances match the distance between each pair."""
+    X = create_test_distance_numpy(6, 3, n_timepoints)
+    y = create_test_distance_numpy(4, 3, n_timepoints - 10, random_state=2)
+    X[0, 1] = 0.0
+    for standardize in [True, False]:
+        expected = np.array([[sbd_distance(a, b, standardize) for b in y] for a in X])
+        assert_almost_equal(sbd_pairwise_distance(X, y, standardize), expected)
+        expected = np.array([[sbd_distance(a, b, standardize) for b in X] for a in X])
+        pairwise = sbd_pairwise_distance(X, standardize=standardize)
+        assert_almost_equal(pairwise, expected)
+        assert np.array_equal(pairwise, pairwise.T)
+        assert np.all(np.diag(pairwise) == 0)
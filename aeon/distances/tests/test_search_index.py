@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""Tests for the DTW search index."""
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal, assert_array_equal
+
+from aeon.distances import DTWSearchIndex, nearest_neighbors
+from aeon.distances.tests._utils import create_test_distance_numpy
+
+BOUNDING = [None, {"window": 0.0}, {"window": 0.2}, {"itakura_max_slope": 0.5}]
+
+
+@pytest.mark.parametrize("distance", ["dtw", "ddtw"])
+@pytest.mark.parametrize("distance_params", BOUNDING)
+@pytest.mark.parametrize("n_channels", [1, 3])
+def test_search_index(distance, distance_params, n_channels):
+    """Test the index finds the same neighbours as a brute force search."""
+    y = np.cumsum(create_test_distance_numpy(20, n_channels, 15), axis=2)
+    x = np.cumsum(create_test_distance_numpy(5, n_channels, 15, random_state=2), axis=2)
+    # Queries with exact and tied matches in the collection.
+    y[4] = y[11]
+    x[0] = y[11]
+    index = DTWSearchIndex(distance, distance_params).fit(y)
+    for n_neighbors in [1, 3, 20]:
+        indices, distances = index.kneighbors(x, n_neighbors)
+        expected_indices, expected_distances = nearest_neighbors(
+            x, y, distance, n_neighbors=n_neighbors, **(distance_params or {})
+        )
+        assert_array_equal(indices, expected_indices)
+        assert_almost_equal(distances, expected_distances)
+    assert_array_equal(index.kneighbors(x, 2)[0][0], [4, 11])
+
+    parallel_index = DTWSearchIndex(distance, distance_params, n_jobs=-1).fit(y)
+    assert_array_equal(parallel_index.kneighbors(x, 3)[0], index.kneighbors(x, 3)[0])
+
+
+def test_search_index_input():
+    """Test the index input types and errors."""
+    y = create_test_distance_numpy(10, 12)
+    x = create_test_distance_numpy(3, 12, random_state=2)
+    index = DTWSearchIndex().fit(y)
+    indices, _ = index.kneighbors(x, 2)
+    assert_array_equal(indices, index.kneighbors(list(x.reshape((3, 1, 12))), 2)[0])
+    assert_array_equal(
+        indices, DTWSearchIndex().fit(list(y.reshape((10, 1, 12)))).kneighbors(x, 2)[0]
+    )
+
+    with pytest.raises(ValueError, match="fitted"):
+        DTWSearchIndex().kneighbors(x)
+    with pytest.raises(ValueError, match="n_neighbors"):
+        index.kneighbors(x, 11)
+    with pytest.raises(ValueError, match="same number of channels"):
+        index.kneighbors(create_test_distance_numpy(3, 10))
+    with pytest.raises(ValueError, match="equal length"):
+        DTWSearchIndex().fit([np.zeros((1, 10)), np.zeros((1, 12))])
+    with pytest.raises(ValueError, match="distance must be one of"):
+        DTWSearchIndex("msm").fit(y)
+    with pytest.raises(ValueError, match="unexpected distance parameters"):
+        DTWSearchIndex(distance_params={"g": 0.1}).fit(y)
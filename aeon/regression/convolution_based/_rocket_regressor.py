@@ -9,11 +9,12 @@ __all__ = ["RocketRegressor"]
 
 import numpy as np
 from sklearn.linear_model import RidgeCV
+from sklearn.pipeline import make_pipeline
 from sklearn.preprocessing import StandardScaler
 
 from aeon.base._base import _clone_estimator
-from aeon.pipeline import make_pipeline
 from aeon.regression.base import BaseRegressor
+from aeon.regression.sklearn import IncrementalRidgeCV
 from aeon.transformations.collection.convolution_based import (
     MiniRocket,
     MiniRocketMultivariate,
@@ -21,6 +22,9 @@ from aeon.transformations.collection.convolution_based import (
     MultiRocketMultivariate,
     Rocket,
 )
+from aeon.transformations.collection.convolution_based._feature_cache import (
+    _check_feature_cache,
+)
 
 
 class RocketRegressor(BaseRegressor):
@@ -55,6 +59,12 @@ class RocketRegressor(BaseRegressor):
     n_jobs : int, default=1
         The number of jobs to run in parallel for both `fit` and `predict`.
         ``-1`` means using all processors.
+    feature_cache : str, Path, RocketFeatureCache or None, default=None
+        If not None, the fitted transformer and the transformed training data are
+        stored in and loaded from this cache, see ``RocketFeatureCache``. Fitting
+        again with the same transformer parameters and training data, for example
+        with a different ``estimator``, then does not recompute the transform.
+        Only used if ``random_state`` is an int.
 
     Attributes
     ----------
@@ -102,6 +112,7 @@ class RocketRegressor(BaseRegressor):
         random_state=None,
         estimator=None,
         n_jobs=1,
+        feature_cache=None,
     ):
         self.num_kernels = num_kernels
         self.rocket_transform = rocket_transform
@@ -111,6 +122,9 @@ class RocketRegressor(BaseRegressor):
         self.random_state = random_state
         self.estimator = estimator
         self.n_jobs = n_jobs
+        self.feature_cache = feature_cache
+
+        self._incremental = False
 
         super(RocketRegressor, self).__init__()
 
@@ -136,22 +150,86 @@ class RocketRegressor(BaseRegressor):
         """
         self.n_instances_, self.n_dims_, self.series_length_ = X.shape
 
+        self._transformer = self._get_transformer()
+        self._scaler = StandardScaler(with_mean=False)
+        self._estimator = _clone_estimator(
+            RidgeCV(alphas=np.logspace(-3, 3, 10))
+            if self.estimator is None
+            else self.estimator,
+            self.random_state,
+        )
+        feature_cache = _check_feature_cache(self.feature_cache)
+        if feature_cache is not None:
+            self._transformer, X_t = feature_cache.fit_transform(self._transformer, X)
+            self._estimator.fit(self._scaler.fit_transform(X_t), y)
+        self.pipeline_ = make_pipeline(
+            self._transformer,
+            self._scaler,
+            self._estimator,
+        )
+        if feature_cache is None:
+            self.pipeline_.fit(X, y)
+        return self
+
+    def partial_fit(self, X, y):
+        """Update the regressor with a batch of training data.
+
+        The first call, or the first call after ``fit``, fits the Rocket transformer
+        to the batch and starts a new ``IncrementalRidgeCV``. Each call transforms
+        the batch and updates the ridge regression, so a model can be trained on
+        more data than fits in memory and refreshed with new data without
+        refitting. Only the default ``estimator`` can be trained this way.
+
+        Parameters
+        ----------
+        X : 3D np.ndarray of shape = [n_instances, n_channels, n_timepoints]
+            A batch of training data.
+        y : np.ndarray of shape = [n_instances]
+            The target variable values of the batch.
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        if self.estimator is not None:
+            raise ValueError(
+                "partial_fit can only be used with the default estimator, but "
+                f"estimator is {self.estimator}"
+            )
+        if not self._incremental:
+            self.reset()
+            X = self._preprocess_collection(X)
+            self.n_instances_, self.n_dims_, self.series_length_ = X.shape
+            self._transformer = self._get_transformer().fit(X)
+            self._estimator = IncrementalRidgeCV()
+            self.pipeline_ = make_pipeline(self._transformer, self._estimator)
+            self._incremental = True
+            self._is_fitted = True
+        else:
+            X = self._preprocess_collection(X)
+            self.n_instances_ += X.shape[0]
+        y = self._check_y(y, X.shape[0])
+        self._estimator.partial_fit(self._transformer.transform(X), y)
+        return self
+
+    def _get_transformer(self):
         if self.rocket_transform == "rocket":
-            self._transformer = Rocket(
+            return Rocket(
                 num_kernels=self.num_kernels,
                 n_jobs=self.n_jobs,
                 random_state=self.random_state,
             )
         elif self.rocket_transform == "minirocket":
             if self.n_dims_ > 1:
-                self._transformer = MiniRocketMultivariate(
+                return MiniRocketMultivariate(
                     num_kernels=self.num_kernels,
                     max_dilations_per_kernel=self.max_dilations_per_kernel,
                     n_jobs=self.n_jobs,
                     random_state=self.random_state,
                 )
             else:
-                self._transformer = MiniRocket(
+                return MiniRocket(
                     num_kernels=self.num_kernels,
                     max_dilations_per_kernel=self.max_dilations_per_kernel,
                     n_jobs=self.n_jobs,
@@ -159,7 +237,7 @@ class RocketRegressor(BaseRegressor):
                 )
         elif self.rocket_transform == "multirocket":
             if self.n_dims_ > 1:
-                self._transformer = MultiRocketMultivariate(
+                return MultiRocketMultivariate(
                     num_kernels=self.num_kernels,
                     max_dilations_per_kernel=self.max_dilations_per_kernel,
                     n_features_per_kernel=self.n_features_per_kernel,
@@ -167,29 +245,14 @@ class RocketRegressor(BaseRegressor):
                     random_state=self.random_state,
                 )
             else:
-                self._transformer = MultiRocket(
+                return MultiRocket(
                     num_kernels=self.num_kernels,
                     max_dilations_per_kernel=self.max_dilations_per_kernel,
                     n_features_per_kernel=self.n_features_per_kernel,
                     n_jobs=self.n_jobs,
                     random_state=self.random_state,
                 )
-        else:
-            raise ValueError(f"Invalid Rocket transformer: {self.rocket_transform}")
-        self._scaler = StandardScaler(with_mean=False)
-        self._estimator = _clone_estimator(
-            RidgeCV(alphas=np.logspace(-3, 3, 10))
-            if self.estimator is None
-            else self.estimator,
-            self.random_state,
-        )
-        self.pipeline_ = make_pipeline(
-            self._transformer,
-            self._scaler,
-            self._estimator,
-        )
-        self.pipeline_.fit(X, y)
-        return self
+        raise ValueError(f"Invalid Rocket transformer: {self.rocket_transform}")
 
     def _predict(self, X) -> np.ndarray:
         """Predicts labels for sequences in X.
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Rocket regressor test code."""
+import numpy as np
+
+from aeon.regression.convolution_based import RocketRegressor
+from aeon.regression.sklearn import IncrementalRidgeCV
+from aeon.utils._testing.collection import make_3d_test_data
+
+
+def test_rocket_regressor_partial_fit():
+    """Test partial_fit on batches matches fitting an incremental ridge at once."""
+    X, y = make_3d_test_data(
+        n_cases=30, n_timepoints=30, regression_target=True, random_state=0
+    )
+    rocket = RocketRegressor(num_kernels=50, random_state=0)
+    for i in range(0, 30, 10):
+        rocket.partial_fit(X[i : i + 10], y[i : i + 10])
+    assert isinstance(rocket._estimator, IncrementalRidgeCV)
+    assert rocket.n_instances_ == 30
+
+    transformer = rocket._transformer
+    ridge = IncrementalRidgeCV().fit(transformer.transform(X), y)
+    np.testing.assert_array_almost_equal(
+        rocket.predict(X), ridge.predict(transformer.transform(X)), decimal=4
+    )
+
+    rocket.fit(X, y)
+    assert not isinstance(rocket._estimator, IncrementalRidgeCV)
@@ -11,7 +11,7 @@ __all__ = ["KNeighborsTimeSeriesRegressor"]
 
 import numpy as np
 
-from aeon.distances import get_distance_function
+from aeon.distances import get_distance_function, nearest_neighbors
 from aeon.regression.base import BaseRegressor
 
 WEIGHTS_SUPPORTED = ["uniform", "distance"]
@@ -47,6 +47,9 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
             output must be mxn array if X is array of m Series, X2 of n Series.
     distance_params : dict, default = None
         Dictionary for metric parameters , in case that distance is a str.
+    n_jobs : int, default = 1
+        The number of parallel jobs to run for neighbors search.
+        ``-1`` means using all processors.
 
     Examples
     --------
@@ -73,10 +76,12 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         distance_params=None,
         n_neighbors=1,
         weights="uniform",
+        n_jobs=1,
     ):
         self.distance = distance
         self.distance_params = distance_params
         self.n_neighbors = n_neighbors
+        self.n_jobs = n_jobs
 
         if weights not in WEIGHTS_SUPPORTED:
             raise ValueError(
@@ -130,16 +135,16 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
         self.check_is_fitted()
 
         preds = np.empty(len(X))
+        idx, weights = self._kneighbors(X)
         for i in range(len(X)):
-            idx, weights = self._kneighbors(X[i])
-            preds[i] = np.average(self.y_[idx], weights=weights)
+            preds[i] = np.average(self.y_[idx[i]], weights=weights[i])
 
         return preds
 
     def _kneighbors(self, X):
-        """Find the K-neighbors of a point.
+        """Find the K-neighbors of each case in X.
 
-        Returns indices and weights of each point.
+        Returns indices and weights of the neighbours of each case.
 
         Parameters
         ----------
@@ -151,34 +156,28 @@ class KNeighborsTimeSeriesRegressor(BaseRegressor):
 
         Returns
         -------
-        ind : array
-            Indices of the nearest points in the population matrix.
-        ws : array
+        ind : array of shape (n_cases, n_neighbors)
+            Indices of the nearest points in the population matrix, ordered by
+            distance.
+        ws : array of shape (n_cases, n_neighbors)
             Array representing the weights of each neighbor.
         """
-        distances = np.array(
-            [
-                self.metric_(X, self.X_[j], **self._distance_params)
-                for j in range(len(self.X_))
-            ]
+        closest_idx, distances = nearest_neighbors(
+            X,
+            self.X_,
+            self.distance,
+            n_neighbors=self.n_neighbors,
+            n_jobs=self.n_jobs,
+            **self._distance_params,
         )
 
-        # Find indices of k nearest neighbors using partitioning:
-        # [0..k-1], [k], [k+1..n-1]
-        # They might not be ordered within themselves,
-        # but it is not necessary and partitioning is
-        # O(n) while sorting is O(nlogn)
-        closest_idx = np.argpartition(distances, self.n_neighbors)
-        closest_idx = closest_idx[: self.n_neighbors]
-
         if self.weights == "distance":
-            ws = distances[closest_idx]
-            ws = ws**2
+            ws = distances**2
 
             # Using epsilon ~= 0 to avoid division by zero
             ws = 1 / (ws + np.finfo(float).eps)
         elif self.weights == "uniform":
-            ws = np.repeat(1.0, self.n_neighbors)
+            ws = np.ones(closest_idx.shape)
         else:
             raise Exception(f"Invalid kNN weights: {self.weights}")
 
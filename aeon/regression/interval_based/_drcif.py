@@ -117,6 +117,11 @@ class DrCIFRegressor(BaseIntervalForest, BaseRegressor):
         value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
+    predict_batch_size : int or None, default=None
+        The number of cases to predict at a time. Features are extracted for a block
+        of cases and the predictions of all estimators are summed before the next
+        block, so memory used in predict is bounded by the block size rather than
+        the number of cases. If None, all cases are predicted in a single block.
 
     Attributes
     ----------
@@ -187,6 +192,7 @@ class DrCIFRegressor(BaseIntervalForest, BaseRegressor):
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
+        predict_batch_size=None,
     ):
         d = []
         self.use_pycatch22 = use_pycatch22
@@ -233,6 +239,7 @@ class DrCIFRegressor(BaseIntervalForest, BaseRegressor):
             random_state=random_state,
             n_jobs=n_jobs,
             parallel_backend=parallel_backend,
+            predict_batch_size=predict_batch_size,
         )
 
     @classmethod
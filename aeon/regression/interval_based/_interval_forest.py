@@ -120,6 +120,11 @@ class IntervalForestRegressor(BaseIntervalForest, BaseRegressor):
         value of "threads" is used by default.
         Valid options are "loky", "multiprocessing", "threading" or a custom backend.
         See the joblib Parallel documentation for more details.
+    predict_batch_size : int or None, default=None
+        The number of cases to predict at a time. Features are extracted for a block
+        of cases and the predictions of all estimators are summed before the next
+        block, so memory used in predict is bounded by the block size rather than
+        the number of cases. If None, all cases are predicted in a single block.
 
     Attributes
     ----------
@@ -191,6 +196,7 @@ class IntervalForestRegressor(BaseIntervalForest, BaseRegressor):
         random_state=None,
         n_jobs=1,
         parallel_backend=None,
+        predict_batch_size=None,
     ):
         super(IntervalForestRegressor, self).__init__(
             base_estimator=base_estimator,
@@ -209,6 +215,7 @@ class IntervalForestRegressor(BaseIntervalForest, BaseRegressor):
             random_state=random_state,
             n_jobs=n_jobs,
             parallel_backend=parallel_backend,
+            predict_batch_size=predict_batch_size,
         )
 
     @classmethod
@@ -1,7 +1,9 @@
 # -*- coding: utf-8 -*-
 """Vector sklearn classifiers."""
 __all__ = [
+    "IncrementalRidgeCV",
     "RotationForestRegressor",
 ]
 
+from aeon.regression.sklearn._incremental_ridge import IncrementalRidgeCV
 from aeon.regression.sklearn._rotation_forest_regressor import RotationForestRegressor
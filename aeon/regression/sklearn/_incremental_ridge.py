@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+"""Ridge regression with built-in alpha selection that can be trained in batches."""
+
+__all__ = ["IncrementalRidgeCV"]
+
+import numpy as np
+from sklearn.base import BaseEstimator, MultiOutputMixin, RegressorMixin
+from sklearn.utils.validation import check_is_fitted
+
+from aeon.utils._ridge import RidgeStatistics
+
+
+class IncrementalRidgeCV(MultiOutputMixin, RegressorMixin, BaseEstimator):
+    """Ridge regression with generalised cross-validation trained in batches.
+
+    The model is trained with ``partial_fit`` on batches of data, which updates the
+    mean and covariance of the features and targets. The ridge coefficients for
+    each value of ``alphas`` are then found from an eigendecomposition of the
+    feature covariance, and the alpha with the lowest generalised cross-validation
+    (GCV) error [1]_ is used. GCV approximates the leave-one-out error used by
+    ``sklearn.linear_model.RidgeCV`` using only the covariances.
+
+    The covariance of the features is a ``(n_features, n_features)`` array, so the
+    memory used does not depend on the number of instances. The coefficients are
+    computed when they are first used after ``partial_fit``, so many batches can be
+    added before solving.
+
+    Parameters
+    ----------
+    alphas : array-like of shape (n_alphas,) or None, default=None
+        Regularisation strengths to select from. If None, ``np.logspace(-3, 3, 10)``
+        is used, as in ``RocketClassifier``.
+    fit_intercept : bool, default=True
+        Whether to fit an intercept. If False, the data is not centred.
+    scale : bool, default=True
+        Whether to divide each feature by its standard deviation over all data seen,
+        as ``sklearn.preprocessing.StandardScaler(with_mean=False)`` does, before
+        fitting the ridge regression.
+
+    Attributes
+    ----------
+    n_instances_ : int
+        The number of instances seen.
+    n_features_in_ : int
+        The number of features.
+    coef_ : np.ndarray of shape (n_features,) or (n_targets, n_features)
+        Coefficients of the features, for the unscaled features.
+    intercept_ : float or np.ndarray of shape (n_targets,)
+        The intercept.
+    alpha_ : float
+        The selected regularisation strength.
+    best_score_ : float
+        The negative GCV estimate of the mean squared error with ``alpha_``.
+
+    See Also
+    --------
+    IncrementalRidgeClassifierCV
+
+    References
+    ----------
+    .. [1] Golub G.H., Heath M. and Wahba G.: Generalized Cross-Validation as a
+    Method for Choosing a Good Ridge Parameter. Technometrics 21(2), 1979.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from aeon.regression.sklearn import IncrementalRidgeCV
+    >>> rng = np.random.RandomState(0)
+    >>> X = rng.randn(100, 5)
+    >>> y = X @ np.arange(5) + 1
+    >>> ridge = IncrementalRidgeCV()
+    >>> ridge = ridge.partial_fit(X[:50], y[:50]).partial_fit(X[50:], y[50:])
+    >>> ridge.predict(X[:2]).round(2)
+    array([17.55,  2.98])
+    """
+
+    def __init__(self, alphas=None, fit_intercept=True, scale=True):
+        self.alphas = alphas
+        self.fit_intercept = fit_intercept
+        self.scale = scale
+
+    def fit(self, X, y):
+        """Fit the ridge regression to X and y, discarding any previous data.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            The training data.
+        y : np.ndarray of shape (n_instances,) or (n_instances, n_targets)
+            The targets.
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        self._reset()
+        self.partial_fit(X, y)
+        self._solve()
+        return self
+
+    def partial_fit(self, X, y):
+        """Update the ridge regression with a batch of data.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            A batch of training data.
+        y : np.ndarray of shape (n_instances,) or (n_instances, n_targets)
+            The targets of the batch.
+
+        Returns
+        -------
+        self :
+            Reference to self.
+        """
+        first = getattr(self, "n_instances_", 0) == 0
+        X, y = self._validate_data(
+            X, y, multi_output=True, y_numeric=True, dtype=np.float64, reset=first
+        )
+        if first:
+            self._reset()
+            self._single_target = y.ndim == 1
+        y = y.reshape((y.shape[0], -1))
+        if self.n_instances_ > 0 and y.shape[1] != self._statistics.n_targets:
+            raise ValueError(
+                f"y has {y.shape[1]} targets, but {self._statistics.n_targets} were "
+                f"seen in previous calls to partial_fit"
+            )
+        self._statistics.update(X, y)
+        self.n_instances_ = self._statistics.n_instances
+        self._solved = False
+        return self
+
+    def predict(self, X):
+        """Predict the targets of X.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            The data to predict.
+
+        Returns
+        -------
+        np.ndarray of shape (n_instances,) or (n_instances, n_targets)
+            The predicted targets.
+        """
+        check_is_fitted(self, "n_instances_")
+        X = self._validate_data(X, dtype=np.float64, reset=False)
+        coef, intercept, _, _ = self._solution()
+        return X @ coef.T + intercept
+
+    @property
+    def coef_(self):
+        """Coefficients of the features, for the unscaled features."""
+        return self._solution()[0]
+
+    @property
+    def intercept_(self):
+        """The intercept."""
+        return self._solution()[1]
+
+    @property
+    def alpha_(self):
+        """The selected regularisation strength."""
+        return self._solution()[2]
+
+    @property
+    def best_score_(self):
+        """The negative GCV estimate of the mean squared error with ``alpha_``."""
+        return self._solution()[3]
+
+    def _solution(self):
+        check_is_fitted(self, "n_instances_")
+        if not self._solved:
+            self._solve()
+        return self._coef, self._intercept, self._alpha, self._best_score
+
+    def _reset(self):
+        self.n_instances_ = 0
+        self._statistics = RidgeStatistics()
+
+    def _solve(self):
+        coef, intercept, self._alpha, self._best_score = self._statistics.solve(
+            self.alphas, self.fit_intercept, self.scale
+        )
+        if self._single_target:
+            self._coef = coef[:, 0]
+            self._intercept = float(intercept[0])
+        else:
+            self._coef = coef.T
+            self._intercept = intercept
+        self._solved = True
+
+    def _more_tags(self):
+        return {"multioutput": True}
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""Incremental ridge regression test code."""
+import numpy as np
+import pytest
+from sklearn.linear_model import Ridge
+from sklearn.preprocessing import StandardScaler
+from sklearn.utils.estimator_checks import parametrize_with_checks
+
+from aeon.regression.sklearn import IncrementalRidgeCV
+
+
+@parametrize_with_checks([IncrementalRidgeCV()])
+def test_sklearn_compatible_estimator(estimator, check):
+    """Test that IncrementalRidgeCV adheres to sklearn conventions."""
+    check(estimator)
+
+
+@pytest.mark.parametrize("fit_intercept", [True, False])
+@pytest.mark.parametrize("scale", [True, False])
+def test_incremental_ridge(fit_intercept, scale):
+    """Test batches give the ridge regression of all the data."""
+    rng = np.random.RandomState(0)
+    X = rng.randn(100, 8) * np.arange(1, 9) + 5
+    y = np.c_[X @ rng.randn(8), X @ rng.randn(8)] + rng.randn(100, 2)
+
+    ridge = IncrementalRidgeCV(fit_intercept=fit_intercept, scale=scale)
+    for i in range(0, 100, 30):
+        ridge.partial_fit(X[i : i + 30], y[i : i + 30])
+    assert ridge.n_instances_ == 100
+
+    scaler = StandardScaler(with_mean=False, with_std=scale).fit(X)
+    expected = Ridge(alpha=ridge.alpha_, fit_intercept=fit_intercept)
+    expected.fit(scaler.transform(X), y)
+    X_test = rng.randn(10, 8)
+    np.testing.assert_array_almost_equal(
+        ridge.predict(X_test), expected.predict(scaler.transform(X_test))
+    )
+    full = IncrementalRidgeCV(fit_intercept=fit_intercept, scale=scale).fit(X, y)
+    assert full.alpha_ == ridge.alpha_
+    np.testing.assert_array_almost_equal(full.coef_, ridge.coef_)
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+"""Summary statistics of intervals found from block cumulative sums of a collection.
+
+The interval transformers extract the mean, standard deviation and slope of many
+intervals of the same series. Finding each of these from the interval values takes
+time linear in the interval length. Cumulative sums of the series, its squares and
+its values multiplied by the time index give each statistic from a few sums per
+block of time points instead.
+"""
+
+import numpy as np
+from numba import njit
+
+from aeon.utils.numba.stats import mean, row_mean, row_slope, row_std, slope, std
+
+# number of time points in each block of the cumulative sums
+_BLOCK_SIZE = 64
+# largest ratio of the magnitude of the summed terms to a statistic before it is
+# found from the interval values instead
+_MAX_CANCELLATION = 1e4
+
+
+class _IntervalStatistics:
+    """Block cumulative sums of a collection used to find interval statistics.
+
+    Cumulative sums taken over a whole series lose precision when they are
+    subtracted: an interval of small values after a run of large values, or late in
+    a trending series, is found as the difference of two large sums. The sums are
+    instead restarted every ``_BLOCK_SIZE`` time points and taken relative to the
+    first value of the block. The statistic of an interval is found by combining the
+    sums of the parts of the interval in each block around the interval mean, as in
+    the parallel variance algorithm of Chan et al. Each statistic takes time linear
+    in the number of blocks the interval spans, and constant intervals give a
+    standard deviation and slope of exactly 0.
+
+    The magnitude of the terms summed for each statistic bounds its rounding error.
+    Where the terms are more than ``_MAX_CANCELLATION`` times larger than the
+    statistic, such as when a level shift within a block leaves the interval values
+    far from the first value of the block, the statistic is found from the interval
+    values with ``mean``, ``std`` or ``slope`` instead. Results are accurate to a
+    relative error of around ``1e-11`` of those of ``row_mean``, ``row_std`` and
+    ``row_slope``, whatever the level or trend of the series.
+
+    Parameters
+    ----------
+    X : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+        The collection to find interval statistics for. If X contains NaN or infinite
+        values no sums are stored and no features are supported, as a single missing
+        value would change the statistics of every interval of its block.
+    """
+
+    def __init__(self, X):
+        X = np.asarray(X, dtype=np.float64)
+        self._valid = bool(np.isfinite(X).all())
+        if self._valid:
+            self._X = X
+            (
+                self._offsets,
+                self._sums,
+                self._squared_sums,
+                self._indexed_sums,
+            ) = _block_cumulative_sums(X)
+
+    def supports(self, feature, dilation=1):
+        """Return whether ``feature`` of an interval can be found from the sums."""
+        return self._valid and dilation == 1 and _is_interval_statistic(feature)
+
+    def transform(self, feature, dim, start, end):
+        """Find a supported feature of the interval ``[start, end)`` of a channel.
+
+        Parameters
+        ----------
+        feature : function
+            One of ``row_mean``, ``row_std`` or ``row_slope``.
+        dim : int
+            The channel of the interval.
+        start : int
+            The first time point of the interval.
+        end : int
+            The time point after the last in the interval.
+
+        Returns
+        -------
+        np.ndarray of shape (n_instances,)
+            The feature of the interval of each series.
+        """
+        if feature is row_mean:
+            statistic = 0
+        elif feature is row_std:
+            statistic = 1
+        else:
+            statistic = 2
+        return _interval_statistic(
+            self._X,
+            self._offsets,
+            self._sums,
+            self._squared_sums,
+            self._indexed_sums,
+            dim,
+            start,
+            end,
+            statistic,
+        )
+
+
+def _is_interval_statistic(feature):
+    # Whether a feature function can be found from the cumulative sums.
+    return feature is row_mean or feature is row_std or feature is row_slope
+
+
+@njit(cache=True, fastmath=True)
+def _block_cumulative_sums(X):
+    # Sums of x - o, (x - o)^2 and (t - b) * (x - o) from the start b of each block
+    # up to and including each time point t, where o is the first value of the block.
+    n_instances, n_channels, n_timepoints = X.shape
+    n_blocks = (n_timepoints + _BLOCK_SIZE - 1) // _BLOCK_SIZE
+    offsets = np.zeros((n_instances, n_channels, n_blocks))
+    sums = np.zeros((n_instances, n_channels, n_timepoints))
+    squared_sums = np.zeros((n_instances, n_channels, n_timepoints))
+    indexed_sums = np.zeros((n_instances, n_channels, n_timepoints))
+    for i in range(n_instances):
+        for c in range(n_channels):
+            for b in range(n_blocks):
+                block_start = b * _BLOCK_SIZE
+                offset = X[i, c, block_start]
+                offsets[i, c, b] = offset
+
+                s = 0.0
+                q = 0.0
+                p = 0.0
+                for t in range(
+                    block_start, min(block_start + _BLOCK_SIZE, n_timepoints)
+                ):
+                    x = X[i, c, t] - offset
+                    s += x
+                    q += x * x
+                    p += (t - block_start) * x
+                    sums[i, c, t] = s
+                    squared_sums[i, c, t] = q
+                    indexed_sums[i, c, t] = p
+    return offsets, sums, squared_sums, indexed_sums
+
+
+@njit(cache=True, fastmath=True)
+def _part_sum(sums, block_start, start, end):
+    # sum over [start, end) within a single block from its cumulative sums
+    if start > block_start:
+        return sums[end - 1] - sums[start - 1]
+    return sums[end - 1]
+
+
+@njit(cache=True, fastmath=True)
+def _part_scale(sums, block_start, start, end):
+    # magnitude of the cumulative sums subtracted by _part_sum, which bounds its
+    # rounding error
+    if start > block_start:
+        return abs(sums[end - 1]) + abs(sums[start - 1])
+    return abs(sums[end - 1])
+
+
+@njit(cache=True, fastmath=True)
+def _interval_statistic(
+    X, offsets, sums, squared_sums, indexed_sums, dim, start, end, statistic
+):
+    # statistic 0 is the mean, 1 the standard deviation and 2 the slope over the
+    # interval index, as row_mean, row_std and row_slope
+    length = end - start
+    first_block = start // _BLOCK_SIZE
+    last_block = (end - 1) // _BLOCK_SIZE
+    mid = (start + end - 1) / 2
+
+    values = np.zeros(sums.shape[0])
+    for i in range(sums.shape[0]):
+        # the interval mean, relative to the offset of its first block so constant
+        # intervals give exactly 0
+        anchor = offsets[i, dim, first_block]
+        total = 0.0
+        scale = abs(anchor) * length
+        for b in range(first_block, last_block + 1):
+            block_start = b * _BLOCK_SIZE
+            a = max(start, block_start)
+            e = min(end, block_start + _BLOCK_SIZE)
+            total += (e - a) * (offsets[i, dim, b] - anchor) + _part_sum(
+                sums[i, dim], block_start, a, e
+            )
+            scale += (e - a) * abs(offsets[i, dim, b] - anchor) + _part_scale(
+                sums[i, dim], block_start, a, e
+            )
+        delta = total / length
+
+        if statistic == 0:
+            values[i] = anchor + delta
+            if scale > _MAX_CANCELLATION * abs(values[i]) * length:
+                values[i] = mean(X[i, dim, start:end])
+            continue
+
+        moment = 0.0
+        scale = 0.0
+        for b in range(first_block, last_block + 1):
+            block_start = b * _BLOCK_SIZE
+            a = max(start, block_start)
+            e = min(end, block_start + _BLOCK_SIZE)
+            n = e - a
+            s = _part_sum(sums[i, dim], block_start, a, e)
+            # offset of the block from the interval mean
+            d = offsets[i, dim, b] - anchor - delta
+
+            if statistic == 1:
+                # squared deviations of the part about its own mean, plus the
+                # squared deviation of its mean from the interval mean
+                q = _part_sum(squared_sums[i, dim], block_start, a, e)
+                part_d = d + s / n
+                moment += q - s * s / n + n * part_d * part_d
+                scale += (
+                    _part_scale(squared_sums[i, dim], block_start, a, e)
+                    + s * s / n
+                    + n * part_d * part_d
+                )
+            else:
+                # sum of (t - mid) * (x - mean) over the part
+                p = _part_sum(indexed_sums[i, dim], block_start, a, e)
+                centre = d * n * ((a + e - 1) / 2 - mid)
+                moment += p + (block_start - mid) * s + centre
+                scale += (
+                    _part_scale(indexed_sums[i, dim], block_start, a, e)
+                    + abs(block_start - mid)
+                    * _part_scale(sums[i, dim], block_start, a, e)
+                    + abs(centre)
+                )
+
+        # values of a part far from the first value of its block, such as a level
+        # shift within the block, leave the moment as the small difference of large
+        # sums, so it is found from the interval values instead
+        exact = scale > _MAX_CANCELLATION * abs(moment)
+        if statistic == 1:
+            if exact:
+                values[i] = std(X[i, dim, start:end])
+            else:
+                var = moment / length
+                values[i] = var**0.5 if var > 0 else 0
+        elif exact:
+            values[i] = slope(X[i, dim, start:end])
+        elif length > 1:
+            values[i] = moment / (length * (length * length - 1) / 12)
+    return values
@@ -7,8 +7,10 @@ __all__ = [
     "MiniRocketMultivariateVariable",
     "MultiRocket",
     "MultiRocketMultivariate",
+    "RocketFeatureCache",
 ]
 
+from ._feature_cache import RocketFeatureCache
 from ._minirocket import MiniRocket
 from ._minirocket_multivariate import MiniRocketMultivariate
 from ._minirocket_multivariate_variable import MiniRocketMultivariateVariable
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+"""Transform collections in blocks of instances with the Rocket transformers.
+
+The Rocket transformers produce thousands of features per series, and transform
+each series independently. Transforming a large collection in blocks of instances
+bounds the memory used for converted and normalised copies of the input, and
+:meth:`_BatchTransformMixin.transform_batches` yields the features of each block so
+that the whole feature matrix need never be held in memory.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+class _BatchTransformMixin:
+    """Mixin for transformers that transform blocks of instances independently.
+
+    Transformers using this mixin have a ``batch_size`` parameter and implement
+    ``_transform_batch``, which transforms a 3D numpy array of instances into a 2D
+    array of features. ``_transform`` should call ``_transform_in_batches``.
+    """
+
+    def transform_batches(self, X, batch_size=None):
+        """Transform X in blocks of instances, yielding the features of each block.
+
+        Parameters
+        ----------
+        X : 3D np.ndarray of shape = [n_instances, n_channels, series_length] or list
+            Collection of time series to transform. Blocks are sliced from X before
+            they are converted, so a ``np.memmap`` is read one block at a time.
+        batch_size : int or None, default=None
+            Number of instances in each block. If None, the ``batch_size``
+            parameter is used, and if that is also None all instances are
+            transformed in one block.
+
+        Yields
+        ------
+        Transformed features of each block of instances, in the same format as
+        the output of ``transform``.
+        """
+        self.check_is_fitted()
+        if batch_size is None:
+            batch_size = self.batch_size
+        _check_batch_size(batch_size)
+        n_instances = len(X)
+        if batch_size is None:
+            batch_size = n_instances
+        for start in range(0, n_instances, batch_size):
+            yield self.transform(X[start : start + batch_size])
+
+    def _transform_in_batches(self, X):
+        # Transform blocks of batch_size instances into a preallocated output, so
+        # that any copies of the input made by _transform_batch are block sized.
+        _check_batch_size(self.batch_size)
+        n_instances = X.shape[0]
+        if self.batch_size is None or self.batch_size >= n_instances:
+            return self._transform_batch(X)
+        Xt = None
+        for start in range(0, n_instances, self.batch_size):
+            block = self._transform_batch(X[start : start + self.batch_size])
+            if Xt is None:
+                Xt = np.empty((n_instances, block.shape[1]), dtype=block.dtype)
+            Xt[start : start + block.shape[0]] = block
+        return Xt
+
+
+def _check_batch_size(batch_size):
+    if batch_size is not None and (
+        not isinstance(batch_size, (int, np.integer)) or batch_size < 1
+    ):
+        raise ValueError(f"batch_size must be a positive int or None, got {batch_size}")
+
+
+def _as_float(X):
+    # float32 and float64 arrays are used as they are, anything else is converted
+    # to float64.
+    if X.dtype == np.float32 or X.dtype == np.float64:
+        return X
+    return X.astype(np.float64)
+
+
+@njit(cache=True, fastmath=True)
+def _z_normalise_instance(x):
+    # Normalise each channel of a series to zero mean and unit variance, computing
+    # the mean and standard deviation in float64 and returning float32.
+    n_channels, n_timepoints = x.shape
+    _x = np.empty((n_channels, n_timepoints), dtype=np.float32)
+    for c in range(n_channels):
+        mean = 0.0
+        for t in range(n_timepoints):
+            mean += x[c, t]
+        mean /= n_timepoints
+        var = 0.0
+        for t in range(n_timepoints):
+            var += (x[c, t] - mean) ** 2
+        std = np.sqrt(var / n_timepoints) + 1e-8
+        for t in range(n_timepoints):
+            _x[c, t] = (x[c, t] - mean) / std
+    return _x
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _z_normalise_float32(X):
+    # float32 copy of a collection with each channel of each series normalised.
+    _X = np.empty(X.shape, dtype=np.float32)
+    for i in prange(X.shape[0]):
+        _X[i] = _z_normalise_instance(X[i])
+    return _X
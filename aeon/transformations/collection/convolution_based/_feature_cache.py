@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""On-disk cache of fitted Rocket transformers and their training features."""
+
+__all__ = ["RocketFeatureCache"]
+
+import hashlib
+import os
+import uuid
+from pathlib import Path
+
+import numpy as np
+
+from aeon.base import load
+
+# Parameters that change how a transform is computed but not its output.
+_IGNORED_PARAMS = ("n_jobs", "batch_size")
+
+
+class RocketFeatureCache:
+    """On-disk cache of fitted Rocket transformers and their training features.
+
+    Fitting a Rocket transformer generates its kernels, and transforming the
+    training data is usually the most expensive part of fitting a Rocket classifier
+    or regressor. The cache stores the fitted transformer, which holds the kernels,
+    and the transformed training data, keyed by a fingerprint of the transformer
+    parameters and the training data. Fitting another estimator with the same
+    transformer parameters on the same data, for example when searching the
+    parameters of the classifier trained on the features, loads both from the cache
+    instead of recomputing the convolutions.
+
+    Transformers are only cached if their ``random_state`` is an int, otherwise the
+    kernels are random and are generated on every call.
+
+    Parameters
+    ----------
+    path : str or Path
+        Directory of the cache, created if it does not exist. The fitted transformer
+        is saved as a zip file with ``save`` and the features as a ``.npy`` file.
+
+    See Also
+    --------
+    Rocket, MiniRocket, MiniRocketMultivariate, MultiRocket, MultiRocketMultivariate
+
+    Examples
+    --------
+    >>> import tempfile
+    >>> from aeon.transformations.collection.convolution_based import (
+    ...     Rocket, RocketFeatureCache
+    ... )
+    >>> from aeon.datasets import load_unit_test
+    >>> X_train, y_train = load_unit_test(split="train")
+    >>> cache = RocketFeatureCache(tempfile.mkdtemp())
+    >>> rocket = Rocket(num_kernels=50, random_state=0)
+    >>> fitted, X_t = cache.fit_transform(rocket, X_train)
+    >>> X_t.shape
+    (20, 100)
+    >>> fitted, X_t = cache.fit_transform(rocket, X_train)
+    >>> len(cache)
+    1
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self):
+        """Return the number of cached transforms."""
+        return len(list(self.path.glob("*.npy")))
+
+    def fingerprint(self, transformer, X):
+        """Return the key of a transformer and training data in the cache.
+
+        Parameters
+        ----------
+        transformer : Rocket transformer
+            Unfitted transformer. ``n_jobs`` and ``batch_size`` are not part of the
+            key, as they do not change the features.
+        X : np.ndarray
+            Training data.
+
+        Returns
+        -------
+        str
+            Hexadecimal digest of the class and parameters of the transformer and
+            the shape, type and values of X.
+        """
+        params = {
+            k: v
+            for k, v in transformer.get_params(deep=False).items()
+            if k not in _IGNORED_PARAMS
+        }
+        digest = hashlib.sha1()
+        digest.update(type(transformer).__name__.encode())
+        digest.update(repr(sorted(params.items())).encode())
+        X = np.ascontiguousarray(X)
+        digest.update(repr((X.shape, X.dtype.str)).encode())
+        digest.update(memoryview(X).cast("B"))
+        return digest.hexdigest()
+
+    def fit_transform(self, transformer, X):
+        """Fit a transformer on X and transform X, using the cache if possible.
+
+        Parameters
+        ----------
+        transformer : Rocket transformer
+            Unfitted transformer.
+        X : np.ndarray of shape (n_instances, n_channels, n_timepoints)
+            Training data.
+
+        Returns
+        -------
+        transformer : Rocket transformer
+            The fitted transformer, loaded from the cache if it was cached.
+        X_t : np.ndarray of shape (n_instances, n_features)
+            The transformed training data.
+        """
+        if not isinstance(transformer.get_params().get("random_state"), int):
+            return transformer, np.asarray(transformer.fit_transform(X))
+
+        key = self.fingerprint(transformer, X)
+        features = self.path / f"{key}.npy"
+        if features.exists():
+            return load(str(self.path / key)), np.load(features)
+
+        X_t = np.asarray(transformer.fit_transform(X))
+        # Written to temporary names and moved, so a concurrent fit never reads a
+        # partly written entry. The features are moved last as they mark the entry.
+        tmp = f"{key}_{uuid.uuid4().hex}"
+        transformer.save(self.path / tmp).close()
+        os.replace(self.path / f"{tmp}.zip", self.path / f"{key}.zip")
+        np.save(self.path / f"{tmp}.npy", X_t)
+        os.replace(self.path / f"{tmp}.npy", features)
+        return transformer, X_t
+
+    def clear(self):
+        """Remove all cached transforms."""
+        for file in list(self.path.glob("*.npy")) + list(self.path.glob("*.zip")):
+            file.unlink()
+
+
+def _check_feature_cache(feature_cache):
+    # A RocketFeatureCache from a cache or a path, or None.
+    if feature_cache is None or isinstance(feature_cache, RocketFeatureCache):
+        return feature_cache
+    if isinstance(feature_cache, (str, Path)):
+        return RocketFeatureCache(feature_cache)
+    raise TypeError(
+        "feature_cache must be None, a str or Path or a RocketFeatureCache, but "
+        f"found {type(feature_cache)}"
+    )
@@ -10,9 +10,12 @@ import numpy as np
 from numba import get_num_threads, njit, prange, set_num_threads, vectorize
 
 from aeon.transformations.collection import BaseCollectionTransformer
+from aeon.transformations.collection.convolution_based._batching import (
+    _BatchTransformMixin,
+)
 
 
-class MiniRocket(BaseCollectionTransformer):
+class MiniRocket(_BatchTransformMixin, BaseCollectionTransformer):
     """MINImally RandOm Convolutional KErnel Transform (MiniRocket).
 
     MiniRocket [1]_ is an almost deterministic version of Rocket. If creates
@@ -32,6 +35,11 @@ class MiniRocket(BaseCollectionTransformer):
         processors.
     random_state : None or int, default = None
         Seed for random number generation.
+    batch_size : int or None, default=None
+        Number of instances to transform at once. If None, all instances are
+        transformed at once. Smaller batches bound the memory used for converted
+        copies of the input, see also ``transform_batches``, which yields the
+        features of each batch.
 
     See Also
     --------
@@ -70,12 +78,14 @@ class MiniRocket(BaseCollectionTransformer):
         max_dilations_per_kernel=32,
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.num_kernels = num_kernels
         self.max_dilations_per_kernel = max_dilations_per_kernel
 
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.batch_size = batch_size
         super(MiniRocket, self).__init__()
 
     def _fit(self, X, y=None):
@@ -122,8 +132,6 @@ class MiniRocket(BaseCollectionTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        X = X[:, 0, :].astype(np.float32)
-
         # change n_jobs dependend on value and existing cores
         prev_threads = get_num_threads()
         if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
@@ -131,10 +139,13 @@ class MiniRocket(BaseCollectionTransformer):
         else:
             n_jobs = self.n_jobs
         set_num_threads(n_jobs)
-        X_ = _transform(X, self.parameters)
+        X_ = self._transform_in_batches(X)
         set_num_threads(prev_threads)
         return X_
 
+    def _transform_batch(self, X):
+        return _transform(X[:, 0, :].astype(np.float32, copy=False), self.parameters)
+
 
 @njit(
     "float32[:](float32[:,:],int32[:],int32[:],float32[:],optional(int32))",
@@ -5,11 +5,14 @@ import numpy as np
 import pandas as pd
 from numba import get_num_threads, njit, prange, set_num_threads
 
-from aeon.datatypes import convert
 from aeon.transformations.collection import BaseCollectionTransformer
+from aeon.transformations.collection.convolution_based._batching import (
+    _BatchTransformMixin,
+    _z_normalise_float32,
+)
 
 
-class MultiRocket(BaseCollectionTransformer):
+class MultiRocket(_BatchTransformMixin, BaseCollectionTransformer):
     """Multi RandOm Convolutional KErnel Transform (MultiRocket).
 
     MultiRocket [1]_ is uses the same set of kernels as MiniRocket on both the raw
@@ -36,6 +39,11 @@ class MultiRocket(BaseCollectionTransformer):
         processors.
     random_state : None or int, default = None
         Seed for random number generation.
+    batch_size : int or None, default=None
+        Number of instances to transform at once. If None, all instances are
+        transformed at once. Smaller batches bound the memory used for converted
+        copies of the input, see also ``transform_batches``, which yields the
+        features of each batch.
 
     Attributes
     ----------
@@ -86,6 +94,7 @@ class MultiRocket(BaseCollectionTransformer):
         normalise=False,
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.max_dilations_per_kernel = max_dilations_per_kernel
         self.n_features_per_kernel = n_features_per_kernel
@@ -95,6 +104,7 @@ class MultiRocket(BaseCollectionTransformer):
         self.normalise = normalise
         self.n_jobs = n_jobs
         self.random_state = random_state if isinstance(random_state, int) else None
+        self.batch_size = batch_size
 
         self.parameter = None
         self.parameter1 = None
@@ -114,12 +124,7 @@ class MultiRocket(BaseCollectionTransformer):
         -------
         self
         """
-        X = X.astype(np.float64)
-        X = convert(X, from_type="numpy3D", to_type="numpyflat", as_scitype="Panel")
-        if self.normalise:
-            X = (X - X.mean(axis=-1, keepdims=True)) / (
-                X.std(axis=-1, keepdims=True) + 1e-8
-            )
+        X = self._float32_series(X)
 
         self.parameter = self._get_parameter(X)
 
@@ -141,15 +146,6 @@ class MultiRocket(BaseCollectionTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        X = X.astype(np.float64)
-        X = convert(X, from_type="numpy3D", to_type="numpyflat", as_scitype="Panel")
-        if self.normalise:
-            X = (X - X.mean(axis=-1, keepdims=True)) / (
-                X.std(axis=-1, keepdims=True) + 1e-8
-            )
-
-        X1 = np.diff(X, 1)
-
         # change n_jobs dependend on value and existing cores
         prev_threads = get_num_threads()
         if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
@@ -158,19 +154,26 @@ class MultiRocket(BaseCollectionTransformer):
             n_jobs = self.n_jobs
         set_num_threads(n_jobs)
 
+        X = self._transform_in_batches(X)
+        set_num_threads(prev_threads)
+        return pd.DataFrame(X)
+
+    def _transform_batch(self, X):
+        X = self._float32_series(X)
         X = _transform(
             X,
-            X1,
+            np.diff(X, 1),
             self.parameter,
             self.parameter1,
             self.n_features_per_kernel,
         )
-        X = np.nan_to_num(X)
+        return np.nan_to_num(X, copy=False)
 
-        set_num_threads(prev_threads)
-        # # from_2d_array_to_3d_numpy
-        # _X = np.reshape(_X, (_X.shape[0], 1, _X.shape[1])).astype(np.float64)
-        return pd.DataFrame(X)
+    def _float32_series(self, X):
+        # The first channel of X as a float32 array, normalised if required.
+        if self.normalise:
+            return _z_normalise_float32(X)[:, 0]
+        return X[:, 0].astype(np.float32, copy=False)
 
     def _get_parameter(self, X):
         _, input_length = X.shape
@@ -193,7 +196,7 @@ class MultiRocket(BaseCollectionTransformer):
 
 
 @njit(
-    "float32[:,:](float64[:,:],float64[:,:],Tuple((int32[:],int32[:],float32[:])),"
+    "float32[:,:](float32[:,:],float32[:,:],Tuple((int32[:],int32[:],float32[:])),"
     "Tuple((int32[:],int32[:],float32[:])),int32)",
     fastmath=True,
     parallel=True,
@@ -727,7 +730,7 @@ def _transform(X, X1, parameters, parameters1, n_features_per_kernel):
 
 
 @njit(
-    "float32[:](float64[:,:],int32[:],int32[:],float32[:],optional(int64))",
+    "float32[:](float32[:,:],int32[:],int32[:],float32[:],optional(int64))",
     fastmath=True,
     parallel=False,
     cache=True,
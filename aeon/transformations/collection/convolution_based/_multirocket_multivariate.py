@@ -6,9 +6,13 @@ import pandas as pd
 from numba import get_num_threads, njit, prange, set_num_threads
 
 from aeon.transformations.collection import BaseCollectionTransformer
+from aeon.transformations.collection.convolution_based._batching import (
+    _BatchTransformMixin,
+    _z_normalise_float32,
+)
 
 
-class MultiRocketMultivariate(BaseCollectionTransformer):
+class MultiRocketMultivariate(_BatchTransformMixin, BaseCollectionTransformer):
     """Multi RandOm Convolutional KErnel Transform (MultiRocket).
 
     MultiRocket [1]_ is uses the same set of kernels as MiniRocket on both the raw
@@ -33,6 +37,12 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
         The number of jobs to run in parallel for `transform`. ``-1`` means using all
         processors.
     random_state : None or int, default = None
+        Seed for random number generation.
+    batch_size : int or None, default=None
+        Number of instances to transform at once. If None, all instances are
+        transformed at once. Smaller batches bound the memory used for converted
+        copies of the input, see also ``transform_batches``, which yields the
+        features of each batch.
 
     Attributes
     ----------
@@ -84,6 +94,7 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
         normalise=False,
         n_jobs=1,
         random_state=None,
+        batch_size=None,
     ):
         self.max_dilations_per_kernel = max_dilations_per_kernel
         self.n_features_per_kernel = n_features_per_kernel
@@ -91,6 +102,7 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
         self.normalise = normalise
         self.n_jobs = n_jobs
         self.random_state = random_state if isinstance(random_state, int) else None
+        self.batch_size = batch_size
 
         self.parameter = None
         self.parameter1 = None
@@ -110,10 +122,7 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
         -------
         self
         """
-        if self.normalise:
-            X = (X - X.mean(axis=-1, keepdims=True)) / (
-                X.std(axis=-1, keepdims=True) + 1e-8
-            )
+        X = self._float32_collection(X)
 
         if X.shape[2] < 10:
             # handling very short series (like PensDigit from the MTSC archive)
@@ -123,8 +132,6 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
             X = _X1
             del _X1
 
-        X = X.astype(np.float64)
-
         self.parameter = self._get_parameter(X)
         _X1 = np.diff(X, 1)
 
@@ -145,13 +152,6 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
         -------
         pandas DataFrame, transformed features
         """
-        if self.normalise:
-            X = (X - X.mean(axis=-1, keepdims=True)) / (
-                X.std(axis=-1, keepdims=True) + 1e-8
-            )
-
-        _X1 = np.diff(X, 1)
-
         # change n_jobs dependend on value and existing cores
         prev_threads = get_num_threads()
         if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
@@ -160,18 +160,26 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
             n_jobs = self.n_jobs
         set_num_threads(n_jobs)
 
+        X = self._transform_in_batches(X)
+        set_num_threads(prev_threads)
+        return pd.DataFrame(X)
+
+    def _transform_batch(self, X):
+        X = self._float32_collection(X)
         X = _transform(
             X,
-            _X1,
+            np.diff(X, 1),
             self.parameter,
             self.parameter1,
             self.n_features_per_kernel,
         )
-        X = np.nan_to_num(X)
+        return np.nan_to_num(X, copy=False)
 
-        set_num_threads(prev_threads)
-
-        return pd.DataFrame(X)
+    def _float32_collection(self, X):
+        # X as a float32 array, normalised if required.
+        if self.normalise:
+            return _z_normalise_float32(X)
+        return X.astype(np.float32, copy=False)
 
     def _get_parameter(self, X):
         _, num_channels, input_length = X.shape
@@ -230,7 +238,7 @@ class MultiRocketMultivariate(BaseCollectionTransformer):
 
 
 @njit(
-    "float32[:](float64[:,:,:],int32[:],int32[:],int32[:],int32[:],float32[:],"
+    "float32[:](float32[:,:,:],int32[:],int32[:],int32[:],int32[:],float32[:],"
     "optional(int64))",
     fastmath=True,
     parallel=False,
@@ -628,7 +636,7 @@ def _quantiles(n):
 
 
 @njit(
-    "float32[:,:](float64[:,:,:],float64[:,:,:],"
+    "float32[:,:](float32[:,:,:],float32[:,:,:],"
     "Tuple((int32[:],int32[:],int32[:],int32[:],float32[:])),"
     "Tuple((int32[:],int32[:],int32[:],int32[:],float32[:])),int32)",
     fastmath=True,
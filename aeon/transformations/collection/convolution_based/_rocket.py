@@ -10,9 +10,14 @@ import numpy as np
 from numba import get_num_threads, njit, prange, set_num_threads
 
 from aeon.transformations.collection import BaseCollectionTransformer
+from aeon.transformations.collection.convolution_based._batching import (
+    _as_float,
+    _BatchTransformMixin,
+    _z_normalise_instance,
+)
 
 
-class Rocket(BaseCollectionTransformer):
+class Rocket(_BatchTransformMixin, BaseCollectionTransformer):
     """RandOm Convolutional KErnel Transform (ROCKET).
 
     A kernel (or convolution) is a subseries used to create features that can be used
@@ -35,6 +40,11 @@ class Rocket(BaseCollectionTransformer):
        The number of jobs to run in parallel for `transform`. ``-1`` means use all
        processors.
     random_state : None or int, optional, default = None
+    batch_size : int or None, default=None
+        Number of instances to transform at once. If None, all instances are
+        transformed at once. Smaller batches bound the memory used for converted
+        copies of the input, see also ``transform_batches``, which yields the
+        features of each batch.
 
     See Also
     --------
@@ -67,11 +77,19 @@ class Rocket(BaseCollectionTransformer):
         "scitype:transform-output": "Primitives",
     }
 
-    def __init__(self, num_kernels=10_000, normalise=True, n_jobs=1, random_state=None):
+    def __init__(
+        self,
+        num_kernels=10_000,
+        normalise=True,
+        n_jobs=1,
+        random_state=None,
+        batch_size=None,
+    ):
         self.num_kernels = num_kernels
         self.normalise = normalise
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self.batch_size = batch_size
         super(Rocket, self).__init__()
 
     def _fit(self, X, y=None):
@@ -114,20 +132,21 @@ class Rocket(BaseCollectionTransformer):
         -------
         np.ndarray [n_instances, num_kernels], transformed features
         """
-        if self.normalise:
-            X = (X - X.mean(axis=-1, keepdims=True)) / (
-                X.std(axis=-1, keepdims=True) + 1e-8
-            )
         prev_threads = get_num_threads()
         if self.n_jobs < 1 or self.n_jobs > multiprocessing.cpu_count():
             n_jobs = multiprocessing.cpu_count()
         else:
             n_jobs = self.n_jobs
         set_num_threads(n_jobs)
-        X_ = _apply_kernels(X.astype(np.float32), self.kernels)
+        X_ = self._transform_in_batches(X)
         set_num_threads(prev_threads)
         return X_
 
+    def _transform_batch(self, X):
+        # Each series is converted to float32, and normalised if required, inside
+        # the kernel, so X is not copied.
+        return _apply_kernels(_as_float(X), self.kernels, self.normalise)
+
 
 @njit(
     "Tuple((float32[:],int32[:],float32[:],int32[:],int32[:],int32[:],"
@@ -274,13 +293,17 @@ def _apply_kernel_multivariate(
 
 
 @njit(
-    "float32[:,:](float32[:,:,:],Tuple((float32[::1],int32[:],float32[:],"
-    "int32[:],int32[:],int32[:],int32[:])))",
+    [
+        "float32[:,:](float32[:,:,:],Tuple((float32[::1],int32[:],float32[:],"
+        "int32[:],int32[:],int32[:],int32[:])),boolean)",
+        "float32[:,:](float64[:,:,:],Tuple((float32[::1],int32[:],float32[:],"
+        "int32[:],int32[:],int32[:],int32[:])),boolean)",
+    ],
     parallel=True,
     fastmath=True,
     cache=True,
 )
-def _apply_kernels(X, kernels):
+def _apply_kernels(X, kernels, normalise):
     (
         weights,
         lengths,
@@ -299,6 +322,11 @@ def _apply_kernels(X, kernels):
     )  # 2 features per kernel
 
     for i in prange(n_instances):
+        if normalise:
+            _x = _z_normalise_instance(X[i])
+        else:
+            _x = X[i].astype(np.float32)
+
         a1 = 0  # for weights
         a2 = 0  # for channel_indices
         a3 = 0  # for features
@@ -310,7 +338,7 @@ def _apply_kernels(X, kernels):
 
             if num_channel_indices[j] == 1:
                 _X[i, a3:b3] = _apply_kernel_univariate(
-                    X[i, channel_indices[a2]],
+                    _x[channel_indices[a2]],
                     weights[a1:b1],
                     lengths[j],
                     biases[j],
@@ -322,7 +350,7 @@ def _apply_kernels(X, kernels):
                 _weights = weights[a1:b1].reshape((num_channel_indices[j], lengths[j]))
 
                 _X[i, a3:b3] = _apply_kernel_multivariate(
-                    X[i],
+                    _x,
                     _weights,
                     lengths[j],
                     biases[j],
@@ -7,6 +7,7 @@ from aeon.transformations.collection.convolution_based import (
     MiniRocket,
     MiniRocketMultivariate,
     MultiRocket,
+    MultiRocketMultivariate,
     Rocket,
 )
 
@@ -103,3 +104,36 @@ def test_rocket_on_multivariate(transform):
     assert X_trans[2][3] == X_trans2[2][3]
     assert X_trans[0][80] == X_trans2[0][80]
     assert X_trans[3][55] == X_trans2[3][55]
+
+
+@pytest.mark.parametrize(
+    "transform",
+    [Rocket, MiniRocket, MiniRocketMultivariate, MultiRocket, MultiRocketMultivariate],
+)
+def test_rocket_batches(transform):
+    """Test transforming in batches gives the same features as all at once."""
+    rng = np.random.RandomState(0)
+    n_channels = 1 if transform in [MiniRocket, MultiRocket] else 2
+    X = rng.randn(10, n_channels, 20)
+    np.random.seed(0)
+    X_trans = np.asarray(transform(num_kernels=100, random_state=0).fit_transform(X))
+    np.random.seed(0)
+    rocket = transform(num_kernels=100, random_state=0, batch_size=3).fit(X)
+    np.testing.assert_array_equal(np.asarray(rocket.transform(X)), X_trans)
+    batches = [np.asarray(Xt) for Xt in rocket.transform_batches(X)]
+    assert [len(Xt) for Xt in batches] == [3, 3, 3, 1]
+    np.testing.assert_array_equal(np.concatenate(batches), X_trans)
+    batches = list(rocket.transform_batches(X, batch_size=4))
+    assert [len(Xt) for Xt in batches] == [4, 4, 2]
+    assert np.asarray(batches[0]).dtype == np.float32
+    with pytest.raises(ValueError, match="batch_size"):
+        next(rocket.transform_batches(X, batch_size=0))
+
+
+def test_rocket_normalise_float32():
+    """Test Rocket gives the same features for float32 and float64 input."""
+    X = np.random.RandomState(0).randn(5, 2, 30)
+    rocket = Rocket(num_kernels=100, random_state=0).fit(X)
+    np.testing.assert_almost_equal(
+        rocket.transform(X.astype(np.float32)), rocket.transform(X), decimal=4
+    )
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Tests for the Rocket feature cache."""
+import numpy as np
+import pytest
+
+from aeon.transformations.collection.convolution_based import (
+    MiniRocket,
+    MultiRocketMultivariate,
+    Rocket,
+    RocketFeatureCache,
+)
+from aeon.utils._testing.collection import make_3d_test_data
+
+
+@pytest.mark.parametrize("transform", [Rocket, MiniRocket, MultiRocketMultivariate])
+def test_feature_cache(transform, tmp_path):
+    """Test cached transformers and features are the same as computed ones."""
+    n_channels = 1 if transform is MiniRocket else 2
+    X, _ = make_3d_test_data(n_cases=10, n_channels=n_channels, n_timepoints=20)
+    cache = RocketFeatureCache(tmp_path)
+    np.random.seed(0)
+    fitted, X_t = cache.fit_transform(transform(num_kernels=100, random_state=0), X)
+    assert len(cache) == 1
+    np.testing.assert_array_equal(X_t, np.asarray(fitted.transform(X)))
+
+    rocket = transform(num_kernels=100, random_state=0, n_jobs=2, batch_size=3)
+    loaded, X_t2 = cache.fit_transform(rocket, X)
+    assert len(cache) == 1
+    assert not rocket.is_fitted
+    np.testing.assert_array_equal(X_t2, X_t)
+    np.testing.assert_array_equal(
+        np.asarray(loaded.transform(X[:4])), np.asarray(fitted.transform(X[:4]))
+    )
+
+    cache.fit_transform(transform(num_kernels=100, random_state=1), X)
+    cache.fit_transform(transform(num_kernels=100, random_state=0), X[:5])
+    assert len(cache) == 3
+    cache.fit_transform(transform(num_kernels=100), X)
+    assert len(cache) == 3
+    cache.clear()
+    assert len(cache) == 0
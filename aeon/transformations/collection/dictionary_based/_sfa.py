@@ -314,6 +314,38 @@ class SFA(BaseCollectionTransformer):
         else:
             dfts = supplied_dft
 
+        if self._typed_dict and not self.skip_grams:
+            # the words and bag are created in a single compiled loop, which also
+            # releases the GIL so series can be transformed in threads
+            bag, words = (
+                _create_pyramid_bag_typed(
+                    dfts,
+                    self.word_length,
+                    self.alphabet_size,
+                    self.breakpoints,
+                    self.letter_bits,
+                    self.word_bits,
+                    self.levels,
+                    self.window_size,
+                    self.series_length,
+                    self.remove_repeat_words,
+                    self.bigrams,
+                )
+                if self.levels > 1
+                else _create_bag_typed(
+                    dfts,
+                    self.word_length,
+                    self.alphabet_size,
+                    self.breakpoints,
+                    self.letter_bits,
+                    self.word_bits,
+                    self.window_size,
+                    self.remove_repeat_words,
+                    self.bigrams,
+                )
+            )
+            return self._transform_case_output(bag, words)
+
         if self._typed_dict:
             bag = (
                 Dict.empty(
@@ -335,7 +367,7 @@ class SFA(BaseCollectionTransformer):
 
         for window in range(dfts.shape[0]):
             word_raw = (
-                SFA._create_word(
+                _create_word(
                     dfts[window],
                     self.word_length,
                     self.alphabet_size,
@@ -391,6 +423,9 @@ class SFA(BaseCollectionTransformer):
                                 skip_gram = (skip_gram << self.level_bits) | 0
                         bag[skip_gram] = bag.get(skip_gram, 0) + 1
 
+        return self._transform_case_output(bag, words)
+
+    def _transform_case_output(self, bag, words):
         # cant pickle typed dict
         if self._typed_dict and self.n_jobs != 1:
             pdict = dict()
@@ -466,8 +501,7 @@ class SFA(BaseCollectionTransformer):
         breakpoints = np.zeros((self.word_length, self.alphabet_size))
 
         for letter in range(self.word_length):
-            res = [round(dft[i][letter] * 100) / 100 for i in range(total_num_windows)]
-            column = np.sort(np.array(res))
+            column = np.sort(np.round(dft[:total_num_windows, letter] * 100) / 100)
 
             bin_index = 0
 
@@ -530,17 +564,12 @@ class SFA(BaseCollectionTransformer):
     def _binning_dft(self, series, num_windows_per_inst):
         # Splits individual time series into windows and returns the DFT for
         # each
-        split = np.split(
-            series,
-            np.linspace(
-                self.window_size,
-                self.window_size * (num_windows_per_inst - 1),
-                num_windows_per_inst - 1,
-                dtype=np.int_,
-            ),
-        )
+        split = [
+            series[i * self.window_size : (i + 1) * self.window_size]
+            for i in range(num_windows_per_inst - 1)
+        ]
         start = self.series_length - self.window_size
-        split[-1] = series[start : self.series_length]
+        split.append(series[start : self.series_length])
 
         result = np.zeros((len(split), self.dft_length), dtype=np.float64)
 
@@ -911,18 +940,6 @@ class SFA(BaseCollectionTransformer):
         )
         return (word, quadrant), num_quadrants
 
-    @staticmethod
-    @njit(fastmath=True, cache=True)
-    def _create_word(dft, word_length, alphabet_size, breakpoints, letter_bits):
-        word = np.int64(0)
-        for i in range(word_length):
-            for bp in range(alphabet_size):
-                if dft[i] <= breakpoints[i][bp]:
-                    word = (word << letter_bits) | bp
-                    break
-
-        return word
-
     def _create_word_large(self, dft):
         word = 0
         for i in range(self.word_length):
@@ -1084,3 +1101,104 @@ class SFA(BaseCollectionTransformer):
         # small window size for testing
         params = {"window_size": 4}
         return params
+
+
+# key type of the typed dictionary bags with a spatial pyramid
+_pyramid_key_type = types.UniTuple(types.int64, 2)
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _create_word(dft, word_length, alphabet_size, breakpoints, letter_bits):
+    word = np.int64(0)
+    for i in range(word_length):
+        for bp in range(alphabet_size):
+            if dft[i] <= breakpoints[i][bp]:
+                word = (word << letter_bits) | bp
+                break
+
+    return word
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _create_bag_typed(
+    dfts,
+    word_length,
+    alphabet_size,
+    breakpoints,
+    letter_bits,
+    word_bits,
+    window_size,
+    remove_repeat_words,
+    bigrams,
+):
+    # SFA._transform_case for typed dictionaries with a single level.
+    bag = Dict.empty(key_type=types.int64, value_type=types.uint32)
+    words = np.zeros(dfts.shape[0], dtype=np.int64)
+    last_word = -1
+
+    for window in range(dfts.shape[0]):
+        word_raw = _create_word(
+            dfts[window], word_length, alphabet_size, breakpoints, letter_bits
+        )
+        words[window] = word_raw
+
+        if not (remove_repeat_words and word_raw == last_word):
+            bag[word_raw] = bag.get(word_raw, 0) + 1
+            last_word = word_raw
+
+        if bigrams and window - window_size >= 0:
+            bigram = (words[window - window_size] << word_bits) | word_raw
+            bag[bigram] = bag.get(bigram, 0) + 1
+
+    return bag, words
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _create_pyramid_bag_typed(
+    dfts,
+    word_length,
+    alphabet_size,
+    breakpoints,
+    letter_bits,
+    word_bits,
+    levels,
+    window_size,
+    series_length,
+    remove_repeat_words,
+    bigrams,
+):
+    # SFA._transform_case for typed dictionaries with a spatial pyramid, words are
+    # keyed by (word, quadrant) and bigrams by (bigram, -1).
+    bag = Dict.empty(key_type=_pyramid_key_type, value_type=types.uint32)
+    words = np.zeros(dfts.shape[0], dtype=np.int64)
+    last_word = -1
+    repeat_words = 0
+
+    for window in range(dfts.shape[0]):
+        word_raw = _create_word(
+            dfts[window], word_length, alphabet_size, breakpoints, letter_bits
+        )
+        words[window] = word_raw
+
+        if remove_repeat_words and word_raw == last_word:
+            repeat_words += 1
+        else:
+            window_ind = window - int(repeat_words / 2)
+            start = 0
+            for i in range(levels):
+                num_quadrants = 2**i
+                quadrant = start + int(
+                    (window_ind + int(window_size / 2))
+                    / int(series_length / num_quadrants)
+                )
+                key = (word_raw, np.int64(quadrant))
+                bag[key] = bag.get(key, 0) + num_quadrants
+                start += num_quadrants
+            last_word = word_raw
+            repeat_words = 0
+
+        if bigrams and window - window_size >= 0:
+            key = ((words[window - window_size] << word_bits) | word_raw, np.int64(-1))
+            bag[key] = bag.get(key, 0) + 1
+
+    return bag, words
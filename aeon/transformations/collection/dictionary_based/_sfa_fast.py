@@ -383,14 +383,7 @@ class SFAFast(BaseCollectionTransformer):
             words,
             self.remove_repeat_words,
         )[0]
-
-        if self.return_pandas_data_series:
-            bb = pd.DataFrame()
-            bb[0] = [pd.Series(bag) for bag in bags]
-            return bb
-        elif self.return_sparse:
-            bags = csr_matrix(bags, dtype=np.uint32)
-        return bags
+        return self._format_bags(_csr_bag(bags, words.shape[0]))
 
     def transform_to_bag(self, words, word_len, y=None):
         """Transform words to bag-of-pattern and apply feature selection."""
@@ -410,6 +403,7 @@ class SFAFast(BaseCollectionTransformer):
                 word_len,  # self.word_length_actual,
                 self.remove_repeat_words,
             )
+            bag_of_words = _csr_bag(bag_of_words, words.shape[0])
         else:
             feature_names = create_feature_names(words)
 
@@ -424,6 +418,7 @@ class SFAFast(BaseCollectionTransformer):
                     words,
                     self.remove_repeat_words,
                 )
+                bag_of_words = _csr_bag(bag_of_words, words.shape[0])
 
             # Random feature selection
             elif self.feature_selection == "random":
@@ -439,6 +434,7 @@ class SFAFast(BaseCollectionTransformer):
                     words,
                     self.remove_repeat_words,
                 )
+                bag_of_words = _csr_bag(bag_of_words, words.shape[0])
 
             # Chi-squared feature selection taking
             # a) the top-k features
@@ -458,6 +454,7 @@ class SFAFast(BaseCollectionTransformer):
                     words,
                     self.remove_repeat_words,
                 )
+                bag_of_words = _csr_bag(bag_of_words, words.shape[0])
 
                 # apply chi2-based feature selection
                 chi2_statistics, p = chi2(bag_of_words, y)
@@ -478,14 +475,17 @@ class SFAFast(BaseCollectionTransformer):
                 bag_of_words = bag_of_words[:, relevant_features_idx]
 
         self.feature_count = bag_of_words.shape[1]
+        return self._format_bags(bag_of_words)
 
+    def _format_bags(self, bags):
+        # The bags are built as a CSR matrix, returned as it is if return_sparse.
         if self.return_pandas_data_series:
             bb = pd.DataFrame()
-            bb[0] = [pd.Series(bag) for bag in bag_of_words]
+            bb[0] = [pd.Series(bag) for bag in bags.toarray()]
             return bb
         elif self.return_sparse:
-            bag_of_words = csr_matrix(bag_of_words, dtype=np.uint32)
-        return bag_of_words
+            return bags
+        return bags.toarray()
 
     def _binning(self, X, y=None):
         dft = _binning_dft(
@@ -1049,24 +1049,24 @@ def create_feature_names(sfa_words):
     return feature_names
 
 
+def _csr_bag(bag, n_instances):
+    # CSR matrix from the arrays returned by the create_bag functions.
+    indptr, indices, data, feature_count = bag
+    return csr_matrix(
+        (data, indices, indptr), shape=(n_instances, feature_count), dtype=np.uint32
+    )
+
+
 @njit(cache=True, fastmath=True)
 def create_bag_none(
     X_index, breakpoints, n_instances, sfa_words, word_length, remove_repeat_words
 ):
     feature_count = np.uint32(breakpoints.shape[1] ** word_length)
-    all_win_words = np.zeros((n_instances, feature_count), dtype=np.uint32)
-
-    for j in prange(sfa_words.shape[0]):
-        # this mask is used to encode the repeated words
-        if remove_repeat_words:
-            masked = np.nonzero(sfa_words[j])
-            all_win_words[j, :] = np.bincount(
-                sfa_words[j][masked], minlength=feature_count
-            )
-        else:
-            all_win_words[j, :] = np.bincount(sfa_words[j], minlength=feature_count)
-
-    return all_win_words
+    empty_dict = Dict.empty(key_type=types.uint32, value_type=types.uint32)
+    indptr, indices, data = _create_bag_csr(
+        sfa_words, empty_dict, False, feature_count, remove_repeat_words
+    )
+    return indptr, indices, data, feature_count
 
 
 @njit(cache=True, fastmath=True)
@@ -1089,12 +1089,14 @@ def create_bag_feature_selection(
         if 0 in relevant_features:
             del relevant_features[0]
 
-    all_win_words = np.zeros((n_instances, len(relevant_features_idx)), dtype=np.uint32)
-    for j in range(sfa_words.shape[0]):
-        for key in sfa_words[j]:
-            if key in relevant_features:
-                all_win_words[j, relevant_features[key]] += 1
-    return all_win_words, relevant_features
+    indptr, indices, data = _create_bag_csr(
+        sfa_words,
+        relevant_features,
+        True,
+        len(relevant_features_idx),
+        remove_repeat_words,
+    )
+    return (indptr, indices, data, len(relevant_features_idx)), relevant_features
 
 
 @njit(cache=True, fastmath=True)
@@ -1106,28 +1108,52 @@ def create_bag_transform(
     sfa_words,
     remove_repeat_words,
 ):
-    all_win_words = np.zeros((len(sfa_words), feature_count), np.uint32)
-    for j in prange(sfa_words.shape[0]):
-        if len(relevant_features) == 0 and feature_selection == "none":
-            # this mask is used to encode the repeated words
-            if remove_repeat_words:
-                masked = np.nonzero(sfa_words[j])
-                all_win_words[j, :] = np.bincount(
-                    sfa_words[j][masked], minlength=feature_count
-                )
-            else:
-                all_win_words[j, :] = np.bincount(sfa_words[j], minlength=feature_count)
-        else:
-            if remove_repeat_words:
-                if 0 in relevant_features:
-                    del relevant_features[0]
+    use_features = not (len(relevant_features) == 0 and feature_selection == "none")
+    indptr, indices, data = _create_bag_csr(
+        sfa_words, relevant_features, use_features, feature_count, remove_repeat_words
+    )
+    return (indptr, indices, data, feature_count), feature_count
+
 
-            for _, key in enumerate(sfa_words[j]):
-                if key in relevant_features:
-                    o = relevant_features[key]
-                    all_win_words[j, o] += 1
+@njit(cache=True, fastmath=True)
+def _create_bag_csr(
+    sfa_words, relevant_features, use_features, feature_count, remove_repeat_words
+):
+    # Count the words of each instance straight into the index pointer, column
+    # index and data arrays of a CSR matrix, so the dense (n_instances,
+    # feature_count) bag is never created. Words are mapped to columns with
+    # relevant_features if use_features is True, otherwise the word is its column.
+    # Repeated words are encoded as 0 and are not counted if remove_repeat_words.
+    n_instances, n_words = sfa_words.shape
+    indptr = np.zeros(n_instances + 1, dtype=np.int64)
+    indices = np.empty(n_instances * n_words, dtype=np.int32)
+    data = np.empty(n_instances * n_words, dtype=np.uint32)
+    columns = np.empty(n_words, dtype=np.int64)
+    nnz = 0
+    for j in range(n_instances):
+        n_columns = 0
+        for word in sfa_words[j]:
+            if remove_repeat_words and word == 0:
+                continue
+            if use_features:
+                if word in relevant_features:
+                    columns[n_columns] = relevant_features[word]
+                    n_columns += 1
+            elif word < feature_count:
+                columns[n_columns] = word
+                n_columns += 1
+
+        instance_columns = np.sort(columns[:n_columns])
+        for k in range(n_columns):
+            if k > 0 and instance_columns[k] == instance_columns[k - 1]:
+                data[nnz - 1] += 1
+            else:
+                indices[nnz] = instance_columns[k]
+                data[nnz] = 1
+                nnz += 1
+        indptr[j + 1] = nnz
 
-    return all_win_words, all_win_words.shape[1]
+    return indptr, indices[:nnz].copy(), data[:nnz].copy()
 
 
 @njit(fastmath=True, cache=True)
@@ -240,3 +240,35 @@ def test_typed_dict_disabled_numba():
         del os.environ["NUMBA_DISABLE_JIT"]
     else:
         os.environ["NUMBA_DISABLE_JIT"] = numba_disabled
+
+
+@pytest.mark.parametrize("levels", [1, 3])
+@pytest.mark.parametrize("bigrams", [True, False])
+@pytest.mark.parametrize("remove_repeat_words", [True, False])
+def test_typed_dict_bags(levels, bigrams, remove_repeat_words):
+    """Test the compiled typed dictionary bags match the python dictionary bags."""
+    X = np.random.RandomState(0).rand(10, 1, 100)
+    y = np.array([0, 0, 0, 0, 0, 1, 1, 1, 1, 1])
+
+    bags = []
+    for typed_dict in [True, False]:
+        p = SFA(
+            word_length=6,
+            alphabet_size=4,
+            window_size=12,
+            levels=levels,
+            bigrams=bigrams,
+            remove_repeat_words=remove_repeat_words,
+            save_words=True,
+            typed_dict=typed_dict,
+        )
+        bags.append(p.fit_transform(X, y)[0])
+
+    for typed_bag, bag in zip(*bags):
+        if levels > 1:
+            # python dictionary pyramid words are stored as a single int
+            typed_bag = {
+                (word << p.level_bits) | max(quadrant, 0): count
+                for (word, quadrant), count in typed_bag.items()
+            }
+        assert dict(typed_bag) == dict(bag)
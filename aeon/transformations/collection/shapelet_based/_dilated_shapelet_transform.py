@@ -585,16 +585,18 @@ def random_dilated_shapelet_extraction(
                 else:
                     id_test = idx_sample
 
-                # Compute distance vector, first get the subsequences
-                X_subs = get_all_subsequences(X[id_test], length, dilation)
+                # Compute distance vector, normalizing the subsequences if needed
                 if norm:
-                    # Normalize them if needed
                     X_means, X_stds = sliding_mean_std_one_series(
                         X[id_test], length, dilation
                     )
-                    X_subs = normalize_subsequences(X_subs, X_means, X_stds)
+                else:
+                    X_means = np.zeros((n_channels, 0))
+                    X_stds = np.zeros((n_channels, 0))
 
-                x_dist = compute_shapelet_dist_vector(X_subs, _val, length)
+                x_dist = compute_shapelet_dist_vector_from_series(
+                    X[id_test], _val, length, dilation, X_means, X_stds, norm
+                )
 
                 lower_bound = np.percentile(x_dist, threshold_percentiles[0])
                 upper_bound = np.percentile(x_dist, threshold_percentiles[1])
@@ -667,26 +669,43 @@ def dilated_shapelet_transform(X, shapelets):
         dilation = params_shp[i_params, 1]
         id_shps = np.where((lengths == length) & (dilations == dilation))[0]
 
+        idx_no_norm = id_shps[np.where(~normalize[id_shps])[0]]
+        idx_norm = id_shps[np.where(normalize[id_shps])[0]]
+        no_means = np.zeros((n_channels, 0))
+
         for i_x in prange(n_instances):
-            X_subs = get_all_subsequences(X[i_x], length, dilation)
-            idx_no_norm = id_shps[np.where(~normalize[id_shps])[0]]
-            for i_shp in idx_no_norm:
-                X_new[
-                    i_x, (n_ft * i_shp) : (n_ft * i_shp + n_ft)
-                ] = compute_shapelet_features(
-                    X_subs, values[i_shp], length, threshold[i_shp]
+            # Each series is scanned once for all shapelets of a group, without
+            # storing its subsequences
+            if len(idx_no_norm) > 0:
+                features = compute_shapelet_features_from_series(
+                    X[i_x],
+                    values[idx_no_norm],
+                    length,
+                    dilation,
+                    threshold[idx_no_norm],
+                    no_means,
+                    no_means,
+                    False,
                 )
+                for i in range(len(idx_no_norm)):
+                    i_shp = idx_no_norm[i]
+                    X_new[i_x, (n_ft * i_shp) : (n_ft * i_shp + n_ft)] = features[i]
 
-            idx_norm = id_shps[np.where(normalize[id_shps])[0]]
             if len(idx_norm) > 0:
                 X_means, X_stds = sliding_mean_std_one_series(X[i_x], length, dilation)
-                X_subs = normalize_subsequences(X_subs, X_means, X_stds)
-                for i_shp in idx_norm:
-                    X_new[
-                        i_x, (n_ft * i_shp) : (n_ft * i_shp + n_ft)
-                    ] = compute_shapelet_features(
-                        X_subs, values[i_shp], length, threshold[i_shp]
-                    )
+                features = compute_shapelet_features_from_series(
+                    X[i_x],
+                    values[idx_norm],
+                    length,
+                    dilation,
+                    threshold[idx_norm],
+                    X_means,
+                    X_stds,
+                    True,
+                )
+                for i in range(len(idx_norm)):
+                    i_shp = idx_norm[i]
+                    X_new[i_x, (n_ft * i_shp) : (n_ft * i_shp + n_ft)] = features[i]
     return X_new
 
 
@@ -834,3 +853,143 @@ def compute_shapelet_dist_vector(X_subs, values, length):
     for i_sub in prange(n_subsequences):
         dist_vector[i_sub] = manhattan_distance(X_subs[i_sub], values[:, :length])
     return dist_vector
+
+
+@njit(fastmath=True, cache=True)
+def _fill_subsequence(X, i_sub, length, dilation, X_means, X_stds, normalize, sub):
+    # Copy a subsequence of X into sub, z-normalizing it if normalize is True. A
+    # channel with a standard deviation of 0 is set to 0, as normalize_subsequences.
+    n_channels = X.shape[0]
+    for i_channel in range(n_channels):
+        if normalize:
+            mean = X_means[i_channel, i_sub]
+            std = X_stds[i_channel, i_sub]
+            if std > 0:
+                for i_length in range(length):
+                    sub[i_channel, i_length] = (
+                        X[i_channel, i_sub + (i_length * dilation)] - mean
+                    ) / std
+            else:
+                sub[i_channel, :length] = 0
+        else:
+            for i_length in range(length):
+                sub[i_channel, i_length] = X[i_channel, i_sub + (i_length * dilation)]
+
+
+@njit(fastmath=True, cache=True)
+def _subsequence_distance(sub, values, length, bound):
+    # Manhattan distance between a subsequence and shapelet values, abandoned once it
+    # reaches bound. The sum only grows, so an abandoned distance is still >= bound.
+    _dist = 0.0
+    for i_channel in range(sub.shape[0]):
+        for i_length in range(length):
+            _dist += abs(sub[i_channel, i_length] - values[i_channel, i_length])
+            if _dist >= bound:
+                return _dist
+    return _dist
+
+
+@njit(fastmath=True, cache=True)
+def compute_shapelet_features_from_series(
+    X, values, length, dilation, threshold, X_means, X_stds, normalize
+):
+    """Extract the features of a group of shapelets without storing subsequences.
+
+    Equivalent to ``compute_shapelet_features`` for each shapelet, applied to the
+    subsequences of ``X`` normalized with ``normalize_subsequences`` if
+    ``normalize`` is True. Each subsequence is built once for all the shapelets, which
+    must share the same length and dilation, and only uses memory for a single
+    subsequence. The distance to a shapelet is abandoned once it is above both the
+    current minimum and the threshold, as it can no longer change the features.
+
+    Parameters
+    ----------
+    X : array, shape (n_channels, n_timestamps)
+        An input time series.
+    values : array, shape (n_shapelets, n_channels, max(shapelet_lengths))
+        The values of the shapelets.
+    length : int
+        Length of the shapelets.
+    dilation : int
+        Dilation of the shapelets.
+    threshold : array, shape (n_shapelets)
+        The threshold parameter of each shapelet.
+    X_means : array, shape (n_channels, n_timestamps-(length-1)*dilation)
+        Means of the subsequences of X, only used if normalize is True.
+    X_stds : array, shape (n_channels, n_timestamps-(length-1)*dilation)
+        Standard deviations of the subsequences of X, only used if normalize is True.
+    normalize : bool
+        Whether to z-normalize the subsequences.
+
+    Returns
+    -------
+    array, shape (n_shapelets, 3)
+        The min, argmin and shapelet occurrence of each shapelet.
+    """
+    n_shapelets = values.shape[0]
+    n_channels, n_timestamps = X.shape
+    n_subsequences = n_timestamps - (length - 1) * dilation
+
+    _min = np.full(n_shapelets, np.inf)
+    _argmin = np.full(n_shapelets, np.inf)
+    _SO = np.zeros(n_shapelets)
+
+    sub = np.zeros((n_channels, length))
+    for i_sub in range(n_subsequences):
+        _fill_subsequence(X, i_sub, length, dilation, X_means, X_stds, normalize, sub)
+        for i_shp in range(n_shapelets):
+            _dist = _subsequence_distance(
+                sub, values[i_shp], length, max(_min[i_shp], threshold[i_shp])
+            )
+            if _dist < _min[i_shp]:
+                _min[i_shp] = _dist
+                _argmin[i_shp] = i_sub
+            if _dist < threshold[i_shp]:
+                _SO[i_shp] += 1
+
+    features = np.zeros((n_shapelets, 3))
+    features[:, 0] = _min
+    features[:, 1] = _argmin
+    features[:, 2] = _SO
+    return features
+
+
+@njit(fastmath=True, cache=True)
+def compute_shapelet_dist_vector_from_series(
+    X, values, length, dilation, X_means, X_stds, normalize
+):
+    """Compute the distance vector of a shapelet without storing subsequences.
+
+    Equivalent to ``compute_shapelet_dist_vector`` applied to the subsequences of
+    ``X``, normalized with ``normalize_subsequences`` if ``normalize`` is True.
+
+    Parameters
+    ----------
+    X : array, shape (n_channels, n_timestamps)
+        An input time series.
+    values : array, shape (n_channels, length)
+        The value array of the shapelet.
+    length : int
+        Length of the shapelet.
+    dilation : int
+        Dilation of the shapelet.
+    X_means : array, shape (n_channels, n_timestamps-(length-1)*dilation)
+        Means of the subsequences of X, only used if normalize is True.
+    X_stds : array, shape (n_channels, n_timestamps-(length-1)*dilation)
+        Standard deviations of the subsequences of X, only used if normalize is True.
+    normalize : bool
+        Whether to z-normalize the subsequences.
+
+    Returns
+    -------
+    array, shape (n_timestamps-(length-1)*dilation)
+        The distance between the shapelet and each subsequence of X.
+    """
+    n_channels, n_timestamps = X.shape
+    n_subsequences = n_timestamps - (length - 1) * dilation
+    dist_vector = np.zeros(n_subsequences)
+    sub = np.zeros((n_channels, length))
+    for i_sub in range(n_subsequences):
+        _fill_subsequence(X, i_sub, length, dilation, X_means, X_stds, normalize, sub)
+        dist_vector[i_sub] = _subsequence_distance(sub, values, length, np.inf)
+    return dist_vector
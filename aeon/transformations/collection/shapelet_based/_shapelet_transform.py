@@ -342,6 +342,24 @@ class RandomShapeletTransform(BaseCollectionTransformer):
                     sorted(range(s[1]), reverse=True, key=lambda j, sabs=sabs: sabs[j])
                 )
             )
+
+        # shapelets as padded arrays for the compiled transform
+        n_shapelets = len(self.shapelets)
+        max_length = max([s[1] for s in self.shapelets], default=0)
+        self._shapelet_values = np.zeros((n_shapelets, max_length))
+        self._shapelet_sorted_indicies = np.zeros(
+            (n_shapelets, max_length), dtype=np.int64
+        )
+        for n, s in enumerate(self.shapelets):
+            self._shapelet_values[n, : s[1]] = s[6]
+            self._shapelet_sorted_indicies[n, : s[1]] = self._sorted_indicies[n]
+        self._shapelet_lengths = np.array(
+            [s[1] for s in self.shapelets], dtype=np.int64
+        )
+        self._shapelet_positions = np.array(
+            [s[2] for s in self.shapelets], dtype=np.int64
+        )
+        self._shapelet_dims = np.array([s[3] for s in self.shapelets], dtype=np.int64)
         return self
 
     def _transform(self, X, y=None):
@@ -358,22 +376,64 @@ class RandomShapeletTransform(BaseCollectionTransformer):
             The transformed data.
         """
         output = np.zeros((len(X), len(self.shapelets)))
+        if len(self.shapelets) == 0:
+            return output
 
-        for i, series in enumerate(X):
-            dists = Parallel(
-                n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
-            )(
-                delayed(_online_shapelet_distance)(
-                    series[shapelet[3]],
-                    shapelet[6],
-                    self._sorted_indicies[n],
-                    shapelet[2],
-                    shapelet[1],
-                )
-                for n, shapelet in enumerate(self.shapelets)
-            )
+        # Series are transformed in one block per job. Each block finds the distances
+        # to all shapelets in compiled code, without a dispatch per shapelet.
+        blocks = np.array_split(np.arange(len(X)), min(self._n_jobs, len(X)))
+        dists = Parallel(
+            n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
+        )(delayed(self._transform_block)(X[block]) for block in blocks)
+
+        for block, d in zip(blocks, dists):
+            output[block] = d
+
+        return output
+
+    def _transform_block(self, X):
+        # Distances from the series in X to all shapelets. Short shapelets use the
+        # early abandoning _online_shapelet_distance. For long shapelets the sliding
+        # dot products with every subsequence are found for all series at once using
+        # the FFT, as in MASS, and each distance is found in constant time.
+        output = np.zeros((X.shape[0], len(self.shapelets)))
+        is_long = self._shapelet_lengths >= _MASS_MIN_LENGTH
+
+        _online_shapelet_distances(
+            X,
+            self._shapelet_values,
+            self._shapelet_sorted_indicies,
+            self._shapelet_positions,
+            self._shapelet_lengths,
+            self._shapelet_dims,
+            np.where(~is_long)[0],
+            output,
+        )
 
-            output[i] = dists
+        if is_long.any():
+            # the series transformed may be longer than those the shapelets were
+            # extracted from
+            series_length = X.shape[2]
+            n_fft = 1 << (series_length - 1).bit_length()
+            series_fft = {}
+            for n in np.where(is_long)[0]:
+                length = self._shapelet_lengths[n]
+                dim = self._shapelet_dims[n]
+                shapelet = self._shapelet_values[n, :length]
+
+                if dim not in series_fft:
+                    series_fft[dim] = np.fft.rfft(X[:, dim], n=n_fft)
+                dot_products = np.fft.irfft(
+                    series_fft[dim] * np.fft.rfft(shapelet[::-1], n=n_fft), n=n_fft
+                )[:, length - 1 : series_length]
+
+                output[:, n] = _mass_shapelet_distances(
+                    X[:, dim],
+                    np.ascontiguousarray(dot_products),
+                    shapelet,
+                    self._shapelet_positions[n],
+                    length,
+                )
 
         return output
 
@@ -555,6 +615,93 @@ class RandomShapeletTransform(BaseCollectionTransformer):
         return to_keep
 
 
+# shapelets at least this long use the FFT to find the distance to a series
+_MASS_MIN_LENGTH = 16
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _online_shapelet_distances(
+    X, values, sorted_indicies, positions, lengths, dims, shapelet_idx, output
+):
+    for i in range(X.shape[0]):
+        for n in shapelet_idx:
+            output[i, n] = _online_shapelet_distance(
+                X[i, dims[n]],
+                values[n, : lengths[n]],
+                sorted_indicies[n, : lengths[n]],
+                positions[n],
+                lengths[n],
+            )
+
+
+@njit(fastmath=True, cache=True, nogil=True)
+def _mass_shapelet_distances(X, dot_products, shapelet, position, length):
+    # The squared distance between a z-normalised shapelet q and a subsequence x
+    # z-normalised with mean m and standard deviation s is
+    #   sum(q^2) - 2 * (sum(q * x) - m * sum(q)) / s + length
+    # where sum(q * x) is the sliding dot product. As in _online_shapelet_distance,
+    # the subsequence the shapelet was extracted from is compared first, normalising
+    # by its variance, and every other subsequence is compared with its standard
+    # deviation.
+    n_instances, series_length = X.shape
+    n_subsequences = series_length - length + 1
+
+    sum_q = 0.0
+    sum_q2 = 0.0
+    for j in range(length):
+        sum_q += shapelet[j]
+        sum_q2 += shapelet[j] * shapelet[j]
+
+    distances = np.zeros(n_instances)
+    for i in range(n_instances):
+        series = X[i]
+
+        sum = 0.0
+        sum2 = 0.0
+        for j in range(position, position + length):
+            sum += series[j]
+            sum2 += series[j] * series[j]
+        mean = sum / length
+        var = (sum2 - mean * mean * length) / length
+        best_dist = 0.0
+        for j in range(length):
+            val = (series[position + j] - mean) / var if var > 0 else 0
+            temp = shapelet[j] - val
+            best_dist += temp * temp
+
+        sum = 0.0
+        sum2 = 0.0
+        for j in range(length):
+            sum += series[j]
+            sum2 += series[j] * series[j]
+
+        for p in range(n_subsequences):
+            if p > 0:
+                start = series[p - 1]
+                end = series[p + length - 1]
+                sum += end - start
+                sum2 += end * end - start * start
+
+            if p != position:
+                mean = sum / length
+                var = (sum2 - mean * mean * length) / length
+                if var > 0:
+                    dist = (
+                        sum_q2
+                        - 2 * (dot_products[i, p] - mean * sum_q) / math.sqrt(var)
+                        + length
+                    )
+                    dist = max(dist, 0.0)
+                else:
+                    dist = sum_q2
+
+                if dist < best_dist:
+                    best_dist = dist
+
+        distances[i] = best_dist if best_dist == 0 else 1 / length * best_dist
+    return distances
+
+
 @njit(fastmath=True, cache=True)
 def _online_shapelet_distance(series, shapelet, sorted_indicies, position, length):
     subseq = series[position : position + length]
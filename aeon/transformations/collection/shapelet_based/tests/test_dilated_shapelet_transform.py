@@ -17,10 +17,13 @@ from aeon.distances import manhattan_distance
 from aeon.transformations.collection.shapelet_based._dilated_shapelet_transform import (
     RandomDilatedShapeletTransform,
     compute_shapelet_dist_vector,
+    compute_shapelet_dist_vector_from_series,
     compute_shapelet_features,
+    compute_shapelet_features_from_series,
     get_all_subsequences,
     normalize_subsequences,
 )
+from aeon.utils.numba.general import sliding_mean_std_one_series
 from aeon.utils.numba.stats import is_prime
 
 DATATYPES = ["int64", "float64"]
@@ -181,3 +184,33 @@ def test_compute_shapelet_dist_vector(dtype):
                 _sub = X[:, _idx]
                 true_vect[i_sub] += manhattan_distance(values, _sub)
             assert_array_almost_equal(d_vect, true_vect)
+
+
+@pytest.mark.parametrize("normalize", [False, True])
+def test_shapelet_features_from_series(normalize):
+    rng = np.random.RandomState(0)
+    X = rng.rand(2, 60)
+    X[:, 10:30] = 0.5
+    for length in [3, 7]:
+        for dilation in [1, 4]:
+            values = rng.rand(4, 2, 9)
+            threshold = rng.rand(4) * length
+            X_subs = get_all_subsequences(X, length, dilation)
+            X_means, X_stds = sliding_mean_std_one_series(X, length, dilation)
+            if normalize:
+                X_subs = normalize_subsequences(X_subs, X_means, X_stds)
+
+            features = compute_shapelet_features_from_series(
+                X, values, length, dilation, threshold, X_means, X_stds, normalize
+            )
+            for i in range(values.shape[0]):
+                assert_array_almost_equal(
+                    features[i],
+                    compute_shapelet_features(X_subs, values[i], length, threshold[i]),
+                )
+                assert_array_almost_equal(
+                    compute_shapelet_dist_vector_from_series(
+                        X, values[i], length, dilation, X_means, X_stds, normalize
+                    ),
+                    compute_shapelet_dist_vector(X_subs, values[i], length),
+                )
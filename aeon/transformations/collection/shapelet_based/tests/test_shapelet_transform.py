@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Shapelet transform unit tests."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_array_almost_equal
+
+from aeon.transformations.collection.shapelet_based import RandomShapeletTransform
+from aeon.transformations.collection.shapelet_based._shapelet_transform import (
+    _online_shapelet_distance,
+)
+from aeon.utils._testing.collection import make_3d_test_data
+
+
+@pytest.mark.parametrize("n_jobs", [1, 2])
+def test_shapelet_transform_distances(n_jobs):
+    """Test the batched transform against the distance to each shapelet."""
+    X, y = make_3d_test_data(n_cases=10, n_channels=2, n_timepoints=60, random_state=0)
+
+    st = RandomShapeletTransform(
+        n_shapelet_samples=50,
+        max_shapelets=10,
+        min_shapelet_length=5,
+        max_shapelet_length=40,
+        n_jobs=n_jobs,
+        random_state=0,
+    )
+    st.fit(X, y)
+    X_t = np.asarray(st.transform(X))
+
+    expected = np.zeros((X.shape[0], len(st.shapelets)))
+    for i in range(X.shape[0]):
+        for n, s in enumerate(st.shapelets):
+            expected[i, n] = _online_shapelet_distance(
+                X[i, s[3]], s[6], st._sorted_indicies[n], s[2], s[1]
+            )
+
+    assert any(s[1] >= 16 for s in st.shapelets)
+    assert_array_almost_equal(X_t, expected)
+
+
+def test_shapelet_transform_longer_series():
+    """Test transforming series longer than those the transform was fit on."""
+    X, y = make_3d_test_data(n_cases=10, n_timepoints=60, random_state=0)
+    X_long, _ = make_3d_test_data(n_cases=5, n_timepoints=90, random_state=1)
+
+    st = RandomShapeletTransform(
+        n_shapelet_samples=50,
+        max_shapelets=10,
+        min_shapelet_length=20,
+        max_shapelet_length=40,
+        random_state=0,
+    )
+    st.fit(X, y)
+    X_t = np.asarray(st.transform(X_long))
+
+    expected = np.zeros((X_long.shape[0], len(st.shapelets)))
+    for i in range(X_long.shape[0]):
+        for n, s in enumerate(st.shapelets):
+            expected[i, n] = _online_shapelet_distance(
+                X_long[i, s[3]], s[6], st._sorted_indicies[n], s[2], s[1]
+            )
+
+    assert all(s[1] >= 16 for s in st.shapelets)
+    assert_array_almost_equal(X_t, expected)
@@ -18,6 +18,10 @@ from sklearn.utils import check_random_state
 
 from aeon.base._base import _clone_estimator
 from aeon.transformations.base import BaseTransformer
+from aeon.transformations.collection._interval_statistics import (
+    _IntervalStatistics,
+    _is_interval_statistic,
+)
 from aeon.transformations.collection.base import BaseCollectionTransformer
 from aeon.utils.numba.general import z_normalise_series_3d
 from aeon.utils.numba.stats import (
@@ -181,6 +185,10 @@ class SupervisedIntervals(BaseCollectionTransformer):
         X, y, rng = self._fit_setup(X, y)
 
         X_norm = z_normalise_series_3d(X) if self.normalise_for_search else X
+        stats_norm = self._interval_statistics(X_norm)
+        stats = (
+            self._interval_statistics(X) if self.normalise_for_search else stats_norm
+        )
 
         fit = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
@@ -191,6 +199,8 @@ class SupervisedIntervals(BaseCollectionTransformer):
                 y,
                 rng.randint(np.iinfo(np.int32).max),
                 True,
+                stats,
+                stats_norm,
             )
             for _ in range(self.n_intervals)
         )
@@ -205,16 +215,13 @@ class SupervisedIntervals(BaseCollectionTransformer):
 
         self._transform_features = [True] * len(self.intervals_)
 
-        Xt = transformed_intervals[0]
-        for i in range(1, self.n_intervals):
-            Xt = np.hstack((Xt, transformed_intervals[i]))
-
-        return Xt
+        return np.hstack(transformed_intervals)
 
     def _fit(self, X, y=None):
         X, y, rng = self._fit_setup(X, y)
 
         X_norm = z_normalise_series_3d(X) if self.normalise_for_search else X
+        stats_norm = self._interval_statistics(X_norm)
 
         fit = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
@@ -225,6 +232,8 @@ class SupervisedIntervals(BaseCollectionTransformer):
                 y,
                 rng.randint(np.iinfo(np.int32).max),
                 False,
+                None,
+                stats_norm,
             )
             for _ in range(self.n_intervals)
         )
@@ -242,12 +251,19 @@ class SupervisedIntervals(BaseCollectionTransformer):
         return self
 
     def _transform(self, X, y=None):
+        # A caller transforming the same X with several transformers can share the
+        # statistics of X by setting _shared_statistics before calling transform.
+        stats = getattr(self, "_shared_statistics", None)
+        if stats is None:
+            stats = self._interval_statistics(X)
+
         transform = Parallel(
             n_jobs=self._n_jobs, backend=self.parallel_backend, prefer="threads"
         )(
             delayed(self._transform_intervals)(
                 X,
                 i,
+                stats,
             )
             for i in range(len(self.intervals_))
         )
@@ -355,10 +371,19 @@ class SupervisedIntervals(BaseCollectionTransformer):
         le = preprocessing.LabelEncoder()
         return X, le.fit_transform(y), rng
 
-    def _generate_intervals(self, X, X_norm, y, seed, keep_transform):
+    def _interval_statistics(self, X):
+        # Cumulative sums for the mean, standard deviation and slope of intervals
+        # of X, if any of the features are found from them.
+        if any(_is_interval_statistic(f) for f in self._features):
+            return _IntervalStatistics(X)
+        return None
+
+    def _generate_intervals(
+        self, X, X_norm, y, seed, keep_transform, stats=None, stats_norm=None
+    ):
         rng = check_random_state(seed)
 
-        Xt = np.empty((self.n_instances_, 0)) if keep_transform else None
+        Xt = [np.empty((self.n_instances_, 0))] if keep_transform else None
         intervals = []
 
         for i in range(self.n_dims_):
@@ -382,11 +407,13 @@ class SupervisedIntervals(BaseCollectionTransformer):
                     rng,
                     keep_transform,
                     isinstance(feature, BaseTransformer),
+                    stats,
+                    stats_norm,
                 )
                 intervals.extend(intervals_L)
 
                 if keep_transform:
-                    Xt = np.hstack((Xt, Xt_L))
+                    Xt.append(Xt_L)
 
                 intervals_R, Xt_R = self._supervised_search(
                     X_norm[:, i, random_cut_point:],
@@ -398,15 +425,17 @@ class SupervisedIntervals(BaseCollectionTransformer):
                     rng,
                     keep_transform,
                     isinstance(feature, BaseTransformer),
+                    stats,
+                    stats_norm,
                 )
                 intervals.extend(intervals_R)
 
                 if keep_transform:
-                    Xt = np.hstack((Xt, Xt_R))
+                    Xt.append(Xt_R)
 
-        return intervals, Xt
+        return intervals, np.hstack(Xt) if keep_transform else None
 
-    def _transform_intervals(self, X, idx):
+    def _transform_intervals(self, X, idx, stats=None):
         if not self._transform_features[idx]:
             return np.zeros(X.shape[0])
 
@@ -415,7 +444,17 @@ class SupervisedIntervals(BaseCollectionTransformer):
         if isinstance(feature, BaseTransformer):
             return feature.transform(X[:, dim, start:end]).flatten()
         else:
-            return feature(X[:, dim, start:end])
+            return self._interval_feature(
+                X[:, dim, start:end], feature, dim, start, end, stats
+            )
+
+    @staticmethod
+    def _interval_feature(X, feature, dim, start, end, stats):
+        # feature of the interval values X, the interval [start, end) of channel dim,
+        # found from the cumulative sums if possible
+        if stats is not None and stats.supports(feature):
+            return stats.transform(feature, dim, start, end)
+        return feature(X)
 
     def _supervised_search(
         self,
@@ -428,9 +467,11 @@ class SupervisedIntervals(BaseCollectionTransformer):
         rng,
         keep_transform,
         feature_is_transformer,
+        stats=None,
+        stats_norm=None,
     ):
         intervals = []
-        Xt = np.empty((X.shape[0], 0)) if keep_transform else None
+        Xt = [np.empty((X.shape[0], 0))] if keep_transform else None
 
         while X.shape[1] >= self._min_interval_length * 2:
             if (
@@ -450,8 +491,22 @@ class SupervisedIntervals(BaseCollectionTransformer):
                 interval_feature_0 = feature.fit_transform(sub_interval_0).flatten()
                 interval_feature_1 = feature.fit_transform(sub_interval_1).flatten()
             else:
-                interval_feature_0 = feature(sub_interval_0)
-                interval_feature_1 = feature(sub_interval_1)
+                interval_feature_0 = self._interval_feature(
+                    sub_interval_0,
+                    feature,
+                    dim,
+                    ini_idx,
+                    ini_idx + div_point,
+                    stats_norm,
+                )
+                interval_feature_1 = self._interval_feature(
+                    sub_interval_1,
+                    feature,
+                    dim,
+                    ini_idx + div_point,
+                    ini_idx + X.shape[1],
+                    stats_norm,
+                )
 
             score_0 = self._metric(interval_feature_0, y)
             score_1 = self._metric(interval_feature_1, y)
@@ -469,17 +524,16 @@ class SupervisedIntervals(BaseCollectionTransformer):
                                 X_ori[:, ini_idx:end]
                             ).flatten()
                         else:
-                            interval_feature_to_use = feature(X_ori[:, ini_idx:end])
+                            interval_feature_to_use = self._interval_feature(
+                                X_ori[:, ini_idx:end], feature, dim, ini_idx, end, stats
+                            )
                     else:
                         interval_feature_to_use = interval_feature_0
 
-                    Xt = np.hstack(
-                        (
-                            Xt,
-                            np.reshape(
-                                interval_feature_to_use,
-                                (interval_feature_to_use.shape[0], 1),
-                            ),
+                    Xt.append(
+                        np.reshape(
+                            interval_feature_to_use,
+                            (interval_feature_to_use.shape[0], 1),
                         )
                     )
             elif score_1 > score_0:
@@ -496,23 +550,22 @@ class SupervisedIntervals(BaseCollectionTransformer):
                                 X_ori[:, ini_idx:end]
                             ).flatten()
                         else:
-                            interval_feature_to_use = feature(X_ori[:, ini_idx:end])
+                            interval_feature_to_use = self._interval_feature(
+                                X_ori[:, ini_idx:end], feature, dim, ini_idx, end, stats
+                            )
                     else:
                         interval_feature_to_use = interval_feature_1
 
-                    Xt = np.hstack(
-                        (
-                            Xt,
-                            np.reshape(
-                                interval_feature_to_use,
-                                (interval_feature_to_use.shape[0], 1),
-                            ),
+                    Xt.append(
+                        np.reshape(
+                            interval_feature_to_use,
+                            (interval_feature_to_use.shape[0], 1),
                         )
                     )
             else:
                 break
 
-        return intervals, Xt
+        return intervals, np.hstack(Xt) if keep_transform else None
 
     def set_features_to_transform(self, arr, raise_error=True):
         """Set transform_features to the given array.
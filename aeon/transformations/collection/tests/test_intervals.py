@@ -1,11 +1,16 @@
 # -*- coding: utf-8 -*-
 """Interval extraction test code."""
 
+import numpy as np
+import pytest
+from numpy.testing import assert_almost_equal
+
 from aeon.transformations.collection import Catch22, SevenNumberSummaryTransformer
+from aeon.transformations.collection._interval_statistics import _IntervalStatistics
 from aeon.transformations.collection.random_intervals import RandomIntervals
 from aeon.transformations.collection.supervised_intervals import SupervisedIntervals
 from aeon.utils._testing.collection import make_3d_test_data
-from aeon.utils.numba.stats import row_mean, row_median
+from aeon.utils.numba.stats import row_mean, row_median, row_slope, row_std
 
 
 def test_interval_prune():
@@ -52,3 +57,67 @@ def test_supervised_transformers():
     X_t = sit.fit_transform(X, y)
 
     assert X_t.shape == (X.shape[0], 7)
+
+
+@pytest.mark.parametrize("feature", [row_mean, row_std, row_slope])
+def test_interval_statistics(feature):
+    X, _ = make_3d_test_data(random_state=0, n_channels=2, n_timepoints=40)
+    X = X + 100
+    X[:5, 1, 10:20] = 3.5
+
+    stats = _IntervalStatistics(X)
+    assert stats.supports(feature)
+    assert not stats.supports(feature, dilation=2)
+    assert not stats.supports(row_median)
+    for dim, start, end in [(0, 0, 40), (0, 37, 40), (1, 5, 30), (1, 10, 20)]:
+        assert_almost_equal(
+            stats.transform(feature, dim, start, end),
+            feature(X[:, dim, start:end]),
+        )
+    assert np.all(stats.transform(row_std, 1, 10, 20)[:5] == 0)
+
+    X[0, 0, 0] = np.nan
+    assert not _IntervalStatistics(X).supports(feature)
+
+
+def test_interval_statistics_level_shift_and_trend():
+    rng = np.random.RandomState(0)
+    t = np.arange(3000)
+    shift = np.where(t < 1000, 1e3, 0.0) + rng.normal(scale=0.5, size=3000)
+    trend = 0.5 * t + 1e3 + rng.normal(size=3000)
+    X = np.stack([shift, trend])[:, np.newaxis, :]
+    X = np.concatenate([X, X[:, :, ::-1]], axis=1)
+
+    stats = _IntervalStatistics(X)
+    intervals = [(990, 1010), (1000, 1064), (2000, 2003), (1500, 2900), (0, 3000)]
+    for start in rng.randint(0, 2990, size=20):
+        intervals.append((start, rng.randint(start + 2, 3001)))
+    for feature in [row_mean, row_std, row_slope]:
+        for dim in range(2):
+            for start, end in intervals:
+                np.testing.assert_allclose(
+                    stats.transform(feature, dim, start, end),
+                    feature(X[:, dim, start:end]),
+                    rtol=1e-9,
+                )
+
+
+def test_interval_statistics_transform():
+    X, y = make_3d_test_data(random_state=0, n_channels=2, n_timepoints=20)
+    features = [row_mean, row_std, row_slope, row_median]
+
+    rit = RandomIntervals(features=features, n_intervals=5, random_state=0)
+    X_t = rit.fit_transform(X, y)
+    expected = np.column_stack(
+        [f(X[:, dim, start:end:d]) for start, end, dim, f, d in rit.intervals_]
+    )
+    assert_almost_equal(X_t, expected)
+    assert_almost_equal(rit.transform(X), expected)
+
+    sit = SupervisedIntervals(features=features, n_intervals=2, random_state=0)
+    X_t = sit.fit_transform(X, y)
+    expected = np.column_stack(
+        [f(X[:, dim, start:end]) for start, end, dim, f in sit.intervals_]
+    )
+    assert_almost_equal(X_t, expected)
+    assert_almost_equal(sit.transform(X), expected)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+"""Sufficient statistics of ridge regression that can be updated in batches.
+
+Ridge regression only depends on the data through the means, the covariance of
+the features and the covariance of the features and the targets. These are updated
+from each batch, so a model can be trained on data that does not fit in memory
+and updated when new data arrives without revisiting the old data.
+"""
+
+__all__ = ["RidgeStatistics"]
+
+import numpy as np
+
+
+class RidgeStatistics:
+    """Means and co-moments of features and targets, solved for ridge coefficients.
+
+    Used by ``IncrementalRidgeCV`` and ``IncrementalRidgeClassifierCV``. The
+    co-moments of the features are a ``(n_features, n_features)`` array, so the
+    memory used does not depend on the number of instances.
+    """
+
+    def __init__(self):
+        self.n_instances = 0
+        self.n_targets = None
+
+    def update(self, X, y):
+        """Add a batch of data to the statistics.
+
+        Parameters
+        ----------
+        X : np.ndarray of shape (n_instances, n_features)
+            A batch of data.
+        y : np.ndarray of shape (n_instances, n_targets)
+            The targets of the batch.
+        """
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        # Merge the means and co-moments of the batch with those of the previous
+        # data, see Chan, Golub and LeVeque (1979).
+        n_batch = X.shape[0]
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean(axis=0)
+        X_c = X - x_mean
+        y_c = y - y_mean
+        if self.n_instances == 0:
+            self.n_targets = y.shape[1]
+            self._x_mean = x_mean
+            self._y_mean = y_mean
+            self._xx = X_c.T @ X_c
+            self._xy = X_c.T @ y_c
+            self._yy = np.sum(y_c * y_c, axis=0)
+        else:
+            n = self.n_instances + n_batch
+            weight = self.n_instances * n_batch / n
+            x_delta = x_mean - self._x_mean
+            y_delta = y_mean - self._y_mean
+            self._xx += X_c.T @ X_c + weight * np.outer(x_delta, x_delta)
+            self._xy += X_c.T @ y_c + weight * np.outer(x_delta, y_delta)
+            self._yy += np.sum(y_c * y_c, axis=0) + weight * y_delta * y_delta
+            self._x_mean += x_delta * n_batch / n
+            self._y_mean += y_delta * n_batch / n
+        self.n_instances += n_batch
+
+    def solve(self, alphas=None, fit_intercept=True, scale=True):
+        """Find the ridge coefficients with the alpha selected by GCV.
+
+        The coefficients for each value of ``alphas`` are found from an
+        eigendecomposition of the feature co-moments, and the alpha with the lowest
+        generalised cross-validation (GCV) error is used.
+
+        Parameters
+        ----------
+        alphas : array-like of shape (n_alphas,) or None, default=None
+            Regularisation strengths to select from. If None,
+            ``np.logspace(-3, 3, 10)`` is used.
+        fit_intercept : bool, default=True
+            Whether to fit an intercept. If False, the data is not centred.
+        scale : bool, default=True
+            Whether to divide each feature by its standard deviation before fitting.
+
+        Returns
+        -------
+        coef : np.ndarray of shape (n_features, n_targets)
+            Coefficients of the features, for the unscaled features.
+        intercept : np.ndarray of shape (n_targets,)
+            The intercept.
+        alpha : float
+            The selected regularisation strength.
+        best_score : float
+            The negative GCV estimate of the mean squared error with ``alpha``.
+        """
+        n = self.n_instances
+        xx, xy, yy = self._xx, self._xy, self._yy
+        if not fit_intercept:
+            # Co-moments about zero rather than about the mean.
+            xx = xx + n * np.outer(self._x_mean, self._x_mean)
+            xy = xy + n * np.outer(self._x_mean, self._y_mean)
+            yy = yy + n * self._y_mean * self._y_mean
+        std = np.ones(xx.shape[0])
+        if scale:
+            std = np.sqrt(np.diag(self._xx) / n)
+            std[std == 0] = 1
+            xx = xx / np.outer(std, std)
+            xy = xy / std[:, np.newaxis]
+
+        eigenvalues, eigenvectors = np.linalg.eigh(xx)
+        # Eigenvalues lost to rounding are treated as zero, as in a rank estimate.
+        tolerance = max(eigenvalues.max(), 0) * xx.shape[0] * np.finfo(float).eps
+        eigenvalues[eigenvalues <= tolerance] = 0
+        projected = eigenvectors.T @ xy
+        # Squared length of the targets along each eigenvector of the features,
+        # and outside the span of the features.
+        nonzero = eigenvalues > 0
+        spanned = np.zeros_like(projected)
+        spanned[nonzero] = projected[nonzero] ** 2 / eigenvalues[nonzero, np.newaxis]
+        unspanned = np.maximum(yy - np.sum(spanned, axis=0), 0)
+        alphas = (
+            np.logspace(-3, 3, 10)
+            if alphas is None
+            else np.atleast_1d(np.asarray(alphas, dtype=np.float64))
+        )
+
+        scores = np.zeros(alphas.shape[0])
+        for i, alpha in enumerate(alphas):
+            # Residual sum of squares and residual degrees of freedom of the fit,
+            # written as sums of positive terms so that both stay accurate when
+            # there are more features than instances and the fit interpolates the
+            # data as alpha becomes small.
+            shrink = alpha / (eigenvalues + alpha)
+            rss = np.sum((shrink * shrink)[:, np.newaxis] * spanned, axis=0)
+            rss += unspanned
+            residual_df = n - fit_intercept - xx.shape[0] + np.sum(shrink)
+            scores[i] = (
+                np.mean(rss) * n / residual_df**2 if residual_df > 0 else np.inf
+            )
+
+        best = int(np.argmin(scores))
+        alpha = float(alphas[best])
+        coef = eigenvectors @ (projected / (eigenvalues + alpha)[:, np.newaxis])
+        coef = coef / std[:, np.newaxis]
+        intercept = (
+            self._y_mean - self._x_mean @ coef
+            if fit_intercept
+            else np.zeros(coef.shape[1])
+        )
+        return coef, intercept, alpha, -float(scores[best])
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""Utilities for controlling the number of threads used by numba."""
+
+__all__ = ["threaded"]
+
+import functools
+import inspect
+from typing import Callable
+
+from numba import config, get_num_threads, set_num_threads
+
+from aeon.utils.validation import check_n_jobs
+
+
+def threaded(func: Callable) -> Callable:
+    """Run a function with the number of numba threads set from its ``n_jobs``.
+
+    The decorated function must take an ``n_jobs`` argument. Before the call the
+    number of threads numba uses for ``prange`` loops is set to ``n_jobs`` (resolved
+    with :func:`aeon.utils.validation.check_n_jobs` and capped at the number of
+    threads numba was launched with), and the previous value is restored once the
+    function returns or raises.
+
+    Parameters
+    ----------
+    func : Callable
+        Function with an ``n_jobs`` argument.
+
+    Returns
+    -------
+    Callable
+        The wrapped function.
+
+    Examples
+    --------
+    >>> from numba import get_num_threads
+    >>> from aeon.utils._threading import threaded
+    >>> @threaded
+    ... def f(n_jobs=1):
+    ...     return get_num_threads()
+    >>> f(n_jobs=1)
+    1
+    """
+    signature = inspect.signature(func)
+    if "n_jobs" not in signature.parameters:
+        raise ValueError(
+            f"Function {func.__name__} must have an n_jobs argument to be threaded"
+        )
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        n_jobs = min(check_n_jobs(bound.arguments["n_jobs"]), config.NUMBA_NUM_THREADS)
+
+        prev_threads = get_num_threads()
+        set_num_threads(n_jobs)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            set_num_threads(prev_threads)
+
+    return wrapper
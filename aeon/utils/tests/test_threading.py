@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Tests for the numba thread utilities."""
+import pytest
+from numba import config, get_num_threads
+
+from aeon.utils._threading import threaded
+from aeon.utils.validation import check_n_jobs
+
+
+def test_threaded():
+    """Test threaded sets and then restores the number of numba threads."""
+
+    @threaded
+    def _get_threads(n_jobs=1):
+        return get_num_threads()
+
+    prev_threads = get_num_threads()
+    assert _get_threads() == 1
+    assert _get_threads(n_jobs=-1) == min(check_n_jobs(-1), config.NUMBA_NUM_THREADS)
+    assert _get_threads(config.NUMBA_NUM_THREADS + 1) == config.NUMBA_NUM_THREADS
+    assert get_num_threads() == prev_threads
+
+    @threaded
+    def _raise(n_jobs=1):
+        raise ValueError("raise")
+
+    with pytest.raises(ValueError, match="raise"):
+        _raise(n_jobs=1)
+    assert get_num_threads() == prev_threads
+
+
+def test_threaded_no_n_jobs():
+    """Test threaded raises an error for functions without an n_jobs argument."""
+    with pytest.raises(ValueError, match="must have an n_jobs argument"):
+
+        @threaded
+        def _f(x):
+            return x